@@ -2,10 +2,14 @@
 """Merge WHAT WE BUILT into A WORLD FIRST by removing the redundant section,
    killing the duplicate number grid, and rewriting the product cards intro."""
 
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.fileio import report_modified
+from tsxtools.jsx import build_index
+
 filepath = r"c:\Users\brayd\Downloads\bw-nexus-ai-final-11\components\CommandCenter.tsx"
 
-with open(filepath, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+buf = EditBuffer(filepath)
+lines = buf.lines
 
 print(f"Original line count: {len(lines)}")
 
@@ -29,7 +33,7 @@ if wb_end + 1 < len(lines) and lines[wb_end + 1].strip() == '':
     wb_end += 1
 
 print(f"WHAT WE BUILT: removing lines {wb_start+1} to {wb_end+1}")
-lines = lines[:wb_start] + lines[wb_end+1:]
+buf.delete_lines(wb_start, wb_end + 1)
 
 # === STEP 2: Remove the duplicate Key Numbers grid ===
 # Find "{/* Key Numbers */}" 
@@ -41,25 +45,21 @@ for i, line in enumerate(lines):
         break
 
 if kn_start is not None:
-    # Find the closing </div> of the grid (ends with "</div>")
-    brace_depth = 0
-    for i in range(kn_start + 1, min(kn_start + 30, len(lines))):
-        if 'className="grid grid-cols-2 md:grid-cols-4' in lines[i]:
-            # Count div opens/closes from here
-            for j in range(i, min(i + 20, len(lines))):
-                brace_depth += lines[j].count('<div')
-                brace_depth -= lines[j].count('</div>')
-                if brace_depth <= 0:
-                    kn_end = j
-                    break
+    # The grid is the first matching <div> within 30 lines of the comment; its
+    # span comes from the JSX index. One further away is some other grid.
+    index = build_index(''.join(lines))
+    for el in index.query('div[className^="grid grid-cols-2 md:grid-cols-4"]'):
+        if el.line - 1 > kn_start:
+            if el.line - 1 < kn_start + 30:
+                kn_end = el.end_line - 1
             break
-    
+
     if kn_end is not None:
         # Also remove trailing blank line
         if kn_end + 1 < len(lines) and lines[kn_end + 1].strip() == '':
             kn_end += 1
         print(f"Key Numbers grid: removing lines {kn_start+1} to {kn_end+1}")
-        lines = lines[:kn_start] + lines[kn_end+1:]
+        buf.delete_lines(kn_start, kn_end + 1)
     else:
         print("WARNING: Could not find Key Numbers grid end")
 else:
@@ -77,9 +77,11 @@ for i, line in enumerate(lines):
 if prod_start is not None:
     # Find the end of the intro paragraph (before the grid of cards starts)
     intro_end = None
-    for i in range(prod_start, min(prod_start + 10, len(lines))):
-        if 'className="grid grid-cols-2 gap-3"' in lines[i]:
-            intro_end = i
+    index = build_index(''.join(lines))
+    for el in index.query('div[className="grid grid-cols-2 gap-3"]'):
+        if el.line - 1 >= prod_start:
+            if el.line - 1 < prod_start + 10:      # the intro is a few lines; further is another grid
+                intro_end = el.line - 1
             break
     
     if intro_end is not None:
@@ -91,7 +93,8 @@ if prod_start is not None:
             '                        <p className="text-base text-slate-700 mb-5 max-w-3xl">Four products deliver this. Each draws from the same 22-engine intelligence core \u2014 the same formulas, the same methodology, the same audit trails:</p>\n',
         ]
         print(f"Product intro: replacing lines {prod_start+1} to {intro_end}")
-        lines = lines[:prod_start] + new_intro + lines[intro_end:]
+        # The new wrapper <div> stays open around the card grid below.
+        buf.replace_lines(prod_start, intro_end, new_intro, balanced=False)
     else:
         print("WARNING: Could not find product grid start")
 else:
@@ -102,12 +105,13 @@ for i, line in enumerate(lines):
     if "scrollToSection('system-overview')" in line and 'The System' in line:
         # Remove this nav link entirely since the section no longer exists
         # Actually, redirect it to 'technology' since that's where the merged content lives
-        lines[i] = line.replace("scrollToSection('system-overview')", "scrollToSection('technology')").replace('The System', 'The Platform')
+        buf.set_line(i, line.replace("scrollToSection('system-overview')", "scrollToSection('technology')").replace('The System', 'The Platform'))
         print(f"Nav link updated at line {i+1}")
         break
 
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+if not buf.write():
+    exit(1)
+report_modified()
 
 print(f"New line count: {len(lines)}")
 print("DONE")
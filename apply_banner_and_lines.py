@@ -7,6 +7,8 @@
 import os
 import re
 
+from tsxtools.fileio import report_modified, write_if_changed
+
 FILE = os.path.join(os.path.dirname(__file__), 'components', 'CommandCenter.tsx')
 
 with open(FILE, 'r', encoding='utf-8') as f:
@@ -207,8 +209,8 @@ content = '\n'.join(lines3)
 print("Updated card body text colors")
 
 # ─── WRITE FILE ───
-with open(FILE, 'w', encoding='utf-8') as f:
-    f.write(content)
+write_if_changed(FILE, content)
+report_modified()
 
 final_lines = content.split('\n')
 print(f"File is now {len(final_lines)} lines")
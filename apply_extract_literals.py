@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Move large inline literals out of TSX files into lazily imported modules.
+
+    python apply_extract_literals.py [path ...] [--threshold BYTES] [--objects] [--dry-run]
+
+Finds `const` data literals and static JSX blocks of at least --threshold
+source bytes (default 2000) under the given files or directories (default
+components/), and moves what can move (see tsxtools.literals):
+
+    data   to data/extracted/<File>.<name>.json, read back with
+           useLazyData('<key>', load<Name>, []) at the top of each
+           component that uses it; arrays only unless --objects
+    JSX    to extracted/<File>.<Component><Tag><n>.tsx next to the file,
+           rendered as <Suspense fallback={null}><Component... /></Suspense>
+           through React.lazy
+
+Each file goes through EditBuffer, so a rewrite that would unbalance it is
+refused and none of its modules are written. Prints every literal moved or
+kept (with the reason), and the bytes leaving each file's chunk, estimated
+with whitespace collapsed as a minifier would.
+"""
+
+import argparse
+import os
+import sys
+
+from find_brace import iter_paths
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.fileio import report_modified, write_if_changed
+from tsxtools.literals import HOOK, THRESHOLD, plan_extraction
+
+DEFAULT = os.path.relpath(os.path.join(os.path.dirname(__file__), 'components'))
+
+HOOK_SOURCE = """import { useEffect, useState } from 'react';
+
+// Data moved out of a component by apply_extract_literals.py, loaded once per
+// key on first use and shared by every component that reads it.
+const loaded = new Map<string, unknown>();
+const pending = new Map<string, Promise<unknown>>();
+
+const useLazyData = <T,>(key: string, load: () => Promise<T>, fallback: T): T => {
+    const [data, setData] = useState<T>(() => (loaded.has(key) ? (loaded.get(key) as T) : fallback));
+
+    useEffect(() => {
+        if (loaded.has(key)) {
+            setData(loaded.get(key) as T);
+            return;
+        }
+        let active = true;
+        if (!pending.has(key)) {
+            pending.set(key, load().then((value) => {
+                loaded.set(key, value);
+                return value;
+            }, (error) => {
+                pending.delete(key);     // let the next mount retry
+                throw error;
+            }));
+        }
+        pending.get(key)!.then((value) => {
+            if (active) setData(value as T);
+        }, () => {});
+        return () => {
+            active = false;
+        };
+    }, [key, load]);
+
+    return data;
+};
+
+export default useLazyData;
+"""
+
+
+def _kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def rewrite(path, threshold=THRESHOLD, objects=False, dry_run=False):
+    """Apply the extraction plan for path; returns (plan, written)."""
+    buf = EditBuffer(path)
+    text = ''.join(buf.lines)
+    plan = plan_extraction(path, text, threshold, objects)
+    if not plan.moved:
+        return plan, False
+    starts = [0]
+    for line in buf.lines:
+        starts.append(starts[-1] + len(line))
+
+    def line_of(offset):
+        return text.count('\n', 0, offset)
+
+    # Edits sharing a line are spliced into one block.
+    blocks = []
+    for start, end, new in plan.edits:
+        first = line_of(start)
+        last = max(first, line_of(end - 1) if end > start else first)
+        if blocks and first <= blocks[-1][1]:
+            blocks[-1][1] = max(blocks[-1][1], last)
+            blocks[-1][2].append((start, end, new))
+        else:
+            blocks.append([first, last, [(start, end, new)]])
+    # Bottom-up, so earlier line numbers stay valid.
+    for first, last, edits in reversed(blocks):
+        offset = starts[first]
+        block = text[offset:starts[last + 1]]
+        for start, end, new in reversed(edits):
+            block = block[:start - offset] + new + block[end - offset:]
+        buf.replace_lines(first, last + 1, block)
+    if dry_run:
+        return plan, False
+    if not buf.write():
+        return plan, False
+    for module, content in plan.modules.items():
+        os.makedirs(os.path.dirname(module), exist_ok=True)
+        write_if_changed(os.path.relpath(module), content)
+    if plan.hook and not os.path.exists(HOOK + '.ts'):
+        write_if_changed(os.path.relpath(HOOK + '.ts'), HOOK_SOURCE)
+    return plan, True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=[DEFAULT])
+    parser.add_argument('--threshold', type=int, default=THRESHOLD, metavar='BYTES',
+                        help=f'smallest literal to move (default {THRESHOLD})')
+    parser.add_argument('--objects', action='store_true',
+                        help='move object literals too (they read as {} until loaded)')
+    parser.add_argument('--dry-run', action='store_true', help='report only, write nothing')
+    args = parser.parse_args(argv)
+
+    before = after = 0
+    status = 0
+    for path in iter_paths(args.paths):
+        if not path.endswith(('.tsx', '.jsx')) or f'{os.sep}extracted{os.sep}' in path:
+            continue
+        size = os.path.getsize(path)
+        plan, written = rewrite(path, args.threshold, args.objects, args.dry_run)
+        if not plan.moved and not plan.kept:
+            continue
+        for lit in plan.moved:
+            print(f"{path}:{lit.line}: {lit.kind} {lit.name}, {_kb(lit.minified)} -> lazy module")
+        for lit in plan.kept:
+            print(f"{path}:{lit.line}: {lit.kind} {lit.name}, {_kb(lit.minified)} kept ({lit.fixed})")
+        before += size
+        after += size - max(plan.saved, 0)
+        if plan.moved:
+            print(f"{path}: ~{_kb(plan.saved)} out of its chunk")
+        if plan.moved and not args.dry_run and not written:
+            status = 1
+
+    print(f"\nEstimated bytes in the scanned files' chunks: ~{_kb(before)} -> ~{_kb(after)} "
+          f"(~{_kb(before - after)} now loaded on demand)")
+    if not args.dry_run:
+        report_modified()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Make hard-coded Unsplash <img> tags responsive.
+
+    python apply_image_srcset.py [path ...] [--hero FILE ...] [--dry-run]
+
+Indexes every remote image URL under the given files or directories (default
+components/), then rewrites each <img> with a literal Unsplash src: the src is
+resized to the width the image is actually drawn at, and srcSet, sizes,
+loading="lazy" and decoding="async" are added. Heroes stay eager: images
+under a "hero" element, and those in the first section of the components the
+landing view opens with (CommandCenter.tsx and Hero.tsx, or the file names
+given with --hero). See tsxtools.images for how widths are worked out. Each
+file goes through EditBuffer, so a rewrite that would unbalance a file is
+refused. Prints every image with its estimated download before and after,
+and the total estimated bytes saved.
+"""
+
+import argparse
+import os
+import sys
+
+from find_brace import iter_paths
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.fileio import report_modified
+from tsxtools.images import FIRST_SCREEN, index_images, plan_images
+
+DEFAULT = os.path.relpath(os.path.join(os.path.dirname(__file__), 'components'))
+
+
+def _kb(n):
+    return f"{n / 1024:.0f} KB"
+
+
+def rewrite(path, dry_run=False, first_screen=False):
+    """Rewrite the Unsplash <img> tags in path; returns (plans, written)."""
+    buf = EditBuffer(path)
+    text = ''.join(buf.lines)
+    plans = plan_images(text, first_screen)
+    starts = [0]
+    for line in buf.lines:
+        starts.append(starts[-1] + len(line))
+    # Bottom-up, so earlier line numbers stay valid.
+    for plan in sorted((p for p in plans if p.tag is not None), key=lambda p: p.start, reverse=True):
+        first = plan.line - 1
+        last = first + text.count('\n', plan.start, plan.end)
+        block = text[starts[first]:starts[last + 1]]
+        offset = starts[first]
+        buf.replace_lines(first, last + 1,
+                          block[:plan.start - offset] + plan.tag + block[plan.end - offset:])
+    if dry_run or not any(p.tag is not None for p in plans):
+        return plans, False
+    return plans, buf.write()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=[DEFAULT])
+    parser.add_argument('--hero', action='append', metavar='FILE',
+                        help='file name whose first section is above the fold (repeatable; '
+                             f'default {", ".join(FIRST_SCREEN)})')
+    parser.add_argument('--dry-run', action='store_true', help='report only, write nothing')
+    args = parser.parse_args(argv)
+    heroes = set(args.hero or FIRST_SCREEN)
+
+    hosts = {}
+    contexts = {}
+    old_total = new_total = 0
+    status = 0
+    for path in iter_paths(args.paths):
+        if not path.endswith(('.tsx', '.jsx')):
+            continue
+        images = index_images(path)
+        for image in images:
+            host = image.url.split('/')[2]
+            hosts[host] = hosts.get(host, 0) + 1
+            contexts[image.context] = contexts.get(image.context, 0) + 1
+        if not any('images.unsplash.com' in image.url and image.context == 'img' for image in images):
+            continue
+        plans, written = rewrite(path, args.dry_run, os.path.basename(path) in heroes)
+        for plan in plans:
+            if plan.tag is None:
+                print(f"{path}:{plan.line}: skipped ({plan.skipped})")
+                continue
+            old_total += plan.old_bytes
+            new_total += plan.new_bytes
+            kind = 'hero, eager' if plan.hero else 'lazy'
+            print(f"{path}:{plan.line}: drawn {plan.width}px ({kind}), "
+                  f"~{_kb(plan.old_bytes)} -> ~{_kb(plan.new_bytes)}")
+        if not args.dry_run and not written and any(p.tag is not None for p in plans):
+            status = 1
+
+    print(f"\nRemote image URLs: {sum(hosts.values())} "
+          f"({', '.join(f'{n} {h}' for h, n in sorted(hosts.items(), key=lambda kv: -kv[1]))}; "
+          f"{', '.join(f'{n} {c}' for c, n in sorted(contexts.items()))})")
+    print(f"Estimated transfer for rewritten <img> src: ~{_kb(old_total)} -> ~{_kb(new_total)}, "
+          f"saving ~{_kb(old_total - new_total)} before lazy loading defers the rest")
+    if not args.dry_run:
+        report_modified()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Split conditionally rendered blocks (modals, popups) into lazily loaded components.
+
+    python apply_lazy_split.py FILE [--when CONDITION | --line N] [--name NAME]
+                               [--min-bytes BYTES] [--dry-run]
+
+Without --when or --line, lists the `{condition && (...)}` blocks in FILE of
+at least --min-bytes (default 2000) with the props each would need. With
+one, moves that block into NAME.tsx next to FILE (by default the file name
+plus the condition, e.g. CommandCenterFormulas for `showFormulas`), carrying
+the imports it uses and taking everything else it reads as props, and
+renders it in place through React.lazy and <Suspense fallback={null}>; see
+tsxtools.codesplit. FILE goes through EditBuffer, so a rewrite that would
+unbalance it is refused and the new component is not written.
+"""
+
+import argparse
+import os
+import sys
+
+from tsxtools.codesplit import MIN_SIZE, find_conditionals, plan_split
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.fileio import report_modified, write_if_changed
+
+
+def _kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def apply_edits(buf, text, edits):
+    """Splice (start, end, text) edits of text into buf, bottom-up, one block per group of lines."""
+    starts = [0]
+    for line in buf.lines:
+        starts.append(starts[-1] + len(line))
+    blocks = []
+    for start, end, new in sorted(edits, key=lambda edit: edit[:2]):
+        first = text.count('\n', 0, start)
+        last = max(first, text.count('\n', 0, end - 1) if end > start else first)
+        if blocks and first <= blocks[-1][1]:
+            blocks[-1][1] = max(blocks[-1][1], last)
+            blocks[-1][2].append((start, end, new))
+        else:
+            blocks.append([first, last, [(start, end, new)]])
+    for first, last, group in reversed(blocks):
+        offset = starts[first]
+        block = text[offset:starts[last + 1]]
+        for start, end, new in reversed(group):
+            block = block[:start - offset] + new + block[end - offset:]
+        buf.replace_lines(first, last + 1, block)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path')
+    which = parser.add_mutually_exclusive_group()
+    which.add_argument('--when', metavar='CONDITION', help='the block rendered when CONDITION')
+    which.add_argument('--line', type=int, help='the block starting on line N')
+    parser.add_argument('--name', help='component name (default: file name + condition)')
+    parser.add_argument('--min-bytes', type=int, default=MIN_SIZE,
+                        help=f'smallest block to list (default {MIN_SIZE})')
+    parser.add_argument('--dry-run', action='store_true', help='report only, write nothing')
+    args = parser.parse_args(argv)
+
+    buf = EditBuffer(args.path)
+    text = ''.join(buf.lines)
+    blocks = find_conditionals(text, 0 if args.when or args.line else args.min_bytes)
+    if not args.when and not args.line:
+        for block in blocks:
+            split = plan_split(args.path, text, block)
+            print(f"{args.path}:{block.line}-{block.end_line}: {{{block.condition} && ...}} "
+                  f"{_kb(block.size)}, {len(split.props)} prop(s): "
+                  f"{', '.join(p for p, _ in split.props) or '-'}")
+        if not blocks:
+            print(f"{args.path}: no conditional blocks of {args.min_bytes} bytes or more")
+        return 0
+
+    chosen = [b for b in blocks
+              if (args.when and b.condition == args.when) or (args.line and b.line <= args.line <= b.end_line)]
+    if len(chosen) != 1:
+        what = f"--when {args.when!r}" if args.when else f"--line {args.line}"
+        print(f"ERROR: {what} matches {len(chosen)} conditional blocks in {args.path}")
+        return 1
+    block = chosen[0]
+    split = plan_split(args.path, text, block, args.name)
+    if os.path.exists(split.module):
+        print(f"ERROR: {os.path.relpath(split.module)} already exists; pick another --name")
+        return 1
+    print(f"{args.path}:{block.line}-{block.end_line}: {{{block.condition} && ...}} -> {split.name} "
+          f"({_kb(block.size)} out of {os.path.basename(args.path)}'s chunk)")
+    for prop, kind in split.props:
+        print(f"  prop {prop}: {kind or 'any'}")
+    for imp in split.imports:
+        print(f"  import {imp.local} from '{imp.source}'")
+    if split.dropped:
+        print(f"  no longer imported by {os.path.basename(args.path)}: {', '.join(split.dropped)}")
+
+    apply_edits(buf, text, split.edits)
+    if args.dry_run:
+        return 0
+    if not buf.write():
+        return 1
+    write_if_changed(os.path.relpath(split.module), split.content)
+    report_modified()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
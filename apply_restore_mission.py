@@ -6,10 +6,13 @@ Put OUR ORIGIN back as normal white section below.
 
 import os
 
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.fileio import read_template, report_modified
+
 FILE = os.path.join(os.path.dirname(__file__), 'components', 'CommandCenter.tsx')
 
-with open(FILE, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+buf = EditBuffer(FILE)
+lines = buf.lines
 
 print(f"Original file: {len(lines)} lines")
 
@@ -23,121 +26,25 @@ for i, line in enumerate(lines):
         section_end = i + 1
         break
 
+if section_start is None or section_end is None:
+    print(f"ERROR: Could not find merged section boundaries. start={section_start}, end={section_end}")
+    exit(1)
+
 print(f"Current merged section: lines {section_start+1} to {section_end}")
 
 # Replacement: OUR MISSION with photo banner + OUR ORIGIN as white section
-new_content = '''            {/* OUR MISSION — Header with photo banner background */}
-            <section id="mission" className="relative pt-36 pb-20 px-4 overflow-hidden">
-                <img 
-                    src="https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1920&h=1080&fit=crop&q=80" 
-                    alt="Regional landscape" 
-                    className="absolute inset-0 w-full h-full object-cover" 
-                />
-                <div className="absolute inset-0 bg-gradient-to-b from-slate-900/70 via-slate-900/50 to-slate-900/80" />
-                <div className="relative z-10 max-w-5xl mx-auto text-center">
-                    <p className="text-blue-400 uppercase tracking-[0.3em] text-sm mb-6 font-bold">OUR MISSION</p>
-                    <h1 className="text-4xl sm:text-5xl md:text-6xl lg:text-7xl font-light leading-tight mb-8 text-white">
-                        Strong nations are built<br />on strong regions.
-                    </h1>
-                    <p className="text-lg md:text-xl text-slate-300 max-w-3xl mx-auto leading-relaxed mb-4">
-                        Every nation depends on its regions &mdash; for food, resources, industry, and resilience. But for too long, opportunity has been decided by proximity to capital, not by fundamentals.
-                    </p>
-                    <p className="text-base md:text-lg text-slate-400 max-w-2xl mx-auto leading-relaxed mb-8">
-                        The capability is there. The potential is real. What has been missing are the tools. We built those tools.
-                    </p>
-                    <button 
-                        onClick={() => scrollToSection('bwai-search')}
-                        className="inline-flex items-center gap-3 px-10 py-4 bg-blue-600 border-2 border-blue-500 rounded-full text-white text-base font-bold hover:bg-blue-500 transition-all shadow-lg shadow-blue-600/30"
-                    >
-                        <Search size={18} />
-                        Try BW AI Search
-                    </button>
-                </div>
-            </section>
-
-            {/* OUR ORIGIN */}
-            <section className="py-10 px-4 bg-white">
-                <div className="max-w-5xl mx-auto">
-                    <p className="text-blue-600 uppercase tracking-[0.2em] text-sm mb-3 font-bold">OUR ORIGIN</p>
-                    <h2 className="text-2xl md:text-3xl font-light mb-6 text-slate-900">The Story of BWGA</h2>
-                    <div className="grid md:grid-cols-2 gap-x-8 text-base text-slate-700 leading-relaxed mb-8">
-                        <div className="space-y-3">
-                            <p>
-                                BWGA wasn&rsquo;t founded in a glass skyscraper in New York or London. It was born on the edge of the developing world, in a small coastal city where the gap between potential and opportunity is painfully clear.
-                            </p>
-                            <p>
-                                <strong>BW Global Advisory (BWGA)</strong> is an advisory practice built from firsthand experience in regional communities &mdash; places that hold real economic potential but lack the tools, connections, and institutional visibility to compete for global investment on equal footing.
-                            </p>
-                            <p>
-                                We watched regional leaders &mdash; mayors, entrepreneurs, councils &mdash; work tirelessly to attract investment. They had the vision, the drive, the raw assets.
-                            </p>
-                            <p>
-                                From that observation came the question: what if you could build a system that internalised all of that methodology &mdash; 60+ years of documented practice across 150 countries &mdash; and made it available to anyone, anywhere, instantly?
-                            </p>
-                        </div>
-                        <div className="space-y-3 mt-3 md:mt-0">
-                            <p>
-                                The practice exists because of a simple observation: <strong>every &ldquo;new idea&rdquo; is old somewhere.</strong> The 1963 Philippine Integrated Socioeconomic Plan, the 1978 Region 7 Five-Year Development Plan, Special Economic Zones across 80+ countries, PPP frameworks across 150+ nations &mdash; they all follow the same methodology. Growth poles. Investment incentives. Sectoral planning. Infrastructure corridors. The names update. The practice persists. <strong>The past is the solution library.</strong>
-                            </p>
-                            <p>
-                                <strong>BWGA Intelligence AI is the answer.</strong> It is the technology arm of BW Global Advisory. Not a chatbot. Not a search engine. Not a lookup table. It is a complete digital boardroom &mdash; a system that reasons through investment, trade, and development problems using the same depth of analysis that previously required a team of senior consultants, weeks of research, and hundreds of thousands of dollars.
-                            </p>
-                        </div>
-                    </div>
-                    <p className="text-base text-slate-700 leading-relaxed mb-8">
-                        That&rsquo;s not a criticism &mdash; it&rsquo;s the insight that made this system possible. If the answers already exist, scattered across decades and continents, then the real problem isn&rsquo;t knowledge. It&rsquo;s access. It&rsquo;s synthesis. It&rsquo;s the ability to take what worked in Shenzhen in 1980, in Penang in 1995, in Medell&iacute;n in 2004, and translate it into a strategic roadmap for a regional council staring at a blank page today.
-                    </p>
-
-                    {/* Personal Story — Brayden Walls */}
-                    <div className="bg-white border-2 border-slate-300 rounded-sm p-8 mb-8 shadow-lg">
-                        <h3 className="text-2xl font-semibold text-slate-900 mb-6">Who I am — the founder and sole developer</h3>
-                        
-                        <div className="flex flex-col md:flex-row gap-6 mb-6">
-                            <div className="md:w-2/3">
-                                <p className="text-base text-slate-700 leading-relaxed mb-4">
-                                    Hey everyone, I'm Brayden Walls, the developer behind <strong>BW NEXUS AI</strong>, and I'm thrilled to finally share this with the world. For the first time, I'm lifting the curtain on what we've built—a groundbreaking neuro-symbolic intelligence system that's not just another AI tool, but a complete rethinking of how machines can reason like humans.
-                                </p>
-                                <p className="text-base text-slate-700 leading-relaxed mb-4">
-                                    For more than 16 months, I've been living, researching, and building in a place that inspired everything you see here — the Philippines. Not in a lab. Not in a corporate office. On the ground, in the communities where economic potential is enormous but the tools to unlock it simply don't exist.
-                                </p>
-                            </div>
-                            <div className="md:w-1/3">
-                                <img src="https://images.unsplash.com/photo-1469474968028-56623f02e42e?w=600&h=400&fit=crop&q=80" alt="Regional landscape" className="w-full h-64 md:h-full object-cover rounded-sm shadow-lg" />
-                            </div>
-                        </div>
-
-                        <p className="text-base text-slate-700 leading-relaxed mb-4">
-                            I watched the same pattern repeat everywhere: ambitious businesses exploring new frontiers with incomplete information, regional governments eager for partnerships but unable to translate their advantages into investor language, unproductive meetings built on mismatched expectations. Places like Mindanao, regional Australia, communities across the Pacific — they all wanted the same thing: to be seen, to be understood, to have a fair shot.
-                        </p>
-
-                        <p className="text-base text-slate-700 leading-relaxed mb-6">
-                            So I stopped waiting for someone else to build it. I taught myself to code, studied every economic development framework I could find, and spent over a year turning that knowledge into software. What came out the other side isn't a chatbot or a dashboard — it's a complete reasoning system. One that thinks through problems the way a team of senior consultants would, but faster, cheaper, and available to anyone. What you're about to see below is what I built, how it works, and why nothing else like it exists.
-                        </p>
-
-                        <div className="bg-gradient-to-r from-slate-100 to-slate-50 border border-slate-300 rounded-sm p-6">
-                            <p className="text-lg text-slate-800 leading-relaxed italic mb-3">
-                                "Every 'new idea' is old somewhere. The child learns what the parent already knows. The past isn't historical interest. The past is the solution library."
-                            </p>
-                            <p className="text-slate-600 text-sm font-medium">— Brayden Walls, Founder & Sole Developer</p>
-                        </div>
-                    </div>
-                </div>
-            </section>
-
-'''
+new_content = read_template('mission_restore')
 
 # Replace
-del lines[section_start:section_end]
-
 new_lines = new_content.split('\n')
 new_lines = [l + '\n' for l in new_lines]
-for i, line in enumerate(new_lines):
-    lines.insert(section_start + i, line)
+buf.replace_lines(section_start, section_end, new_lines)
 
 print(f"Replaced {section_end - section_start} lines with {len(new_lines)} lines")
 
-with open(FILE, 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+if not buf.write():
+    exit(1)
+report_modified()
 
 print(f"File is now {len(lines)} lines")
 print("Done!")
@@ -73,9 +73,13 @@ export const About: React.FC = () => {
                 {/* Main Image Container */}
                 <div className="relative h-full w-full rounded-2xl overflow-hidden shadow-2xl border border-black/10 group">
                     <img 
-                        src="https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=2301" 
+                        src="https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=640" 
                         alt="Global Architecture" 
                         className="w-full h-full object-cover grayscale group-hover:grayscale-0 transition-all duration-1000 scale-100 group-hover:scale-105"
+                        srcSet="https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=400 400w, https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=640 640w, https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=828 828w, https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=1080 1080w, https://images.unsplash.com/photo-1497366216548-37526070297c?auto=format&fit=crop&q=80&w=1280 1280w"
+                        sizes="(min-width: 768px) 640px, 100vw"
+                        loading="lazy"
+                        decoding="async"
                     />
                     <div className="absolute inset-0 bg-bw-navy/20 mix-blend-multiply pointer-events-none transition-opacity duration-500 group-hover:opacity-0"></div>
                     
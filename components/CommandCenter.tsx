@@ -1,6 +1,8 @@
 ﻿import React, { useState } from 'react';
 import { ArrowRight, Shield, Users, Zap, CheckCircle2, Scale, Building2, Globe, Mail, Phone, Briefcase, TrendingUp, FileCheck, GitBranch, X, Info } from 'lucide-react';
 import DocumentModal, { type DocumentType } from './LegalDocuments';
+
+const CommandCenterFormulas = React.lazy(() => import('./CommandCenterFormulas'));
 // OSINT search removed - using unified location research
 
 // Command Center - Complete BWGA Landing Page
@@ -335,9 +337,11 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
             {/* OUR MISSION  -  Header with photo banner background */}
             <section id="mission" className="relative pt-36 pb-20 px-4 overflow-hidden">
                 <img 
-                    src="https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1920&h=1080&fit=crop&q=80" 
+                    src="https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1600&h=900&fit=crop&q=80" 
                     alt="Regional landscape" 
-                    className="absolute inset-0 w-full h-full object-cover" 
+                    className="absolute inset-0 w-full h-full object-cover"
+                    srcSet="https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=400&h=225&fit=crop&q=80 400w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=640&h=360&fit=crop&q=80 640w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=828&h=466&fit=crop&q=80 828w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1080&h=608&fit=crop&q=80 1080w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1280&h=720&fit=crop&q=80 1280w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1600&h=900&fit=crop&q=80 1600w, https://images.unsplash.com/photo-1500382017468-9049fed747ef?w=1920&h=1080&fit=crop&q=80 1920w"
+                    sizes="100vw"
                 />
                 <div className="absolute inset-0 bg-gradient-to-b from-slate-900/70 via-slate-900/50 to-slate-900/80" />
                 <div className="relative z-10 max-w-5xl mx-auto text-center">
@@ -441,7 +445,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                             </div>
                             {/* Photo (Right) */}
                             <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1497366216548-37526070297c?w=800&h=600&fit=crop&q=80" alt="The gap in current AI tools" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1497366216548-37526070297c?w=400&h=300&fit=crop&q=80" alt="The gap in current AI tools" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1497366216548-37526070297c?w=400&h=300&fit=crop&q=80 400w, https://images.unsplash.com/photo-1497366216548-37526070297c?w=640&h=480&fit=crop&q=80 640w, https://images.unsplash.com/photo-1497366216548-37526070297c?w=768&h=576&fit=crop&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                             </div>
                         </div>
 
@@ -507,7 +511,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                             </div>
                             {/* Photo (Right) */}
                             <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&w=800&h=600&q=80" alt="Regional city infrastructure and economic corridor" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&w=400&h=300&q=80" alt="Regional city infrastructure and economic corridor" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&w=400&h=300&q=80 400w, https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&w=640&h=480&q=80 640w, https://images.unsplash.com/photo-1486406146926-c627a92ad1ab?auto=format&fit=crop&w=768&h=576&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                             </div>
                         </div>
                     </div>
@@ -551,7 +555,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                         </div>
                         {/* Photo (Right) */}
                         <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                            <img src="https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=800&h=600&fit=crop&q=80" alt="Regional council meeting" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                            <img src="https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=400&h=300&fit=crop&q=80" alt="Regional council meeting" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=400&h=300&fit=crop&q=80 400w, https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=640&h=480&fit=crop&q=80 640w, https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=768&h=576&fit=crop&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                         </div>
                     </div>
                 </div>
@@ -681,7 +685,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                     <div className="mb-16">
                         <div className="group bg-white border border-slate-200 overflow-hidden shadow-sm hover:shadow-lg transition-shadow">
                             <div className="h-56 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1200&h=500&fit=crop&q=80" alt="Strategic deliverables" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1200&h=500&fit=crop&q=80" alt="Strategic deliverables" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=400&h=167&fit=crop&q=80 400w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=640&h=267&fit=crop&q=80 640w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=828&h=345&fit=crop&q=80 828w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1080&h=450&fit=crop&q=80 1080w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1200&h=500&fit=crop&q=80 1200w" sizes="(min-width: 768px) 1152px, 100vw" loading="lazy" decoding="async" />
                                 <div className="absolute inset-0 bg-gradient-to-t from-slate-900/80 to-transparent" />
                                 <div className="absolute bottom-5 left-6">
                                     <h2 className="text-2xl md:text-3xl font-bold text-white">What You Walk Away With</h2>
@@ -767,7 +771,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
 
                             {/* Photo (Right) */}
                             <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=800&h=600&fit=crop&q=80" alt="Global standards compliance" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=400&h=300&fit=crop&q=80" alt="Global standards compliance" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=400&h=300&fit=crop&q=80 400w, https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=640&h=480&fit=crop&q=80 640w, https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=768&h=576&fit=crop&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                             </div>
                         </div>
 
@@ -814,7 +818,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
 
                             {/* Photo (Right) */}
                             <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1521791136064-7986c2920216?w=800&h=500&fit=crop&q=80" alt="Partnership collaboration" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1521791136064-7986c2920216?w=400&h=250&fit=crop&q=80" alt="Partnership collaboration" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1521791136064-7986c2920216?w=400&h=250&fit=crop&q=80 400w, https://images.unsplash.com/photo-1521791136064-7986c2920216?w=640&h=400&fit=crop&q=80 640w, https://images.unsplash.com/photo-1521791136064-7986c2920216?w=768&h=480&fit=crop&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                             </div>
                         </div>
 
@@ -971,7 +975,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                             
                             {/* Photo (Right) */}
                             <div className="h-64 md:h-auto md:w-1/3 flex-shrink-0 relative overflow-hidden">
-                                <img src="https://images.unsplash.com/photo-1551434678-e076c223a692?w=800&h=600&fit=crop&q=80" alt="Intelligence platform interface" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" />
+                                <img src="https://images.unsplash.com/photo-1551434678-e076c223a692?w=400&h=300&fit=crop&q=80" alt="Intelligence platform interface" className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500" srcSet="https://images.unsplash.com/photo-1551434678-e076c223a692?w=400&h=300&fit=crop&q=80 400w, https://images.unsplash.com/photo-1551434678-e076c223a692?w=640&h=480&fit=crop&q=80 640w, https://images.unsplash.com/photo-1551434678-e076c223a692?w=768&h=576&fit=crop&q=80 768w" sizes="(min-width: 768px) 384px, 100vw" loading="lazy" decoding="async" />
                             </div>
                         </div>
 
@@ -988,9 +992,13 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                         {/* Photo Header */}
                         <div className="h-48 relative overflow-hidden flex-shrink-0">
                             <img 
-                                src="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1200&h=400&fit=crop&q=80"
+                                src="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1080&h=360&fit=crop&q=80"
                                 alt="Strategic deliverables"
                                 className="w-full h-full object-cover"
+                                srcSet="https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=400&h=133&fit=crop&q=80 400w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=640&h=213&fit=crop&q=80 640w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=828&h=276&fit=crop&q=80 828w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1080&h=360&fit=crop&q=80 1080w, https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1200&h=400&fit=crop&q=80 1200w"
+                                sizes="(min-width: 768px) 896px, 100vw"
+                                loading="lazy"
+                                decoding="async"
                             />
                             <div className="absolute inset-0 bg-gradient-to-t from-slate-900/80 via-slate-900/30 to-transparent" />
                             <button 
@@ -1468,9 +1476,13 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
                         {/* Photo Header */}
                         <div className="h-52 relative overflow-hidden flex-shrink-0">
                             <img 
-                                src="https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1200&h=400&fit=crop&q=80"
+                                src="https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1080&h=360&fit=crop&q=80"
                                 alt="Systematic workflow"
                                 className="w-full h-full object-cover"
+                                srcSet="https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=400&h=133&fit=crop&q=80 400w, https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=640&h=213&fit=crop&q=80 640w, https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=828&h=276&fit=crop&q=80 828w, https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1080&h=360&fit=crop&q=80 1080w, https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1200&h=400&fit=crop&q=80 1200w"
+                                sizes="(min-width: 768px) 1024px, 100vw"
+                                loading="lazy"
+                                decoding="async"
                             />
                             <div className="absolute inset-0 bg-gradient-to-t from-slate-900/85 via-slate-900/40 to-transparent" />
                             <button 
@@ -2691,7 +2703,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
 
                         {/* Photo Banner  -  Strategic Planning */}
                         <div className="w-full h-40 md:h-52 relative overflow-hidden">
-                            <img src="https://images.unsplash.com/photo-1552664730-d307ca884978?w=1920&h=400&fit=crop&q=80" alt="Strategic planning session" className="w-full h-full object-cover" />
+                            <img src="https://images.unsplash.com/photo-1552664730-d307ca884978?w=1080&h=225&fit=crop&q=80" alt="Strategic planning session" className="w-full h-full object-cover" srcSet="https://images.unsplash.com/photo-1552664730-d307ca884978?w=400&h=83&fit=crop&q=80 400w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=640&h=133&fit=crop&q=80 640w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=828&h=172&fit=crop&q=80 828w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=1080&h=225&fit=crop&q=80 1080w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=1280&h=267&fit=crop&q=80 1280w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=1600&h=333&fit=crop&q=80 1600w, https://images.unsplash.com/photo-1552664730-d307ca884978?w=1792&h=373&fit=crop&q=80 1792w" sizes="(min-width: 768px) 896px, 100vw" loading="lazy" decoding="async" />
                             <div className="absolute inset-0 bg-gradient-to-r from-slate-900/40 to-slate-900/10" />
                         </div>
 
@@ -3272,426 +3284,7 @@ const CommandCenter: React.FC<CommandCenterProps> = ({ onEnterPlatform, onOpenGl
 
             {/* Full Architecture & Formulas Popup */}
             {showFormulas && (
-                <div className="fixed inset-0 z-50 flex items-start justify-center overflow-y-auto bg-black/70 backdrop-blur-sm p-4" onClick={() => setShowFormulas(false)}>
-                    <div className="bg-white rounded-lg shadow-2xl max-w-5xl w-full my-8 relative" onClick={(e) => e.stopPropagation()}>
-                        {/* Popup header */}
-                        <div className="sticky top-0 z-10 bg-gradient-to-r from-slate-900 to-slate-800 rounded-t-lg px-8 py-6 flex items-center justify-between">
-                            <div>
-                                <p className="text-blue-400 uppercase tracking-[0.2em] text-sm font-bold mb-1">NSIL Runtime - How It Thinks Now</p>
-                                <h3 className="text-2xl font-bold text-white">Inside the NSIL &mdash; Current Layers, Formulas &amp; Engines</h3>
-                            </div>
-                            <button onClick={() => setShowFormulas(false)} className="text-slate-400 hover:text-white transition-colors p-2">
-                                <X size={24} />
-                            </button>
-                        </div>
-                        {/* Popup body */}
-                        <div className="p-6 md:p-8 space-y-6 text-sm text-slate-700 leading-relaxed">
-
-                            <div className="bg-blue-50 border-l-4 border-blue-400 p-4 rounded-sm mb-6">
-                                <p className="text-sm text-slate-900 font-semibold mb-2">BW AI: Current Intelligence Architecture</p>
-                                <p className="text-sm text-slate-700">
-                                    This is <strong>how the system thinks today.</strong> Every input enters a deterministic 10-layer pipeline with adaptive multi-phase intake, a Regional Development Kernel, partner intelligence scoring, causal problem-to-solution graphs, and case-method gating. The current runtime now adds <strong>streaming responses</strong>, <strong>reactive draft analysis while users type</strong>, a <strong>concurrent planner/executor timeline</strong>, and <strong>confidence + source provenance</strong> on outputs. It validates, debates, scores, stress-tests, and synthesises analysis with explicit logic and auditability.
-                                </p>
-                            </div>
-
-                            <p>The NSIL &mdash; <strong>Nexus Strategic Intelligence Layer</strong> &mdash; is a deterministic reasoning engine that combines <strong>46+ proprietary formulas</strong>, <strong>44+ intelligence engines</strong>, and <strong>12 core algorithms</strong> into a unified 10-layer pipeline, now extended with a <strong>Regional Development Kernel</strong>, <strong>Partner Intelligence Engine</strong>, <strong>Problem-to-Solution Graph</strong>, <strong>Global Data Fabric</strong>, <strong>Case Study Method Layer</strong>, and <strong>Outcome Learning Service</strong>. Implemented in <span className="font-mono text-sm bg-slate-100 px-1 rounded">services/NSILIntelligenceHub.ts</span>, it runs every analysis through computational layers in sequence, with parallelism inside each layer where dependencies allow. Same inputs, same outputs, every time. Here&rsquo;s every layer, every formula, every engine.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 0 &mdash; The Laws (Knowledge Architecture)</h4>
-                            <p>Hard-coded economic truth that the AI cannot alter. 46+ proprietary formulas defined with fixed mathematical relationships and bounded outputs, managed by a DAG Scheduler (<span className="font-mono text-sm bg-slate-100 px-1 rounded">DAGScheduler.ts</span>). The scheduler maps every formula into a directed acyclic graph across 5 execution levels &mdash; Level 0 runs PRI, CRI, BARNA, and TCO in parallel; Level 1 feeds into SPI, RROI, NVI, RNI, CAP; Level 2 produces SEAM, IVAS, ESI, FRS, AGI, VCI; Level 3 creates the master Strategic Confidence Framework (SCF); Level 4 runs 8 autonomous intelligence indices. Results are memoised &mdash; no formula executes twice.</p>
-
-                            <p>Three examples of what these formulas do: <strong>SPI</strong> (Strategic Positioning Index) quantifies market dominance by weighting political risk against country risk with growth-adjusted positioning. <strong>RROI</strong> (Risk-Adjusted Return on Investment) runs Monte Carlo propagation across probability-weighted scenarios &mdash; real-world variance, not a single optimistic projection. <strong>SEAM</strong> (Strategic Ethical Alignment Matrix) cross-references strategy against policy frameworks and stakeholder impact.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 1 &mdash; The Shield (Input Validation)</h4>
-                            <p>A SAT Contradiction Solver I wrote (<span className="font-mono text-sm bg-slate-100 px-1 rounded">SATContradictionSolver.ts</span>) converts inputs into propositional logic &mdash; conjunctive normal form &mdash; and runs a DPLL-based satisfiability check. Catches contradictions like claiming low risk while expecting 40%+ ROI, targeting global expansion on a small budget, or combining conservative strategy with aggressive growth targets. Each contradiction is classified by severity.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 2 &mdash; The Boardroom (Multi-Agent Debate)</h4>
-                            <p>Five adversarial personas &mdash; Skeptic (1.2x weight), Advocate, Regulator, Accountant, and Operator &mdash; conduct a structured Bayesian debate (<span className="font-mono text-sm bg-slate-100 px-1 rounded">BayesianDebateEngine.ts</span>). Each votes across four outcomes: proceed, pause, restructure, or reject. Beliefs update via Bayesian inference. Early stopping at 0.75 posterior probability or 0.02 belief delta. Disagreements resolved through Nash bargaining. Every persona&rsquo;s reasoning preserved in the audit trail.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 3 &mdash; The Engine (Formula Scoring)</h4>
-                            <p>The DAG Scheduler executes the full 46+ formula suite with typed inputs, bounded outputs, component breakdowns, and execution timing. Results flow into a <span className="font-mono text-sm bg-slate-100 px-1 rounded">CompositeScoreService</span> that normalises raw data against region-specific baselines. Deterministic jitter from hash-based seeding ensures reproducibility.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 4 &mdash; Stress Testing (Scenario Simulation)</h4>
-                            <p>The Scenario Simulation Engine (<span className="font-mono text-sm bg-slate-100 px-1 rounded">ScenarioSimulationEngine.ts</span>) builds causal graphs with feedback loops, runs Monte Carlo propagation through multi-step chains with non-linear dynamics, and simulates forward outcomes using Markov chain state transitions across economic, political, social, environmental, technological, and regulatory categories.</p>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 5 &mdash; The Brain (Human Cognition Engine)</h4>
-                            <p>The Human Cognition Engine I wrote (<span className="font-mono text-sm bg-slate-100 px-1 rounded">HumanCognitionEngine.ts</span>) implements 7 neuroscience models as mathematical implementations:</p>
-                            <ol className="list-decimal list-inside space-y-1 pl-2">
-                                <li><strong>Wilson-Cowan Neural Field Dynamics</strong> &mdash; Differential equations on excitatory/inhibitory neuron populations on a 50&times;50 spatial grid. Parameters: w_ee=1.5, w_ei=-1.0, w_ie=1.0, w_ii=-0.5, dt=0.01.</li>
-                                <li><strong>Predictive Coding (Rao &amp; Ballard)</strong> &mdash; 3-level hierarchical belief updating with prediction error minimisation. Learning rate 0.1.</li>
-                                <li><strong>Free Energy Principle (Friston)</strong> &mdash; Variational inference across 8 candidate policies, discount factor &gamma;=0.95.</li>
-                                <li><strong>Attention Models (Itti &amp; Koch)</strong> &mdash; Salience maps with intensity/colour/orientation weights. Winner-take-all with inhibition of return (0.7).</li>
-                                <li><strong>Emotional Processing</strong> &mdash; Neurovisceral integration theory, emotional inertia (0.8), autonomic coupling (0.6).</li>
-                                <li><strong>Global Workspace Theory</strong> &mdash; Coalition formation with ignition threshold 0.6. Information broadcasting across cognitive subsystems.</li>
-                                <li><strong>Baddeley&rsquo;s Working Memory</strong> &mdash; Phonological decay 0.05, visual decay 0.03, rehearsal benefit 0.2.</li>
-                            </ol>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Layer 6 &mdash; Autonomous Intelligence (8 Engines)</h4>
-                            <ul className="list-disc list-inside space-y-1 pl-2">
-                                <li><strong>Creative Synthesis</strong> &mdash; Koestler&rsquo;s bisociation theory + Fauconnier &amp; Turner conceptual blending.</li>
-                                <li><strong>Cross-Domain Transfer</strong> &mdash; Maps biology, physics, engineering onto economics via Gentner&rsquo;s structure-mapping theory.</li>
-                                <li><strong>Autonomous Goal</strong> &mdash; Detects emergent strategic goals from top-level index scores.</li>
-                                <li><strong>Ethical Reasoning</strong> &mdash; Multi-stakeholder utility, Rawlsian fairness, Stern Review discount rates (&le;1.4%). Every recommendation must pass this gate.</li>
-                                <li><strong>Self-Evolving Algorithm</strong> &mdash; Online gradient descent w_t+1 = w_t - &eta;&nabla;L, Thompson sampling, mutation-selection with full rollback.</li>
-                                <li><strong>Adaptive Learning</strong> &mdash; Bayesian belief updates from outcome feedback.</li>
-                                <li><strong>Emotional Intelligence</strong> &mdash; Prospect Theory + Russell&rsquo;s Circumplex Model for stakeholder dynamics.</li>
-                                <li><strong>Scenario Simulation</strong> &mdash; 5,000 Monte Carlo runs with causal loop modelling and Markov state transitions.</li>
-                            </ul>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-4">Output Synthesis & Document Intelligence (Layer 8)</h4>
-                            <p className="text-sm text-slate-700 mb-3">The output layer generates institutional-grade deliverables with full traceability:</p>
-                            <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600 mb-4">
-                                <li><strong>156+ Letter Templates</strong> &mdash; Pre-structured letters for recommendations, objections, escalations, negotiations, and stakeholder communications, now selectable with letters-only generation paths.</li>
-                                <li><strong>247+ Document Outputs Across 15 Categories</strong> &mdash; Executive summaries, risk assessments, counterfactual analysis reports, persona debate transcripts, financial stress tests, governance audits, regulatory compliance dossiers, market intelligence briefs, implementation roadmaps, and case study comparisons, with adaptive length control.</li>
-                                <li><strong>Case Study Intelligence</strong> &mdash; Upload any past deal, project, or decision. The system applies NSIL analysis retroactively: full SPI/RROI/SEAM breakdown with what-if scenarios showing how outcomes could have changed.</li>
-                                <li><strong>Provenance & Auditability</strong> &mdash; Every number in every document traces back to source data, formula component, neuroscience model, or autonomous engine decision. Full breadcrumb trail for regulators, auditors, boards.</li>
-                            </ul>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Advanced User Analysis (Reflexive Intelligence Layer)</h4>
-                            <p className="text-sm text-slate-700 mb-3">Seven specialized engines that analyse YOU, not just the situation:</p>
-                            <div className="space-y-2 text-sm text-slate-600 mb-4">
-                                <div>
-                                    <strong>User Signal Decoder</strong> &mdash; Shannon entropy analysis of narrative patterns. Detects repetition (uncertainty), avoidance (hidden concerns), emotional emphasis (priority signals). Acts as mirror to surface unspoken decision drivers.
-                                </div>
-                                <div>
-                                    <strong>Internal Echo Detector</strong> &mdash; Prevents confirmation bias inside the machine itself. Flags when NSIL's own conclusions align too strongly with your stated preferences-runs explicit contradiction checks.
-                                </div>
-                                <div>
-                                    <strong>Investment Lifecycle Mapper</strong> &mdash; Identifies project stage (pre-launch, scaling, plateau, exit) and adjusts analytical framework. Early-stage deals need different risk tolerance than late-stage exits.
-                                </div>
-                                <div>
-                                    <strong>Regional Mirroring Engine</strong> &mdash; Finds structural twin regions via 6-dimensional structure-mapping (economy, governance, geography, culture, infrastructure, regulation). Surfaces hidden analogues for precedent learning.
-                                </div>
-                                <div>
-                                    <strong>Regional Identity Decoder</strong> &mdash; Detects when authentic organizational or regional identity has been replaced with generic marketing language. Flags inconsistencies between declared values and actual investment patterns.
-                                </div>
-                                <div>
-                                    <strong>Latent Advantage Miner</strong> &mdash; Surfaces casually mentioned assets (a partner relationship, a minority stakeholder, past technical work) that have real strategic significance. Extracts hidden optionality.
-                                </div>
-                                <div>
-                                    <strong>Universal Translation Layer</strong> &mdash; Translates NSIL findings for 5 audiences simultaneously: investor language (risk/return), government language (compliance/impact), community language (benefit/fairness), partner language (synergy/capability), executive language (execution/timeline).
-                                </div>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Performance Optimizations Across the Pipeline</h4>
-                            <p className="text-sm text-slate-700 mb-2">The system implements 4 critical speed improvements without sacrificing analytical depth:</p>
-                            <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600 mb-4">
-                                <li><strong>Memory Retrieval (10-50x faster)</strong> &mdash; Vector Memory Index uses approximate nearest neighbour search instead of linear scan. Finds analogous cases in milliseconds vs seconds.</li>
-                                <li><strong>Formula Execution (3-5x faster)</strong> &mdash; DAG Scheduler parallelizes independent formula computations. Level 0 runs 4 formulas simultaneously; cascades through 5 levels with smart dependency resolution.</li>
-                                <li><strong>Debate Early Stopping (2-3x faster)</strong> &mdash; Bayesian Debate Engine terminates when posterior probability reaches 0.75 or belief delta drops below 0.02. No wasted rounds on foregone conclusions.</li>
-                                <li><strong>Derivative Index Caching (2-4x faster)</strong> &mdash; Lazy Evaluation Engine computes secondary indices only on demand. If you don't ask for a specific breakdown, it never runs.</li>
-                            </ul>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-4 border-t-2 border-blue-200 mt-6">v7.0 &mdash; Regional Development Kernel</h4>
-                            <p className="text-sm text-slate-700 mb-3">The central orchestrator for global regional problem-solving. Every entry path in the system &mdash; UI, ReportOrchestrator, DecisionPipeline, AutonomousOrchestrator, MultiAgentOrchestrator &mdash; now runs through the Regional Development Kernel before generating output.</p>
-                            <div className="bg-blue-50/60 border border-blue-200 rounded-sm p-4 mb-4">
-                                <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600">
-                                    <li><strong>RegionalDevelopmentOrchestrator</strong> &mdash; Takes region profile, sector, constraints, funding envelope, governance context, country/jurisdiction, objective, current matter, evidence, and partner candidates. Returns interventions, partners, execution plan, causal graph, data fabric snapshot, governance readiness score, and analyst notes.</li>
-                                    <li><strong>Partner Intelligence Engine</strong> &mdash; Ranks ideal partners using Partner Fit, Delivery Reliability, Policy Alignment, and Local Legitimacy indices blended with PVI/CIS/CCS/RFI/SRA/FRS. Each partner gets a full score breakdown and rationale. Governance, banking, private sector, NGO, and multilateral partners scored equally.</li>
-                                    <li><strong>Problem-to-Solution Graph</strong> &mdash; Builds a causal graph from case evidence. Maps root causes, bottlenecks, and leverage points to interventions and required documents/letters. Surfaces hidden structural dependencies that narrative analysis misses.</li>
-                                    <li><strong>Global Data Fabric</strong> &mdash; Signal ingestion scaffold with country/jurisdiction normalization. Policy, macro, and trade signals each scored for confidence (0-100) and freshness (hours since update). Regional kernel blocks output when data confidence drops below threshold.</li>
-                                    <li><strong>Outcome Learning Service</strong> &mdash; Tracks recommended vs actual outcomes across cases. Adjusts governance thresholds and ranking bias over time. Feeds back into Partner Intelligence rankings and intervention prioritization.</li>
-                                </ul>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-2">v7.0 &mdash; Case Study Method Layer</h4>
-                            <p className="text-sm text-slate-700 mb-3">Before any report generates, five methodological gates must be satisfied:</p>
-                            <ol className="list-decimal list-inside space-y-1 pl-2 text-sm text-slate-600 mb-4">
-                                <li><strong>Boundary Clarity</strong> &mdash; Problem statement must exceed 60 characters of meaningful scope definition.</li>
-                                <li><strong>Objective Quality</strong> &mdash; Strategic intent must exceed 20 characters with measurable outcomes.</li>
-                                <li><strong>Evidence Sufficiency</strong> &mdash; Quantitative data, precedent, or structured analysis must be present.</li>
-                                <li><strong>Rival Explanations</strong> &mdash; At least one alternative hypothesis or counter-argument must be documented.</li>
-                                <li><strong>Implementation Feasibility</strong> &mdash; Timeline, resource allocation, and execution pathway must be defined.</li>
-                            </ol>
-                            <p className="text-sm text-slate-700 mb-4">If any gate fails, the system blocks generation and provides specific remediation steps. This is enforced across all entry paths: UI generation, ReportOrchestrator, DecisionPipeline, and autonomous loops.</p>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-2">v7.0 &mdash; 8 Global Issue Packs</h4>
-                            <p className="text-sm text-slate-700 mb-3">Domain-specific intelligence scaffolds that activate contextual knowledge, policy frameworks, typical interventions, and partner profiles for the world&rsquo;s most critical development challenges:</p>
-                            <div className="grid md:grid-cols-2 gap-2 mb-4">
-                                <ul className="space-y-1 text-sm text-slate-600">
-                                    <li>&bull; <strong>Water Security</strong> &mdash; Infrastructure, governance, cross-border water rights, desalination, conservation</li>
-                                    <li>&bull; <strong>Energy Transition</strong> &mdash; Renewable integration, grid modernization, storage, carbon markets</li>
-                                    <li>&bull; <strong>Logistics Corridors</strong> &mdash; Trade route optimization, port development, supply chain resilience</li>
-                                    <li>&bull; <strong>Housing Systems</strong> &mdash; Affordable housing policy, construction technology, urban planning</li>
-                                </ul>
-                                <ul className="space-y-1 text-sm text-slate-600">
-                                    <li>&bull; <strong>Health Systems</strong> &mdash; Healthcare infrastructure, pharmaceutical access, pandemic resilience</li>
-                                    <li>&bull; <strong>Digital Infrastructure</strong> &mdash; Connectivity, data sovereignty, digital identity, fintech</li>
-                                    <li>&bull; <strong>Workforce Transition</strong> &mdash; Skills development, automation readiness, migration economics</li>
-                                    <li>&bull; <strong>Climate Resilience</strong> &mdash; Adaptation infrastructure, disaster response, insurance, carbon capture</li>
-                                </ul>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-4 border-t-2 border-blue-200 mt-6">Entity Intelligence Pipeline &mdash; Real-Time Entity Verification</h4>
-                            <p className="text-sm text-slate-700 mb-3">When any entity (company, partner, organisation, individual) is mentioned in a query, the Entity Intelligence Pipeline fires automatically. It runs 7 verification sources in parallel and produces a composite assessment:</p>
-                            <div className="bg-amber-50/60 border border-amber-200 rounded-sm p-4 mb-4">
-                                <div className="grid md:grid-cols-2 gap-2">
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>OpenSanctions</strong> &mdash; OFAC, UN, EU, UK, INTERPOL sanctions + PEP screening with clearance levels</li>
-                                        <li>&bull; <strong>OpenCorporates</strong> &mdash; Corporate registry verification: jurisdiction, incorporation date, active status</li>
-                                        <li>&bull; <strong>GLEIF</strong> &mdash; Legal Entity Identifier (LEI) lookup: ownership chain, parent entities, registration status</li>
-                                        <li>&bull; <strong>V-Dem v14</strong> &mdash; Academic governance scores (University of Gothenburg): rule of law, corruption control, civil liberties, democratic quality across 40+ countries</li>
-                                    </ul>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>Tavily</strong> &mdash; Deep AI-synthesised web research with source attribution for entity background</li>
-                                        <li>&bull; <strong>Brave Search</strong> &mdash; Independent non-Google web index providing unbiased search results</li>
-                                        <li>&bull; <strong>GDELT</strong> &mdash; Global news monitoring with tone/sentiment analysis for media coverage assessment</li>
-                                    </ul>
-                                </div>
-                                <p className="text-sm text-slate-700 mt-3">The pipeline produces a composite <strong>Entity Intelligence Report</strong>: verified/unverified status, sanctions clearance, PEP flags, jurisdiction governance band, media sentiment, and an overall risk rating (LOW/MODERATE/HIGH/CRITICAL). Every claim traces to its data source. When a source returns no data, the system says so.</p>
-                            </div>
-                            <p className="text-sm text-slate-700 mb-3">The system also supports <strong>Groq function calling</strong> &mdash; 4 tool schemas (<code className="text-xs bg-slate-100 px-1 rounded">screen_entity</code>, <code className="text-xs bg-slate-100 px-1 rounded">lookup_company</code>, <code className="text-xs bg-slate-100 px-1 rounded">research_entity</code>, <code className="text-xs bg-slate-100 px-1 rounded">compare_governance</code>) allow the AI to autonomously decide which verification tools to invoke during a conversation, executing up to 3 rounds of tool use before producing a final answer.</p>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-4 border-t-2 border-blue-200 mt-6">Live External Intelligence Layer &mdash; 15+ Global Data APIs</h4>
-                            <p className="text-sm text-slate-700 mb-3">The system now connects to live external data sources on every analysis. No simulated data, no cached proxies &mdash; real-time signals from authoritative global sources:</p>
-                            <div className="bg-emerald-50/60 border border-emerald-200 rounded-sm p-4 mb-4">
-                                <div className="grid md:grid-cols-2 gap-2">
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>ACLED</strong> &mdash; Real-time conflict &amp; political violence events with severity scoring and risk levels</li>
-                                        <li>&bull; <strong>OpenSanctions</strong> &mdash; Entity screening against OFAC, UN, EU, UK, INTERPOL + PEP databases</li>
-                                        <li>&bull; <strong>OpenCorporates</strong> &mdash; Company verification: jurisdiction, status, incorporation date, registry data</li>
-                                        <li>&bull; <strong>GLEIF</strong> &mdash; Legal Entity Identifier lookups: LEI codes, ownership chains, registration status</li>
-                                        <li>&bull; <strong>V-Dem v14</strong> &mdash; Academic governance scores: 12+ dimensions for 40+ countries (University of Gothenburg)</li>
-                                        <li>&bull; <strong>UN Comtrade</strong> &mdash; Bilateral trade statistics: exports, imports, trade balance by country pair</li>
-                                        <li>&bull; <strong>GDELT</strong> &mdash; Global news event monitoring with geolocation and sentiment analysis</li>
-                                        <li>&bull; <strong>World Bank</strong> &mdash; GDP, inflation, trade openness, governance indicators by country</li>
-                                    </ul>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>Brave Search</strong> &mdash; Independent non-Google web index for unbiased entity and market research</li>
-                                        <li>&bull; <strong>Tavily</strong> &mdash; Deep AI-synthesised web research with source attribution and confidence scores</li>
-                                        <li>&bull; <strong>Wikidata</strong> &mdash; Structured knowledge graph via SPARQL queries for entities, relationships, facts</li>
-                                        <li>&bull; <strong>Wikipedia</strong> &mdash; Encyclopedic context and summaries for cities, regions, organisations</li>
-                                        <li>&bull; <strong>REST Countries</strong> &mdash; Country profiles: population, area, borders, currencies, languages, timezones</li>
-                                        <li>&bull; <strong>DuckDuckGo</strong> &mdash; Live web search for current events and breaking developments</li>
-                                    </ul>
-                                </div>
-                                <p className="text-sm text-slate-700 mt-3">Every data point carries a <strong>freshness timestamp</strong> and <strong>confidence score</strong>. The Regional Development Kernel blocks output when data confidence drops below threshold. All sources are queried in parallel via the Brain Integration Service and Entity Intelligence Pipeline.</p>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-2">Brain Integration Service &mdash; 44-Engine Parallel Brain</h4>
-                            <p className="text-sm text-slate-700 mb-3">Every query fires 44+ engines simultaneously via <code className="text-xs bg-slate-100 px-1 rounded">Promise.allSettled</code>. The Brain Integration Service is the runtime core that sits between your input and the AI response:</p>
-                            <div className="bg-blue-50/60 border border-blue-200 rounded-sm p-4 mb-4">
-                                <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600">
-                                    <li><strong>Formula indices</strong> &mdash; All 46+ proprietary formulas via CompositeScoreService</li>
-                                    <li><strong>Regional Development Kernel</strong> &mdash; Interventions, partners, causal graphs, governance readiness</li>
-                                    <li><strong>Decision Pipeline</strong> &mdash; Structured decision packets with ranked strategic options</li>
-                                    <li><strong>Domain Agent Synthesis</strong> &mdash; Gov Policy, Banking, Corporate, Market, Risk, Historical agents</li>
-                                    <li><strong>Persona Engine</strong> &mdash; Skeptic, Advocate, Regulator, Accountant debate</li>
-                                    <li><strong>ReactiveIntelligenceEngine</strong> &mdash; Opportunity detection + live risk monitoring</li>
-                                    <li><strong>GlobalIssueResolver</strong> &mdash; Universal problem-solver with root cause analysis</li>
-                                    <li><strong>SelfImprovementEngine</strong> &mdash; Runtime weight tuning with drift detection and rollback</li>
-                                    <li><strong>ResearchEcosystemScoringService</strong> &mdash; TAI/ICI/ERS scoring with confidence calibration, integrated into runtime adjudication</li>
-                                    <li><strong>ACLED, OpenSanctions, UN Comtrade, Tavily</strong> &mdash; Live external data agents</li>
-                                    <li><strong>OSINT search</strong> &mdash; Open-source intelligence for country/org context</li>
-                                    <li><strong>Derived indices</strong> &mdash; PRI (Political Risk), TCO (Total Cost), CRI (Country Risk)</li>
-                                </ul>
-                                <p className="text-sm text-slate-700 mt-3">Engines that fail gracefully degrade without blocking the rest. Results are unpacked, merged, and injected into a unified strategic prompt with full source attribution.</p>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-blue-800 pt-2">Self-Learning &amp; Self-Improvement Loop</h4>
-                            <p className="text-sm text-slate-700 mb-3">The system continuously improves from its own operations:</p>
-                            <div className="bg-violet-50/60 border border-violet-200 rounded-sm p-4 mb-4">
-                                <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600">
-                                    <li><strong>SelfImprovementEngine</strong> &mdash; Records per-run performance metrics, detects accuracy drift via Welch&rsquo;s t-test, auto-tunes formula weights with full rollback safety</li>
-                                    <li><strong>selfLearningEngine</strong> &mdash; EventBus-driven continuous learning: listens for analysis completions, user feedback, formula executions, and agent outcomes to build institutional knowledge over time</li>
-                                    <li><strong>Adaptive Query Routing</strong> &mdash; Detects query type (info question, person lookup, location research, complex analysis) and routes to the optimal processing path automatically</li>
-                                    <li><strong>World Knowledge Grants</strong> &mdash; Every AI turn receives a system-level knowledge instruction, ensuring accurate factual responses for general questions alongside deep NSIL analysis</li>
-                                </ul>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-2">Implementation Inventory</h4>
-                            <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-600 mb-6">
-                                <li><strong>55,000+ lines of TypeScript code</strong> across 165+ service files</li>
-                                <li><strong>Fully implemented, no placeholders:</strong> Every engine has working code, type definitions, and unit test coverage</li>
-                                <li><strong>15+ live external data APIs:</strong> ACLED, OpenSanctions, OpenCorporates, GLEIF, V-Dem, Brave Search, UN Comtrade, GDELT, Tavily, World Bank, Wikidata, Wikipedia, REST Countries, DuckDuckGo</li>
-                                <li><strong>Entity Intelligence Pipeline:</strong> 7-source parallel entity verification with composite risk assessment, sanctions screening, corporate registry, LEI lookup, governance scoring, news sentiment</li>
-                                <li><strong>Published mathematical foundations:</strong> Each model cites academic sources (Wilson-Cowan, Rao &amp; Ballard, Friston, Gentner, etc.)</li>
-                                <li><strong>Deterministic seeding:</strong> Hash-based RNG ensures reproducibility. Same input, same output, every time, across machines and deployments</li>
-                                <li><strong>Audit-ready architecture:</strong> Every decision traces to source data, formula component, neuroscience model, or autonomous engine with full confidence intervals</li>
-                            </ul>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-4">The 12 Core Algorithm Engines</h4>
-                            <p className="mb-3">Beyond the intelligence layers, 12 specialised algorithm engines power the system&rsquo;s advanced capabilities:</p>
-                            <div className="grid md:grid-cols-2 gap-3 mb-6">
-                                <div>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>DAG Scheduler</strong> &mdash; Directed acyclic graph execution across 5 formula levels with memoisation. Performance: <em>3-5x speedup</em> vs sequential execution.</li>
-                                        <li>&bull; <strong>SAT Contradiction Solver</strong> &mdash; DPLL-based satisfiability checking via Boolean satisfiability.</li>
-                                        <li>&bull; <strong>Bayesian Debate Engine</strong> &mdash; Multi-agent belief updating and Nash bargaining with posterior probability convergence.</li>
-                                        <li>&bull; <strong>Human Cognition Engine</strong> &mdash; 7 neuroscience models running live with real-time parameter tuning.</li>
-                                        <li>&bull; <strong>Deep Thinking Engine</strong> &mdash; Chain-of-Thought &amp; Tree-of-Thoughts reasoning (801 lines, full token replay).</li>
-                                        <li>&bull; <strong>Vector Memory Index</strong> &mdash; Approximate nearest neighbour search with cosine similarity. Performance: <em>10-50x speedup</em> vs linear scan.</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li>&bull; <strong>Frontier Intelligence Engine</strong> &mdash; Multi-round negotiation, persona evolution, institutional memory (568 lines).</li>
-                                        <li>&bull; <strong>Gradient Ranking Engine</strong> &mdash; Learning-to-rank with online gradient descent and Thompson sampling.</li>
-                                        <li>&bull; <strong>Optimized Agentic Brain</strong> &mdash; High-performance multi-agent coordination with rollback safety.</li>
-                                        <li>&bull; <strong>Decision Tree Synthesizer</strong> &mdash; Automated decision path generation from index scores.</li>
-                                        <li>&bull; <strong>Lazy Evaluation Engine</strong> &mdash; On-demand derivative index computation. Performance: <em>2-4x speedup</em> on secondary indices.</li>
-                                        <li>&bull; <strong>Intelligent Document Generator</strong> &mdash; Context-aware template selection and population from 156 templates.</li>
-                                    </ul>
-                                </div>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-4">The Frontier Intelligence Engine (Advanced Reasoning Layer)</h4>
-                            <p className="mb-3">For complex strategic situations, the Frontier Intelligence Engine (<span className="font-mono text-sm bg-slate-100 px-1 rounded">FrontierIntelligenceEngine.ts</span>, 568 lines) adds 10 additional reasoning subsystems:</p>
-                            <div className="grid md:grid-cols-2 gap-3 mb-3">
-                                <div>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li><strong>Negotiation Simulation</strong> &mdash; Runs multi-round negotiation dialogue trees. Models counterparty strategy updates via Bayesian updating of beliefs about opponent type.</li>
-                                        <li><strong>Persona Evolution</strong> &mdash; Tracks how debate personas evolve as evidence accumulates. Updates coalition weights on each round.</li>
-                                        <li><strong>Institutional Memory</strong> &mdash; Links current decision to historical precedent database. Surface-maps similar past cases with outcome tracking.</li>
-                                        <li><strong>Regulatory Pulse</strong> &mdash; Real-time monitoring trigger for regulatory changes. Applies SPI, RROI, SEAM adjustments when signals fire.</li>
-                                        <li><strong>Synthetic Foresight</strong> &mdash; Generates plausible future scenarios via branching probability trees. Samples 5,000 Monte Carlo trajectories.</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <ul className="space-y-1 text-sm text-slate-600">
-                                        <li><strong>Stakeholder Simulation</strong> &mdash; Models how 6+ stakeholder types will react to proposals. Utility functions per stakeholder class.</li>
-                                        <li><strong>Explainability Contract</strong> &mdash; Provenance tracking for every recommendation. Links outputs to data sources, formula component breakdowns, and confidence bounds.</li>
-                                        <li><strong>Modality Fusion</strong> &mdash; Integrates multi-modal inputs (text, financials, geopolitical feeds, structural data). Resolves conflicts via information-theoretic weighting.</li>
-                                        <li><strong>What-If Sandbox</strong> &mdash; Stress-tests strategies under user-controlled perturbations. Sensitivity Analysis &amp; Tornado Charts.</li>
-                                        <li><strong>Governance Auto-Update</strong> &mdash; Self-modifying governance policies based on outcome feedback. Learns optimal decision rules via reinforcement learning.</li>
-                                    </ul>
-                                </div>
-                            </div>
-
-                            <h4 className="text-lg font-bold text-slate-900 pt-4">The 46+ Proprietary Formulas</h4>
-                            <div className="grid md:grid-cols-3 gap-3 mt-2 mb-4">
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Strategic Core Indices</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; SPI&trade; &mdash; Strategic Proof Index</li>
-                                        <li>&bull; RROI&trade; &mdash; Real Return on Intent</li>
-                                        <li>&bull; SEAM&trade; &mdash; Symbiotic Ecosystem Alignment Model</li>
-                                        <li>&bull; IVAS&trade; &mdash; Integrity, Viability, Accountability</li>
-                                        <li>&bull; SCF&trade; &mdash; Strategic Counterfactual Framework</li>
-                                        <li>&bull; PVI&trade; &mdash; Partnership Viability Index</li>
-                                        <li>&bull; RRI&trade; &mdash; Regional Resilience Index</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Evaluation Matrices (Advanced)</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; BARNA &mdash; Baseline Adaptive Risk&amp;Opportunity </li>
-                                        <li>&bull; NVI &mdash; Novelty Viability Index</li>
-                                        <li>&bull; CAP &mdash; Capacity Alignment Profile</li>
-                                        <li>&bull; AGI &mdash; Agility &amp; Growth Index</li>
-                                        <li>&bull; VCI &mdash; Volatility &amp; Change Index</li>
-                                        <li>&bull; ATI &mdash; Adaptability &amp; Transition Index</li>
-                                        <li>&bull; ESI &mdash; Ecosystem Shock Index</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Structural Assessment (Hidden)</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; ISI &mdash; Implementation Stress Index</li>
-                                        <li>&bull; OSI &mdash; Operational Sustainability Index</li>
-                                        <li>&bull; RNI &mdash; Renewal &amp; Iteration Index</li>
-                                        <li>&bull; SRA &mdash; Stakeholder Risk Assessment</li>
-                                        <li>&bull; IDV &mdash; Implementation Difficulty Variance</li>
-                                        <li>&bull; FRS &mdash; Financial Robustness Score</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Risk Formulas</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; CRPS &mdash; Composite Risk Priority Score</li>
-                                        <li>&bull; RME &mdash; Risk Mitigation Effectiveness</li>
-                                        <li>&bull; VaR &mdash; Value at Risk (95th percentile)</li>
-                                        <li>&bull; SRCI &mdash; Supply Chain Risk Index</li>
-                                        <li>&bull; PSS &mdash; Policy Shock Sensitivity</li>
-                                        <li>&bull; PRS &mdash; Political Risk Score</li>
-                                        <li>&bull; DCS &mdash; Dependency Concentration Score</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Financial Metrics</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; IRR &mdash; Internal Rate of Return</li>
-                                        <li>&bull; NPV &mdash; Net Present Value</li>
-                                        <li>&bull; WACC &mdash; Weighted Avg Cost of Capital</li>
-                                        <li>&bull; DSCR &mdash; Debt Service Coverage Ratio</li>
-                                        <li>&bull; FMS &mdash; Funding Match Score</li>
-                                        <li>&bull; ROE &mdash; Return on Equity</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Operational &amp; Execution</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; ORS &mdash; Organizational Readiness Score</li>
-                                        <li>&bull; TCS &mdash; Team Capability Score</li>
-                                        <li>&bull; EEI &mdash; Execution Efficiency Index</li>
-                                        <li>&bull; SEQ &mdash; Sequencing Integrity Score</li>
-                                        <li>&bull; CGI &mdash; Capability Gap Index</li>
-                                        <li>&bull; LCI &mdash; Leadership Confidence Index</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Market &amp; Competition</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; MPI &mdash; Market Penetration Index</li>
-                                        <li>&bull; CAI &mdash; Competitive Advantage Index</li>
-                                        <li>&bull; TAM &mdash; Total Addressable Market</li>
-                                        <li>&bull; SAM &mdash; Serviceable Available Market</li>
-                                        <li>&bull; GRI &mdash; Growth Rate Index</li>
-                                    </ul>
-                                </div>
-                                <div>
-                                    <h5 className="text-sm font-semibold text-slate-900 mb-1">Governance &amp; Integrity</h5>
-                                    <ul className="space-y-0.5 text-sm text-slate-600">
-                                        <li>&bull; GCI &mdash; Governance Confidence Index</li>
-                                        <li>&bull; CCS &mdash; Compliance Certainty Score</li>
-                                        <li>&bull; TPI &mdash; Transparency Index</li>
-                                        <li>&bull; ARI &mdash; Audit Readiness Index</li>
-                                        <li>&bull; RFI &mdash; Regulatory Friction Index</li>
-                                        <li>&bull; CIS &mdash; Counterparty Integrity Score</li>
-                                        <li>&bull; ESG &mdash; Environmental Social Governance</li>
-                                    </ul>
-                                </div>
-                            </div>
-
-                            <div className="bg-blue-50 border border-blue-200 rounded-sm p-4 mt-4">
-                                <p className="text-sm text-slate-700 font-semibold mb-2">
-                                    Complete System Architecture &mdash; Current Runtime
-                                </p>
-                                <p className="text-sm text-slate-700 mb-3">
-                                    NSIL current runtime is built on:
-                                </p>
-                                <ul className="list-disc list-inside space-y-1 pl-2 text-sm text-slate-700 mb-3">
-                                    <li><strong>44+ Specialized Intelligence Engines</strong> - Input Shield, Persona Engine, Counterfactual Engine, Outcome Tracker, Unbiased Analysis, Creative Synthesis, Cross-Domain Transfer, Autonomous Goal, Ethical Reasoning, Self-Evolving Algorithm, Adaptive Learning, Emotional Intelligence, Scenario Simulation, plus proactive and reflexive engines</li>
-                                    <li><strong>12 Core Algorithm Engines</strong> - From vector memory retrieval to frontier intelligence with negotiation simulation</li>
-                                    <li><strong>10-Layer Deterministic Pipeline</strong> - Laws &rarr; Shield &rarr; Boardroom &rarr; Engine &rarr; Stress Test &rarr; Brain &rarr; Autonomous &rarr; Proactive &rarr; Output &rarr; Reflexive</li>
-                                    <li><strong>46+ Proprietary Formulas</strong> - Strategic core indices, advanced evaluation matrices, structural assessments, risk models, financial metrics, operational scores, market analysis, governance frameworks, partner scoring, and Research Ecosystem formulas (TAI/ICI/ERS)</li>
-                                    <li><strong>7 Neuroscience Models</strong> - Wilson-Cowan, Predictive Coding, Free Energy Principle, Attention, Emotional Processing, Global Workspace, Working Memory</li>
-                                    <li><strong>44-Engine Parallel Brain</strong> - BrainIntegrationService fires adversarial reasoning, comprehensive indices, multi-agent orchestration, historical learning, NSIL hub, composite scoring, global compliance, case graphs, regional development, partner comparison, decision pipeline, document routing, IFC standards, pattern confidence, maturity scoring, problem-to-solution graphs, motivation detection, counterfactual analysis, narrative synthesis, historical parallel matching, partner intelligence, situation analysis, outcome tracking, self-learning, unbiased analysis, persona debate, derived indices, OSINT, consultant gating, reactive intelligence, global issue resolution, self-improvement, ACLED, sanctions screening, UN Comtrade, Tavily, intelligence quality gating, V-Dem governance, Research Ecosystem scoring, and failure mode governance simultaneously via Promise.allSettled</li>
-                                    <li><strong>Entity Intelligence Pipeline</strong> - 7-source parallel entity verification: OpenSanctions screening, OpenCorporates registry, GLEIF LEI lookup, V-Dem governance scoring, Tavily deep research, Brave independent search, GDELT news sentiment. Produces composite risk ratings with source accountability</li>
-                                    <li><strong>Groq Function Calling</strong> - 4 tool schemas (screen_entity, lookup_company, research_entity, compare_governance) enable the AI to autonomously invoke verification tools during conversation with up to 3 rounds of tool use</li>
-                                    <li><strong>15+ Live External Data APIs</strong> - ACLED conflict data, OpenSanctions screening, OpenCorporates, GLEIF, V-Dem v14 governance, Brave Search, UN Comtrade trade statistics, GDELT global news, World Bank indicators, Wikidata SPARQL, Wikipedia, REST Countries, DuckDuckGo web search, Tavily deep research - every data point timestamped with confidence scoring</li>
-                                    <li><strong>Regional Development Kernel</strong> - RegionalDevelopmentOrchestrator, Partner Intelligence Engine, Problem-to-Solution Graph, Global Data Fabric, Outcome Learning Service</li>
-                                    <li><strong>Case Study Method Layer</strong> - 5-gate methodological validation enforced across all entry paths before any output generates</li>
-                                    <li><strong>Reactive Agentic Runtime</strong> - Streamed responses, draft-time signal extraction, concurrent planner/executor tasks, message-level provenance confidence, adaptive query routing (info/person/location/complex analysis detection), and world knowledge grants on every turn</li>
-                                    <li><strong>Self-Learning &amp; Self-Improvement Loop</strong> - SelfImprovementEngine (runtime weight tuning with Welch&rsquo;s t-test drift detection and rollback), selfLearningEngine (EventBus-driven continuous learning from every system event), GlobalIssueResolver (universal problem-solver with root cause analysis)</li>
-                                    <li><strong>8 Global Issue Packs</strong> - Water Security, Energy Transition, Logistics Corridors, Housing Systems, Health Systems, Digital Infrastructure, Workforce Transition, Climate Resilience</li>
-                                    <li><strong>Output at Scale</strong> - 156+ letter templates, 247+ document outputs, adaptive intake-to-generation flow, full case study analysis, multi-audience translation, partner-aware institutional drafting</li>
-                                </ul>
-                                <p className="text-sm text-slate-700 italic font-semibold">
-                                    Every recommendation has a complete audit trail. Every formula has published mathematics. Every engine has working code. This is not a chatbot narrative generator &mdash; it is an operating system for institutional intelligence, regional development, and strategic translation across government, banking, and private-sector contexts. Built from ground truth. Benchmarked against real decisions. Ready for sovereign-grade deployment.
-                                </p>
-                            </div>
-                        </div>
-                        {/* Close button at bottom */}
-                        <div className="px-8 py-6 border-t border-slate-200 bg-slate-50 rounded-b-lg flex justify-end">
-                            <button 
-                                onClick={() => setShowFormulas(false)}
-                                className="px-8 py-3 bg-slate-900 text-white rounded-sm text-sm font-bold hover:bg-slate-800 transition-all"
-                            >
-                                Close
-                            </button>
-                        </div>
-                    </div>
-                </div>
+                <React.Suspense fallback={null}><CommandCenterFormulas setShowFormulas={setShowFormulas} /></React.Suspense>
             )}
 
             {showBreakthroughPopup && (
@@ -19,9 +19,11 @@ export const Hero: React.FC = () => {
             <div className="absolute inset-0 pointer-events-none">
                 <div className="absolute inset-0 bg-gradient-to-b from-white via-bw-light to-white" />
                 <img
-                    src="https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2600&q=80"
+                    src="https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1600&q=80"
                     alt="Urban Complexity"
                     className="absolute inset-0 w-full h-full object-cover opacity-[0.06] grayscale"
+                    srcSet="https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=400&q=80 400w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=640&q=80 640w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=828&q=80 828w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1080&q=80 1080w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1280&q=80 1280w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1600&q=80 1600w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1920&q=80 1920w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2400&q=80 2400w, https://images.unsplash.com/photo-1480714378408-67cf0d13bc1b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2600&q=80 2600w"
+                    sizes="100vw"
                 />
                 <div className="absolute -top-24 -left-24 w-[420px] h-[420px] bg-bw-gold/15 rounded-full blur-3xl" />
                 <div className="absolute -bottom-24 -right-24 w-[520px] h-[520px] bg-bw-navy/10 rounded-full blur-3xl" />
@@ -79,9 +79,13 @@ export const Services: React.FC = () => {
                     <div className="relative z-10 bg-stone-100 p-2 rounded-sm rotate-1 shadow-xl border border-stone-200">
                         <div className="aspect-[4/5] bg-stone-200 rounded-sm overflow-hidden relative group">
                              <img 
-                                src="https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=2342" 
+                                src="https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=640" 
                                 alt="System Architect" 
                                 className="w-full h-full object-cover grayscale contrast-125"
+                                srcSet="https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=400 400w, https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=640 640w, https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=828 828w, https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=1080 1080w, https://images.unsplash.com/photo-1507679799987-c73779587ccf?auto=format&fit=crop&q=80&w=1280 1280w"
+                                sizes="(min-width: 768px) 640px, 100vw"
+                                loading="lazy"
+                                decoding="async"
                              />
                              <div className="absolute inset-0 bg-gradient-to-t from-bw-navy via-transparent to-transparent opacity-90"></div>
                              
@@ -1,5 +1,8 @@
 import React, { useState, useMemo } from 'react';
 import { Database, Search, Filter, DollarSign, Clock, CheckCircle, AlertCircle, Globe, TrendingUp, Link2 } from 'lucide-react';
+import useLazyData from '../hooks/useLazyData';
+
+const loadAllPrograms = () => import('../data/extracted/SupportProgramsDatabase.allPrograms.json').then((m) => m.default as unknown as Program[]);
 
 interface Program {
   id: string;
@@ -53,46 +56,7 @@ const SupportProgramsDatabase: React.FC = () => {
   };
 
   // Comprehensive database of 200+ programs
-  const allPrograms: Program[] = [
-    // US Programs
-    { id: 'sba-sbir', name: 'SBA SBIR Program', provider: 'U.S. Small Business Administration', country: 'United States', type: 'Grant', industry: ['Technology', 'Healthcare', 'Defense', 'Manufacturing'], stage: 'Early-Stage', fundingAmount: 250000, fundingType: 'Phase I Grant', requirements: ['< $7M revenue', 'US-based', 'Innovative project'], timeline: '9 months', successRate: 28, complexity: 'High', description: 'Phase I grants for innovative small businesses in federal research areas', contactEmail: 'sbir@sba.gov', applicationUrl: 'www.sbir.gov' },
-    { id: 'y-combinator', name: 'Y Combinator', provider: 'Y Combinator', country: 'United States', type: 'Accelerator', industry: ['Technology', 'SaaS', 'Hardware', 'Biotech'], stage: 'Pre-Launch', fundingAmount: 125000, fundingType: 'Equity (7%)', requirements: ['Founding team', 'Early product'], timeline: '3 months', successRate: 1, complexity: 'High', description: 'Prestigious 3-month accelerator program in Mountain View', contactEmail: 'apply@ycombinator.com', applicationUrl: 'www.ycombinator.com' },
-    { id: 'raise-act', name: 'RAISE Act Tax Credit', provider: 'IRS', country: 'United States', type: 'Tax Incentive', industry: ['Manufacturing', 'Production'], stage: 'Growth', fundingAmount: 0, fundingType: '15% tax credit on payroll', requirements: ['Manufacturing/production activity', 'US-based'], timeline: 'Annual', successRate: 95, complexity: 'Medium', description: 'Research & development tax credit for domestic manufacturing and R&D activities', contactEmail: 'taxcredit@irs.gov', applicationUrl: 'www.irs.gov' },
-    { id: 'eir-program', name: 'Entrepreneur in Residence', provider: 'State Economic Development', country: 'United States', type: 'Accelerator', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 50000, fundingType: 'Stipend + mentorship', requirements: ['Committed founder', 'Market opportunity'], timeline: '6 months', successRate: 70, complexity: 'Low', description: 'Intensive mentorship program with monthly stipend for promising entrepreneurs', contactEmail: 'eir@economic-development.gov', applicationUrl: 'www.stateecd.com' },
-    { id: 'nist-sbdc', name: 'NIST Small Business Development Centers', provider: 'NIST/SBA', country: 'United States', type: 'Incubator', industry: ['All'], stage: 'Early-Stage', fundingAmount: 0, fundingType: 'Free consulting + resources', requirements: ['US-based small business', 'Growth intention'], timeline: 'Ongoing', successRate: 88, complexity: 'Low', description: 'Free business advisory services and network access across all 50 states', contactEmail: 'sbdc@nist.gov', applicationUrl: 'www.sba.gov/sbdc' },
-
-    // EU Programs
-    { id: 'horizon-europe', name: 'Horizon Europe', provider: 'EU Commission', country: 'Germany', type: 'Grant', industry: ['Technology', 'Healthcare', 'Energy', 'Agriculture'], stage: 'Growth', fundingAmount: 2500000, fundingType: 'Grant + matching', requirements: ['EU-based', 'Innovation focus'], timeline: '18-24 months', successRate: 15, complexity: 'High', description: 'EU\'s €95 billion research and innovation program for ambitious projects', contactEmail: 'horizon@ec.europa.eu', applicationUrl: 'www.research.ec.europa.eu' },
-    { id: 'kfw-startup', name: 'KfW StartUp Loan', provider: 'KfW Development Bank', country: 'Germany', type: 'Loan', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 500000, fundingType: '90% loan guarantee', requirements: ['Germany-based', 'Sound business plan'], timeline: '4 weeks', successRate: 85, complexity: 'Medium', description: 'Favorable loans for new business startups with government guarantee', contactEmail: 'startup@kfw.de', applicationUrl: 'www.kfw.de' },
-    { id: 'eic-accelerator', name: 'EIC Accelerator', provider: 'EU Innovation Council', country: 'Poland', type: 'Accelerator', industry: ['Deep Tech', 'Climate'], stage: 'Early-Stage', fundingAmount: 3000000, fundingType: 'Equity investment + grant', requirements: ['EU-based', 'Deep tech focus'], timeline: '12 months', successRate: 8, complexity: 'High', description: 'Support for breakthrough innovations and deep-tech scaling with up to €3M equity and grants', contactEmail: 'eic@ec.europa.eu', applicationUrl: 'www.eic.ec.europa.eu' },
-    { id: 'startup-france', name: 'French Tech Visa', provider: 'Bpifrance', country: 'Poland', type: 'Accelerator', industry: ['Technology', 'Digital'], stage: 'Pre-Launch', fundingAmount: 250000, fundingType: 'Equity-free funding', requirements: ['French startup', 'Innovation focus'], timeline: '2 months', successRate: 60, complexity: 'Medium', description: 'Accelerated visa process and €250k grant for promising French tech startups', contactEmail: 'visa@bpifrance.fr', applicationUrl: 'www.bpifrance.fr' },
-    { id: 'innovate-uk', name: 'Innovate UK EDGE', provider: 'Innovate UK', country: 'Poland', type: 'Grant', industry: ['All'], stage: 'Growth', fundingAmount: 500000, fundingType: '100% grant', requirements: ['UK-based', 'Innovation project'], timeline: '6 months', successRate: 45, complexity: 'High', description: 'Non-dilutive funding for UK businesses scaling innovative technology products', contactEmail: 'edge@innovateuk.gov.uk', applicationUrl: 'www.innovateuk.gov.uk' },
-
-    // Asia Programs
-    { id: 'singapore-grant', name: 'Enterprise Development Grant', provider: 'Enterprise Singapore', country: 'Singapore', type: 'Grant', industry: ['All'], stage: 'Growth', fundingAmount: 750000, fundingType: '70% co-fund', requirements: ['Singapore-based', 'Growth project'], timeline: '12 weeks', successRate: 65, complexity: 'Medium', description: 'Co-funding for business improvement and growth initiatives in Singapore', contactEmail: 'edg@enterprisesg.gov.sg', applicationUrl: 'www.enterprisesg.gov.sg' },
-    { id: 'masason-fund', name: 'Masason Fund', provider: 'SoftBank Vision Fund', country: 'Japan', type: 'Equity', industry: ['Technology', 'AI', 'Robotics'], stage: 'Growth', fundingAmount: 100000000, fundingType: 'Equity investment', requirements: ['Strong team', 'Large market'], timeline: 'Variable', successRate: 5, complexity: 'High', description: '$100M fund investing in deep-tech founders and AI/robotics companies globally', contactEmail: 'masason@softbankvf.com', applicationUrl: 'www.masason.fund' },
-    { id: 'taiwan-accelerator', name: 'Taiwan Startup Program', provider: 'Ministry of Economic Affairs', country: 'Singapore', type: 'Accelerator', industry: ['Hardware', 'Semiconductors', 'IoT'], stage: 'Early-Stage', fundingAmount: 500000, fundingType: 'Equity + stipend', requirements: ['Taiwan connection', 'Hardware focus'], timeline: '5 months', successRate: 50, complexity: 'Medium', description: 'Accelerator program for hardware startups with Taiwan government backing', contactEmail: 'startup@moea.gov.tw', applicationUrl: 'www.startupstarland.tw' },
-    { id: 'india-startup-india', name: 'India Startup India Initiative', provider: 'DPIIT', country: 'Singapore', type: 'Grant', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 100000, fundingType: 'Tax benefits + recognition', requirements: ['India-based', 'Registered startup'], timeline: 'Ongoing', successRate: 80, complexity: 'Low', description: 'Tax benefits, IP support, and regulatory benefits for registered startups in India', contactEmail: 'startup@dpiit.gov.in', applicationUrl: 'www.startupindia.gov.in' },
-    { id: 'nus-enterprise', name: 'NUS Enterprise Accelerator', provider: 'National University of Singapore', country: 'Singapore', type: 'Incubator', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 300000, fundingType: 'Mentorship + co-working', requirements: ['Founder commitment', 'Ideas stage OK'], timeline: '12 months', successRate: 75, complexity: 'Medium', description: 'University-backed incubator with deep mentorship and access to NUS resources', contactEmail: 'enterprise@nus.edu.sg', applicationUrl: 'www.nussenterprise.com' },
-
-    // Southeast Asia Programs
-    { id: 'vietnam-startup', name: 'Vietnam Digital Startup Fund', provider: 'Vietnam Ministry of Finance', country: 'Vietnam', type: 'Equity', industry: ['Digital', 'E-commerce', 'FinTech'], stage: 'Early-Stage', fundingAmount: 500000, fundingType: 'Matching capital', requirements: ['Vietnam-based', 'Digital focus'], timeline: '8 weeks', successRate: 55, complexity: 'Medium', description: 'Government co-investment fund for digital transformation startups in Vietnam', contactEmail: 'dsf@mof.gov.vn', applicationUrl: 'www.vietnamstartup.vn' },
-    { id: 'bangkok-scb10x', name: 'SCB 10X', provider: 'Siam Commercial Bank', country: 'Vietnam', type: 'Accelerator', industry: ['FinTech', 'Digital Banking'], stage: 'Early-Stage', fundingAmount: 200000, fundingType: 'Equity-free', requirements: ['FinTech focus', 'Thai market'], timeline: '4 months', successRate: 60, complexity: 'Medium', description: 'FinTech accelerator backed by Thailand\'s largest bank with mentorship and market access', contactEmail: 'apply@scb10x.com', applicationUrl: 'www.scb10x.com' },
-    { id: 'startup-thailand', name: 'Startup Thailand Initiative', provider: 'Thai Government', country: 'Vietnam', type: 'Grant', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 250000, fundingType: 'Grant + visa', requirements: ['Thailand focus', 'Innovation'], timeline: '12 weeks', successRate: 70, complexity: 'Medium', description: 'Government grants and special visa for startups relocating to Thailand', contactEmail: 'startup@thailand.go.th', applicationUrl: 'www.startupthailand.org' },
-
-    // Latin America Programs
-    { id: 'mexico-startup', name: 'Mexico Innovation Fund', provider: 'CONACYT', country: 'Mexico', type: 'Grant', industry: ['All'], stage: 'Early-Stage', fundingAmount: 500000, fundingType: 'Grant + matching', requirements: ['Mexico-based', 'Innovation focus'], timeline: '10 weeks', successRate: 45, complexity: 'High', description: 'National government support for innovative startups with matching capital', contactEmail: 'startup@conacyt.mx', applicationUrl: 'www.conacyt.mx' },
-    { id: 'brazil-startup', name: 'Brazil BNDES Social Innovation', provider: 'BNDES', country: 'Mexico', type: 'Loan', industry: ['Social Impact', 'Sustainability'], stage: 'Growth', fundingAmount: 2000000, fundingType: 'Low-interest loan', requirements: ['Social impact', 'Brazil-based'], timeline: '8 weeks', successRate: 50, complexity: 'Medium', description: 'Development bank financing for social impact and sustainable businesses', contactEmail: 'startup@bndes.gov.br', applicationUrl: 'www.bndes.gov.br' },
-
-    // Middle East Programs
-    { id: 'saudi-pif', name: 'Public Investment Fund (PIF)', provider: 'Saudi Arabia Government', country: 'Saudi Arabia', type: 'Equity', industry: ['Technology', 'Energy', 'Healthcare'], stage: 'Growth', fundingAmount: 500000000, fundingType: 'Strategic investment', requirements: ['Vision 2030 alignment', 'Large scale'], timeline: 'Variable', successRate: 2, complexity: 'High', description: '$500B+ Saudi sovereign wealth fund with strategic vision 2030 investments', contactEmail: 'pif@saudi.gov.sa', applicationUrl: 'www.pif.gov.sa' },
-    { id: 'uae-startup-hub', name: 'Dubai Business Hub', provider: 'Dubai Chamber', country: 'Saudi Arabia', type: 'Incubator', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 100000, fundingType: 'Office + mentorship', requirements: ['Business plan', 'Founder commitment'], timeline: '6 months', successRate: 80, complexity: 'Low', description: 'Free incubation space and business support in Dubai with access to MENA markets', contactEmail: 'startup@dubaichamber.ae', applicationUrl: 'www.dubaistartupschool.com' },
-
-    // Additional diverse programs
-    { id: 'mozilla-builders', name: 'Mozilla Builders', provider: 'Mozilla Corporation', country: 'United States', type: 'Grant', industry: ['Web Technology', 'Privacy', 'AI'], stage: 'Early-Stage', fundingAmount: 50000, fundingType: 'Non-dilutive grant', requirements: ['Aligned mission', 'Innovative approach'], timeline: '4 months', successRate: 30, complexity: 'Medium', description: 'Grants for builders creating a healthier internet, privacy-focused, or AI-aligned projects', contactEmail: 'builders@mozilla.org', applicationUrl: 'www.mozilla.org/builders' },
-    { id: 'ycombinator-startup-school', name: 'Y Combinator Startup School', provider: 'Y Combinator', country: 'United States', type: 'Incubator', industry: ['All'], stage: 'Pre-Launch', fundingAmount: 0, fundingType: 'Free online course', requirements: ['Email address', 'Founder commitment'], timeline: '12 weeks', successRate: 85, complexity: 'Low', description: 'Free online startup program with video lessons and community support', contactEmail: 'school@ycombinator.com', applicationUrl: 'www.startupschool.org' },
-    { id: 'ixo-impact', name: 'IXO Impact Investing', provider: 'IXO Foundation', country: 'Switzerland', type: 'Equity', industry: ['Impact', 'Sustainability', 'Climate'], stage: 'Growth', fundingAmount: 50000000, fundingType: 'Impact capital', requirements: ['SDG alignment', 'Measurable impact'], timeline: 'Variable', successRate: 20, complexity: 'High', description: 'Global impact investing fund supporting sustainable development goals', contactEmail: 'invest@ixo.world', applicationUrl: 'www.ixo.world' },
-  ];
+  const allPrograms = useLazyData<Program[]>('SupportProgramsDatabase.allPrograms', loadAllPrograms, []);
 
   const filteredPrograms = useMemo(() => {
     return allPrograms.filter(program => {
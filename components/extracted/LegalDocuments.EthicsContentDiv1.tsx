@@ -0,0 +1,103 @@
+// Static markup moved out of LegalDocuments.tsx by apply_extract_literals.py.
+const EthicsContentDiv1 = () => (
+    <div className="space-y-6">
+        <div className="text-center border-b border-slate-200 pb-6">
+            <h1 className="text-2xl font-light text-slate-900 mb-1">Ethical AI Framework</h1>
+            <p className="text-xs text-slate-400">Effective Date: 1 February 2026 * Last Updated: 9 February 2026</p>
+        </div>
+
+        <p>This Ethical AI Framework sets out the principles, safeguards, and governance structures that guide the design, development, and deployment of BW Ai. It reflects our commitment to responsible AI practices aligned with international standards.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">1. Our AI Ethics Principles</h4>
+        <p>BW Ai is built on six core ethical principles:</p>
+        <div className="grid md:grid-cols-2 gap-3 mt-3">
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Transparency</p>
+                <p className="text-xs text-slate-600">Every score, recommendation, and conclusion produced by the system is traceable to specific data inputs, formula calculations, and persona debate transcripts. No black boxes.</p>
+            </div>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Accountability</p>
+                <p className="text-xs text-slate-600">The system is a decision-support tool. Users retain full accountability for decisions. BWGA takes responsibility for the integrity of its analytical methodology.</p>
+            </div>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Fairness & Non-Discrimination</p>
+                <p className="text-xs text-slate-600">The platform is designed to serve all users equally - from regional councils in rural Australia to government agencies in Southeast Asia. Scoring formulas do not discriminate based on location, organisation size, or economic status.</p>
+            </div>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Privacy & Data Protection</p>
+                <p className="text-xs text-slate-600">User data is processed minimally and purposefully. We do not sell, share, or monetise user data. Data processing is governed by our Privacy Policy and applicable international law.</p>
+            </div>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Human Oversight</p>
+                <p className="text-xs text-slate-600">All AI outputs are advisory. The system is designed to augment human decision-making, not replace it. Critical decisions always require human review and approval.</p>
+            </div>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <p className="font-semibold text-sm text-slate-900 mb-1">Public Benefit</p>
+                <p className="text-xs text-slate-600">The platform exists to democratise access to institutional-quality strategic analysis - specifically for communities and organisations that have historically been excluded from such tools.</p>
+            </div>
+        </div>
+
+        <h4 className="font-bold text-slate-900 mt-6">2. Adversarial Design as an Ethical Safeguard</h4>
+        <p>Unlike most AI systems that optimise for agreeable responses, BW AI is designed for adversarial reasoning. The 5-persona system (Advocate, Skeptic, Regulator, Accountant, Operator) ensures that every analysis is stress-tested from multiple perspectives before a recommendation is issued.</p>
+        <p className="mt-2">This design is an ethical safeguard in itself - it prevents the system from producing uncritical, confirmation-biased outputs that could mislead users into overconfident decisions.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">3. Transparency & Auditability</h4>
+        <p>3.1. <strong>Formula Transparency:</strong> All 38 scoring formulas have defined methodology, documented inputs, and published calculation logic. Users can inspect how every score was derived.</p>
+        <p>3.2. <strong>Audit Trail:</strong> Every document produced by the Platform carries a provenance chain showing: which data inputs were used, which formulas were applied, how persona debates concluded, and what threshold gates were evaluated.</p>
+        <p>3.3. <strong>Reproducibility:</strong> Given identical inputs, the scoring pipeline produces identical outputs. There is no randomness in the formula layer - only in Monte Carlo simulation ranges, which are documented with P10/P50/P90 bands.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">4. AI Risk Classification</h4>
+        <p>Under the EU AI Act risk classification framework, BW Ai would be classified as a <strong>limited-risk</strong> system. It does not:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Make autonomous decisions that directly affect individuals' rights or safety</li>
+            <li>Perform biometric identification or social scoring</li>
+            <li>Operate critical infrastructure or medical devices</li>
+            <li>Engage in law enforcement or judicial decision-making</li>
+        </ul>
+        <p className="mt-2">It does provide decision-support for investment and strategic planning, which requires transparency obligations that we meet through our audit trail and score provenance systems.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">5. Bias Mitigation</h4>
+        <p>5.1. <strong>Formula-Based Scoring:</strong> The primary scoring pipeline uses deterministic mathematical formulas, not language-model generation. This eliminates the majority of LLM-related bias risks in the scoring layer.</p>
+        <p>5.2. <strong>Regional Equity:</strong> The platform is purpose-built for regional and underserved communities. Scoring benchmarks are calibrated for diverse economic contexts - not biased toward developed-market norms.</p>
+        <p>5.3. <strong>Persona Diversity:</strong> The adversarial persona system ensures multiple viewpoints are represented in every analysis, reducing the risk of single-perspective bias.</p>
+        <p>5.4. <strong>Continuous Calibration:</strong> The Proactive Intelligence Layer includes a backtesting calibration engine that validates scoring accuracy against real-world outcomes and flags drift.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">6. Human-in-the-Loop</h4>
+        <p>BW AI is designed with a strict human-in-the-loop philosophy:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>No output is automatically actioned - all reports, documents, and recommendations require human review</li>
+            <li>Users explicitly initiate report generation and document production</li>
+            <li>The system presents go/no-go recommendations but does not execute actions on users' behalf</li>
+            <li>The "Draft Finalization" step requires explicit user acceptance before documents are finalised</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">7. Environmental Responsibility</h4>
+        <p>7.1. We are committed to minimising the environmental impact of AI computation. The Platform uses efficient prompt engineering, response caching, and selective API calls to reduce unnecessary compute.</p>
+        <p>7.2. As we scale, we will evaluate and disclose the carbon footprint of our AI operations and pursue carbon-neutral or carbon-negative computing where feasible.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">8. International Standards Alignment</h4>
+        <p>This Ethical AI Framework is designed to align with:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li><strong>OECD AI Principles</strong> - including inclusive growth, human-centred values, transparency, robustness, and accountability</li>
+            <li><strong>UNESCO Recommendation on the Ethics of AI</strong> - proportionality, safety, fairness, sustainability, and human oversight</li>
+            <li><strong>EU AI Act</strong> - transparency requirements and risk classification</li>
+            <li><strong>NIST AI Risk Management Framework</strong> - governance, mapping, measurement, and management of AI risks</li>
+            <li><strong>Australia's AI Ethics Principles</strong> - human-centred, fairness, privacy, reliability, transparency, contestability, and accountability</li>
+            <li><strong>Philippines DICT AI Roadmap</strong> - responsible and ethical AI development aligned with national development goals</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">9. 10% Community Commitment</h4>
+        <p>BWGA commits that during the beta phase and in future commercial subscriptions, <strong>10% of every paid transaction</strong> will be directed back into initiatives that support regional development and long-term community outcomes. This commitment is a core part of our ethical framework - ensuring that the value created by this platform flows back to the communities it serves.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">10. Reporting Concerns</h4>
+        <p>If you believe the Platform has produced biased, inaccurate, or harmful outputs, or if you have any ethical concerns about the system, please contact us:</p>
+        <p className="mt-2"><strong>Ethics Contact:</strong><br />Email: brayden@bwglobaladvis.info<br />Subject line: "AI Ethics Concern"</p>
+        <p className="mt-2">All concerns will be reviewed, investigated, and responded to within 14 business days.</p>
+
+        <div className="text-center border-t border-slate-200 pt-4 mt-4">
+            <p className="text-xs text-slate-400">- End of Ethical AI Framework a"</p>
+        </div>
+    </div>
+);
+
+export default EthicsContentDiv1;
@@ -0,0 +1,114 @@
+// Static markup moved out of LegalDocuments.tsx by apply_extract_literals.py.
+const PrivacyContentDiv1 = () => (
+    <div className="space-y-6">
+        <div className="text-center border-b border-slate-200 pb-6">
+            <h1 className="text-2xl font-light text-slate-900 mb-1">Privacy Policy</h1>
+            <p className="text-xs text-slate-400">Effective Date: 1 February 2026 * Last Updated: 9 February 2026</p>
+        </div>
+
+        <p>This Privacy Policy explains how BW Global Advisory (ABN 55 978 113 300) ("BWGA", "we", "us", "our") collects, uses, stores, and protects your personal information when you use the BW Ai platform ("Platform").</p>
+        <p>This Policy is designed to comply with the Australian Privacy Act 1988, the Australian Privacy Principles (APPs), the EU General Data Protection Regulation (GDPR), the Philippines Data Privacy Act of 2012, and other applicable international data protection laws.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">1. Information We Collect</h4>
+        <p><strong>1.1. Information You Provide:</strong></p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Organisation name, entity type, industry, and country</li>
+            <li>Strategic objectives, market descriptions, partner profiles</li>
+            <li>Financial projections, risk assessments, capability descriptions</li>
+            <li>Contact information (email, phone) if voluntarily provided</li>
+            <li>Chat messages sent to the BW Consultant</li>
+            <li>Location search queries</li>
+        </ul>
+        <p className="mt-3"><strong>1.2. Information Collected Automatically:</strong></p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Browser type and version</li>
+            <li>Device type and operating system</li>
+            <li>IP address (anonymised where possible)</li>
+            <li>Pages viewed, features used, and session duration</li>
+            <li>Error logs for debugging and platform improvement</li>
+        </ul>
+        <p className="mt-3"><strong>1.3. Information from Third-Party Sources:</strong></p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Public data from government databases, World Bank, REST Countries API, and other open data sources - used to enrich location intelligence and scoring</li>
+            <li>AI-generated research content from API providers (Google Gemini, OpenAI) - processed transiently and not stored with your personal data</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">2. How We Use Your Information</h4>
+        <p>We use collected information for the following purposes:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Providing the Platform's core services: report generation, scoring, and document production</li>
+            <li>Powering the BW Consultant AI advisor with context-aware responses</li>
+            <li>Improving the Platform's accuracy, performance, and user experience</li>
+            <li>Diagnosing and fixing technical issues</li>
+            <li>Communicating with you about the Platform (only if you have provided contact details)</li>
+            <li>Complying with legal obligations</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">3. Data Storage & Security</h4>
+        <p>3.1. <strong>Local Storage:</strong> During the R&D phase, user intake data is primarily stored in your browser's local storage. This means your data remains on your device. We do not currently operate centralised user databases for intake data.</p>
+        <p>3.2. <strong>AI Service Processing:</strong> When you generate reports or use BW AI Search, your inputs are sent to AI service providers (Google Gemini, OpenAI) for processing. These transmissions are encrypted in transit (TLS 1.2+). AI providers process data according to their respective privacy policies and data processing agreements.</p>
+        <p>3.3. <strong>Security Measures:</strong> We implement appropriate technical and organisational measures to protect your information, including encryption in transit, secure API key management, and access controls. As the Platform moves toward commercial deployment, additional security certifications (ISO 27001 alignment) will be pursued.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">4. Data Sharing</h4>
+        <p>4.1. We do not sell your personal information to third parties.</p>
+        <p>4.2. We may share data with:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li><strong>AI Service Providers</strong> (Google, OpenAI) - for processing queries and generating analysis, subject to their data processing terms</li>
+            <li><strong>Public Data Sources</strong> - we access publicly available datasets; no personal data is shared with these sources</li>
+            <li><strong>Law Enforcement</strong> - only where required by law or valid legal process</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">5. Your Rights</h4>
+        <p>Depending on your jurisdiction, you may have the following rights:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li><strong>Access:</strong> Request a copy of the personal data we hold about you</li>
+            <li><strong>Correction:</strong> Request correction of inaccurate personal data</li>
+            <li><strong>Deletion:</strong> Request deletion of your personal data (subject to legal retention requirements)</li>
+            <li><strong>Portability:</strong> Request your data in a structured, machine-readable format</li>
+            <li><strong>Objection:</strong> Object to processing of your personal data for certain purposes</li>
+            <li><strong>Restriction:</strong> Request restriction of processing in certain circumstances</li>
+        </ul>
+        <p className="mt-2">To exercise these rights, contact us at brayden@bwglobaladvis.info.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">6. International Data Transfers</h4>
+        <p>6.1. The Platform is developed in Australia and the Philippines. AI processing services may be located in the United States, Europe, or other regions.</p>
+        <p>6.2. Where personal data is transferred internationally, we ensure appropriate safeguards are in place, including reliance on adequacy decisions, standard contractual clauses, or binding corporate rules as applicable.</p>
+        <p>6.3. The Platform is designed as a global application and aims to comply with data protection requirements in all jurisdictions where it operates, including but not limited to:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Australia - Privacy Act 1988, APPs</li>
+            <li>European Union - GDPR</li>
+            <li>Philippines - Data Privacy Act of 2012</li>
+            <li>United Kingdom - UK GDPR and Data Protection Act 2018</li>
+            <li>New Zealand - Privacy Act 2020</li>
+            <li>Canada - PIPEDA</li>
+            <li>United States - applicable state privacy laws (CCPA/CPRA where relevant)</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">7. Cookies & Tracking</h4>
+        <p>7.1. The Platform uses essential browser storage (localStorage) for saving your intake progress and preferences. These are functional, not tracking cookies.</p>
+        <p>7.2. We do not currently use third-party advertising cookies or cross-site tracking technologies.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">8. Data Retention</h4>
+        <p>8.1. Browser local storage data persists until you clear your browser data or explicitly reset the Platform.</p>
+        <p>8.2. AI processing data is transient - queries are processed and responses returned without permanent storage by BWGA.</p>
+        <p>8.3. Contact information voluntarily provided is retained until you request its deletion.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">9. Children's Privacy</h4>
+        <p>The Platform is not intended for use by individuals under 18 years of age. We do not knowingly collect personal information from children.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">10. Changes to This Policy</h4>
+        <p>We may update this Privacy Policy from time to time. Changes will be posted on the Platform with an updated date. Continued use constitutes acceptance.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">11. Contact & Complaints</h4>
+        <p><strong>Data Protection Contact:</strong><br />BW Global Advisory<br />Email: brayden@bwglobaladvis.info<br />Phone: +63 960 835 4283</p>
+        <p className="mt-2"><strong>Australian Privacy Complaints:</strong> If you are unsatisfied with our response, you may lodge a complaint with the Office of the Australian Information Commissioner (OAIC) at oaic.gov.au.</p>
+        <p><strong>Philippines Privacy Complaints:</strong> You may contact the National Privacy Commission (NPC) at privacy.gov.ph.</p>
+        <p><strong>EU/UK Complaints:</strong> You may lodge a complaint with your local supervisory authority.</p>
+
+        <div className="text-center border-t border-slate-200 pt-4 mt-4">
+            <p className="text-xs text-slate-400">- End of Privacy Policy a"</p>
+        </div>
+    </div>
+);
+
+export default PrivacyContentDiv1;
@@ -0,0 +1,90 @@
+// Static markup moved out of LegalDocuments.tsx by apply_extract_literals.py.
+const TermsContentDiv1 = () => (
+    <div className="space-y-6">
+        <div className="text-center border-b border-slate-200 pb-6">
+            <h1 className="text-2xl font-light text-slate-900 mb-1">Terms & Conditions</h1>
+            <p className="text-xs text-slate-400">Effective Date: 1 February 2026 * Last Updated: 9 February 2026</p>
+        </div>
+
+        <p>These Terms & Conditions ("Terms") govern your access to and use of the BW Ai platform ("Platform"), operated by BW Global Advisory, trading as a registered Australian sole trader under ABN 55 978 113 300 ("BWGA", "we", "us", "our").</p>
+        <p>By accessing or using the Platform, you agree to be bound by these Terms. If you do not agree, you must not access or use the Platform.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">1. About the Platform</h4>
+        <p>1.1. BW Ai is a strategic decision-support platform currently in active Research & Development (R&D). The Platform is developed in Melbourne, Australia, with development operations also conducted in Pagadian City, Philippines.</p>
+        <p>1.2. The Platform is designed for global use and is intended to meet international standards for data protection, AI ethics, and information security across all jurisdictions in which it operates or may operate.</p>
+        <p>1.3. The Platform is not a financial advisor, legal advisor, or licensed consulting service. All outputs are advisory and informational in nature.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">2. Eligibility</h4>
+        <p>2.1. You must be at least 18 years of age to use the Platform.</p>
+        <p>2.2. If you are using the Platform on behalf of an organisation, you represent that you have authority to bind that organisation to these Terms.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">3. Use of the Platform</h4>
+        <p>3.1. You may use the Platform for lawful strategic planning and analysis purposes only.</p>
+        <p>3.2. You agree not to:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Use the Platform for any illegal, fraudulent, or harmful purpose</li>
+            <li>Attempt to reverse-engineer, copy, or reproduce the Platform's proprietary algorithms, formulas, or architecture</li>
+            <li>Submit deliberately false or misleading data with intent to produce deceptive documents</li>
+            <li>Use outputs to misrepresent your project's viability to investors or regulatory bodies</li>
+            <li>Circumvent security measures or attempt unauthorised access</li>
+            <li>Use the Platform in any manner that could damage, disable, or impair its operation</li>
+        </ul>
+
+        <h4 className="font-bold text-slate-900 mt-6">4. Intellectual Property</h4>
+        <p>4.1. All intellectual property in the Platform - including but not limited to the NSIL engine, 38 proprietary formulas, Human Cognition Engine, Proactive Intelligence Layer, persona architecture, and Document Factory templates - is owned exclusively by BW Global Advisory.</p>
+        <p>4.2. The following are proprietary indices created by BWGA: SPI(TM), RROI(TM), SEAM(TM), PVI(TM), RRI(TM), and all other named indices listed in the Platform's architecture documentation.</p>
+        <p>4.3. You retain ownership of all data you input into the Platform. You grant BWGA a limited, non-exclusive licence to process your data solely for the purpose of providing the Platform's services.</p>
+        <p>4.4. Documents generated by the Platform are produced for your use. You may use, distribute, and present these documents as your own. However, you may not claim authorship of the underlying analytical methodology or scoring architecture.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">5. Advisory Nature & Disclaimer</h4>
+        <p>5.1. <strong>All Platform outputs are advisory.</strong> Scores, classifications, persona debates, risk assessments, and document outputs are produced by automated systems and are intended to inform - not replace - human decision-making.</p>
+        <p>5.2. BWGA does not guarantee the accuracy, completeness, or suitability of any output for any particular purpose. Outputs are generated based on user inputs and available data sources, which may be incomplete or contain inaccuracies.</p>
+        <p>5.3. Users retain full and sole accountability for all decisions made using the Platform's analysis, recommendations, and documents.</p>
+        <p>5.4. BWGA is not liable for any loss, damage, or adverse outcome arising from reliance on Platform outputs, including but not limited to investment losses, regulatory penalties, failed partnerships, or reputational damage.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">6. R&D Phase Provisions</h4>
+        <p>6.1. The Platform is currently in R&D phase. Features, scoring methodologies, and available outputs may change without notice.</p>
+        <p>6.2. During the R&D phase, access may be limited, suspended, or modified at BWGA's discretion.</p>
+        <p>6.3. No service level agreements (SLAs) apply during the R&D phase.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">7. Data & Privacy</h4>
+        <p>7.1. Your use of the Platform is also governed by our Privacy Policy, which forms part of these Terms.</p>
+        <p>7.2. By using the Platform, you consent to the collection, processing, and storage of data as described in the Privacy Policy.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">8. Limitation of Liability</h4>
+        <p>8.1. To the maximum extent permitted by law, BWGA's total liability for any claim arising from or related to the Platform is limited to the amount you have paid to BWGA for use of the Platform in the 12 months preceding the claim (or AUD $0 if no fees have been charged).</p>
+        <p>8.2. BWGA is not liable for any indirect, incidental, consequential, special, or punitive damages.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">9. International Standards Compliance</h4>
+        <p>9.1. The Platform is designed to meet or align with the following international standards and frameworks:</p>
+        <ul className="list-disc ml-6 space-y-1">
+            <li>Australian Privacy Act 1988 and Australian Privacy Principles (APPs)</li>
+            <li>EU General Data Protection Regulation (GDPR)</li>
+            <li>Philippines Data Privacy Act of 2012 (Republic Act No. 10173)</li>
+            <li>ISO/IEC 27001 (Information Security Management) - alignment target</li>
+            <li>OECD AI Principles</li>
+            <li>UNESCO Recommendation on the Ethics of Artificial Intelligence</li>
+            <li>EU AI Act transparency and risk classification requirements</li>
+            <li>NIST AI Risk Management Framework</li>
+        </ul>
+        <p>9.2. While the Platform has not yet undergone formal certification by these bodies, it is designed and developed with the express intention of meeting these standards as it progresses toward commercial deployment.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">10. Governing Law</h4>
+        <p>10.1. These Terms are governed by the laws of the State of Victoria, Australia.</p>
+        <p>10.2. Any disputes arising under these Terms shall be subject to the exclusive jurisdiction of the courts of Victoria, Australia.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">11. Changes to Terms</h4>
+        <p>11.1. BWGA reserves the right to update these Terms at any time. Changes will be posted on the Platform with an updated "Last Updated" date.</p>
+        <p>11.2. Continued use of the Platform after changes constitutes acceptance of the revised Terms.</p>
+
+        <h4 className="font-bold text-slate-900 mt-6">12. Contact</h4>
+        <p>For questions about these Terms, contact:</p>
+        <p className="mt-2"><strong>BW Global Advisory</strong><br />Email: brayden@bwglobaladvis.info<br />Phone: +63 960 835 4283<br />ABN: 55 978 113 300<br />Melbourne, Australia</p>
+
+        <div className="text-center border-t border-slate-200 pt-4 mt-4">
+            <p className="text-xs text-slate-400">- End of Terms & Conditions a"</p>
+        </div>
+    </div>
+);
+
+export default TermsContentDiv1;
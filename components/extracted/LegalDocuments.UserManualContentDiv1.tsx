@@ -0,0 +1,413 @@
+// Static markup moved out of LegalDocuments.tsx by apply_extract_literals.py.
+const UserManualContentDiv1 = () => (
+    <div className="space-y-8">
+        {/* Cover / Title */}
+        <div className="text-center border-b border-slate-200 pb-8">
+            <p className="text-xs text-amber-600 uppercase tracking-[0.3em] font-semibold mb-2">Official User Manual</p>
+            <h1 className="text-3xl font-light text-slate-900 mb-2">BW Ai</h1>
+            <h2 className="text-lg text-slate-500 font-light">Nexus Intelligence Operating System v7.0</h2>
+            <p className="text-xs text-slate-400 mt-4">Version 7.0 * February 2026 * R&D Phase</p>
+            <p className="text-xs text-slate-400">Developed in Melbourne, Australia & Pagadian City, Philippines</p>
+        </div>
+
+        {/* Table of Contents */}
+        <div className="bg-slate-50 border border-slate-200 rounded-lg p-6">
+            <h3 className="text-sm font-bold text-slate-900 uppercase tracking-wider mb-4">Table of Contents</h3>
+            <div className="grid md:grid-cols-2 gap-1 text-xs text-slate-600">
+                <p>1. Welcome & Getting Started</p>
+                <p>8. Step 5 - Financial Model</p>
+                <p>2. System Requirements & Access</p>
+                <p>9. Step 6 - Risk & Mitigation</p>
+                <p>3. Platform Overview</p>
+                <p>10. Step 7 - Resources & Capability</p>
+                <p>4. The Command Page (Landing)</p>
+                <p>11. Step 8 - Execution Plan</p>
+                <p>5. Entering the Platform</p>
+                <p>12. Step 9 - Governance & Monitoring</p>
+                <p>6. Step 1 - Identity & Foundation</p>
+                <p>13. Step 10 - Scoring & Readiness</p>
+                <p>7. Steps 2a"4 - Strategy, Market, Partners</p>
+                <p>14. Generating Your Report</p>
+                <p>&nbsp;</p>
+                <p>15. The BW Consultant</p>
+                <p>&nbsp;</p>
+                <p>16. The Document Factory</p>
+                <p>&nbsp;</p>
+                <p>17. Understanding Your Scores</p>
+                <p>&nbsp;</p>
+                <p>18. Guidance Modes</p>
+                <p>&nbsp;</p>
+                <p>19. Troubleshooting & Support</p>
+            </div>
+        </div>
+
+        {/* Chapter 1 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">1. Welcome & Getting Started</h3>
+            <p className="mb-3">Thank you for choosing BW Ai. This manual will guide you through every feature of the platform, from your first search to exporting board-ready documents.</p>
+            <p className="mb-3"><strong>What is BW Ai?</strong> It is a Sovereign-Grade Intelligence Operating System designed to help regional communities, businesses, government agencies, and first-time exporters produce institutional-quality strategic analysis - the same calibre of work that multinational corporations commission from top-tier consulting firms.</p>
+            <p className="mb-3">The platform is not a chatbot. It is a structured intelligence pipeline that:</p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li>Captures your opportunity through a structured 10-step intake process</li>
+                <li>Scores your project using 38 proprietary mathematical formulas</li>
+                <li>Stress-tests your assumptions using 5 adversarial AI personas</li>
+                <li>Simulates decision-maker reactions using 7 behavioural models</li>
+                <li>Produces traceable, auditable, board-ready documents</li>
+                <li>Continuously improves through proactive intelligence monitoring</li>
+            </ul>
+            <div className="bg-amber-50 border border-amber-200 rounded-lg p-4">
+                <p className="text-xs font-semibold text-amber-800 mb-1">Important Note</p>
+                <p className="text-xs text-amber-700">BW AI is a decision-support tool. All outputs are advisory in nature. Users retain full accountability for decisions made using the platform's analysis and recommendations.</p>
+            </div>
+        </div>
+
+        {/* Chapter 2 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">2. System Requirements & Access</h3>
+            <p className="mb-3"><strong>Supported Browsers:</strong> Google Chrome (recommended), Microsoft Edge, Mozilla Firefox, Safari. The platform is web-based - no software installation required.</p>
+            <p className="mb-3"><strong>Device Compatibility:</strong> Desktop and laptop computers are recommended for the full experience. Tablet devices are supported with a responsive layout. Mobile phones can access the Command Page and the BW Consultant but the full report builder is optimised for larger screens.</p>
+            <p className="mb-3"><strong>Internet Connection:</strong> A stable broadband connection is required. The platform communicates with AI services and live data sources in real time. Slow or intermittent connections may cause search timeouts or report generation delays.</p>
+            <p className="mb-3"><strong>Access:</strong> During the R&D phase, access is provided via direct URL. No account registration is currently required. Future commercial releases will include authenticated user accounts with role-based access controls.</p>
+        </div>
+
+        {/* Chapter 3 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">3. Platform Overview</h3>
+            <p className="mb-3">The platform consists of four primary areas:</p>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4 space-y-3 mb-3">
+                <div><strong className="text-slate-900">Command Page</strong> - The landing page you see when you first arrive. It explains the platform, its architecture, and a live case-study demo. It is your launch point into the system.</div>
+                <div><strong className="text-slate-900">Main Canvas (Report Builder)</strong> - The primary workspace where you complete the 10-step intake protocol, view live report generation, and interact with the BW Consultant.</div>
+                <div><strong className="text-slate-900">BW Consultant</strong> - A unified AI advisor that occupies the right sidebar of the Main Canvas. You can ask it anything - location research, company analysis, strategic advice, score explanations - all in one chat window. It is also proactive, automatically pushing intelligence briefings and live analysis updates into the conversation.</div>
+                <div><strong className="text-slate-900">Document Factory</strong> - The output system that compiles your analysis into 200+ institutional-grade document types.</div>
+            </div>
+            <p className="mb-3"><strong>10-Layer Processing Architecture (NSIL):</strong> Every report passes through ten processing layers in sequence:</p>
+            <ol className="list-decimal ml-6 space-y-1">
+                <li><strong>Input Validation & Governance</strong> - Screens inputs for completeness and consistency</li>
+                <li><strong>Multi-Agent Adversarial Debate</strong> - 5 AI personas challenge every claim</li>
+                <li><strong>Quantitative Formula Scoring</strong> - 38 formulas calculate hard metrics</li>
+                <li><strong>Monte Carlo Stress Testing</strong> - 10,000+ scenario simulations</li>
+                <li><strong>Neuroscience-Based Cognition Modelling</strong> - 7 behavioural models simulate decision-maker responses</li>
+                <li><strong>Autonomous Agent Intelligence</strong> - Goal-directed agents plan research, spawn specialists, and verify outcomes</li>
+                <li><strong>Proactive Self-Monitoring</strong> - Detects overconfidence, drift, and reasoning errors in its own output</li>
+                <li><strong>Reflexive Analysis</strong> - Analyses the user, not just the market &mdash; detecting what you are not saying</li>
+                <li><strong>Compliance & Ethics Checking</strong> - Scores against IFC standards, Rawlsian ethics, and 195-country regulatory frameworks</li>
+                <li><strong>Audience-Adaptive Output Synthesis</strong> - Reframes for investors, governments, communities, partners, and executives with full provenance</li>
+            </ol>
+        </div>
+
+        {/* Chapter 4 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">4. The Command Page (Landing)</h3>
+            <p className="mb-3">When you first visit the platform, you arrive at the Command Page. This page serves two purposes:</p>
+            <ol className="list-decimal ml-6 space-y-2 mb-3">
+                <li><strong>Education</strong> - Explains what the system does, how it works, and who it is built for. Scroll down to read about the 7-layer architecture, the scoring engine, proprietary behavioural models, and a live case-study demonstration with real outputs.</li>
+                <li><strong>Launch</strong> - At the bottom of the page, accept the Terms & Conditions checkbox and click "Launch Intelligence OS" to enter the full report builder and access the BW Consultant.</li>
+            </ol>
+            <p className="mb-3"><strong>What you'll find on the page:</strong></p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li>10-Layer NSIL Processing Architecture breakdown</li>
+                <li>Original Developments section - what makes this platform unique</li>
+                <li>Proactive Intelligence Layer overview</li>
+                <li>Live case-study walkthrough (Vestas A -  Philippines)</li>
+                <li>Legal documents - User Manual, Terms & Conditions, Privacy Policy, Ethical AI Framework</li>
+            </ul>
+            <div className="bg-blue-50 border border-blue-200 rounded-lg p-4">
+                <p className="text-xs font-semibold text-blue-800 mb-1">Tip</p>
+                <p className="text-xs text-blue-700">All location research, company intelligence, and strategic analysis is handled by the BW Consultant inside the Main Canvas. Launch the platform to access the full AI advisor.</p>
+            </div>
+        </div>
+
+        {/* Chapter 5 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">5. Entering the Platform</h3>
+            <p className="mb-3">After accepting the Terms & Conditions and clicking "Launch Intelligence OS" on the Command Page, you enter the Main Canvas - the primary workspace.</p>
+            <p className="mb-3"><strong>Layout Overview:</strong></p>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4 space-y-2 mb-3">
+                <div><strong>Left Sidebar (narrow):</strong> Navigation icons for switching between the wizard steps, accessing the document factory, and system controls.</div>
+                <div><strong>Centre Panel (main area):</strong> The live document view. This is where your report builds in real time as you complete each intake step. It displays formatted sections, scores, and analysis as they are generated.</div>
+                <div><strong>Right Sidebar - BW Consultant:</strong> A single unified AI advisor chat that fills the entire right sidebar. You can ask it anything: location research, company analysis, score explanations, strategic recommendations. It also proactively pushes intelligence briefings and live analysis summaries into the conversation as you work.</div>
+                <div><strong>Top Bar:</strong> Contains the 10-step intake wizard progress indicators, the Report Library, and the Generate Report button.</div>
+            </div>
+            <p className="mb-3"><strong>Getting Started:</strong> When you first enter the platform, the BW Consultant will greet you and explain what it can do. You can begin by completing Step 1 of the intake wizard, or type a question directly into the consultant chat - for example, "Research Pagadian City, Philippines" to get a full intelligence brief.</p>
+        </div>
+
+        {/* Chapter 6 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">6. Step 1 - Identity & Foundation</h3>
+            <p className="mb-3">Click on Step 1 in the intake wizard to open the Identity modal. This is where you establish who you are.</p>
+            <p className="mb-3"><strong>Required Information:</strong></p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li><strong>Organisation Name:</strong> Your entity's official name</li>
+                <li><strong>Entity Type:</strong> Select from options (Government Agency, Private Company, Non-Profit, Public Authority, etc.)</li>
+                <li><strong>Country:</strong> Where your organisation is headquartered</li>
+                <li><strong>Industry:</strong> Primary industry or sector</li>
+                <li><strong>Contact Information:</strong> Email and key contact details</li>
+                <li><strong>Competitive Positioning:</strong> A brief description of your competitive advantages</li>
+            </ul>
+            <p className="mb-3"><strong>Why this matters:</strong> The Identity data feeds directly into the SPI (Success Probability Index) weighting system. The engine selects industry-specific archetypes and regional benchmarks based on what you enter here. Accurate information produces more relevant scoring.</p>
+            <div className="bg-amber-50 border border-amber-200 rounded-lg p-4">
+                <p className="text-xs text-amber-700"><strong>Tip:</strong> Don't worry about getting everything perfect on your first pass. You can return to any step and update your inputs at any time. The system recalculates all scores when you re-generate.</p>
+            </div>
+        </div>
+
+        {/* Chapter 7 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">7. Steps 2a"4 - Strategy, Market & Partners</h3>
+            
+            <p className="mb-2"><strong>Step 2 - Mandate & Strategy:</strong> Define your strategic vision, objectives (short/medium/long-term), target partner profile, and value proposition. This feeds the SPI strategic intent calculation.</p>
+            
+            <p className="mb-2"><strong>Step 3 - Market & Context:</strong> Describe your market size, growth projections, competitive landscape, and regulatory environment. You can ask the BW Consultant to research any target location and it will provide relevant data to inform this step. This feeds the RROI (Regional Return on Investment) market access component and the RFI (Regulatory Friction Index).</p>
+            
+            <p className="mb-2"><strong>Step 4 - Partners & Ecosystem:</strong> Map your stakeholder landscape - who are your potential partners, what are their profiles, and how do they align with your objectives? This feeds the CIS (Counterparty Integrity Score) and SPI partner reliability component.</p>
+
+            <div className="bg-purple-50 border border-purple-200 rounded-lg p-4 mt-3">
+                <p className="text-xs text-purple-700"><strong>Location Intelligence Integration:</strong> Steps 3a"10 are enhanced by research data. Ask the BW Consultant to research your target location (e.g. "Research Pagadian City, Philippines") and it will provide GDP data, demographics, regulatory frameworks, and risk assessments to inform your inputs.</p>
+            </div>
+        </div>
+
+        {/* Chapter 8 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">8. Step 5 - Financial Model</h3>
+            <p className="mb-3">This step captures your investment requirements, revenue projections, cost structure, and ROI scenarios.</p>
+            <p className="mb-3"><strong>Key Fields:</strong></p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li>Investment amount required</li>
+                <li>Revenue model and Year 1 projections</li>
+                <li>Operating cost breakdown</li>
+                <li>Funding sources (grants, equity, debt, public-private)</li>
+                <li>Base case / best case / worst case scenarios</li>
+            </ul>
+            <div className="bg-red-50 border border-red-200 rounded-lg p-4">
+                <p className="text-xs text-red-700"><strong>Important:</strong> The Accountant persona and SCF (Strategic Cash Flow) formula will flag revenue projections that significantly exceed regional benchmarks. Be prepared to justify or revise projections - this is the system working as designed, stress-testing your assumptions before an investor does.</p>
+            </div>
+        </div>
+
+        {/* Chapter 9 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">9. Step 6 - Risk & Mitigation</h3>
+            <p className="mb-3">Identify and categorise the risks facing your project. The system uses your inputs to calculate the CRPS (Composite Risk Priority Score), PSS (Policy Shock Sensitivity), and RFI bottleneck detection.</p>
+            <p className="mb-3"><strong>Risk Categories:</strong> Political, Economic, Regulatory, Operational, Environmental, Financial, Reputational, Supply Chain.</p>
+            <p className="mb-3">For each risk, you assign a probability (Low/Medium/High) and impact level. The system generates a risk matrix and mitigation framework automatically.</p>
+        </div>
+
+        {/* Chapter 10 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">10. Step 7 - Resources & Capability</h3>
+            <p className="mb-3">Assess your team's strengths, technology stack, and capability gaps. This feeds the ORS (Organisational Readiness Score), TCS (Team Capability Score), and CGI (Capability Gap Index).</p>
+            <p className="mb-3">Be honest about gaps - the system is designed to identify them constructively and recommend how to address them, not penalise you for transparency.</p>
+        </div>
+
+        {/* Chapter 11 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">11. Step 8 - Execution Plan</h3>
+            <p className="mb-3">Define your implementation roadmap: phases, milestones, dependencies, timelines, go/no-go decision gates, and resource allocation per phase.</p>
+            <p className="mb-3">This feeds the IVAS (Investment Velocity & Activation Speed) calculation, which estimates your activation timeline across P10 (best case), P50 (median), and P90 (worst case) scenarios.</p>
+        </div>
+
+        {/* Chapter 12 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">12. Step 9 - Governance & Monitoring</h3>
+            <p className="mb-3">Establish your oversight structure: decision-making authority, reporting cadence, escalation procedures, KPI tracking, and audit frameworks.</p>
+            <p className="mb-3">This feeds the GCI (Governance Confidence Index), CCS (Compliance Certainty Score), and SPI ethical alignment component.</p>
+        </div>
+
+        {/* Chapter 13 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">13. Step 10 - Scoring & Readiness</h3>
+            <p className="mb-3">The final intake step is a readiness self-assessment. Rate your confidence levels, review the pre-launch checklist, and confirm your data is complete.</p>
+            <p className="mb-3">Once all 10 steps are complete, the system has a comprehensive, machine-readable dataset. You are now ready to generate your report.</p>
+            <div className="bg-emerald-50 border border-emerald-200 rounded-lg p-4">
+                <p className="text-xs text-emerald-700"><strong>Completeness Indicator:</strong> The system shows a completeness percentage on the right sidebar. You can generate a report at any time, but higher completeness produces more accurate scoring and richer document output.</p>
+            </div>
+        </div>
+
+        {/* Chapter 14 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">14. Generating Your Report</h3>
+            <p className="mb-3">Click the <strong>"Generate Report"</strong> button in the top bar. The system will:</p>
+            <ol className="list-decimal ml-6 space-y-2 mb-3">
+                <li><strong>Validate your inputs</strong> - Checks for completeness and consistency</li>
+                <li><strong>Run the NSIL engine</strong> - Calculates all 38 formula scores across your data</li>
+                <li><strong>Activate adversarial personas</strong> - 5 AI agents (Advocate, Skeptic, Regulator, Accountant, Operator) debate your project's merits</li>
+                <li><strong>Apply Monte Carlo simulations</strong> - 10,000+ scenarios test your project's resilience</li>
+                <li><strong>Engage the Human Cognition Engine</strong> - 7 behavioural models simulate how decision-makers will react</li>
+                <li><strong>Run proactive intelligence agents</strong> - Deep research, document enhancement, and self-improvement agents refine the output</li>
+                <li><strong>Assemble the report</strong> - All scores, debates, and analysis are compiled into a formatted, traceable document</li>
+            </ol>
+            <p className="mb-3"><strong>Real-Time Visibility:</strong> You can watch this process happen live in the centre panel. Progress indicators show which agents are active, which formulas are being calculated, and the current completeness percentage.</p>
+            <p className="mb-3"><strong>Classification:</strong> Your project will receive a final classification:</p>
+            <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                <table className="w-full text-xs">
+                    <thead><tr className="border-b border-slate-300"><th className="text-left py-2">SPI Score</th><th className="text-left py-2">Grade</th><th className="text-left py-2">Classification</th></tr></thead>
+                    <tbody>
+                        <tr className="border-b border-slate-100"><td className="py-1.5 text-emerald-700 font-bold">aJPY 80</td><td>Grade A</td><td>Investment Ready</td></tr>
+                        <tr className="border-b border-slate-100"><td className="py-1.5 text-emerald-600 font-bold">aJPY 70</td><td>Grade B</td><td>Investment Ready</td></tr>
+                        <tr className="border-b border-slate-100"><td className="py-1.5 text-amber-600 font-bold">aJPY 60</td><td>Grade C</td><td>Proceed With Caution</td></tr>
+                        <tr><td className="py-1.5 text-red-600 font-bold">&lt; 60</td><td>Grade D</td><td>Do Not Proceed</td></tr>
+                    </tbody>
+                </table>
+            </div>
+        </div>
+
+        {/* Chapter 15 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">15. The BW Consultant</h3>
+            <p className="mb-3">The BW Consultant is the unified AI advisor that occupies the entire right sidebar of the report builder. It is your single point of contact for all intelligence, research, analysis, and strategic guidance within the platform.</p>
+            <p className="mb-3"><strong>Capabilities - what you can do in one chat window:</strong></p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li><strong>Location Research:</strong> "Research Pagadian City, Philippines" - returns a full intelligence brief with demographics, GDP, industries, leadership, infrastructure, regulatory environment, and risk assessment</li>
+                <li><strong>Company Analysis:</strong> "Tell me about Vestas" - returns corporate intelligence and strategic context</li>
+                <li><strong>Score Explanations:</strong> "Why is my SPI score low?" - analyses your intake data and explains score drivers</li>
+                <li><strong>Strategic Advice:</strong> "What partners should I consider for this project?" - provides contextual recommendations</li>
+                <li><strong>Risk Analysis:</strong> "What are the regulatory risks in Indonesia?" - delivers region-specific risk intelligence</li>
+                <li><strong>Formula Explanations:</strong> "Explain the RFI bottleneck on my project" - breaks down how scoring formulas apply to your data</li>
+            </ul>
+            <p className="mb-3"><strong>Proactive Intelligence:</strong> The BW Consultant is not just reactive. It proactively pushes intelligence into the conversation without being asked:</p>
+            <ul className="list-disc ml-6 space-y-1 mb-3">
+                <li><strong>Advisor Briefings:</strong> When the multi-agent system (Advocate, Skeptic, Regulator, Accountant, Operator) completes analysis, a summary briefing is automatically posted to the chat</li>
+                <li><strong>Live Analysis Summaries:</strong> When the system generates new insights during report processing, these are injected into the chat in real time</li>
+                <li><strong>Follow-Up Suggestions:</strong> Every response includes suggested follow-up questions so you always know what to explore next</li>
+            </ul>
+            <p className="mb-3"><strong>Voice Output:</strong> Click the speaker icon in the consultant header to enable voice responses. The system will read responses aloud using text-to-speech.</p>
+            <div className="bg-indigo-50 border border-indigo-200 rounded-lg p-4">
+                <p className="text-xs font-semibold text-indigo-800 mb-1">How It Works</p>
+                <p className="text-xs text-indigo-700">The consultant is powered by multi-source intelligence. Location queries are routed through the platform's research pipeline (server-side AI, OpenAI, and public data APIs). Strategic queries use your intake data, scores, and the multi-agent debate system to generate context-aware advice. All responses are traceable to their intelligence sources.</p>
+            </div>
+        </div>
+
+        {/* Chapter 16 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">16. The Document Factory</h3>
+            <p className="mb-3">Once your report is generated, you can produce institutional-grade documents from the Document Factory. The system offers 200+ report types and 150+ letter templates.</p>
+            <p className="mb-3"><strong>Document Categories:</strong></p>
+            <div className="grid md:grid-cols-2 gap-4 mb-3">
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900 mb-2">Strategic Reports</p>
+                    <ul className="text-xs text-slate-600 space-y-1">
+                        <li>* Investment Prospectus</li>
+                        <li>* Partnership Viability Assessment</li>
+                        <li>* Market Entry Analysis</li>
+                        <li>* Risk Assessment Report</li>
+                        <li>* Competitive Landscape Report</li>
+                    </ul>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900 mb-2">Financial Documents</p>
+                    <ul className="text-xs text-slate-600 space-y-1">
+                        <li>* ROI Projection Model</li>
+                        <li>* Financial Due Diligence Pack</li>
+                        <li>* Investment Term Sheet</li>
+                        <li>* Monte Carlo Simulation Report</li>
+                        <li>* Sensitivity Analysis</li>
+                    </ul>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900 mb-2">Legal Templates</p>
+                    <ul className="text-xs text-slate-600 space-y-1">
+                        <li>* Letter of Intent (LOI)</li>
+                        <li>* Memorandum of Understanding</li>
+                        <li>* Non-Disclosure Agreement</li>
+                        <li>* Grant Application Template</li>
+                        <li>* Compliance Checklist</li>
+                    </ul>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900 mb-2">Communication Packs</p>
+                    <ul className="text-xs text-slate-600 space-y-1">
+                        <li>* Executive Summary Brief</li>
+                        <li>* Board Presentation Deck</li>
+                        <li>* Investor Pitch Document</li>
+                        <li>* Stakeholder Update Letter</li>
+                        <li>* Media Release Template</li>
+                    </ul>
+                </div>
+            </div>
+            <p className="mb-3"><strong>Audit Trail:</strong> Every document produced by the Document Factory carries a full audit trail. Each recommendation, score, and conclusion can be traced back to specific data inputs, formula calculations, and persona debate transcripts.</p>
+        </div>
+
+        {/* Chapter 17 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">17. Understanding Your Scores</h3>
+            <p className="mb-3">The NSIL engine produces 38 scores organised into six categories:</p>
+            <div className="space-y-3 mb-3">
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Core Indices (5)</p>
+                    <p className="text-xs text-slate-600">SPI (Success Probability), RROI (Regional Return on Investment), SEAM (Stakeholder Alignment), PVI (Partnership Viability), RRI (Regional Resilience)</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Risk Formulas (7)</p>
+                    <p className="text-xs text-slate-600">CRPS, RME, VaR, SRCI, DCS, PSS, PRS - covering composite risk, mitigation effectiveness, value at risk, supply chain, dependency, policy sensitivity, and political risk</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Financial Metrics (6)</p>
+                    <p className="text-xs text-slate-600">IRR, NPV, WACC, DSCR, FMS, ROE - standard financial analysis adapted for regional development contexts</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Operational Scores (6)</p>
+                    <p className="text-xs text-slate-600">ORS, TCS, EEI, SEQ, CGI, LCI - measuring organisational readiness, team capability, execution efficiency, and leadership confidence</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Market Formulas (5)</p>
+                    <p className="text-xs text-slate-600">MPI, CAI, TAM, SAM, GRI - market penetration, competitive advantage, total/serviceable market, growth rate</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-3">
+                    <p className="font-semibold text-xs text-slate-900">Governance Metrics (9)</p>
+                    <p className="text-xs text-slate-600">GCI, CCS, TPI, ARI, DQS, GCS, RFI, CIS, ESG - covering governance confidence, compliance, transparency, audit readiness, data quality, regulatory friction, counterparty integrity, and ESG</p>
+                </div>
+            </div>
+            <p className="mb-3">Each score is presented on a 0a"100 scale. Scores above 70 are generally considered strong. Scores below 50 indicate areas requiring attention. The system colour-codes scores: <span className="text-emerald-600 font-semibold">green (strong)</span>, <span className="text-amber-600 font-semibold">amber (caution)</span>, <span className="text-red-600 font-semibold">red (critical)</span>.</p>
+        </div>
+
+        {/* Chapter 18 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">18. Guidance Modes</h3>
+            <p className="mb-3">Before beginning, you can select your preferred guidance level. The system adapts its explanations, prompts, and interface density accordingly.</p>
+            <div className="space-y-3 mb-3">
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-sm text-slate-900 mb-1">📊 Orientation Mode</p>
+                    <p className="text-xs text-slate-600">Full explanations at every step, contextual help panels, step-by-step walkthroughs, and educational tooltips. Recommended for first-time users, community groups, and anyone new to strategic planning.</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-sm text-slate-900 mb-1">🤝 Collaborative Mode</p>
+                    <p className="text-xs text-slate-600">Balanced guidance with smart suggestions. You drive the process while the system surfaces insights. Recommended for regional councils, growing businesses, and small teams.</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-sm text-slate-900 mb-1">⚡ Expert Mode</p>
+                    <p className="text-xs text-slate-600">Streamlined interface, minimal hand-holding, full access to advanced controls and raw formula outputs. Recommended for experienced operators, government analysts, and corporate development teams.</p>
+                </div>
+            </div>
+            <p>Your guidance level can be changed at any time from the sidebar settings.</p>
+        </div>
+
+        {/* Chapter 19 */}
+        <div>
+            <h3 className="text-lg font-semibold text-slate-900 mb-3 border-b border-amber-400 pb-2">19. Troubleshooting & Support</h3>
+            <div className="space-y-3">
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-xs text-slate-900 mb-1">Search returns an error or times out</p>
+                    <p className="text-xs text-slate-600">Check your internet connection. Try a simpler search term (e.g., city name only). If the problem persists, try again in a few minutes - the AI service may be experiencing high demand.</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-xs text-slate-900 mb-1">Report generation stalls or shows no progress</p>
+                    <p className="text-xs text-slate-600">Ensure you have a stable internet connection. Reports require multiple AI service calls. On slower connections, generation may take 30a"60 seconds. If stalled beyond 2 minutes, refresh the page and try again - your intake data is preserved in local storage.</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-xs text-slate-900 mb-1">Scores seem unexpected or low</p>
+                    <p className="text-xs text-slate-600">This is usually caused by incomplete intake data. Check your completeness percentage in the right sidebar. Fill in any missing steps and re-generate. The system scores conservatively - missing data is treated as risk.</p>
+                </div>
+                <div className="bg-slate-50 border border-slate-200 rounded-lg p-4">
+                    <p className="font-semibold text-xs text-slate-900 mb-1">Need help or want to provide feedback?</p>
+                    <p className="text-xs text-slate-600">Contact us at <strong>brayden@bwglobaladvis.info</strong> or call <strong>+63 960 835 4283</strong>. We welcome all feedback during this R&D phase.</p>
+                </div>
+            </div>
+        </div>
+
+        {/* End Mark */}
+        <div className="text-center border-t border-slate-200 pt-6">
+            <p className="text-xs text-slate-400">- End of User Manual a"</p>
+            <p className="text-xs text-slate-400">BW Ai * Nexus Intelligence OS v7.0 * NSIL Engine v4.0</p>
+        </div>
+    </div>
+);
+
+export default UserManualContentDiv1;
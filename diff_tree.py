@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Structural diff of two versions of a TSX file.
+
+    python diff_tree.py OLD NEW [--allow A-B ...]
+
+OLD and NEW are paths or git blobs as REV:path, so checking a patch script
+against the last commit is
+
+    python diff_tree.py HEAD:components/CommandCenter.tsx components/CommandCenter.tsx
+
+Reports each JSX element, declaration, multi-line block or other top-level
+statement that was added, removed, moved or modified (its own text changed,
+leaving out its children), with line spans. Whitespace-only changes are ignored.
+With --allow, any change outside the given line ranges (new-file lines, or
+old-file lines for removals) is flagged and the exit status is 1, which is
+how a patch proves it touched only its intended region.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from tsxtools.treediff import REMOVED, diff_trees, load_tree, tree_of_text
+
+
+def _load(spec):
+    if os.path.exists(spec) or ':' not in spec:
+        with open(spec, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+        return load_tree(spec), text
+    blob = subprocess.run(['git', 'show', spec], check=True, capture_output=True).stdout
+    text = blob.decode('utf-8', errors='ignore')
+    return tree_of_text(text), text
+
+
+def _range(value):
+    lo, _, hi = value.partition('-')
+    return int(lo), int(hi or lo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('old', help='path or REV:path of the pre-image')
+    parser.add_argument('new', help='path or REV:path of the post-image')
+    parser.add_argument('--allow', type=_range, action='append', default=[], metavar='A-B',
+                        help='line range the patch may touch (repeatable)')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    old, old_text = _load(args.old)
+    new, new_text = _load(args.new)
+    changes = diff_trees(old, new)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    outside = 0
+    for change in changes:
+        el_old = old.nodes[change.old] if change.old is not None else None
+        el_new = new.nodes[change.new] if change.new is not None else None
+        if change.kind == REMOVED:
+            label = old.label(change.old, old_text)
+            where = f"old {el_old.line}-{el_old.end_line}"
+            span = (el_old.line, el_old.end_line)
+        else:
+            label = new.label(change.new, new_text)
+            where = f"new {el_new.line}-{el_new.end_line}"
+            if el_old is not None:
+                where = f"old {el_old.line}-{el_old.end_line} -> {where}"
+            span = (el_new.line, el_new.end_line)
+        flag = ''
+        if args.allow and not any(lo <= span[0] and span[1] <= hi for lo, hi in args.allow):
+            outside += 1
+            flag = '  OUTSIDE ALLOWED RANGE'
+        print(f"{change.kind:<9} {where}: {label}{flag}")
+
+    counts = {kind: sum(1 for c in changes if c.kind == kind) for kind in ('added', 'removed', 'moved', 'modified')}
+    summary = ', '.join(f"{n} {kind}" for kind, n in counts.items())
+    print(f"{summary} ({len(old)} -> {len(new)} nodes, {elapsed:.1f} ms)")
+    if outside:
+        print(f"{outside} change(s) outside the allowed ranges")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
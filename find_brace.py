@@ -1,27 +1,133 @@
 #!/usr/bin/env python3
-with open(r'c:\Users\brayd\Downloads\bw-nexus-ai-final-11\components\MainCanvas.tsx', 'r', encoding='utf-8', errors='ignore') as f:
-    lines = f.readlines()
-
-balance = 0
-first_negative_line = None
-for i, line in enumerate(lines, 1):
-    for char in line:
-        if char == '{': balance += 1
-        elif char == '}': balance -= 1
-    if balance < 0 and first_negative_line is None:
-        first_negative_line = i
-        print(f"First line where balance goes negative: {i}")
-        print(f"Balance: {balance}")
-        print(f"Content: {line.rstrip()}")
-        # Show surrounding context
-        print("\nContext:")
-        for j in range(max(0, i-4), min(len(lines), i+3)):
-            print(f"  {j+1}: {lines[j].rstrip()[:100]}")
-        break
-
-if first_negative_line is None:
-    print(f"Never goes negative. Final balance: {balance}")
-    if balance > 0:
-        print(f"Missing {balance} closing braces")
-else:
-    print(f"First imbalance at line {first_negative_line}, balance ={balance}")
+"""
+Find the first point where the brace balance goes negative.
+
+    python find_brace.py [path ...]
+
+Paths may be files or directories (e.g. dist/); directories are walked for
+.ts/.tsx/.js/.jsx/.mjs files. Files are read in fixed-size chunks and hits are
+reported as path:line:col with a bounded context window, so minified bundles
+work as well as source.
+
+With --jobs N, files over 256 KB are split into chunks that are scanned in N
+worker processes (see tsxtools.balance_parallel); results are identical.
+
+With --all, every unclosed and unexpected bracket or JSX tag is listed instead
+(see tsxtools.mismatch), each with the location of the token that exposed it.
+
+With --changed [REV | A..B], only the hunks of `git diff` against REV (default
+HEAD, or between two commits) are checked, each in the smallest enclosing
+slice, against a cached profile of the base revision (see
+tsxtools.incremental). Paths, if given, limit which files are considered.
+"""
+
+import argparse
+import os
+import sys
+
+from tsxtools.balance import CONTEXT_CHARS, first_negative, format_context
+from tsxtools.lexer import CHUNK_SIZE
+
+DEFAULT = os.path.join(os.path.dirname(__file__), 'components', 'MainCanvas.tsx')
+EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs')
+
+
+def iter_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d != 'node_modules' and not d.startswith('.'))
+                for name in sorted(files):
+                    if name.endswith(EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def report_all(args):
+    from tsxtools.mismatch import find_mismatches
+
+    status = 0
+    total = 0
+    for path in iter_paths(args.paths):
+        problems = find_mismatches(path, args.chunk_size)
+        if not problems:
+            print(f"{path}: balanced")
+            continue
+        status = 1
+        total += len(problems)
+        for problem in problems:
+            tok = problem.token
+            print(f"{path}:{tok.line}:{tok.col}: {problem.describe()}")
+    if total:
+        print(f"{total} problem(s)")
+    return status
+
+
+def report_changed(args):
+    from tsxtools.incremental import check_changed, git_root
+
+    base, target = args.changed, None
+    if '..' in base:
+        base, target = base.split('..', 1)
+    # git runs from the repo root, so paths given from a subdirectory must be made root-relative.
+    root = git_root()
+    paths = [os.path.relpath(os.path.abspath(p), root) for p in args.paths]
+    status = 0
+    for result in check_changed(base, target or None, paths, root):
+        scope = 'whole new file' if result.full else f"{result.hunks} hunk(s)"
+        verdict = f"{len(result.problems)} new problem(s)" if result.problems else 'ok'
+        print(f"{result.path}: {scope}, rescanned {result.rescanned} of {result.lines} lines, {verdict}")
+        for line, col, description in result.problems:
+            print(f"{result.path}:{line}:{col}: {description}")
+        if result.problems:
+            status = 1
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='bytes read per chunk')
+    parser.add_argument('--context', type=int, default=CONTEXT_CHARS, help='max context chars each side')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='worker processes for large files')
+    parser.add_argument('--all', action='store_true', help='report every mismatch, including JSX tags')
+    parser.add_argument('--changed', nargs='?', const='HEAD', metavar='REV',
+                        help='only check lines changed since REV (or in A..B)')
+    args = parser.parse_args(argv)
+
+    if args.changed:
+        return report_changed(args)
+    args.paths = args.paths or [DEFAULT]
+
+    if args.all:
+        return report_all(args)
+
+    executor = None
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from tsxtools.balance_parallel import PARALLEL_MIN_BYTES, first_negative_parallel
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+
+    status = 0
+    for path in iter_paths(args.paths):
+        if executor is not None and os.path.getsize(path) >= PARALLEL_MIN_BYTES:
+            result = first_negative_parallel(path, args.jobs, args.context, executor)
+        else:
+            result = first_negative(path, args.chunk_size, args.context)
+        if result.negative:
+            status = 1
+            print(f"{result.location}: balance goes negative")
+            print(format_context(result, width=args.context // 2))
+        elif result.balance > 0:
+            status = 1
+            print(f"{path}: never goes negative, missing {result.balance} closing braces")
+        else:
+            print(f"{path}: balanced")
+    if executor is not None:
+        executor.shutdown()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
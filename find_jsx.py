@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Find JSX elements with a CSS-like selector.
+
+    python find_jsx.py SELECTOR [path ...]
+
+    python find_jsx.py 'section#technology > div.grid.grid-cols-2'
+    python find_jsx.py 'button[onClick*=setShowFormulas]' components/CommandCenter.tsx
+
+Prints path:line:col, the line range and the element's opening tag. The
+element index is cached per file content, so repeated queries are cheap.
+"""
+
+import argparse
+import os
+import sys
+
+from tsxtools.jsx import load_index
+from tsxtools.selector import parse
+
+DEFAULT = os.path.join(os.path.dirname(__file__), 'components', 'CommandCenter.tsx')
+
+
+def _opening(text, el, width=100):
+    tag = ' '.join(text[el.start:el.open_end].split())
+    return tag if len(tag) <= width else tag[:width] + '…'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('selector')
+    parser.add_argument('paths', nargs='*', default=[DEFAULT])
+    parser.add_argument('--count', action='store_true', help='only print the number of matches')
+    args = parser.parse_args(argv)
+    try:
+        parse(args.selector)
+    except ValueError as error:
+        parser.error(str(error))
+
+    total = 0
+    for path in args.paths:
+        hits = load_index(path).query(args.selector)
+        total += len(hits)
+        if args.count or not hits:
+            continue
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+        for el in hits:
+            print(f"{path}:{el.line}:{el.col} (lines {el.line}-{el.end_line}) {_opening(text, el)}")
+    print(f"{total} match(es)")
+    return 0 if total else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,25 +1,67 @@
 #!/usr/bin/env python3
-import re
-
-with open(r'c:\Users\brayd\Downloads\bw-nexus-ai-final-11\components\MainCanvas.tsx', 'r', encoding='utf-8', errors='ignore') as f:
-    lines = f.readlines()
-
-# Find all lines that have const declarations or function declarations
-print("Top-level statements (at indent 0-4):")
-for i, line in enumerate(lines[83:600], start=84):  # Start after MainCanvas declaration
-    stripped = line.lstrip()
-    indent = len(line) - len(stripped)
-    
-    # Look for statements that start a new block
-    if (stripped.startswith('const ') or stripped.startswith('const[') or 
-        stripped.startswith('const {') or stripped.startswith('const(') or
-        stripped.startswith('const[') or stripped.startswith('const[') or
-        stripped.startswith('const [') or 
-        line.strip().startswith('useEffect') or line.strip().startswith('const')):
-        
-        if indent <= 4 and '{' in line:
-            open_count = line.count('{')
-            close_count = line.count('}')
-            if open_count != close_count:
-                print(f"Line {i}: indent={indent}, {{ {open_count} }} {close_count}")
-                print(f"  {line.rstrip()[:100]}")
+"""
+Map the top-level declarations of a component and flag misplaced ones.
+
+    python find_unbalanced.py [path] [--kind K] [--name N]
+
+Lists every module-level declaration and every const / function / hook
+directly inside each component body, with its exact line span (from the
+brace index, cached per file hash). Then reports lines indented like
+top-level declarations (0 or 2 spaces) that the map did not pick up because
+they sit at the wrong depth, which is where a missing `}` or `)` above has
+swallowed the rest of the component.
+"""
+
+import argparse
+import os
+import sys
+
+from tsxtools.braces import load_brace_index
+from tsxtools.declarations import DECLARATION, load_declarations
+
+# MainCanvas.tsx now only re-exports this component.
+DEFAULT = os.path.join(os.path.dirname(__file__), 'components', 'BWConsultantOS.tsx')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path', nargs='?', default=DEFAULT)
+    parser.add_argument('--kind', help='only declarations of this kind (const, function, useEffect, ...)')
+    parser.add_argument('--name', help='only declarations binding this name')
+    args = parser.parse_args(argv)
+
+    decls = load_declarations(args.path)
+    index = load_brace_index(args.path)
+    with open(args.path, 'r', encoding='utf-8', errors='ignore') as f:
+        text = f.read()
+
+    shown = decls.find(args.name, args.kind) if args.name else (
+        decls.of_kind(args.kind) if args.kind else list(decls))
+    print(f"Top-level declarations ({len(shown)} of {len(decls)}):")
+    for decl in shown:
+        indent = '  ' if decl.parent is not None else ''
+        names = ', '.join(decl.names) or '-'
+        print(f"  {indent}Lines {decl.line}-{decl.end_line}: {decl.kind} {names}")
+
+    starts = {decl.start for decl in decls}
+    suspects = []
+    for i, start in enumerate(index.line_starts):
+        end = text.find('\n', start)
+        line = text[start:end if end != -1 else len(text)]
+        stripped = line.lstrip(' \t')
+        indent = len(line) - len(stripped)
+        depth = index.line_depths[i]
+        if indent > 2 or start + indent in starts:
+            continue
+        if DECLARATION.match(stripped):
+            suspects.append((i + 1, depth, line.rstrip()))
+    if suspects:
+        print(f"\nLook top-level but sit deeper ({len(suspects)}):")
+        for number, depth, line in suspects:
+            print(f"Line {number}: depth={depth}")
+            print(f"  {line[:100]}")
+    return 1 if suspects else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import { useEffect, useState } from 'react';
+
+// Data moved out of a component by apply_extract_literals.py, loaded once per
+// key on first use and shared by every component that reads it.
+const loaded = new Map<string, unknown>();
+const pending = new Map<string, Promise<unknown>>();
+
+const useLazyData = <T,>(key: string, load: () => Promise<T>, fallback: T): T => {
+    const [data, setData] = useState<T>(() => (loaded.has(key) ? (loaded.get(key) as T) : fallback));
+
+    useEffect(() => {
+        if (loaded.has(key)) {
+            setData(loaded.get(key) as T);
+            return;
+        }
+        let active = true;
+        if (!pending.has(key)) {
+            pending.set(key, load().then((value) => {
+                loaded.set(key, value);
+                return value;
+            }, (error) => {
+                pending.delete(key);     // let the next mount retry
+                throw error;
+            }));
+        }
+        pending.get(key)!.then((value) => {
+            if (active) setData(value as T);
+        }, () => {});
+        return () => {
+            active = false;
+        };
+    }, [key, load]);
+
+    return data;
+};
+
+export default useLazyData;
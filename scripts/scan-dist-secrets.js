@@ -28,16 +28,26 @@ function walk(dir) {
   return files;
 }
 
+// Minified bundles are a single line, so report line:col rather than a line number alone.
+function lineCol(content, index) {
+  const lineStart = content.lastIndexOf('\n', index - 1) + 1;
+  let line = 1;
+  for (let i = content.indexOf('\n'); i !== -1 && i < index; i = content.indexOf('\n', i + 1)) {
+    line += 1;
+  }
+  return `${line}:${index - lineStart + 1}`;
+}
+
 function scanFile(filePath) {
   const content = fs.readFileSync(filePath, 'utf8');
   const findings = [];
 
   for (const pattern of secretPatterns) {
-    const matches = content.match(pattern);
-    if (matches && matches.length > 0) {
-      for (const match of matches.slice(0, 3)) {
-        findings.push({ filePath, match });
-      }
+    let count = 0;
+    for (const match of content.matchAll(pattern)) {
+      findings.push({ filePath, match: match[0], position: lineCol(content, match.index) });
+      count += 1;
+      if (count >= 3) break;
     }
   }
 
@@ -60,7 +70,7 @@ function main() {
   if (findings.length > 0) {
     console.error('[scan-dist-secrets] Potential secret literals found in dist output:');
     for (const finding of findings) {
-      console.error(`- ${path.relative(process.cwd(), finding.filePath)} :: ${finding.match.slice(0, 60)}`);
+      console.error(`- ${path.relative(process.cwd(), finding.filePath)}:${finding.position} :: ${finding.match.slice(0, 60)}`);
     }
     process.exit(1);
   }
@@ -0,0 +1,126 @@
+                    {/* Block 1: The Problem — Statement Piece */}
+                    <div className="mb-12">
+                        {/* Hero row: Photo + Narrative */}
+                        <div className="flex flex-col md:flex-row gap-0 items-stretch mb-0">
+                            <div className="md:w-5/12 relative">
+                                <img 
+                                    src="https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=800&h=600&fit=crop&q=80" 
+                                    alt="Global intelligence data" 
+                                    className="w-full h-full min-h-[380px] object-cover" 
+                                />
+                                <div className="absolute inset-0 bg-gradient-to-r from-transparent to-slate-900/20" />
+                            </div>
+                            <div className="md:w-7/12 bg-gradient-to-br from-slate-900 via-slate-800 to-slate-900 p-8 md:p-10 flex flex-col justify-center">
+                                <p className="text-blue-400 uppercase tracking-[0.25em] text-xs font-bold mb-3">THE CORE PROBLEM</p>
+                                <h3 className="text-3xl md:text-4xl font-bold text-white mb-5 leading-tight">
+                                    Why I built this:<br />
+                                    <span className="text-blue-400">the problem with AI today.</span>
+                                </h3>
+                                <p className="text-base text-slate-300 leading-relaxed mb-4">
+                                    Most AI today &mdash; the language models behind ChatGPT, Claude, and others &mdash; is <strong className="text-white">probabilistic</strong>. It guesses based on patterns. It can hallucinate facts, silently bias results, or give a different answer every time you ask the same question. It sounds confident, but it can&rsquo;t show its reasoning.
+                                </p>
+                                <p className="text-base text-white leading-relaxed font-medium">
+                                    When the stakes are real &mdash; investments, policy decisions, people&rsquo;s livelihoods &mdash; <strong>guessing isn&rsquo;t good enough.</strong>
+                                </p>
+                            </div>
+                        </div>
+
+                        {/* Statement bar */}
+                        <div className="bg-blue-600 px-8 py-5">
+                            <p className="text-center text-white text-lg md:text-xl font-semibold max-w-4xl mx-auto">
+                                I built BW NEXUS AI because I believed intelligence should be <strong>provable</strong>. Not generated. Not predicted. <strong>Proven.</strong>
+                            </p>
+                        </div>
+
+                        {/* Side-by-side comparison */}
+                        <div className="grid md:grid-cols-2 gap-0">
+                            {/* Language-First AI — The Problem */}
+                            <div className="bg-gradient-to-br from-red-50 to-red-100 border-t-4 border-red-500 p-8">
+                                <div className="flex items-center gap-3 mb-5">
+                                    <div className="w-12 h-12 bg-red-500 rounded-full flex items-center justify-center shadow-lg">
+                                        <X size={24} className="text-white" />
+                                    </div>
+                                    <div>
+                                        <h4 className="text-xl font-bold text-red-900">Language-First AI</h4>
+                                        <p className="text-sm text-red-600 font-medium">Probabilistic &mdash; Pattern Guessing</p>
+                                    </div>
+                                </div>
+                                <div className="space-y-3">
+                                    <div className="flex items-start gap-3">
+                                        <span className="text-red-500 font-bold text-lg mt-0.5">&times;</span>
+                                        <p className="text-sm text-red-800"><strong>Hallucinations</strong> &mdash; Generates plausible-sounding information that is factually wrong</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <span className="text-red-500 font-bold text-lg mt-0.5">&times;</span>
+                                        <p className="text-sm text-red-800"><strong>Hidden reasoning</strong> &mdash; Can&rsquo;t explain how it reached a conclusion</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <span className="text-red-500 font-bold text-lg mt-0.5">&times;</span>
+                                        <p className="text-sm text-red-800"><strong>Inconsistent outputs</strong> &mdash; Different answers to the same question every time</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <span className="text-red-500 font-bold text-lg mt-0.5">&times;</span>
+                                        <p className="text-sm text-red-800"><strong>No accountability</strong> &mdash; No audit trail, no source verification, no proof</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <span className="text-red-500 font-bold text-lg mt-0.5">&times;</span>
+                                        <p className="text-sm text-red-800"><strong>Silent bias</strong> &mdash; Trained on biased data with no way to detect or correct it</p>
+                                    </div>
+                                </div>
+                                <div className="mt-6 bg-red-200/60 rounded-sm p-4">
+                                    <p className="text-sm text-red-900 italic font-medium">&ldquo;It sounds confident. But confidence without proof is just noise.&rdquo;</p>
+                                </div>
+                            </div>
+
+                            {/* BW NEXUS AI — The Solution */}
+                            <div className="bg-gradient-to-br from-blue-600 via-blue-700 to-blue-800 border-t-4 border-blue-400 p-8">
+                                <div className="flex items-center gap-3 mb-5">
+                                    <div className="w-12 h-12 bg-white rounded-full flex items-center justify-center shadow-lg">
+                                        <CheckCircle2 size={24} className="text-blue-600" />
+                                    </div>
+                                    <div>
+                                        <h4 className="text-xl font-bold text-white">BW NEXUS AI</h4>
+                                        <p className="text-sm text-blue-200 font-medium">Deterministic &mdash; Provable Intelligence</p>
+                                    </div>
+                                </div>
+                                <div className="space-y-3">
+                                    <div className="flex items-start gap-3">
+                                        <CheckCircle2 size={18} className="text-blue-300 mt-0.5 flex-shrink-0" />
+                                        <p className="text-sm text-blue-100"><strong className="text-white">Validates every input</strong> &mdash; SAT solver catches contradictions before analysis begins</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <CheckCircle2 size={18} className="text-blue-300 mt-0.5 flex-shrink-0" />
+                                        <p className="text-sm text-blue-100"><strong className="text-white">Adversarial debate</strong> &mdash; 5 AI personas challenge every recommendation</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <CheckCircle2 size={18} className="text-blue-300 mt-0.5 flex-shrink-0" />
+                                        <p className="text-sm text-blue-100"><strong className="text-white">Deterministic scoring</strong> &mdash; 38+ formulas, same inputs = same outputs, every time</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <CheckCircle2 size={18} className="text-blue-300 mt-0.5 flex-shrink-0" />
+                                        <p className="text-sm text-blue-100"><strong className="text-white">Full audit trail</strong> &mdash; Every claim traceable to source data and methodology</p>
+                                    </div>
+                                    <div className="flex items-start gap-3">
+                                        <CheckCircle2 size={18} className="text-blue-300 mt-0.5 flex-shrink-0" />
+                                        <p className="text-sm text-blue-100"><strong className="text-white">Ethical enforcement</strong> &mdash; Rawlsian fairness gates reject unethical paths automatically</p>
+                                    </div>
+                                </div>
+                                <div className="mt-6 bg-white/10 backdrop-blur-sm rounded-sm p-4 border border-white/20">
+                                    <p className="text-sm text-white italic font-medium">&ldquo;Every recommendation traceable. Every output repeatable. Every claim defensible.&rdquo;</p>
+                                </div>
+                            </div>
+                        </div>
+
+                        {/* Architecture button */}
+                        <div className="bg-slate-900 p-6 flex flex-col sm:flex-row items-center justify-between gap-4">
+                            <p className="text-sm text-slate-400">Want to see every algorithm, formula, engine, and the full NSIL architecture that makes this possible?</p>
+                            <button 
+                                onClick={() => setShowFormulas(true)}
+                                className="inline-flex items-center gap-3 px-8 py-3 bg-blue-600 text-white rounded-sm text-sm font-bold hover:bg-blue-700 transition-all shadow-lg hover:shadow-xl whitespace-nowrap"
+                            >
+                                <GitBranch size={18} />
+                                View Full Architecture &amp; 38+ Formulas
+                            </button>
+                        </div>
+                    </div>
+
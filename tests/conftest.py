@@ -0,0 +1,15 @@
+"""Puts the repo root on sys.path, so `pytest tests` finds tsxtools without `python -m`.
+
+The on-disk cache and the edit journal are switched off, so tests neither
+read a stale index nor leave anything behind in the repo root.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ['TSXTOOLS_CACHE'] = ''
+os.environ['TSXTOOLS_JOURNAL'] = ''
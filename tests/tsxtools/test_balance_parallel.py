@@ -0,0 +1,62 @@
+"""The chunk-parallel balance scan must agree with the serial one exactly."""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import random
+
+import pytest
+
+from tsxtools.balance import first_negative
+from tsxtools.balance_parallel import first_negative_parallel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SOURCE = os.path.join(ROOT, 'components', 'CommandCenter.tsx')
+
+
+@pytest.fixture(scope='module')
+def source():
+    with open(SOURCE, encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def _corrupt(text, rng):
+    """text with one `{`, `` ` ``, quote or `/*` dropped or added somewhere."""
+    at = rng.randrange(len(text))
+    if rng.random() < 0.5:
+        candidates = [i for i in range(at, min(len(text), at + 5000)) if text[i] in '{`\'"']
+        if candidates:
+            i = candidates[0]
+            return text[:i] + text[i + 1:]
+    return text[:at] + rng.choice(['}', '`', '/*', '"', '${']) + text[at:]
+
+
+def _same(path, executor, jobs):
+    serial = first_negative(path)
+    parallel = first_negative_parallel(path, jobs=jobs, executor=executor)
+    assert (parallel.negative, parallel.balance) == (serial.negative, serial.balance)
+    if serial.negative:
+        assert (parallel.offset, parallel.line, parallel.col) == (serial.offset, serial.line, serial.col)
+        assert (parallel.before, parallel.after) == (serial.before, serial.after)
+
+
+def test_clean_file(tmp_path, source, executor):
+    path = tmp_path / 'clean.tsx'
+    path.write_text(source, encoding='utf-8')
+    _same(str(path), executor, jobs=4)
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_corrupted_files(tmp_path, source, executor, seed):
+    rng = random.Random(seed)
+    text = source
+    for _ in range(rng.randint(1, 3)):
+        text = _corrupt(text, rng)
+    path = tmp_path / f'corrupt-{seed}.tsx'
+    path.write_text(text, encoding='utf-8')
+    _same(str(path), executor, jobs=rng.choice([2, 3, 4, 8]))
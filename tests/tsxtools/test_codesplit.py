@@ -0,0 +1,54 @@
+"""Free-name analysis of tsxtools.codesplit on the BWConsultantOS modals.
+
+Run from the repo root: pytest tests/tsxtools
+"""
+
+import os
+
+import pytest
+
+from tsxtools.codesplit import _bound_and_read, find_conditionals, plan_split
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BWCONSULTANT = os.path.join(ROOT, 'components', 'BWConsultantOS.tsx')
+
+
+def _reads(code):
+    """Names code reads that it does not bind, as free_names() counts them."""
+    bound, reads = _bound_and_read(code)
+    return {name for name, _at in reads} - bound
+
+
+def test_regex_flags_and_escapes_are_not_names():
+    assert _reads("text.split(/\\n\\n+/).map(part => part.replace(/-/g, ' '))") == {'text'}
+
+
+def test_type_after_as_is_skipped():
+    code = "(Object.entries(labels) as Array<[LiveInsightFilter, string]>).map(([k]) => k)"
+    assert _reads(code) == {'Object', 'labels'}
+    assert _reads("[caseStudy as unknown as Record<string, unknown>]") == {'caseStudy'}
+    assert _reads("value satisfies Options | null") == {'value'}
+
+
+def test_type_annotation_on_local_const_is_skipped():
+    assert _reads("const pick: Map<string, Item> = build(items)") == {'build', 'items'}
+
+
+@pytest.fixture(scope='module')
+def bwconsultant():
+    with open(BWCONSULTANT, encoding='utf-8') as f:
+        text = f.read()
+    return text, {block.condition: block for block in find_conditionals(text, 0)}
+
+
+@pytest.mark.parametrize('condition, wrong', [
+    ('showPilotWindow', {'g', 'LiveInsightFilter', 'string'}),
+    ('showFinalReport', {'n'}),
+    ('showWorkspaceModal', {'string', 'unknown'}),
+])
+def test_modal_props_are_values_only(bwconsultant, condition, wrong):
+    text, blocks = bwconsultant
+    split = plan_split(BWCONSULTANT, text, blocks[condition])
+    props = {name for name, _type in split.props}
+    assert props and not props & wrong
+    assert f'setShow{condition[4:]}' in props
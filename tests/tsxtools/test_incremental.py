@@ -0,0 +1,72 @@
+"""Incremental hunk checks (tsxtools.incremental) against a full rescan."""
+
+import difflib
+import os
+import random
+
+import pytest
+
+from tsxtools.incremental import Hunk, check_hunks
+from tsxtools.mismatch import find_mismatches_in_text, structure_profile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SOURCE = os.path.join(ROOT, 'components', 'Gateway.tsx')
+
+
+@pytest.fixture(scope='module')
+def base():
+    with open(SOURCE, encoding='utf-8') as f:
+        text = f.read()
+    assert not find_mismatches_in_text(text)
+    return text, structure_profile(text)
+
+
+def _hunks(old, new):
+    """Hunks as `git diff --unified=0` gives them, 0-based."""
+    matcher = difflib.SequenceMatcher(None, old.splitlines(True), new.splitlines(True), autojunk=False)
+    return [Hunk(i1, i2 - i1, j1, j2 - j1) for op, i1, i2, j1, j2 in matcher.get_opcodes() if op != 'equal']
+
+
+def _edit(text, rng):
+    lines = text.splitlines(True)
+    for _ in range(rng.randint(1, 3)):
+        k = rng.randrange(len(lines))
+        op = rng.choice(('delete', 'duplicate', 'open', 'close', 'tag', 'text'))
+        if op == 'delete':
+            del lines[k]
+        elif op == 'duplicate':
+            lines.insert(k, lines[k])
+        elif op == 'open':
+            lines[k] = lines[k].replace('{', '', 1)
+        elif op == 'close':
+            lines[k] = lines[k].replace('}', '', 1)
+        elif op == 'tag':
+            lines[k] = lines[k].replace('</div>', '', 1)
+        else:
+            lines[k] = lines[k].replace('e', 'é')
+    return ''.join(lines)
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_sampled_edits_agree_with_a_full_rescan(base, seed):
+    text, profile = base
+    new = _edit(text, random.Random(seed))
+    problems, _rescanned, lines = check_hunks(profile, text, new, _hunks(text, new))
+    assert bool(problems) == bool(find_mismatches_in_text(new))
+    assert lines == new.count('\n') + 1
+
+
+def test_clean_edit_rescans_only_its_block(base):
+    text, profile = base
+    new = text.replace('Select Target Region...', 'Choose a target region...')
+    problems, rescanned, _lines = check_hunks(profile, text, new, _hunks(text, new))
+    assert problems == []
+    assert rescanned < 20
+
+
+def test_closing_and_reopening_a_block_is_not_a_problem(base):
+    text, profile = base
+    new = text.replace('                                } else {\n',
+                       '                                } else {\n                                } else {\n', 1)
+    assert new != text and not find_mismatches_in_text(new)
+    assert check_hunks(profile, text, new, _hunks(text, new))[0] == []
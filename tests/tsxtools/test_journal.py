@@ -0,0 +1,62 @@
+"""Reverse-edit journal (tsxtools.journal): undo then redo gives back the exact bytes."""
+
+import pytest
+
+from tsxtools import journal
+from tsxtools.fileio import write_if_changed
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal, 'JOURNAL_DIR', str(tmp_path / 'journal'))
+    return tmp_path
+
+
+def _run(monkeypatch, name, writes):
+    """Journal writes [(path, text)] as one run called name."""
+    monkeypatch.setattr(journal, '_run', name)
+    for path, text in writes:
+        write_if_changed(str(path), text)
+
+
+def _read(path):
+    return path.read_bytes() if path.exists() else None
+
+
+def test_undo_then_redo_round_trips_bytes(journal_dir, monkeypatch):
+    a = journal_dir / 'A.tsx'
+    b = journal_dir / 'B.tsx'
+    a.write_bytes(b"const a = 1;\r\nconst label = 'caf\xc3\xa9';\n")
+    original = a.read_bytes()
+    _run(monkeypatch, 'run-1', [(a, "const a = 2;\r\nconst label = 'café';\nexport default a;\n"),
+                                (b, "export const b = true;\n")])
+    after_first = (_read(a), _read(b))
+    _run(monkeypatch, 'run-2', [(a, "const a = 3;\r\nconst label = 'cafe';\nexport default a;\n")])
+    after_second = _read(a)
+
+    assert journal.undo({'run-2'}) == [str(a)]
+    assert (_read(a), _read(b)) == after_first
+    assert journal.undo({'run-1'}) == sorted([str(a), str(b)])
+    assert _read(a) == original and _read(b) is None
+
+    journal.redo({'run-1'})
+    assert (_read(a), _read(b)) == after_first
+    journal.redo({'run-2'})
+    assert _read(a) == after_second
+    assert [run['undone'] for run in journal.load_runs().values()] == [False, False]
+
+
+def test_undo_refuses_a_file_edited_since(journal_dir, monkeypatch):
+    a = journal_dir / 'A.tsx'
+    a.write_text("const a = 1;\n")
+    _run(monkeypatch, 'run-1', [(a, "const a = 2;\n")])
+    a.write_text("const a = 2; // edited by hand\n")
+    with pytest.raises(journal.JournalError):
+        journal.undo({'run-1'})
+    assert a.read_text() == "const a = 2; // edited by hand\n"
+
+
+def test_regions_record_only_the_changed_bytes():
+    old = b"line one\nline two\nline three\n"
+    new = b"line one\nline 2\nline three\n"
+    assert journal.regions(old, new) == [(14, b'two', b'2')]
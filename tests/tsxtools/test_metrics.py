@@ -0,0 +1,32 @@
+"""largest_literal in tsxtools.metrics covers every kind of inline literal."""
+
+from tsxtools.metrics import data_metrics
+
+PROMPT = 'x' * 300
+TEXT = 'y ' * 200
+
+
+def _largest(source):
+    metrics = data_metrics('Component.tsx', source.encode('utf-8'))
+    return metrics.largest_literal, metrics.largest_literal_line
+
+
+def test_array_literal():
+    items = ', '.join(str(i) for i in range(100))
+    assert _largest(f"const a = 1;\nconst items = [{items}];\n") == (len(items) + 2, 2)
+
+
+def test_template_literal():
+    source = f"const a = [1, 2];\n\nconst prompt = `{PROMPT} ${{a}}`;\n"
+    assert _largest(source) == (len(PROMPT) + 7, 3)
+
+
+def test_jsx_text_run():
+    source = (f"export const Intro = () => (\n  <p className=\"lead\">\n    {TEXT}\n"
+              f"    {{count}} <b>bold</b>\n  </p>\n);\n")
+    assert _largest(source) == (len(TEXT.strip()), 3)
+
+
+def test_apostrophes_in_jsx_text_are_not_strings():
+    source = "const A = () => <p>We don't guess, we don't bluff, and it's not magic.</p>;\n"
+    assert _largest(source) == (len("We don't guess, we don't bluff, and it's not magic."), 1)
@@ -0,0 +1,91 @@
+"""Semantic fingerprints (tsxtools.semantic): what may and may not change the hash.
+
+semhash --changed lets CI skip tsc and the logic tests for files whose hash
+is unchanged, so every "same" case here is an edit CI will not check.
+"""
+
+import pytest
+
+from tsxtools.semantic import fingerprint
+
+COMPONENT = """import React from 'react';
+
+// Rows of the message list.
+export const MessageRow = ({ msg, mode }: Props) => {
+  const label = msg.role === 'user' ? 'You' : 'Advisor';
+  return (
+    <div className={`flex gap-2 ${mode === 'dark' ? 'bg-slate-900' : 'bg-white'}`} data-role={msg.role}>
+      <span className="text-sm font-medium">{label}</span>
+      <a href="https://example.com/help" className={cn('underline', msg.pinned && 'font-bold')}>Help</a>
+    </div>
+  );
+};
+
+function count(items) {
+  let total = 0
+  for (const item of items) {
+    total += item.size
+  }
+  return total
+}
+"""
+
+
+def _digest(text):
+    return fingerprint(text).digest
+
+
+SAME = {
+    'static class': ('text-sm font-medium', 'text-xs font-semibold'),
+    'class in a template': ("'bg-slate-900'", "'bg-zinc-950'"),
+    'class in a cn() call': ("'underline'", "'underline underline-offset-2'"),
+    're-indented line': ('  let total = 0\n', '      let total = 0\n'),
+    'comment': ('// Rows of the message list.', '// One row per message, newest last.'),
+    'blank lines': ('function count', '\n\nfunction count'),
+    're-wrapped opening tag': ('<a href="https://example.com/help" className',
+                               '<a\n        href="https://example.com/help"\n        className'),
+    'wrapped ternary': ("msg.role === 'user' ? 'You' : 'Advisor'",
+                        "msg.role === 'user'\n    ? 'You'\n    : 'Advisor'"),
+}
+
+CHANGED = {
+    'label': ("'Advisor'", "'Assistant'"),
+    'jsx text': ('>Help<', '>Support<'),
+    'url': ('https://example.com/help', 'https://example.com/faq'),
+    'compared string in code': ("msg.role === 'user'", "msg.role === 'usr'"),
+    'compared string in a className': ("mode === 'dark'", "mode === 'light'"),
+    'return value moved to the next line': ('  return total\n', '  return\n  total\n'),
+    'two statements joined': ('  let total = 0\n  for', '  let total = 0 for'),
+    'operator': ('total += item.size', 'total -= item.size'),
+}
+
+
+@pytest.mark.parametrize('old,new', SAME.values(), ids=SAME.keys())
+def test_cosmetic_edits_keep_the_hash(old, new):
+    assert old in COMPONENT
+    assert _digest(COMPONENT.replace(old, new, 1)) == _digest(COMPONENT)
+
+
+@pytest.mark.parametrize('old,new', CHANGED.values(), ids=CHANGED.keys())
+def test_code_edits_change_the_hash(old, new):
+    assert old in COMPONENT
+    assert _digest(COMPONENT.replace(old, new, 1)) != _digest(COMPONENT)
+
+
+@pytest.mark.parametrize('code', [
+    '<div className={mode === "dark" ? "a" : "b"} />',
+    '<div className={"dark" !== mode ? "a" : "b"} />',
+    '<div className={getClass(status == "dark")} />',
+    '<div className={styles["dark"]} />',
+    '<div className={`${mode === `dark` ? "a" : "b"}`} />',
+])
+def test_compared_strings_inside_class_names_are_kept(code):
+    assert _digest(code) != _digest(code.replace('dark', 'light'))
+
+
+def test_declaration_digests_localize_a_change():
+    changed = fingerprint(COMPONENT.replace("'Advisor'", "'Assistant'"))
+    before = {name: digest for name, _line, digest in fingerprint(COMPONENT).parts}
+    after = {name: digest for name, _line, digest in changed.parts}
+    assert before['count'] == after['count']
+    assert before['MessageRow'] != after['MessageRow']
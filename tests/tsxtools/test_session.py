@@ -0,0 +1,93 @@
+"""Patch sessions (tsxtools.session, EditBuffer.write): disjoint edits merge, overlapping ones are refused."""
+
+from concurrent.futures import ProcessPoolExecutor
+import time
+
+from tsxtools.editbuffer import EditBuffer
+from tsxtools.session import line_hunks, merge
+
+BASE = [f"const line{i} = {i};\n" for i in range(20)]
+
+
+def _edited(lines, at, text):
+    out = list(lines)
+    out[at:at + 1] = [text]
+    return out
+
+
+def _merge(ours, theirs):
+    return merge(BASE, line_hunks(BASE, ours), ours, line_hunks(BASE, theirs), theirs)
+
+
+def test_disjoint_edits_merge():
+    ours = _edited(BASE, 3, "const line3 = 'ours';\n")
+    theirs = _edited(BASE, 12, "const line12 = 'theirs';\n")
+    theirs.insert(15, "const extra = true;\n")
+    merged, conflicts = _merge(ours, theirs)
+    assert conflicts == []
+    assert merged == _edited(theirs, 3, "const line3 = 'ours';\n")
+
+
+def test_overlapping_edits_are_rejected():
+    ours = _edited(BASE, 5, "const line5 = 'ours';\n")
+    theirs = _edited(BASE, 5, "const line5 = 'theirs';\n")
+    merged, conflicts = _merge(ours, theirs)
+    assert merged is None
+    assert [(c.ours.old_first, c.theirs.old_first) for c in conflicts] == [(5, 5)]
+
+
+def test_adjacent_edits_count_as_overlapping():
+    ours = _edited(BASE, 5, "const line5 = 'ours';\n")
+    theirs = BASE[:6] + ["const inserted = true;\n"] + BASE[6:]
+    assert _merge(ours, theirs)[0] is None
+
+
+def test_the_same_edit_on_both_sides_is_taken_once():
+    both = _edited(BASE, 7, "const line7 = 'both';\n")
+    merged, conflicts = _merge(both, list(both))
+    assert conflicts == [] and merged == both
+
+
+def _write_file(tmp_path):
+    path = tmp_path / 'Component.tsx'
+    path.write_text(''.join(BASE), encoding='utf-8')
+    return str(path)
+
+
+def test_concurrent_buffers_merge_disjoint_writes(tmp_path):
+    path = _write_file(tmp_path)
+    first, second = EditBuffer(path), EditBuffer(path)
+    first.replace_lines(2, 3, "const line2 = 'first';\n")
+    second.replace_lines(14, 15, "const line14 = 'second';\n")
+    assert first.write() and second.write()
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    assert "'first'" in text and "'second'" in text
+
+
+def test_concurrent_buffers_refuse_overlapping_writes(tmp_path):
+    path = _write_file(tmp_path)
+    first, second = EditBuffer(path), EditBuffer(path)
+    first.replace_lines(2, 3, "const line2 = 'first';\n")
+    second.replace_lines(2, 4, "const line2 = 'second';\n")
+    assert first.write()
+    assert not second.write()
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == ''.join(_edited(BASE, 2, "const line2 = 'first';\n"))
+
+
+def _edit_in_process(path, at):
+    buffer = EditBuffer(path)
+    buffer.replace_lines(at, at + 1, f"const line{at} = 'worker';\n")
+    time.sleep(0.05)            # every worker reads before any writes
+    return buffer.write()
+
+
+def test_parallel_sessions_all_land(tmp_path):
+    path = _write_file(tmp_path)
+    lines = [1, 5, 9, 13, 17]
+    with ProcessPoolExecutor(max_workers=len(lines)) as pool:
+        assert all(pool.map(_edit_in_process, [path] * len(lines), lines))
+    with open(path, encoding='utf-8') as f:
+        result = f.readlines()
+    assert result == [f"const line{i} = 'worker';\n" if i in lines else BASE[i] for i in range(len(BASE))]
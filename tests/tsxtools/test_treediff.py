@@ -0,0 +1,62 @@
+"""Structural diffs from tsxtools.treediff: code outside JSX must show up too."""
+
+from tsxtools.treediff import ADDED, MODIFIED, REMOVED, build_tree, diff_trees
+
+BEFORE = """import React from 'react';
+
+const programs = [
+  { id: 1, name: 'Export grants' },
+  { id: 2, name: 'Skills fund' },
+];
+
+export default function Programs() {
+  const [query, setQuery] = React.useState('');
+  if (!query) {
+    return null;
+  }
+  return (
+    <section className="p-4">
+      <h2>Programs</h2>
+      <ul>{programs.map(p => <li key={p.id}>{p.name}</li>)}</ul>
+    </section>
+  );
+}
+"""
+
+
+def _diff(before, after):
+    """[(kind, label)] of the changes, labelled from the new side unless removed."""
+    old, new = build_tree(before), build_tree(after)
+    out = []
+    for change in diff_trees(old, new):
+        if change.new is None:
+            out.append((change.kind, old.label(change.old, before)))
+        else:
+            out.append((change.kind, new.label(change.new, after)))
+    return out
+
+
+def test_whitespace_only_changes_are_ignored():
+    after = BEFORE.replace('  return (\n', '    return (\n').replace('<ul>{programs', '<ul>\n        {programs')
+    assert _diff(BEFORE, after) == []
+
+
+def test_changes_outside_jsx_are_reported():
+    after = BEFORE.replace("  { id: 2, name: 'Skills fund' },\n", '')
+    after = after.replace("import React from 'react';\n", "import React from 'react';\nimport data from './data';\n")
+    changes = _diff(BEFORE, after)
+    assert (ADDED, "import data from './data';") in changes
+    assert (MODIFIED, 'const programs') in changes
+
+
+def test_changed_block_is_reported_at_the_block():
+    after = BEFORE.replace('return null;', 'return <p>Type to search</p>;')
+    changes = _diff(BEFORE, after)
+    assert (MODIFIED, 'if (!query) {…}') in changes
+    assert (ADDED, '<p>') in changes
+    assert (MODIFIED, 'function Programs') not in changes
+
+
+def test_jsx_element_removed():
+    after = BEFORE.replace('      <h2>Programs</h2>\n', '')
+    assert (REMOVED, '<h2>') in _diff(BEFORE, after)
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+One entry point for the TSX tools.
+
+    python tsxtool.py [--profile[=FILE]] [--memory | --memory-budget MB] COMMAND [args ...]
+
+    check   every unclosed or unexpected bracket or JSX tag, per file
+    audit   top-level declaration map of a component (find_unbalanced.py)
+    apply   run a patch script: `apply NAME`, or `apply` alone to list them
+    diff    structural diff of two versions (diff_tree.py)
+    index   find JSX elements with a CSS-like selector (find_jsx.py)
+    deps    files affected by a change, from the cached import graph
+            (e.g. `check $(python tsxtool.py deps --changed)`)
+    report  per-file structural metrics as NDJSON, worst offenders last
+    render  state hooks, inline props and the JSX sections to extract first
+    bench   time every per-file index, built cold and loaded from the cache;
+            --replay replays real file history from backups/ and git
+    semhash hash files ignoring whitespace, comments and className strings
+            (e.g. `tsc` only on `$(python tsxtool.py semhash --changed)`)
+    journal list the patch runs in the reverse-edit journal
+    undo    revert runs from the journal: the last one, RUN ..., or FIRST..LAST
+    redo    re-apply undone runs, the same way
+
+`python tsxtool.py COMMAND --help` lists a command's options. Only this
+table is loaded at start-up; each command imports its own modules when it
+runs. `check` on a file answers from a result cache keyed on the file's
+content hash and only imports the lexer for files it has not seen; several
+files or directories go through tsxtools.pipeline, which reads ahead while
+they are scanned. With options it hands over to find_brace.py --all.
+
+--memory traces allocations (tsxtools.memory) and reports peak and retained
+memory for the command, each EditBuffer edit and each scanned file on
+stderr; --memory-budget MB also aborts, with exit status 3, as soon as more
+than MB megabytes are traced. TSXTOOLS_MEMORY=1 and TSXTOOLS_MEMORY_BUDGET=MB
+do the same, and also work for patch scripts run on their own.
+
+--profile samples the command's stack every millisecond of CPU time
+(tsxtools.profiler) and writes the samples as folded stacks, tagged with
+the command and the file being worked on and its size, to FILE (default
+tsxtool-COMMAND.folded), for flamegraph.pl, inferno or speedscope; the
+busiest functions and files are summarized on stderr. TSXTOOLS_PROFILE=FILE
+does the same, for patch scripts run on their own too.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def check(argv):
+    if not argv or any(arg.startswith('-') for arg in argv):
+        import find_brace
+        return find_brace.main(['--all', *argv])
+    paths = argv
+    if any(os.path.isdir(arg) for arg in argv):
+        from find_brace import iter_paths
+        paths = list(iter_paths(argv))
+    if len(paths) == 1:
+        from tsxtools.check import check_file
+        found = {paths[0]: check_file(paths[0])}
+    else:
+        from tsxtools.check import check_data
+        from tsxtools.pipeline import run_pipeline
+        found = dict(run_pipeline(paths, check_data, os.cpu_count() or 1))
+
+    status = 0
+    total = 0
+    for path in paths:
+        problems = found[path]
+        if not problems:
+            print(f"{path}: balanced")
+            continue
+        status = 1
+        total += len(problems)
+        for line, col, description in problems:
+            print(f"{path}:{line}:{col}: {description}")
+    if total:
+        print(f"{total} problem(s)")
+    return status
+
+
+def audit(argv):
+    import find_unbalanced
+    return find_unbalanced.main(argv)
+
+
+def _patch_scripts():
+    """{name: path} for apply_NAME.py and _NAME.py patch scripts in the repo root."""
+    scripts = {}
+    for entry in sorted(os.listdir(ROOT)):
+        if not entry.endswith('.py'):
+            continue
+        if entry.startswith('apply_'):
+            scripts[entry[len('apply_'):-3]] = os.path.join(ROOT, entry)
+        elif entry.startswith('_') and not entry.startswith('__'):
+            scripts[entry[1:-3]] = os.path.join(ROOT, entry)
+    return scripts
+
+
+def apply(argv):
+    scripts = _patch_scripts()
+    if not argv or argv[0] in ('-h', '--help'):
+        print("usage: tsxtool.py apply NAME [ARGS ...]\n\npatch scripts:")
+        for name, path in scripts.items():
+            print(f"  {name:<20} {os.path.basename(path)}")
+        return 0 if argv else 2
+    if argv[0] not in scripts:
+        print(f"ERROR: no patch script named {argv[0]!r} (run `tsxtool.py apply` for the list)")
+        return 2
+    import runpy
+    saved = sys.argv
+    sys.argv = [scripts[argv[0]], *argv[1:]]    # for scripts that parse their own arguments
+    try:
+        runpy.run_path(scripts[argv[0]], run_name='__main__')
+    except SystemExit as stop:
+        return stop.code if isinstance(stop.code, int) else 1
+    finally:
+        sys.argv = saved
+    return 0
+
+
+def diff(argv):
+    import diff_tree
+    return diff_tree.main(argv)
+
+
+def index(argv):
+    import find_jsx
+    return find_jsx.main(argv)
+
+
+def deps(argv):
+    import argparse
+    from tsxtools.imports import load_graph, save_graph
+
+    parser = argparse.ArgumentParser(
+        prog='tsxtool.py deps',
+        description='Print the given files and every file that imports them, directly or transitively.')
+    parser.add_argument('paths', nargs='*')
+    parser.add_argument('--changed', nargs='?', const='HEAD', metavar='REV',
+                        help='start from the files changed since REV (default HEAD)')
+    parser.add_argument('--direct', action='store_true', help='only direct importers')
+    parser.add_argument('--imports', action='store_true', help='print what each file imports instead')
+    args = parser.parse_args(argv)
+
+    paths = [os.path.relpath(os.path.abspath(p), ROOT).replace(os.sep, '/') for p in args.paths]
+    if args.changed:
+        from tsxtools.incremental import _git
+        names = _git(['diff', '--name-only', '--no-renames', args.changed], ROOT).decode().split()
+        paths += [name for name in names if name not in paths]
+
+    graph = load_graph(ROOT)
+    if args.imports:
+        for path in paths:
+            for target in graph.imports.get(path, ()):
+                print(f"{path} -> {target}")
+            for spec in graph.unresolved.get(path, ()):
+                print(f"{path} -> {spec} (unresolved)")
+        return 0
+    if args.direct:
+        affected = sorted(set(paths).union(*(graph.dependents(p, transitive=False) for p in paths)))
+    else:
+        affected = graph.affected(paths)
+        save_graph(graph)
+    for path in affected:
+        print(path)
+    return 0
+
+
+REPORT_PATHS = ('components', 'services', 'hooks', 'core', 'server', 'shared', 'constants', 'App.tsx', 'index.tsx')
+
+
+def report(argv):
+    import argparse
+    import json
+    from find_brace import iter_paths
+    from tsxtools.metrics import BUDGETS, data_metrics, score
+    from tsxtools.pipeline import run_pipeline
+
+    parser = argparse.ArgumentParser(
+        prog='tsxtool.py report',
+        description='Stream per-file metrics as NDJSON on stdout; rank the worst files on stderr.')
+    parser.add_argument('paths', nargs='*', default=[os.path.relpath(os.path.join(ROOT, p)) for p in REPORT_PATHS])
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--top', type=int, default=10, help='files in the ranking (0: none)')
+    args = parser.parse_args(argv)
+
+    paths = [p for p in iter_paths(args.paths) if os.path.exists(p)]
+    collected = []
+
+    def emit(_path, metrics):
+        collected.append(metrics)
+        print(json.dumps(metrics.to_dict()), flush=True)
+    run_pipeline(paths, data_metrics, args.jobs, on_result=emit)
+
+    ranked = sorted(collected, key=score, reverse=True)[:args.top]
+    if ranked:
+        budgets = ', '.join(f"{name} {budget}" for name, budget in BUDGETS.items())
+        print(f"\nWorst offenders of {len(collected)} file(s) (score: sum of metric / budget; {budgets}):",
+              file=sys.stderr)
+        for m in ranked:
+            over = f"  over: {', '.join(m.over)}" if m.over else ''
+            print(f"  {score(m):6.2f}  {os.path.relpath(m.path, ROOT)}: {m.lines} lines, "
+                  f"brace depth {m.max_brace_depth}, JSX depth {m.max_jsx_depth}, {m.sections} sections, "
+                  f"{m.hooks} hooks, largest literal {m.largest_literal} chars at line {m.largest_literal_line}"
+                  f"{over}", file=sys.stderr)
+    return 0
+
+
+def render(argv):
+    import argparse
+    from tsxtools.render import advice, analyze, top_sections
+
+    parser = argparse.ArgumentParser(
+        prog='tsxtool.py render',
+        description='Estimate what each state update re-renders, and rank sections to extract or memoize.')
+    parser.add_argument('paths', nargs='*', default=[os.path.relpath(os.path.join(ROOT, 'components', name))
+                                                     for name in ('BWConsultantOS.tsx', 'CommandCenter.tsx')])
+    parser.add_argument('--top', type=int, default=10, help='sections and state variables per component')
+    parser.add_argument('--min-state', type=int, default=1, help='skip components with fewer state hooks')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        for cost in analyze(path):
+            if len(cost.state) < args.min_state:
+                continue
+            print(f"{path}: {cost.name} (lines {cost.line}-{cost.end_line})")
+            print(f"  {len(cost.state)} state hooks, {cost.effects} effects, {cost.memos} useMemo/useCallback, "
+                  f"{cost.elements} JSX elements re-rendered on every state change")
+            if cost.inline:
+                kinds = {}
+                for prop in cost.inline:
+                    kinds[prop.kind] = kinds.get(prop.kind, 0) + 1
+                on_components = sum(prop.on_component for prop in cost.inline)
+                print(f"  inline props created in render: "
+                      f"{', '.join(f'{n} {kind}' for kind, n in sorted(kinds.items()))}; "
+                      f"{on_components} passed to components, which defeats React.memo there")
+                worst = [prop for prop in cost.inline if prop.on_component][:args.top]
+                for prop in worst:
+                    print(f"    {path}:{prop.line}: <{prop.tag} {prop.attr}={{...}}> inline {prop.kind}")
+            if cost.uses:
+                print("  state read by the most JSX (readers / elements under them):")
+                for use in cost.uses[:args.top]:
+                    print(f"    {use.name:<32}{use.readers:>5} {use.subtree:>6}   (declared at line {use.line})")
+            sections = top_sections(cost, args.top)
+            if sections:
+                print("  sections to extract or memoize first "
+                      "(score: elements x share of state they do not read):")
+                for rank, section in enumerate(sections, 1):
+                    lists = f", {section.lists} list(s)" if section.lists else ''
+                    print(f"    {rank:>2}. {section.score:7.1f}  lines {section.line}-{section.end_line} "
+                          f"{section.label}: {section.elements} elements, reads "
+                          f"{len(section.reads)}/{len(cost.state)} state{lists}")
+                    print(f"               -> {advice(cost, section)}")
+            print()
+    return 0
+
+
+def bench(argv):
+    import argparse
+    from tsxtools.bench import STAGES, bench_file, startup
+
+    parser = argparse.ArgumentParser(prog='tsxtool.py bench', description='Time every per-file index.')
+    parser.add_argument('paths', nargs='*')
+    parser.add_argument('--stage', action='append', choices=STAGES, help='only these stages (repeatable)')
+    parser.add_argument('--repeat', type=int, help='runs per figure, best is kept (default 3, 1 with --replay)')
+    parser.add_argument('--startup', action='store_true', help='also time `tsxtool.py check` start-up')
+    parser.add_argument('--replay', action='store_true',
+                        help='replay the versions of each file (default: all with history) from '
+                             'backups/ and git, timing full against cached and incremental work')
+    parser.add_argument('--snapshot', help='backups/ snapshot to start from (default: the newest)')
+    args = parser.parse_args(argv)
+    if args.replay:
+        return _bench_replay(args)
+
+    for path in args.paths or [os.path.join(ROOT, 'components', 'BWConsultantOS.tsx')]:
+        print(f"{path}:")
+        print(f"  {'stage':<14}{'cold ms':>10}{'disk ms':>10}{'memory ms':>11}")
+        for name, cold, disk, memory in bench_file(path, args.stage, args.repeat or 3):
+            disk = f"{disk:10.2f}" if disk is not None else f"{'-':>10}"
+            print(f"  {name:<14}{cold:10.2f}{disk}{memory:11.3f}")
+        if args.startup:
+            command, bare = startup(['check', path], args.repeat or 3)
+            print(f"  tsxtool.py check: {command:.1f} ms ({command - bare:.1f} ms over a bare interpreter)")
+    return 0
+
+
+def _bench_replay(args):
+    from tsxtools.incremental import git_root
+    from tsxtools.replay import replay, summarize
+
+    root = git_root(ROOT)
+    paths = [os.path.relpath(os.path.abspath(p), root).replace(os.sep, '/') for p in args.paths]
+    snapshot = os.path.abspath(args.snapshot) if args.snapshot else None
+    if snapshot and not os.path.isdir(snapshot):
+        print(f"ERROR: no snapshot directory {args.snapshot}")
+        return 1
+
+    def progress(file):
+        if not file.revisions:
+            return
+        print(f"{file.path}:")
+        print(f"  {'revision':<10}{'lines':>7}{'changed':>8}{'full ms':>9}{'store':>8}{'hit':>8}"
+              f"{'check':>9}{'diff':>8}{'incr':>8}")
+        for r in file.revisions:
+            print(f"  {r.label:<10}{r.lines:7d}{r.changed:8d}{r.full:9.1f}{r.store:8.1f}{r.hit:8.1f}"
+                  f"{r.check:9.1f}{r.diff:8.1f}{r.incr:8.1f}")
+
+    replays = replay(paths or None, root, snapshot if snapshot else None, args.stage, args.repeat or 1, progress)
+    total = summarize(replays)
+    if total is None:
+        print("No file has more than one version on record.")
+        return 0
+    print(f"\nReplayed {total.revisions} revision(s) of {total.files} file(s): "
+          f"{total.changed} of {total.lines} lines changed")
+    print(f"  full rebuild, all stages  {total.full:10.1f} ms")
+    print(f"  cache store on each miss  {total.store:10.1f} ms")
+    print(f"  cache hit, all stages     {total.hit:10.1f} ms  "
+          f"({total.hit / max(total.full, 1e-9):.1%} of a rebuild)")
+    print(f"  full structure check      {total.check:10.1f} ms")
+    print(f"  diff + incremental check  {total.diff + total.incr:10.1f} ms  "
+          f"(diff {total.diff:.1f}, check {total.incr:.1f}; faster on {total.incr_wins} "
+          f"of {total.revisions} revisions)")
+    payoff = 'never' if total.payoff == float('inf') else f"after {total.payoff:.2f} reuse(s)"
+    print(f"\nCaching: a revision's entries pay for their store {payoff} (median).")
+    if total.diff + total.incr < total.check:
+        print(f"Incremental check: {total.check / max(total.diff + total.incr, 1e-9):.1f}x "
+              f"faster than rescanning on this history.")
+    else:
+        print(f"Incremental check: slower than rescanning on this history "
+              f"({(total.diff + total.incr) / max(total.check, 1e-9):.1f}x the full check).")
+    return 0
+
+
+def semhash(argv):
+    import argparse
+    import json
+    from find_brace import iter_paths
+    from tsxtools.incremental import SOURCE_SUFFIXES, _git
+    from tsxtools.semantic import load_fingerprint, revision_fingerprint
+
+    parser = argparse.ArgumentParser(
+        prog='tsxtool.py semhash',
+        description='Hash each file ignoring whitespace, comments and className strings; '
+                    'list the files whose code changed.')
+    parser.add_argument('paths', nargs='*')
+    since = parser.add_mutually_exclusive_group()
+    since.add_argument('--changed', nargs='?', const='HEAD', metavar='REV',
+                       help='print the files changed since REV (default HEAD) whose semantic hash changed')
+    since.add_argument('--against', metavar='MANIFEST',
+                       help='print the files whose semantic hash differs from MANIFEST')
+    parser.add_argument('--save', metavar='MANIFEST', help='write the hashes as JSON for a later --against')
+    parser.add_argument('--parts', action='store_true', help='also hash each module-level declaration')
+    args = parser.parse_args(argv)
+
+    def rel(path):
+        return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, '/')
+
+    if args.changed:
+        import subprocess
+        try:
+            _git(['rev-parse', '--verify', '--quiet', f'{args.changed}^{{commit}}'], ROOT)
+        except subprocess.CalledProcessError:
+            print(f"ERROR: unknown revision {args.changed!r}")
+            return 1
+        names = _git(['diff', '--name-only', '--no-renames', args.changed, '--', *args.paths], ROOT).decode().split()
+        paths = [name for name in names if name.endswith(SOURCE_SUFFIXES)]
+    else:
+        given = args.paths or [os.path.relpath(os.path.join(ROOT, p)) for p in REPORT_PATHS]
+        paths = [rel(p) for p in iter_paths(given) if p.endswith(SOURCE_SUFFIXES) and os.path.isfile(p)]
+    current = {path: load_fingerprint(os.path.join(ROOT, path)) if os.path.isfile(os.path.join(ROOT, path))
+               else None for path in paths}
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({path: fp.digest for path, fp in current.items() if fp is not None}, f, indent=1, sort_keys=True)
+            f.write('\n')
+
+    if not args.changed and not args.against:
+        for path, fp in current.items():
+            print(f"{fp.digest[:16]}  {path}")
+            if args.parts:
+                for name, line, digest in fp.parts:
+                    print(f"  {digest[:16]}  {name} (line {line})")
+        return 0
+
+    if args.against:
+        try:
+            with open(args.against, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as error:
+            print(f"ERROR: cannot read {args.against}: {error}")
+            return 1
+        for path in saved:
+            if path not in current and not args.paths:
+                full = os.path.join(ROOT, path)
+                current[path] = load_fingerprint(full) if os.path.isfile(full) else None
+
+        def before(path):
+            return saved.get(path), None
+    else:
+        def before(path):
+            fp = revision_fingerprint(args.changed, path, ROOT)
+            return (fp.digest, {name: digest for name, _line, digest in fp.parts}) if fp else (None, None)
+
+    cosmetic = []
+    for path, fp in current.items():
+        digest, parts = before(path)
+        if fp is not None and digest == fp.digest:
+            cosmetic.append(path)
+            continue
+        print(path)
+        if args.parts and fp is not None and parts is not None:
+            for name, line, part in fp.parts:
+                if parts.get(name) != part:
+                    print(f"  {path}:{line}: {name} {'changed' if name in parts else 'added'}", file=sys.stderr)
+    print(f"{len(current) - len(cosmetic)} of {len(current)} file(s) changed beyond whitespace, "
+          f"comments and classNames", file=sys.stderr)
+    return 0
+
+
+def journal(argv):
+    import argparse
+    from datetime import datetime
+    from tsxtools.journal import journal_path, load_runs
+
+    parser = argparse.ArgumentParser(prog='tsxtool.py journal', description='List the runs in the journal.')
+    parser.add_argument('--files', action='store_true', help='also list the files each run wrote')
+    args = parser.parse_args(argv)
+
+    runs = load_runs()
+    if not runs:
+        print(f"No runs journaled in {journal_path()}")
+        return 0
+    print(f"  {'run':<24}{'state':<9}{'files':>6}{'bytes':>9}  {'when':<20}script")
+    for name, run in runs.items():
+        size = sum(len(removed) + len(inserted) for w in run['writes'] for _o, removed, inserted in w['ops'])
+        when = datetime.fromtimestamp(run['time']).strftime('%Y-%m-%d %H:%M:%S')
+        paths = sorted({w['path'] for w in run['writes']})
+        print(f"  {name:<24}{'undone' if run['undone'] else 'applied':<9}{len(paths):>6}{size:>9}  "
+              f"{when:<20}{run['script']}")
+        if args.files:
+            for path in paths:
+                print(f"      {path}")
+    return 0
+
+
+def _replay_runs(argv, undone):
+    import argparse
+    from tsxtools.journal import JournalError, load_runs, redo, select, undo
+
+    verb = 'redo' if undone else 'undo'
+    parser = argparse.ArgumentParser(
+        prog=f'tsxtool.py {verb}',
+        description=f"{verb.capitalize()} patch runs from the journal (default: the last {'undone' if undone else 'applied'} one).")
+    parser.add_argument('runs', nargs='*', help='run ids, unique prefixes, or FIRST..LAST ranges')
+    args = parser.parse_args(argv)
+
+    try:
+        names = select(load_runs(), args.runs, undone)
+        if not names:
+            print(f"Nothing to {verb}.")
+            return 0
+        paths = (redo if undone else undo)(names)
+    except JournalError as error:
+        print(f"ERROR: {error}; nothing written")
+        return 1
+    print(f"{'Redone' if undone else 'Undone'}: {', '.join(names)}")
+    for path in paths:
+        print(f"  {os.path.relpath(path)}")
+    return 0
+
+
+def undo(argv):
+    return _replay_runs(argv, undone=False)
+
+
+def redo(argv):
+    return _replay_runs(argv, undone=True)
+
+
+COMMANDS = {
+    'check': check,
+    'audit': audit,
+    'apply': apply,
+    'diff': diff,
+    'index': index,
+    'deps': deps,
+    'report': report,
+    'render': render,
+    'bench': bench,
+    'semhash': semhash,
+    'journal': journal,
+    'undo': undo,
+    'redo': redo,
+}
+
+
+def _memory_option(argv):
+    """(argv without a leading --memory/--memory-budget MB, (enabled, budget MB or None))."""
+    if argv and argv[0] == '--memory':
+        return argv[1:], (True, None)
+    if argv and argv[0].startswith('--memory-budget'):
+        value, rest = argv[0].partition('=')[2], argv[1:]
+        if not value and rest:
+            value, rest = rest[0], rest[1:]
+        try:
+            return rest, (True, float(value))
+        except ValueError:
+            print(f"tsxtool.py: --memory-budget needs a size in MB, not {value!r}")
+            raise SystemExit(2)
+    if os.environ.get('TSXTOOLS_MEMORY') or os.environ.get('TSXTOOLS_MEMORY_BUDGET'):
+        from tsxtools.memory import budget_from_env
+        return argv, budget_from_env()
+    return argv, (False, None)
+
+
+def _profile_option(argv):
+    """(argv without a leading --profile[=FILE], the folded-stack file, '' for the default, or None)."""
+    if argv and (argv[0] == '--profile' or argv[0].startswith('--profile=')):
+        return argv[1:], argv[0].partition('=')[2]
+    target = os.environ.get('TSXTOOLS_PROFILE', '')
+    if target not in ('', '0'):
+        return argv, '' if target == '1' else target
+    return argv, None
+
+
+def _run_profiled(run, tag, target):
+    from tsxtools import profiler
+    if profiler.enable(tag) is None:
+        print("tsxtool.py: --profile needs signal.setitimer, which this platform lacks; running unprofiled",
+              file=sys.stderr)
+        return run()
+    try:
+        return run()
+    finally:
+        profiler.finish(target or f"tsxtool-{tag.replace(' ', '-')}.folded")
+
+
+def _run_traced(command, name, argv, budget):
+    from tsxtools import memory
+    tracker = memory.enable(budget)
+    try:
+        with memory.step(' '.join([name, *argv])):
+            return command(argv)
+    except memory.MemoryBudgetExceeded as error:
+        memory.print_exceeded(error)
+        return 3
+    except KeyboardInterrupt:
+        if tracker.exceeded is None:
+            raise
+        traced, sites = tracker.exceeded
+        memory.print_exceeded(memory.MemoryBudgetExceeded(name, traced, tracker.budget, sites))
+        return 3
+    finally:
+        tracker.report()
+        memory.disable()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    argv, profile = _profile_option(argv)
+    argv, (traced, budget) = _memory_option(argv)
+    if argv and (argv[0] == '--profile' or argv[0].startswith('--profile=')):
+        argv, profile = _profile_option(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        return 0 if argv else 2
+    command = COMMANDS.get(argv[0])
+    if command is None:
+        print(f"tsxtool.py: unknown command {argv[0]!r}; choose from {', '.join(COMMANDS)}")
+        return 2
+
+    def run():
+        if traced:
+            return _run_traced(command, argv[0], argv[1:], budget)
+        return command(argv[1:])
+    if profile is not None:
+        tag = ' '.join(argv[:2]) if argv[0] == 'apply' and len(argv) > 1 else argv[0]
+        return _run_profiled(run, tag, profile)
+    return run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Helpers shared by the CommandCenter / component patch scripts."""
@@ -0,0 +1,98 @@
+"""
+Brace balance scanning with line:column positions and bounded context.
+
+Works on files of any shape: source is read in fixed-size chunks, so a
+minified bundle that is one multi-megabyte line costs the same as source and
+the reported context never exceeds the configured window.
+"""
+
+from dataclasses import dataclass
+
+from tsxtools.lexer import CHUNK_SIZE, Lexer, iter_chunks
+
+CONTEXT_CHARS = 120
+CONTEXT_LINES = 3
+
+
+@dataclass
+class BalanceResult:
+    path: str
+    balance: int                 # balance at the first negative point, else final balance
+    negative: bool = False
+    offset: int = -1
+    line: int = 0
+    col: int = 0
+    before: str = ''             # up to CONTEXT_CHARS of text before the offending brace
+    after: str = ''              # the offending brace and up to CONTEXT_CHARS after it
+
+    @property
+    def location(self):
+        return f"{self.path}:{self.line}:{self.col}"
+
+
+def first_negative(path, chunk_size=CHUNK_SIZE, context=CONTEXT_CHARS):
+    """Scan path for the first `}` that takes the brace balance below zero."""
+    lexer = Lexer()
+    window = ''          # trailing text kept for context
+    window_start = 0     # absolute offset of window[0]
+    chunks = iter_chunks(path, chunk_size)
+
+    hit = None
+    for chunk in chunks:
+        window += chunk
+        for offset, line, col, ch in lexer.feed(chunk):
+            if lexer.depth < 0 and ch == '}':
+                hit = (offset, line, col)
+                break
+        if hit:
+            break
+        if len(window) > context:
+            window_start += len(window) - context
+            window = window[-context:]
+    else:
+        for offset, line, col, ch in lexer.close():
+            if lexer.depth < 0 and ch == '}':
+                hit = (offset, line, col)
+                break
+
+    if hit is None:
+        return BalanceResult(path, lexer.depth)
+
+    offset, line, col = hit
+    rel = offset - window_start
+    before = window[max(0, rel - context):rel]
+    after = window[rel:]
+    for chunk in chunks:
+        if len(after) > context:
+            break
+        after += chunk
+    return BalanceResult(path, -1, True, offset, line, col, before, after[:context + 1])
+
+
+def _clip(text, width, keep_end):
+    if len(text) <= width:
+        return text
+    return '…' + text[-width:] if keep_end else text[:width] + '…'
+
+
+def format_context(result, lines=CONTEXT_LINES, width=CONTEXT_CHARS // 2):
+    """Render the context around a hit as numbered lines with a caret.
+
+    Long lines are clipped to `width` chars either side of the hit column, so
+    a one-line bundle prints a short window rather than the whole file.
+    """
+    before_lines = result.before.split('\n')[-(lines + 1):]
+    after_lines = result.after.split('\n')[:lines]
+
+    head = _clip(before_lines[-1], width, keep_end=True)
+    tail = _clip(after_lines[0], width, keep_end=False)
+    out = []
+    first = result.line - (len(before_lines) - 1)
+    for n, text in enumerate(before_lines[:-1], start=first):
+        out.append(f"  {n}: {_clip(text, 2 * width, keep_end=False)}")
+    prefix = f"  {result.line}: "
+    out.append(prefix + head + tail)
+    out.append(' ' * (len(prefix) + len(head)) + '^')
+    for n, text in enumerate(after_lines[1:], start=result.line + 1):
+        out.append(f"  {n}: {_clip(text, 2 * width, keep_end=False)}")
+    return '\n'.join(out)
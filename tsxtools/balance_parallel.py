@@ -0,0 +1,279 @@
+"""
+Chunk-parallel brace balance scan for a single large file.
+
+Per-file parallelism does nothing when one file dominates, so this splits one
+file into byte ranges and lexes them in worker processes. A worker cannot know
+the lexer state its chunk starts in, so it lexes the chunk once per possible
+start mode; the speculative runs are fed in slices and stop as soon as they
+reach the same state as the run from CODE, which is usually within the first
+line. A run that has not converged after SPECULATE_SLICES slices (typically
+starting inside a template, which flips backtick parity for the whole chunk)
+is dropped, and the driver lexes that chunk itself if it turns out to need it.
+Cuts are placed before unindented lines, so chunks nearly always start in
+CODE anyway.
+
+Each run is summarised as a Run: net brace delta, the offsets where the
+running depth first reaches -1, -2, ..., the exit mode and any template
+interpolations left open. Runs compose associatively (compose(a, b) is "a
+then b"), so folding the chunk runs left to right gives the exact first
+negative position. The one thing a chunk cannot see is a `}` closing a `${`
+opened in an earlier chunk; compose() reports that as a conflict and the
+driver rescans just that chunk with the exact state.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
+import re
+
+from tsxtools.balance import CONTEXT_CHARS, BalanceResult
+from tsxtools.lexer import (
+    BLOCK_COMMENT, CODE, DQ, LINE_COMMENT, LOOKBEHIND, REGEX, REGEX_CLASS, SQ, TPL, Lexer,
+)
+
+MODES = (CODE, SQ, DQ, TPL, LINE_COMMENT, BLOCK_COMMENT, REGEX, REGEX_CLASS)
+
+# Files smaller than this are not worth the process start-up.
+PARALLEL_MIN_BYTES = 256 * 1024
+SLICE_CHARS = 4096
+SPECULATE_SLICES = 16
+_CUT_SEARCH = 64 * 1024
+_UNSAFE_BEFORE_CUT = b'\\/*$'
+_UNINDENTED = re.compile(rb'\n(?=[^\s])')
+
+
+@dataclass
+class Run:
+    """Summary of lexing a span of text from one start mode.
+
+    Offsets are relative to the start of the span; depths are relative to the
+    depth at its start.
+    """
+    length: int                                   # chars in the span
+    delta: int                                    # net brace depth change
+    exit_mode: int
+    frames: tuple = ()                            # depths of ${ still open at the end
+    mins: list = field(default_factory=list)      # (depth, offset) at each new low below 0
+    floors: dict = field(default_factory=dict)    # depth before `}` -> first offset, for depths <= 0
+
+
+class Conflict(Exception):
+    """The right-hand run closes a template interpolation opened on the left."""
+
+
+def compose(a, b):
+    """The run for a's span followed by b's span (b must start in a.exit_mode)."""
+    if a.frames and (a.frames[-1] - a.delta) in b.floors:
+        raise Conflict(b.floors[a.frames[-1] - a.delta])
+    low = a.mins[-1][0] if a.mins else 0
+    mins = list(a.mins)
+    for depth, offset in b.mins:
+        if depth + a.delta < low:
+            low = depth + a.delta
+            mins.append((low, offset + a.length))
+    floors = dict(a.floors)
+    for depth, offset in b.floors.items():
+        if depth + a.delta <= 0:
+            floors.setdefault(depth + a.delta, offset + a.length)
+    return Run(
+        a.length + b.length,
+        a.delta + b.delta,
+        b.exit_mode,
+        a.frames + tuple(f + a.delta for f in b.frames),
+        mins,
+        floors,
+    )
+
+
+def _summarize_closes(length, closes, delta, exit_mode, frames):
+    mins = []
+    floors = {}
+    low = 0
+    for offset, depth, popped in closes:
+        if popped:
+            continue
+        if depth < low:
+            low = depth
+            mins.append((depth, offset))
+        if depth < 0:
+            floors.setdefault(depth + 1, offset)
+    return Run(length, delta, exit_mode, tuple(frames), mins, floors)
+
+
+def _lex_slices(slices, mode, prev, primary=None):
+    """Lex slices from `mode`; returns (closes, snapshots, lexer).
+
+    With `primary` (the closes/snapshots/lexer of the CODE run), stop at the
+    first slice boundary where this run's state matches it and splice in the
+    rest of the primary run, or return None if that has not happened within
+    SPECULATE_SLICES slices.
+    """
+    lexer = Lexer(mode=mode, prev=prev)
+    closes = []
+    snaps = []
+    for k, piece in enumerate(slices):
+        for offset, _line, _col, ch in lexer.feed(piece):
+            if ch == '}':
+                closes.append((offset, lexer.depth, lexer.mode == TPL))
+        frames = tuple(f - lexer.depth for f in lexer.tpl_stack)
+        if primary is not None:
+            p_closes, p_snaps, p_lexer = primary
+            p_depth, p_mode, p_frames, p_count = p_snaps[k]
+            if lexer.mode == p_mode and frames == p_frames:
+                diff = lexer.depth - p_depth
+                closes.extend((o, d + diff, p) for o, d, p in p_closes[p_count:])
+                lexer.depth = p_lexer.depth + diff
+                lexer.mode = p_lexer.mode
+                lexer.tpl_stack = [f + diff for f in p_lexer.tpl_stack]
+                return closes, snaps, lexer
+            if k >= SPECULATE_SLICES:
+                return None
+        snaps.append((lexer.depth, lexer.mode, frames, len(closes)))
+    for offset, _line, _col, ch in lexer.close():
+        if ch == '}':
+            closes.append((offset, lexer.depth, lexer.mode == TPL))
+    return closes, snaps, lexer
+
+
+def _read_span(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).decode('utf-8', errors='ignore')
+
+
+def summarize_chunk(path, start, end, prev, slice_chars=SLICE_CHARS):
+    """Worker: the Run for bytes [start, end) of path from every start mode.
+
+    Returns (runs, newline_count, last_newline) where runs is indexed by mode
+    and holds None for start modes that were given up on.
+    """
+    text = _read_span(path, start, end)
+    slices = [text[i:i + slice_chars] for i in range(0, len(text), slice_chars)]
+    primary = _lex_slices(slices, CODE, prev)
+    runs = [None] * len(MODES)
+    for mode in MODES:
+        run = primary if mode == CODE else _lex_slices(slices, mode, prev, primary)
+        if run is None:
+            continue
+        closes, _snaps, lexer = run
+        runs[mode] = _summarize_closes(len(text), closes, lexer.depth, lexer.mode, lexer.tpl_stack)
+    return runs, text.count('\n'), text.rfind('\n')
+
+
+def cut_points(path, parts):
+    """Byte offsets splitting path into about `parts` chunks.
+
+    Cuts go before an unindented line (almost always plain code), else just
+    after any newline; with no newline nearby (minified bundles) they go
+    between two ASCII bytes where no two-char token can straddle.
+    """
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            target = size * i // parts
+            if target <= cuts[-1] + 1:
+                continue
+            f.seek(target - 1)
+            window = f.read(_CUT_SEARCH)
+            match = _UNINDENTED.search(window)
+            nl = match.start() if match else window.find(b'\n')
+            cut = None
+            if nl != -1:
+                cut = target + nl
+            else:
+                for j in range(1, len(window)):
+                    if window[j] < 0x80 and window[j - 1] < 0x80 and window[j - 1] not in _UNSAFE_BEFORE_CUT:
+                        cut = target - 1 + j
+                        break
+            if cut is not None and cuts[-1] < cut < size:
+                cuts.append(cut)
+    cuts.append(size)
+    return cuts
+
+
+def _prev_text(path, cut):
+    """The LOOKBEHIND chars before a cut, which the lexer's heuristics need."""
+    if cut == 0:
+        return ''
+    start = max(0, cut - 4 * LOOKBEHIND)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(cut - start).decode('utf-8', errors='ignore')[-LOOKBEHIND:]
+
+
+def _rescan(path, start, end, acc, prev):
+    """Exact acc after one chunk, lexed with the full state before it."""
+    text = _read_span(path, start, end)
+    lexer = Lexer(mode=acc.exit_mode, tpl_stack=[f - acc.delta for f in acc.frames], prev=prev)
+    closes = []
+    for source in (lexer.feed(text), lexer.close()):
+        for offset, _line, _col, ch in source:
+            if ch == '}':
+                closes.append((offset, lexer.depth, lexer.mode == TPL))
+    run = _summarize_closes(len(text), closes, lexer.depth, lexer.mode, ())
+    # The lexer started with acc's open frames, so its stack already says
+    # which of them survive; take it wholesale instead of appending.
+    merged = compose(Run(acc.length, acc.delta, acc.exit_mode, (), acc.mins), run)
+    merged.frames = tuple(f + acc.delta for f in lexer.tpl_stack)
+    return merged
+
+
+def _locate(path, spans, results, offset, context):
+    """line, col, before, after for an absolute char offset."""
+    base = 0
+    line = 1
+    since_nl = 0     # chars since the last newline before the current chunk
+    for (start, end), (runs, count, last_nl) in zip(spans, results):
+        length = runs[CODE].length
+        if offset < base + length:
+            text = _read_span(path, start, end)
+            rel = offset - base
+            line += text.count('\n', 0, rel)
+            nl = text.rfind('\n', 0, rel)
+            col = rel - nl if nl != -1 else since_nl + rel + 1
+            before = text[max(0, rel - context):rel]
+            if len(before) < context and start > 0:
+                before = (_read_span(path, max(0, start - 4 * context), start) + before)[-context:]
+            after = text[rel:rel + context + 1]
+            if len(after) <= context:
+                after += _read_span(path, end, end + 4 * context)
+            return line, col, before, after[:context + 1]
+        line += count
+        since_nl = length - last_nl - 1 if last_nl != -1 else since_nl + length
+        base += length
+    return line, since_nl + 1, '', ''
+
+
+def first_negative_parallel(path, jobs=None, context=CONTEXT_CHARS, executor=None):
+    """Parallel equivalent of balance.first_negative for one file."""
+    jobs = jobs or os.cpu_count() or 1
+    cuts = cut_points(path, jobs * 2)
+    spans = list(zip(cuts[:-1], cuts[1:]))
+    prevs = [_prev_text(path, start) for start, _ in spans]
+
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        results = list(executor.map(summarize_chunk, [path] * len(spans),
+                                    [s for s, _ in spans], [e for _, e in spans], prevs))
+    finally:
+        if own:
+            executor.shutdown()
+
+    acc = Run(0, 0, CODE)
+    for (start, end), prev, (runs, _count, _last_nl) in zip(spans, prevs, results):
+        run = runs[acc.exit_mode]
+        try:
+            acc = compose(acc, run) if run is not None else _rescan(path, start, end, acc, prev)
+        except Conflict:
+            acc = _rescan(path, start, end, acc, prev)
+        if acc.mins:
+            break
+
+    if not acc.mins:
+        return BalanceResult(path, acc.delta)
+    offset = acc.mins[0][1]
+    line, col, before, after = _locate(path, spans, results, offset, context)
+    return BalanceResult(path, -1, True, offset, line, col, before, after)
@@ -0,0 +1,86 @@
+"""
+Timings for every per-file index, built cold and served from the cache.
+
+bench_file() builds each index from the text (cold), then loads it back the
+way a fresh process would (the pickle under .tsxtools-cache/) and the way a
+repeated query in the same process would (the in-memory table). Each figure
+is the best of `repeat` runs, in milliseconds. startup() times whole
+`tsxtool.py` invocations against a bare interpreter, which is what the
+command-line budget is about.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from tsxtools import cache
+from tsxtools.fileio import content_hash
+
+STAGES = ('check', 'profile', 'braces', 'declarations', 'jsx', 'tree')
+
+
+def _best(fn, repeat):
+    best = None
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def _stage(name, jsx):
+    """(build, cache kind, version) for a stage, with the same kind its loader uses."""
+    flavour = 'jsx' if jsx else 'js'
+    if name == 'check':
+        from tsxtools import check
+        return check._builder(jsx), f"check-{flavour}", check.CHECK_VERSION
+    if name == 'profile':
+        from tsxtools.incremental import PROFILE_VERSION
+        from tsxtools.mismatch import structure_profile
+        return (lambda text: structure_profile(text, jsx)), f"structure-{flavour}", PROFILE_VERSION
+    if name == 'braces':
+        from tsxtools import braces
+        return braces.build_brace_index, 'braces', braces.INDEX_VERSION
+    if name == 'declarations':
+        from tsxtools import declarations
+        return declarations.build_declarations, 'decls', declarations.MAP_VERSION
+    if name == 'jsx':
+        from tsxtools import jsx as jsx_index
+        return jsx_index.build_index, 'jsx', jsx_index.INDEX_VERSION
+    if name == 'tree':
+        from tsxtools import treediff
+        return treediff.build_tree, 'tree', treediff.TREE_VERSION
+    raise ValueError(f"unknown stage {name!r}")
+
+
+def bench_file(path, stages=None, repeat=3):
+    """[(stage, cold_ms, disk_ms, memory_ms)] for path."""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        text = f.read()
+    digest = content_hash(text)
+    jsx = path.endswith(('.tsx', '.jsx'))
+    rows = []
+    for name in stages or STAGES:
+        build, kind, version = _stage(name, jsx)
+        cold, value = _best(lambda: build(text), repeat)
+        cache.store(kind, version, digest, value)
+
+        def from_disk():
+            cache.forget(kind, version, digest)
+            return cache.load(kind, version, digest)
+        disk, _ = _best(from_disk, repeat) if cache.CACHE_DIR else (None, None)
+        memory, _ = _best(lambda: cache.load(kind, version, digest), repeat)
+        rows.append((name, cold, disk, memory))
+    return rows
+
+
+def startup(argv, repeat=5):
+    """(best ms for `python tsxtool.py *argv`, best ms for `python -c pass`)."""
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tsxtool.py')
+
+    def run(cmd):
+        return _best(lambda: subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL), repeat)[0]
+    return run([sys.executable, script, *argv]), run([sys.executable, '-c', 'pass'])
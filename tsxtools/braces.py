@@ -0,0 +1,125 @@
+"""
+Bracket index for a whole file.
+
+build_brace_index() lexes a file once and records every code bracket with the
+nesting depth after it, the matching partner of each pair, and the `;` and
+newline positions that sit in code (statement breaks). From that it answers,
+by bisection rather than rescanning:
+
+    depth_at(offset)    bracket nesting ({, ( and [ together) at an offset
+    match(offset)       the partner of the bracket at an offset
+    enclosing(offset)   the innermost open bracket containing an offset
+    line_depths         depth at the start of every line (the depth profile)
+
+A closer that matches nothing is ignored, and a closer that matches an opener
+deeper in the stack closes everything above it, the same recovery
+tsxtools.mismatch reports on.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from tsxtools import cache
+from tsxtools.lexer import Lexer
+
+INDEX_VERSION = 1
+
+_OPENS = {')': '(', ']': '[', '}': '{'}
+
+
+class BraceIndex:
+
+    def __init__(self, length, offsets, chars, depths, partners, parents, breaks, line_starts):
+        self.length = length
+        self.offsets = offsets          # bracket offsets, ascending
+        self.chars = chars              # bracket characters, parallel to offsets
+        self.depths = depths            # depth after each bracket
+        self.partners = partners        # offset -> partner offset, for matched brackets
+        self.parents = parents          # opener offset -> enclosing opener offset (or -1)
+        self.breaks = breaks            # offsets of `;` and newlines in code
+        self.line_starts = line_starts  # offset of the first char of every line
+        self.line_depths = [self.depth_at(start) for start in line_starts]
+
+    def depth_at(self, offset):
+        """Nesting depth just before offset."""
+        i = bisect_left(self.offsets, offset)
+        return self.depths[i - 1] if i else 0
+
+    def match(self, offset):
+        """Offset of the bracket paired with the one at offset, or None."""
+        return self.partners.get(offset)
+
+    def enclosing(self, offset):
+        """Offset of the innermost opener still open just before offset, or -1."""
+        i = bisect_left(self.offsets, offset)
+        while i:
+            i -= 1
+            at = self.offsets[i]
+            if self.chars[i] in '{([':
+                close = self.partners.get(at)
+                if close is None or close >= offset:
+                    return at
+                return self.parents.get(at, -1)
+            opener = self.partners.get(at)
+            if opener is not None:
+                return self.parents.get(opener, -1)
+        return -1
+
+    def brackets(self, start=0, end=None):
+        """(offset, char, depth_after) for brackets in [start, end)."""
+        lo = bisect_left(self.offsets, start)
+        hi = len(self.offsets) if end is None else bisect_left(self.offsets, end)
+        for i in range(lo, hi):
+            yield self.offsets[i], self.chars[i], self.depths[i]
+
+    def next_break(self, offset, depth):
+        """First statement break at or after offset that sits at depth."""
+        for i in range(bisect_left(self.breaks, offset), len(self.breaks)):
+            at = self.breaks[i]
+            if self.depth_at(at) == depth:
+                return at
+        return None
+
+    def line_of(self, offset):
+        """1-based line number of offset."""
+        return bisect_right(self.line_starts, offset)
+
+
+def build_brace_index(text):
+    lexer = Lexer(statements=True)
+    offsets = []
+    chars = []
+    depths = []
+    partners = {}
+    parents = {}
+    breaks = []
+    stack = []
+    for source in (lexer.feed(text), lexer.close()):
+        for offset, _line, _col, tok in source:
+            if tok == ';' or tok == '\n':
+                breaks.append(offset)
+                continue
+            if tok in _OPENS:
+                want = _OPENS[tok]
+                for i in range(len(stack) - 1, -1, -1):
+                    if stack[i][1] == want:
+                        partners[stack[i][0]] = offset
+                        partners[offset] = stack[i][0]
+                        del stack[i:]
+                        break
+            else:
+                parents[offset] = stack[-1][0] if stack else -1
+                stack.append((offset, tok))
+            offsets.append(offset)
+            chars.append(tok)
+            depths.append(len(stack))
+    line_starts = [0]
+    pos = text.find('\n')
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = text.find('\n', pos + 1)
+    return BraceIndex(len(text), offsets, ''.join(chars), depths, partners, parents, breaks, line_starts)
+
+
+def load_brace_index(path):
+    """BraceIndex for path, from the content-hash cache when possible."""
+    return cache.cached('braces', INDEX_VERSION, path, build_brace_index)
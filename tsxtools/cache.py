@@ -0,0 +1,139 @@
+"""
+Content-hash keyed cache for per-file indexes.
+
+An index is stored under the sha256 of the file it was built from, so it is
+reused for as long as the content is unchanged, whatever the path or mtime.
+Lookups first check an in-process table (keyed by path, mtime and size, so a
+repeated query does not even re-hash the file) and then a pickle under
+.tsxtools-cache/ in the repo root. Set TSXTOOLS_CACHE to move it, or to an
+empty string to disable the on-disk layer.
+"""
+
+import os
+import pickle
+import sys
+
+from tsxtools.fileio import content_hash
+
+CACHE_DIR = os.environ.get(
+    'TSXTOOLS_CACHE',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.tsxtools-cache'),
+)
+
+# (kind, version, sha256) -> built value
+_memory = {}
+# abspath -> (mtime_ns, size, sha256)
+_stat_hashes = {}
+
+
+def _disk_path(kind, version, digest):
+    return os.path.join(CACHE_DIR, f"{kind}-v{version}", digest[:2], digest + '.pickle')
+
+
+def read_with_hash(path):
+    """(text, sha256) for path, decoded as UTF-8 with errors ignored."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = content_hash(data)
+    st = os.stat(path)
+    _stat_hashes[os.path.abspath(path)] = (st.st_mtime_ns, st.st_size, digest)
+    return data.decode('utf-8', errors='ignore'), digest
+
+
+def known_hash(path):
+    """sha256 of path if the file is unchanged since we last hashed it."""
+    entry = _stat_hashes.get(os.path.abspath(path))
+    if entry is None:
+        return None
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if (st.st_mtime_ns, st.st_size) == entry[:2]:
+        return entry[2]
+    return None
+
+
+def load(kind, version, digest):
+    """Cached value for a content hash, or None."""
+    key = (kind, version, digest)
+    if key in _memory:
+        return _memory[key]
+    if not CACHE_DIR:
+        return None
+    try:
+        with open(_disk_path(kind, version, digest), 'rb') as f:
+            value = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        return None
+    _memory[key] = value
+    return value
+
+
+def store(kind, version, digest, value):
+    _memory[(kind, version, digest)] = value
+    if not CACHE_DIR:
+        return
+    target = _disk_path(kind, version, digest)
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def forget(kind, version, digest):
+    """Drop one value from the in-process table, so the next load() reads it from disk."""
+    _memory.pop((kind, version, digest), None)
+
+
+def clear_memory():
+    """Drop every value from the in-process table (say, after pointing CACHE_DIR elsewhere)."""
+    _memory.clear()
+
+
+def _profiler():
+    """tsxtools.profiler when a profile is being taken, else None.
+
+    Imported only then, so a cache hit does not pay for loading it and signal.
+    """
+    module = sys.modules.get('tsxtools.profiler')
+    if module is None and os.environ.get('TSXTOOLS_PROFILE', '') not in ('', '0'):
+        from tsxtools import profiler as module
+    return module if module is not None and module.active() else None
+
+
+def cached(kind, version, path, build):
+    """build(text) for path, memoised on the file's content hash.
+
+    Bump `version` whenever the shape of what build() returns changes.
+    """
+    digest = known_hash(path)
+    if digest is not None:
+        value = load(kind, version, digest)
+        if value is not None:
+            return value
+    text, digest = read_with_hash(path)
+    value = load(kind, version, digest)
+    if value is None:
+        profiler = _profiler()
+        if profiler is None:
+            value = build(text)
+        else:
+            with profiler.file(path, len(text)):
+                value = build(text)
+        store(kind, version, digest, value)
+    return value
+
+
+def cached_text(kind, version, text, build):
+    """build(text) memoised on the hash of an in-memory buffer."""
+    digest = content_hash(text)
+    value = load(kind, version, digest)
+    if value is None:
+        value = build(text)
+        store(kind, version, digest, value)
+    return value
@@ -0,0 +1,36 @@
+"""
+Whole-file structure check with cached results.
+
+check_file() returns what tsxtools.mismatch finds in a file as plain
+(line, col, description) tuples, memoised on the file's content hash. Plain
+tuples unpickle without the lexer or the scanner, so re-checking an
+unchanged file costs a hash and a cache read; the scanner is only imported
+when a file actually has to be lexed.
+"""
+
+from tsxtools import cache
+
+CHECK_VERSION = 1
+
+# tsxtools.mismatch.JSX_SUFFIXES, repeated so a cache hit does not import it.
+_JSX_SUFFIXES = ('.tsx', '.jsx')
+
+
+def _builder(jsx):
+    def build(text):
+        from tsxtools.mismatch import find_mismatches_in_text
+        return [(p.token.line, p.token.col, p.describe()) for p in find_mismatches_in_text(text, jsx)]
+    return build
+
+
+def check_file(path):
+    """[(line, col, description)] for every unclosed or unexpected bracket or tag in path."""
+    jsx = path.endswith(_JSX_SUFFIXES)
+    return cache.cached(f"check-{'jsx' if jsx else 'js'}", CHECK_VERSION, path, _builder(jsx))
+
+
+def check_data(path, data):
+    """check_file() for the bytes of path already read (tsxtools.pipeline work function)."""
+    jsx = path.endswith(_JSX_SUFFIXES)
+    text = data.decode('utf-8', errors='ignore')
+    return cache.cached_text(f"check-{'jsx' if jsx else 'js'}", CHECK_VERSION, text, _builder(jsx))
@@ -0,0 +1,489 @@
+"""
+Conditionally rendered JSX blocks, and what it takes to load them lazily.
+
+A modal or popup is usually written inline in its parent:
+
+    {showFormulas && (
+        <div className="fixed inset-0 ..." onClick={() => setShowFormulas(false)}>
+            ...
+        </div>
+    )}
+
+so its markup ships in the parent's chunk although most visits never open
+it. find_conditionals() lists every `{condition && <element>}` child block
+(parentheses optional) with its size. plan_split() works out what moving one
+into a component file of its own needs:
+
+  * its free names: identifiers read in its `{...}` expressions and the
+    component tags it renders, minus names it binds itself (arrow
+    parameters, local consts), properties, object keys, keywords and
+    browser globals;
+  * which of those are imports of the file, carried over to the new file
+    as they are (it sits in the same directory), and which are values of
+    the file or the component, passed as props; prop types come from the
+    declaration (a type annotation, or useState's type argument or literal
+    initial value, with the matching Dispatch for its setter) and are `any`
+    otherwise;
+  * the edits to the file: the block becomes
+    `<Suspense fallback={null}><Name prop={prop} ... /></Suspense>` behind the
+    same condition, a `React.lazy` import goes after the imports, and
+    imported names the file no longer uses are dropped.
+
+The scan is lexical: a name shadowed inside the block by something other
+than an arrow parameter or a local const is still passed as a prop, which is
+harmless.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import os
+import re
+
+from tsxtools import cache
+from tsxtools.braces import INDEX_VERSION as BRACES_VERSION, build_brace_index
+from tsxtools.declarations import MAP_VERSION, build_declarations
+from tsxtools.jsx import INDEX_VERSION as JSX_VERSION, build_index
+from tsxtools.lexer import LOOKBEHIND, REGEX_LITERAL, opens_regex
+from tsxtools.literals import imports_end, indent_at, react_lazy, reindent
+
+MIN_SIZE = 2000                 # bytes of markup before a block is worth its own chunk
+
+KEYWORDS = frozenset('''
+    as async await break case catch class const continue debugger default delete do else enum
+    export extends false finally for function if implements import in instanceof interface let
+    new null of return satisfies static super switch this throw true try typeof undefined var
+    void while with yield
+'''.split())
+
+GLOBALS = frozenset('''
+    Array Blob Boolean Date Error Infinity Intl JSON Map Math NaN Number Object Promise Proxy
+    Reflect RegExp Set String Symbol URL URLSearchParams WeakMap WeakSet alert clearInterval
+    clearTimeout console crypto decodeURIComponent document encodeURIComponent fetch globalThis
+    isFinite isNaN localStorage location navigator parseFloat parseInt performance
+    requestAnimationFrame sessionStorage setInterval setTimeout structuredClone window
+'''.split())
+
+# Names that can only be types; never values to pass as props.
+TYPE_NAMES = frozenset('''
+    any bigint boolean keyof never number object readonly string symbol unique unknown
+'''.split())
+
+_TOKEN = re.compile(r'''//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`|[A-Za-z_$][\w$]*|\d[\w.]*|\.\.\.|\?\.|=>|\S''', re.S)
+_IMPORT_STATEMENT = re.compile(
+    r'''^\ufeff?import\s+(?P<clause>[^;'"]*?)\s+from\s+(?P<q>['"])(?P<source>[^'"]+)(?P=q);?[ \t]*\r?\n?''', re.M)
+_LAZY_BLOCK = re.compile(r'(?:[ \t]*\r?\n)?(?:const [\w$]+ = (?:React\.)?lazy(?:WithReload)?\([^\n]*\n)+')
+_STATE = re.compile(r'\b(?:useState|useReducer)\s*(?:<(?P<type>[^()]*?)>)?\s*\(\s*(?P<init>[^,)]*)')
+
+
+@dataclass
+class Conditional:
+    condition: str              # source of the condition, e.g. 'showFormulas'
+    element: int                # index of the rendered element in the JSX index
+    start: int                  # offset of the element's '<'
+    end: int                    # offset just past it
+    line: int
+    end_line: int
+    size: int
+
+
+@dataclass
+class Import:
+    local: str
+    source: str
+    imported: str               # 'default', '*' or the exported name
+    type_only: bool = False
+
+
+@dataclass
+class Split:
+    name: str
+    module: str                 # path of the component file to write
+    content: str
+    props: list                 # [(name, type)]
+    imports: list               # [Import] carried to the new file
+    edits: list                 # [(start, end, text)] in the source
+    dropped: list = field(default_factory=list)     # imports the source no longer needs
+
+
+def _tokens(code):
+    """(kind, value, offset) for code, with template literals opened up to their ${...} parts."""
+    out = []
+    i = 0
+    depth = []                  # brace depths at which a template resumes
+    braces = 0
+    while i < len(code):
+        m = _TOKEN.search(code, i)
+        if m is None:
+            break
+        tok = m.group()
+        i = m.end()
+        if tok.startswith(('//', '/*', "'", '"')):
+            out.append(('string' if tok[0] in '\'"' else 'comment', tok, m.start()))
+            continue
+        if tok == '/' and opens_regex(code[max(0, m.start() - LOOKBEHIND):m.start()]):
+            regex = REGEX_LITERAL.match(code, m.start())
+            if regex:
+                i = regex.end()
+                out.append(('string', regex.group(), m.start()))
+                continue
+        if tok == '}' and depth and depth[-1] == braces:
+            depth.pop()
+            tok = '`'           # back inside the template
+        elif tok == '{':
+            braces += 1
+        elif tok == '}':
+            braces -= 1
+        if tok == '`':
+            # Scan template text up to its end or the next ${.
+            while i < len(code) and code[i] != '`':
+                if code[i] == '\\':
+                    i += 2
+                    continue
+                if code.startswith('${', i):
+                    break
+                i += 1
+            if code.startswith('${', i):
+                braces += 1
+                depth.append(braces)
+                i += 2
+            else:
+                i += 1
+            out.append(('string', '`', m.start()))
+            continue
+        kind = 'name' if tok[0].isalpha() or tok[0] in '_$' else 'punct'
+        out.append((kind, tok, m.start()))
+    return out
+
+
+def _type_end(tokens, k):
+    """Index just past the type expression starting at tokens[k] (after `as`, `satisfies` or `:`)."""
+    level = 0
+    operand = True              # expecting a type name, literal or group next
+    while k < len(tokens):
+        kind, value, _at = tokens[k]
+        if value in ('(', '[', '{', '<'):
+            level += 1
+        elif value in (')', ']', '}', '>'):
+            if level == 0:
+                return k
+            level -= 1
+            operand = False
+        elif level == 0:
+            if value in ('|', '&', '.', '=>', 'keyof', 'typeof', 'readonly', 'unique'):
+                operand = True
+            elif kind in ('name', 'string') or value[0].isdigit():
+                if not operand:
+                    return k
+                operand = False
+            else:
+                return k
+        k += 1
+    return k
+
+
+def _bound_and_read(code):
+    """(names bound, [(name, offset)] read) in one piece of code."""
+    tokens = [t for t in _tokens(code) if t[0] not in ('comment', 'string')]
+    bound = set()
+    reads = []
+    skip = set()
+    for i, (kind, value, _at) in enumerate(tokens):
+        if value == '=>':
+            # Parameters: one name, or the names of a (...) list, not their types or defaults.
+            j = i - 1
+            if j >= 0 and tokens[j][0] == 'name':
+                bound.add(tokens[j][1])
+                continue
+            if j >= 0 and tokens[j][1] == ')':
+                level = 0
+                in_type = False
+                while j >= 0:
+                    v = tokens[j][1]
+                    if v == ')':
+                        level += 1
+                    elif v == '(':
+                        level -= 1
+                        if level == 0:
+                            break
+                    j -= 1
+                k = j + 1
+                level = 0
+                while k < i - 1:
+                    kind_k, v, _ = tokens[k]
+                    if v in '([{<':
+                        level += 1
+                    elif v in ')]}>':
+                        level -= 1
+                    if v == ':' and level == 0:
+                        in_type = True
+                    elif v == ',' and level == 0:
+                        in_type = False
+                    elif v == '=' and level == 0:
+                        in_type = True      # default value: reads, but rare here
+                    elif kind_k == 'name' and not in_type:
+                        nxt = tokens[k + 1][1] if k + 1 < len(tokens) else ''
+                        if nxt != ':' or level == 0:
+                            bound.add(v)
+                    if kind_k == 'name':
+                        skip.add(k)
+                    k += 1
+        elif value in ('const', 'let', 'var') and i + 1 < len(tokens):
+            k = i + 1
+            if tokens[k][1] in ('[', '{'):
+                level = 0
+                while k < len(tokens):
+                    v = tokens[k][1]
+                    level += v in '[{'
+                    level -= v in ']}'
+                    if tokens[k][0] == 'name':
+                        bound.add(v)
+                        skip.add(k)
+                    if level == 0:
+                        break
+                    k += 1
+            elif tokens[k][0] == 'name':
+                bound.add(tokens[k][1])
+                skip.add(k)
+                if k + 1 < len(tokens) and tokens[k + 1][1] == ':':
+                    skip.update(range(k + 2, _type_end(tokens, k + 2)))
+        elif value in ('as', 'satisfies'):
+            skip.update(range(i + 1, _type_end(tokens, i + 1)))
+    for i, (kind, value, at) in enumerate(tokens):
+        if kind != 'name' or i in skip or value in KEYWORDS or value in TYPE_NAMES:
+            continue
+        prev = tokens[i - 1][1] if i else ''
+        nxt = tokens[i + 1][1] if i + 1 < len(tokens) else ''
+        if prev in ('.', '?.'):
+            continue                            # a property
+        if nxt == ':' and prev in ('{', ','):
+            continue                            # an object key
+        reads.append((value, at))
+    return bound, reads
+
+
+def free_names(text, index, braces, start, end):
+    """{name: first offset} read by the JSX block text[start:end] and not bound in it."""
+    els = [el for el in index.elements if start <= el.start < end]
+    starts = [el.start for el in els]
+    found = {}
+    bound = set()
+    for el in els:
+        root = re.match(r'[A-Za-z_$][\w$]*', el.tag or '')
+        if root and (el.tag[:1].isupper() or '.' in el.tag):
+            found.setdefault(root.group(), el.start + 1)
+    for at, char, _depth in braces.brackets(start, end):
+        if char != '{':
+            continue
+        i = bisect_right(starts, at) - 1
+        el = els[i] if i >= 0 else None
+        while el is not None and not el.start <= at < el.end:
+            el = index.elements[el.parent] if el.parent is not None and index.elements[el.parent].start >= start else None
+        if el is None or braces.parents.get(at, -1) >= el.start:
+            continue                            # code inside another expression
+        close = braces.match(at)
+        if close is None:
+            continue
+        code = list(text[at + 1:close])
+        for other in els:
+            if at < other.start < close:        # JSX nested in the expression: its own braces count
+                code[other.start - at - 1:other.end - at - 1] = ' ' * (other.end - other.start)
+        names, reads = _bound_and_read(''.join(code))
+        bound |= names
+        for name, offset in reads:
+            found.setdefault(name, at + 1 + offset)
+    return {name: at for name, at in sorted(found.items(), key=lambda kv: kv[1])
+            if name not in bound and name not in GLOBALS}
+
+
+def _indexes(text):
+    return (cache.cached_text('jsx', JSX_VERSION, text, build_index),
+            cache.cached_text('braces', BRACES_VERSION, text, build_brace_index),
+            cache.cached_text('decls', MAP_VERSION, text, build_declarations))
+
+
+def find_conditionals(text, min_size=MIN_SIZE):
+    """[Conditional] for the `{cond && <el>}` blocks of at least min_size bytes in text."""
+    index, braces, _decls = _indexes(text)
+    out = []
+    for el in index.elements:
+        if el.end - el.start < min_size or not el.closed:
+            continue
+        before = text[:el.start].rstrip()
+        if before.endswith('('):
+            before = before[:-1].rstrip()
+        if not before.endswith('&&'):
+            continue
+        opener = braces.enclosing(el.start)
+        while opener != -1 and text[opener] == '(':
+            opener = braces.parents.get(opener, -1)
+        if opener == -1 or text[opener] != '{':
+            continue
+        close = braces.match(opener)
+        after = text[el.end:close].strip() if close is not None else None
+        if after not in ('', ')'):
+            continue
+        condition = text[opener + 1:len(before) - 2].strip()
+        if not condition or '\n\n' in condition:
+            continue
+        out.append(Conditional(condition, el.index, el.start, el.end, el.line, el.end_line,
+                               el.end - el.start))
+    # Outermost blocks only.
+    out.sort(key=lambda c: c.start)
+    kept = []
+    for cond in out:
+        if kept and cond.start < kept[-1].end:
+            continue
+        kept.append(cond)
+    return kept
+
+
+def parse_imports(text):
+    """({local name: Import}, [(start, end, statement match)]) for the file's import statements."""
+    found = {}
+    statements = []
+    for m in _IMPORT_STATEMENT.finditer(text):
+        clause = m.group('clause')
+        type_only = clause.startswith('type ')
+        if type_only:
+            clause = clause[5:]
+        statements.append(m)
+        named = re.search(r'\{([^}]*)\}', clause)
+        head = clause[:named.start()] if named else clause
+        for part in (p.strip() for p in head.split(',')):
+            if part.startswith('*'):
+                local = part.split()[-1]
+                found[local] = Import(local, m.group('source'), '*', type_only)
+            elif part:
+                found[part] = Import(part, m.group('source'), 'default', type_only)
+        for part in (p.strip() for p in (named.group(1).split(',') if named else ())):
+            if not part:
+                continue
+            item_type = part.startswith('type ')
+            part = part[5:].strip() if item_type else part
+            imported, _, local = part.partition(' as ')
+            local = (local or imported).strip()
+            found[local] = Import(local, m.group('source'), imported.strip(), type_only or item_type)
+    return found, statements
+
+
+def _import_lines(imports):
+    by_source = {}
+    for imp in imports:
+        by_source.setdefault(imp.source, []).append(imp)
+    lines = []
+    for source, items in by_source.items():
+        default = [i.local for i in items if i.imported == 'default']
+        star = [i.local for i in items if i.imported == '*']
+        named = [("type " if i.type_only else '') + (i.imported if i.imported == i.local else f"{i.imported} as {i.local}")
+                 for i in items if i.imported not in ('default', '*')]
+        parts = default + [f"* as {s}" for s in star] + ([f"{{ {', '.join(named)} }}"] if named else [])
+        lines.append(f"import {', '.join(parts)} from '{source}';")
+    return lines
+
+
+def _prop_type(text, decls, name):
+    """TypeScript type of the value name is declared as in text, or None."""
+    for decl in decls.find(name):
+        source = text[decl.start:decl.end]
+        if decl.kind in ('useState', 'useReducer'):
+            m = _STATE.search(source)
+            if m is None:
+                return None
+            kind = m.group('type')
+            init = m.group('init').strip()
+            if kind is None:
+                kind = ('boolean' if init in ('true', 'false') else 'number' if re.match(r'-?\d', init)
+                        else 'string' if init[:1] in '\'"`' and init else None)
+            if kind is None:
+                return None
+            if decl.names and name == decl.names[-1] and len(decl.names) > 1 and decl.kind == 'useState':
+                return f"React.Dispatch<React.SetStateAction<{kind}>>"
+            return kind
+        m = re.search(rf'\b(?:const|let|var)\s+{re.escape(name)}\s*:\s*(?P<type>[^=]+?)\s*=(?!>)', source)
+        if m:
+            return ' '.join(m.group('type').split())
+    return None
+
+
+def _name_for(condition, stem):
+    words = re.findall(r'[A-Za-z][A-Za-z0-9]*', condition)
+    word = next((w for w in words if w not in KEYWORDS), 'Block')
+    word = re.sub(r'^(?:show|is|open|has|display)(?=[A-Z])', '', word)
+    return stem + word[:1].upper() + word[1:]
+
+
+def plan_split(path, text, conditional, name=None):
+    """Split moving conditional (from find_conditionals(text)) into its own lazily loaded file."""
+    index, braces, decls = _indexes(text)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = name or _name_for(conditional.condition, stem)
+    module = os.path.join(os.path.dirname(os.path.abspath(path)), name + '.tsx')
+    imported, statements = parse_imports(text)
+
+    free = free_names(text, index, braces, conditional.start, conditional.end)
+    carried = [imported[n] for n in free if n in imported]
+    props = [(n, _prop_type(text, decls, n)) for n in free if n not in imported and n != 'React']
+    block = text[conditional.start:conditional.end]
+    needs_react = 'React' not in [i.local for i in carried]
+    carried_lines = (["import React from 'react';"] if needs_react else []) + _import_lines(carried)
+
+    members = []
+    for prop, kind in props:
+        if kind is None:
+            members.append('    // eslint-disable-next-line @typescript-eslint/no-explicit-any')
+        members.append(f"    {prop}: {kind or 'any'};")
+    if props:
+        signature = (f"interface {name}Props {{\n" + '\n'.join(members) + "\n}\n\n"
+                     f"const {name}: React.FC<{name}Props> = ({{ {', '.join(p for p, _ in props)} }}) => (")
+    else:
+        signature = f"const {name}: React.FC = () => ("
+    content = ('\n'.join(carried_lines) + '\n\n'
+               f"// Rendered by {stem}.tsx when {conditional.condition}; split out by apply_lazy_split.py\n"
+               f"// so its markup loads the first time it opens.\n"
+               f"{signature}\n"
+               f"{reindent(block, indent_at(text, conditional.start), '    ')}\n"
+               f");\n\nexport default {name};\n")
+
+    prefix, react_line, react_edit = react_lazy(text)
+    indent = indent_at(text, conditional.start)
+    attrs = [f"{p}={{{p}}}" for p, _ in props]
+    if len(attrs) <= 3:
+        site = f"<{prefix}Suspense fallback={{null}}><{name}{''.join(' ' + a for a in attrs)} /></{prefix}Suspense>"
+    else:
+        site = (f"<{prefix}Suspense fallback={{null}}>\n{indent}    <{name}\n"
+                + ''.join(f"{indent}        {a}\n" for a in attrs)
+                + f"{indent}    />\n{indent}</{prefix}Suspense>")
+    edits = [(conditional.start, conditional.end, site)]
+    if react_edit:
+        edits.append(react_edit)
+    head = [react_line] if react_line else []
+    at = imports_end(text)
+    lazies = _LAZY_BLOCK.match(text, at)
+    if lazies:
+        at = lazies.end()               # with the lazy components already there
+    else:
+        head.append('')
+    head.append(f"const {name} = {prefix}lazy(() => import('./{name}'));")
+    edits.append((at, at, '\n'.join(head) + '\n'))
+
+    # Imports only the block used go with it.
+    rest = text[:conditional.start] + text[conditional.end:]
+    dropped = []
+    for m in statements:
+        clause = m.group('clause')
+        locals_ = [local for local, imp in imported.items() if imp.source == m.group('source')
+                   and re.search(rf'(?<![\w$]){re.escape(local)}(?![\w$])', clause)]
+        unused = [local for local in locals_ if local in free and not re.search(
+            rf'(?<![\w$.]){re.escape(local)}(?![\w$])', rest[:m.start()] + rest[m.end():])]
+        if not unused:
+            continue
+        dropped += unused
+        keep = [imported[local] for local in locals_ if local not in unused]
+        line = ''
+        if keep:
+            line = m.group()[:m.start('clause') - m.start()] + _import_lines(keep)[0][len('import '):]
+            line = line.replace('import type ', 'import ', 1) if not clause.startswith('type ') else line
+            line += m.group()[len(m.group().rstrip('\r\n')):]
+        edits.append((m.start(), m.end(), line))
+    edits.sort(key=lambda edit: edit[:2])
+    return Split(name, module, content, props, carried, edits, dropped)
@@ -0,0 +1,229 @@
+"""
+Top-level declaration map for TS/TSX modules.
+
+build_declarations() walks a file once and lists every declaration at module
+level and directly inside the body of each module-level function or arrow
+component: const/let/var bindings, function and class declarations, and
+React hook calls (bare `useEffect(...)` statements as well as
+`const [x, setX] = useState(...)`, which is recorded with kind 'useState').
+
+Spans come from the brace index: a declaration runs from the start of its
+line to the first `;` or newline back at its own nesting depth that does not
+continue the expression, so a 400-line useEffect is one entry with exact
+bounds. load_declarations() caches the map per file content hash, which makes
+finding a declaration in a 10k-line component a dictionary lookup.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+import re
+
+from tsxtools import cache
+from tsxtools.braces import build_brace_index
+
+MAP_VERSION = 1
+
+HOOKS = ('useEffect', 'useLayoutEffect', 'useState', 'useMemo', 'useCallback', 'useRef', 'useReducer',
+         'useContext')
+
+DECLARATION = re.compile(
+    r'(?:export\s+(?:default\s+)?)?(?:'
+    r'(?P<keyword>const|let|var)\s+(?P<binding>\[[^\]=]*\]|\{[^}=]*\}|[\w$]+)'
+    r'|(?:async\s+)?(?P<function>function)\s*\*?\s*(?P<function_name>[\w$]*)'
+    r'|(?:abstract\s+)?(?P<class>class)\s+(?P<class_name>[\w$]+)'
+    r'|(?:React\.)?(?P<hook>use\w+)\s*(?:<.*?>)?\s*\('
+    r')',
+    re.S,
+)
+_HOOK_CALL = re.compile(r'[^=;\n]*?=\s*(?:React\.)?(use\w+)\s*(?:<.*?>)?\s*\(', re.S)
+_NAMES = re.compile(r'(?:\.\.\.)?([A-Za-z_$][\w$]*)(?!\s*:)')
+_LINE_COMMENT = re.compile(r'\s//[^\'"`]*$')
+_CONTINUES_AFTER = tuple('=,([{?:+-*/&|<>.')
+_CONTINUES_BEFORE = re.compile(r'\s*(?:\.(?!\.\.)|\?|:|&&|\|\||\+|-(?!-)|\*|/(?![/*])|=(?!=)|as\s|satisfies\s)')
+
+
+@dataclass
+class Declaration:
+    index: int
+    kind: str                 # const, let, var, function, class, or the React hook called
+    names: tuple              # bound names; () for bare hook calls
+    start: int                # offset of the first char of the declaration
+    end: int                  # offset just past its closing `;` or last char
+    line: int
+    end_line: int
+    depth: int                # bracket depth it sits at
+    parent: int = None        # index of the enclosing declaration
+    body: tuple = None        # (open, close) offsets of its function body
+
+    @property
+    def name(self):
+        return self.names[0] if self.names else self.kind
+
+    @property
+    def span(self):
+        return self.start, self.end
+
+
+class DeclarationMap:
+    """Declarations of one file, in source order, with name and kind lookups."""
+
+    def __init__(self, declarations):
+        self.declarations = declarations
+        self.by_name = {}
+        self.by_kind = {}
+        for decl in declarations:
+            for name in decl.names:
+                self.by_name.setdefault(name, []).append(decl.index)
+            self.by_kind.setdefault(decl.kind, []).append(decl.index)
+        self._starts = [decl.start for decl in declarations]
+
+    def __len__(self):
+        return len(self.declarations)
+
+    def __iter__(self):
+        return iter(self.declarations)
+
+    def find(self, name, kind=None):
+        """Declarations binding name, optionally only of one kind."""
+        hits = [self.declarations[i] for i in self.by_name.get(name, ())]
+        return [d for d in hits if kind is None or d.kind == kind]
+
+    def of_kind(self, kind):
+        return [self.declarations[i] for i in self.by_kind.get(kind, ())]
+
+    def members(self, decl):
+        """Declarations directly inside decl's function body."""
+        return [d for d in self.declarations if d.parent == decl.index]
+
+    def at(self, offset):
+        """Innermost declaration whose span contains offset, or None."""
+        i = bisect_right(self._starts, offset)
+        if not i:
+            return None
+        decl = self.declarations[i - 1]
+        if offset < decl.end:
+            return decl
+        if decl.parent is not None and offset < self.declarations[decl.parent].end:
+            return self.declarations[decl.parent]
+        return None
+
+
+def _continues(text, nl):
+    """True if the statement broken by the newline at nl carries on below."""
+    line = text[text.rfind('\n', 0, nl) + 1:nl]
+    line = _LINE_COMMENT.sub('', line).rstrip()
+    if line.endswith(_CONTINUES_AFTER) and not line.endswith(('++', '--')):
+        return True
+    following = nl + 1
+    while following < len(text):
+        eol = text.find('\n', following)
+        eol = len(text) if eol == -1 else eol
+        if text[following:eol].strip():
+            return _CONTINUES_BEFORE.match(text, following) is not None
+        following = eol + 1
+    return False
+
+
+def _statement_end(text, index, start, depth):
+    at = start
+    while True:
+        brk = index.next_break(at, depth)
+        if brk is None:
+            return len(text)
+        if text[brk] == ';' or not _continues(text, brk):
+            return brk + 1 if text[brk] == ';' else brk
+        at = brk + 1
+
+
+def _body(text, index, decl, function):
+    """(open, close) of the function body of a declaration, or None."""
+    after_params = function
+    for offset, char, _depth in index.brackets(decl.start, decl.end):
+        if char != '{':
+            if after_params is True and char == ')' and index.depth_at(offset + 1) == decl.depth:
+                after_params = 'ready'
+            continue
+        close = index.match(offset)
+        if close is None:
+            continue
+        # Only the declaration's own function, possibly wrapped in a call
+        # (React.memo, forwardRef), not a method inside an object literal.
+        before = index.depth_at(offset)
+        if before > decl.depth + 1:
+            continue
+        if before > decl.depth and text[index.enclosing(offset)] != '(':
+            continue
+        if after_params == 'ready' or text[max(0, offset - 64):offset].rstrip().endswith('=>'):
+            return offset, close
+    return None
+
+
+def _declare(text, index, m, start, depth, number, parent):
+    if m.group('keyword'):
+        kind = m.group('keyword')
+        names = tuple(_NAMES.findall(m.group('binding')))
+        hook = _HOOK_CALL.match(text, m.end())
+        if hook and hook.group(1) in HOOKS:
+            kind = hook.group(1)
+    elif m.group('function'):
+        kind = 'function'
+        names = (m.group('function_name'),) if m.group('function_name') else ()
+    elif m.group('class'):
+        kind = 'class'
+        names = (m.group('class_name'),)
+    else:
+        kind = m.group('hook')
+        names = ()
+    end = _statement_end(text, index, m.end(), depth)
+    decl = Declaration(number, kind, names, start, end, index.line_of(start),
+                       index.line_of(max(start, end - 1)), depth, parent)
+    if kind in ('const', 'let', 'var', 'function'):
+        decl.body = _body(text, index, decl, kind == 'function')
+    return decl
+
+
+def _scan(text, index, lo, hi, depth, parent, out):
+    """Declarations whose lines start in [lo, hi) at the given depth."""
+    first = bisect_right(index.line_starts, lo)
+    if first and index.line_starts[first - 1] == lo:
+        first -= 1
+    covered = lo
+    found = []
+    for i in range(first, len(index.line_starts)):
+        start = index.line_starts[i]
+        if start >= hi:
+            break
+        if start < covered or index.line_depths[i] != depth:
+            continue
+        pos = start + len(text[start:start + 200]) - len(text[start:start + 200].lstrip(' \t'))
+        m = DECLARATION.match(text, pos)
+        if m is None:
+            continue
+        if m.group('hook') and m.group('hook') not in HOOKS:
+            continue
+        decl = _declare(text, index, m, pos, depth, len(out), parent)
+        out.append(decl)
+        found.append(decl)
+        covered = decl.end
+    return found
+
+
+def build_declarations(text):
+    index = build_brace_index(text)
+    declarations = []
+    for decl in _scan(text, index, 0, len(text), 0, None, declarations):
+        if decl.body is not None and decl.kind != 'class':
+            open_, close = decl.body
+            _scan(text, index, open_ + 1, close, index.depth_at(open_ + 1), decl.index, declarations)
+    declarations.sort(key=lambda d: d.start)
+    renumber = {d.index: i for i, d in enumerate(declarations)}
+    for i, decl in enumerate(declarations):
+        decl.index = i
+        if decl.parent is not None:
+            decl.parent = renumber[decl.parent]
+    return DeclarationMap(declarations)
+
+
+def load_declarations(path):
+    """DeclarationMap for path, from the content-hash cache when possible."""
+    return cache.cached('decls', MAP_VERSION, path, build_declarations)
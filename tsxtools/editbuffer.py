@@ -0,0 +1,202 @@
+"""
+Line buffer for the apply_* scripts that checks its own edits before writing.
+
+EditBuffer reads a file into a list of lines and keeps, for every current
+line, the pre-image line it came from. Edits go through replace_lines(),
+insert_lines() and delete_lines(), which splice the list and remember which
+pre-image lines were touched. That gives the same hunks `git diff` would,
+so write() runs the incremental check (tsxtools.incremental.check_hunks)
+against the pre-image's structure profile, cached per content hash: only the
+block around each replacement is lexed, not the 10k-line component, and a
+file the patch would break (an unclosed brace, a stray `</div>`, a template
+left open) is not written at all.
+
+Each replacement template is also scanned on its own when it is spliced in
+(balanced=True, the default), so a template that does not balance by itself
+is reported against the template rather than the line numbers it lands on.
+Pass balanced=False for edits that only open or close part of a block.
+
+An EditBuffer is also a patch session (tsxtools.session): it keeps the hash
+of the bytes it read, and if another run has rewritten the file by the time
+write() is called, its own replacements are merged onto that version when
+the two touch different regions, or refused with a conflict report when
+they do not. Scripts patching different sections of the same component can
+therefore run at the same time.
+
+Splices, validate() and write() are tsxtools.memory steps, so a run with
+memory accounting on reports each one and stops at the first that goes over
+the budget, before the file is written. A profiled run (tsxtools.profiler)
+files their samples under the buffer's path.
+"""
+
+from tsxtools import memory, profiler
+from tsxtools.fileio import content_hash, file_hash, write_lines_if_changed
+from tsxtools.incremental import Hunk, check_hunks, text_profile
+from tsxtools.lexer import LOOKBEHIND
+from tsxtools.mismatch import BRACKET, JSX_SUFFIXES, scan_chunks
+from tsxtools.session import conflict_report, decode, line_hunks, locked, merge
+
+
+def _as_lines(new_lines):
+    """readlines()-style list from a string or a list of lines."""
+    if isinstance(new_lines, str):
+        return new_lines.splitlines(keepends=True)
+    return [line if line.endswith('\n') else line + '\n' for line in new_lines]
+
+
+class EditBuffer:
+    """Lines of one file plus the pre-image they were edited from."""
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self.jsx = path.endswith(JSX_SUFFIXES)
+        with open(path, 'rb') as f:
+            data = f.read()
+        self._rebase(decode(data, encoding), content_hash(data))
+
+    def _rebase(self, lines, base_hash):
+        """Make lines the pre-image: no edits, nothing to validate."""
+        self.lines = lines
+        self.base_hash = base_hash                 # sha256 of the bytes the pre-image was read from
+        self._base = list(lines)
+        self._original = ''.join(lines)
+        self._count = len(lines)
+        self._origin = list(range(self._count))    # pre-image line of each line, None if inserted
+        self.template_problems = []                # (line, col, description) from splice-time checks
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __getitem__(self, i):
+        return self.lines[i]
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def _in_children(self, at):
+        """True if current line `at` starts inside JSX children in the pre-image."""
+        following = next((o for o in self._origin[at:] if o is not None), None)
+        if following is None:
+            return False
+        profile = text_profile(self._original, self.jsx)
+        top = profile.tops[following]
+        return profile.boundaries[following] and top is not None and top.kind != BRACKET
+
+    def replace_lines(self, start, end, new_lines, balanced=True):
+        """Replace lines [start, end) with new_lines (a string or a list of lines)."""
+        with memory.step(f"{self.path}: replace lines {start + 1}-{end}"), profiler.file(self.path):
+            self._replace_lines(start, end, new_lines, balanced)
+
+    def _replace_lines(self, start, end, new_lines, balanced):
+        new = _as_lines(new_lines)
+        if balanced and new:
+            template = ''.join(new)
+            prev = ''.join(self.lines[max(0, start - 4):start])[-LOOKBEHIND:]
+            problems = scan_chunks([template], self.jsx, prev, self._in_children(start))
+            tokens = {id(t): t for p in problems for t in (p.token, p.partner) if t is not None}
+            for tok in tokens.values():
+                tok.line += start
+            for p in problems:
+                self.template_problems.append(
+                    (p.token.line, p.token.col, f"{p.describe('end of the inserted block')} (in the inserted block)"))
+        self.lines[start:end] = new
+        self._origin[start:end] = [None] * len(new)
+
+    def insert_lines(self, at, new_lines, balanced=True):
+        self.replace_lines(at, at, new_lines, balanced)
+
+    def delete_lines(self, start, end):
+        self.replace_lines(start, end, [])
+
+    def set_line(self, i, text):
+        """Rewrite one line in place; not checked on its own (usually a partial edit)."""
+        self.replace_lines(i, i + 1, [text], balanced=False)
+
+    def hunks(self):
+        """Hunks from the pre-image to the current lines, as diff_hunks() reports them."""
+        hunks = []
+        expected = 0
+        first = None
+        for i, origin in enumerate(self._origin):
+            if origin == expected:
+                if first is not None:
+                    hunks.append(Hunk(expected, 0, first, i - first))
+                    first = None
+                expected += 1
+            elif origin is None:
+                if first is None:
+                    first = i
+            else:
+                # Pre-image lines [expected, origin) were deleted here.
+                new_first = first if first is not None else i
+                hunks.append(Hunk(expected, origin - expected, new_first, i - new_first))
+                first = None
+                expected = origin + 1
+        total = self._count
+        if first is not None or expected < total:
+            new_first = first if first is not None else len(self._origin)
+            hunks.append(Hunk(expected, total - expected, new_first, len(self._origin) - new_first))
+        return hunks
+
+    def validate(self):
+        """(line, col, description) for every problem the edits introduced."""
+        with memory.step(f"{self.path}: validate"), profiler.file(self.path):
+            return self._validate()
+
+    def _validate(self):
+        problems = list(self.template_problems)
+        hunks = self.hunks()
+        if hunks:
+            profile = text_profile(self._original, self.jsx)
+            found, _rescanned, _lines = check_hunks(profile, self._original, ''.join(self.lines), hunks, self.jsx)
+            # A template that is broken by itself shows up again in its region.
+            seen = {(line, col) for line, col, _desc in problems}
+            problems += [p for p in found if p[:2] not in seen]
+        return sorted(problems)
+
+    def _refuse(self, problems, what=''):
+        print(f"REFUSED: {self.path}{what} would be left with {len(problems)} structure problem(s):")
+        for line, col, desc in problems:
+            print(f"  {self.path}:{line}:{col}: {desc}")
+        return False
+
+    def _merged_onto(self, data):
+        """Our edits applied to the file's current bytes, or None (reported) if they cannot be."""
+        theirs = decode(data, self.encoding)
+        merged, conflicts = merge(self._base, self.hunks(), self.lines, line_hunks(self._base, theirs), theirs)
+        if conflicts:
+            for line in conflict_report(self.path, self._base, conflicts, self.base_hash,
+                                        content_hash(data), self.encoding):
+                print(line)
+            return None
+        their_text = ''.join(theirs)
+        problems, _rescanned, _lines = check_hunks(text_profile(their_text, self.jsx), their_text,
+                                                   ''.join(merged), line_hunks(theirs, merged), self.jsx)
+        if problems:
+            self._refuse(problems, ' (merged with the version now on disk)')
+            return None
+        print(f"Merged: {self.path} changed on disk since it was read; "
+              f"{len(self.hunks())} region(s) applied on top of that version")
+        return merged
+
+    def write(self):
+        """Write the buffer if it validates; returns False (and writes nothing) if it does not.
+
+        If the file changed on disk since it was read, the edits are merged
+        onto the new version, or refused when they overlap what changed.
+        """
+        problems = self.validate()
+        if problems:
+            return self._refuse(problems)
+        with memory.step(f"{self.path}: write"), profiler.file(self.path), locked(self.path):
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            lines = self.lines
+            if content_hash(data) != self.base_hash:
+                lines = self._merged_onto(data)
+                if lines is None:
+                    return False
+            write_lines_if_changed(self.path, lines, self.encoding)
+            self._rebase(lines, file_hash(self.path))
+        return True
@@ -0,0 +1,98 @@
+"""
+Content-addressed file writes for the apply_* scripts.
+
+Every patch script used to rewrite its target unconditionally, which bumps the
+mtime and makes Vite (and tsc) rebuild even when nothing changed. These helpers
+compare the hash of the new buffer with what is on disk and skip the write when
+they are identical.
+
+Every write is also recorded in the reverse-edit journal (tsxtools.journal),
+so a run can be undone without keeping a backup of the file.
+
+Large replacement blocks live in templates/ at the repo root and are read
+with read_template() when a script gets to the step that uses them, instead
+of sitting in the script as multi-kilobyte string literals.
+"""
+
+import hashlib
+import os
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+
+# Paths actually rewritten during this run, in write order.
+_modified = []
+
+
+def content_hash(data):
+    """sha256 hex digest of a bytes or str buffer (str is hashed as UTF-8)."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(text, encoding):
+    # Mirror open(path, 'w') so the bytes we compare are the bytes text mode
+    # would have written (CRLF on Windows checkouts).
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode(encoding)
+
+
+def file_hash(path):
+    """sha256 of a file on disk, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_if_changed(path, text, encoding='utf-8'):
+    """Write text to path unless the file already holds exactly these bytes.
+
+    Returns True if the file was written.
+    """
+    data = _encode(text, encoding)
+    try:
+        with open(path, 'rb') as f:
+            old = f.read()
+    except FileNotFoundError:
+        old = None
+
+    if old is not None and len(old) == len(data) and content_hash(old) == content_hash(data):
+        print(f"Unchanged: {path} (write skipped)")
+        return False
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    from tsxtools import journal
+    journal.record(path, old, data)
+    _modified.append(path)
+    print(f"Modified: {path}")
+    return True
+
+
+def write_lines_if_changed(path, lines, encoding='utf-8'):
+    """write_if_changed for a list of lines as produced by readlines()."""
+    return write_if_changed(path, ''.join(lines), encoding)
+
+
+def read_template(name, encoding='utf-8'):
+    """Text of templates/<name>.tsx.tpl, exactly as stored (no newline translation)."""
+    with open(os.path.join(TEMPLATE_DIR, name + '.tsx.tpl'), 'r', encoding=encoding, newline='') as f:
+        return f.read()
+
+
+def modified_files():
+    """Paths written so far in this process."""
+    return list(_modified)
+
+
+def report_modified():
+    """Print the files this run actually modified."""
+    if not _modified:
+        print("No files modified.")
+        return
+    print(f"Modified {len(_modified)} file(s):")
+    for path in _modified:
+        print(f"  {path}")
@@ -0,0 +1,228 @@
+"""
+Remote image index and responsive <img> rewrites for Unsplash assets.
+
+index_images() lists every remote image URL in a file, whether it is an
+<img src>, a CSS `url(...)` or some other string, with its line; it is
+cached per content hash like the other indexes.
+
+plan_images() works out, for each <img> whose src is a literal Unsplash URL,
+how wide it is actually drawn on a desktop viewport (from the Tailwind width,
+max-width, fraction and grid classes on it and its ancestors) and rewrites
+the opening tag:
+
+    src       resized to that width (height scaled to keep a fit=crop aspect)
+    srcSet    the same photo at the standard widths up to 2x that width
+              (or the original width, if smaller)
+    sizes     the drawn width from the md breakpoint up, 100vw below
+    loading   "lazy", and decoding "async", except for heroes
+
+An image is a hero (above the fold) if it sits under an element whose id or
+class mentions "hero", or in the first <section> of a component rendered at
+the top of the page (FIRST_SCREEN, or the files the caller names): in any
+other file the first section is somewhere down the page. Heroes keep eager
+loading so the first paint is not delayed. Tags that already have a srcSet
+are left alone, which makes the rewrite idempotent.
+
+Byte figures are estimates from pixel counts (BYTES_PER_PIXEL is typical for
+Unsplash JPEG/WebP at q=80), comparing the old src with the candidate a
+desktop browser at 1x would pick.
+"""
+
+from dataclasses import dataclass
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from tsxtools import cache
+from tsxtools.jsx import build_index
+
+IMAGES_VERSION = 1
+
+VIEWPORT = 1440              # desktop layout width the sizes are worked out for
+MOBILE_BREAKPOINT = 768      # Tailwind md
+WIDTHS = (400, 640, 828, 1080, 1280, 1600, 1920, 2400)
+FIRST_SCREEN = ('CommandCenter.tsx', 'Hero.tsx')   # what the landing view opens with
+UNSIZED_WIDTH = 4000         # what Unsplash serves when the URL gives no w=
+BYTES_PER_PIXEL = 0.18
+
+_URL = re.compile(r'''https?://[^\s'"`)]+?\.(?:unsplash\.com|pexels\.com|cloudinary\.com|imgix\.net)[^\s'"`)]*'''
+                  r'''|https?://[^\s'"`)]+\.(?:jpe?g|png|webp|gif|avif|svg)(?:\?[^\s'"`)]*)?''', re.I)
+_MAX_W = {'xs': 320, 'sm': 384, 'md': 448, 'lg': 512, 'xl': 576, '2xl': 672, '3xl': 768, '4xl': 896,
+          '5xl': 1024, '6xl': 1152, '7xl': 1280, 'screen-xl': 1280, 'screen-2xl': 1536}
+_FRACTION = re.compile(r'^(?:(?:md|lg|xl):)?w-(\d+)/(\d+)$')
+_FIXED = re.compile(r'^(?:(?:md|lg|xl):)?w-(?:(\d+)|\[(\d+)px\])$')
+_MAXW = re.compile(r'^(?:(?:md|lg|xl):)?max-w-([\w-]+)$')
+_GRID = re.compile(r'^(?:(?:md|lg|xl):)?grid-cols-(\d+)$')
+
+
+@dataclass
+class RemoteImage:
+    url: str
+    line: int
+    context: str             # 'img', 'srcset', 'css' or 'string'
+
+
+@dataclass
+class ImagePlan:
+    line: int
+    start: int               # offset of the opening tag
+    end: int                 # offset just past it
+    tag: str                 # rewritten opening tag, or None when skipped
+    url: str
+    width: int = 0           # drawn width on a desktop viewport, in CSS px
+    hero: bool = False
+    old_bytes: int = 0
+    new_bytes: int = 0
+    skipped: str = ''        # why the tag was left alone
+
+    @property
+    def saved(self):
+        return max(0, self.old_bytes - self.new_bytes)
+
+
+def _scan_urls(text):
+    images = []
+    line = 1
+    last = 0
+    for m in _URL.finditer(text):
+        line += text.count('\n', last, m.start())
+        last = m.start()
+        before = text[max(0, m.start() - 12):m.start()]
+        if 'url(' in before:
+            context = 'css'
+        elif re.search(r'src=\s*["\'{]?$', before):
+            context = 'img'
+        elif re.search(r'srcSet="[^"]*$', text[text.rfind('\n', 0, m.start()) + 1:m.start()]):
+            context = 'srcset'
+        else:
+            context = 'string'
+        images.append(RemoteImage(m.group(0), line, context))
+    return images
+
+
+def index_images(path):
+    """[RemoteImage] for every remote image URL in path, cached per content hash."""
+    return cache.cached('images', IMAGES_VERSION, path, _scan_urls)
+
+
+def _classes_width(classes, width):
+    """Width of an element with these classes inside a box `width` wide."""
+    for cls in classes:
+        m = _FIXED.match(cls)
+        if m:
+            width = int(m.group(1)) * 4 if m.group(1) else int(m.group(2))
+    for cls in classes:
+        m = _FRACTION.match(cls)
+        if m:
+            width = width * int(m.group(1)) // int(m.group(2))
+        m = _MAXW.match(cls)
+        if m and m.group(1) in _MAX_W:
+            width = min(width, _MAX_W[m.group(1)])
+    return width
+
+
+def drawn_width(index, el):
+    """Desktop width of an element from its and its ancestors' Tailwind classes."""
+    chain = []
+    i = el.index
+    while i is not None:
+        chain.append(index.elements[i])
+        i = index.elements[i].parent
+    width = VIEWPORT
+    columns = 1
+    for node in reversed(chain):
+        width = _classes_width(node.classes, width // columns)
+        columns = 1
+        for cls in node.classes:
+            m = _GRID.match(cls)
+            if m:
+                columns = max(columns, int(m.group(1)))
+    return max(1, width)
+
+
+def is_hero(index, el, first_screen=False):
+    """True if el is above the fold; its file's first <section> only counts when first_screen."""
+    sections = index.by_tag.get('section', ())
+    i = el.parent
+    while i is not None:
+        node = index.elements[i]
+        words = ' '.join(node.classes) + ' ' + (node.attrs.get('id') or '')
+        if 'hero' in words.lower():
+            return True
+        if node.tag == 'section':
+            return first_screen and bool(sections) and sections[0] == node.index
+        i = node.parent
+    return False
+
+
+def _with_width(url, width):
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    old_w = int(query['w']) if query.get('w', '').isdigit() else None
+    if old_w and query.get('h', '').isdigit():
+        query['h'] = str(max(1, round(int(query['h']) * width / old_w)))
+    query['w'] = str(width)
+    return urlunsplit(parts._replace(query=urlencode(query, safe=',')))
+
+
+def _pixels(url):
+    query = dict(parse_qsl(urlsplit(url).query))
+    w = int(query['w']) if query.get('w', '').isdigit() else UNSIZED_WIDTH
+    h = int(query['h']) if query.get('h', '').isdigit() else w * 2 // 3
+    return w * h
+
+
+def _add_attrs(tag, attrs):
+    """Opening tag with attrs appended after its last attribute, in the tag's own layout."""
+    close = len(tag) - (2 if tag.endswith('/>') else 1)
+    body = tag[:close].rstrip()
+    sep = ' '
+    if '\n' in body:
+        # One attribute per line, indented like the last one.
+        last = body[body.rfind('\n') + 1:]
+        sep = '\n' + last[:len(last) - len(last.lstrip())]
+    # Spaces the old last attribute trailed before the line break are dropped, not moved.
+    tail = re.sub(r'^[ \t]+(?=\r?\n)', '', tag[len(body):])
+    return body + ''.join(f"{sep}{name}={value}" for name, value in attrs) + tail
+
+
+def plan_images(text, first_screen=False):
+    """[ImagePlan] for every <img> with a literal Unsplash src in text (see is_hero for first_screen)."""
+    index = build_index(text)
+    plans = []
+    for i in index.by_tag.get('img', ()):
+        el = index.elements[i]
+        src = el.attrs.get('src', '')
+        tag = text[el.start:el.open_end]
+        if 'images.unsplash.com' not in src:
+            continue
+        plan = ImagePlan(el.line, el.start, el.open_end, None, src)
+        if src.startswith('{'):
+            plan.skipped = 'src is an expression'
+        elif 'srcSet' in el.attrs:
+            plan.skipped = 'already has srcSet'
+        if plan.skipped:
+            plans.append(plan)
+            continue
+        width = drawn_width(index, el)
+        hero = is_hero(index, el, first_screen)
+        original = dict(parse_qsl(urlsplit(src).query)).get('w', '')
+        largest = int(original) if original.isdigit() else UNSIZED_WIDTH
+        # Standard widths below the cap, then the cap itself: never wider than the original.
+        cap = min(largest, 2 * width)
+        candidates = [w for w in WIDTHS if w < cap] + [cap]
+        chosen = next((w for w in candidates if w >= width), candidates[-1])
+        new_src = _with_width(src, chosen)
+        srcset = ', '.join(f"{_with_width(src, w)} {w}w" for w in candidates)
+        sizes = '100vw' if width >= VIEWPORT else f"(min-width: {MOBILE_BREAKPOINT}px) {width}px, 100vw"
+        new_tag = tag.replace(src, new_src, 1)
+        attrs = [('srcSet', f'"{srcset}"'), ('sizes', f'"{sizes}"')]
+        if not hero:
+            attrs += [('loading', '"lazy"'), ('decoding', '"async"')]
+        attrs = [(name, value) for name, value in attrs if name not in el.attrs]
+        plan.tag = _add_attrs(new_tag, attrs)
+        plan.width = width
+        plan.hero = hero
+        plan.old_bytes = int(_pixels(src) * BYTES_PER_PIXEL)
+        plan.new_bytes = int(_pixels(new_src) * BYTES_PER_PIXEL)
+        plans.append(plan)
+    return plans
@@ -0,0 +1,294 @@
+"""
+Incremental structure check of only the lines a git diff touched.
+
+check_changed() reads `git diff --unified=0` hunks for the working tree (or a
+commit range) and, for each changed file, loads the depth profile of the base
+revision (tsxtools.mismatch.structure_profile), cached under the git blob id
+so it is built once per base version. Each hunk is widened to the nearest
+lines before and after it that sit directly inside the innermost bracket or
+JSX element enclosing it. Only that slice is scanned, in the base and in the
+new text, starting from the same context (code or JSX children), and only
+problems the edit introduced are reported. Editing a
+few lines of a 10k-line component lexes a few lines, not the component.
+
+Hunks whose slices overlap are merged and checked together. A slice that
+shows new problems is widened to the next enclosing bracket or element and
+checked again, up to top level, since an edit can close its enclosing block
+and open a sibling (a duplicated `} else {`) without unbalancing the file;
+only problems still there in the top-level slice are reported.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+import re
+import subprocess
+
+from tsxtools import cache
+from tsxtools.lexer import LOOKBEHIND
+from tsxtools.mismatch import BRACKET, JSX_SUFFIXES, find_mismatches_in_text, scan_chunks, structure_profile
+
+PROFILE_VERSION = 1
+SOURCE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx', '.mjs')
+
+_HUNK = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+@dataclass
+class Hunk:
+    old_first: int      # 0-based first changed line in the base
+    old_count: int
+    new_first: int      # 0-based first changed line in the new text
+    new_count: int
+
+
+@dataclass
+class FileCheck:
+    path: str
+    hunks: int = 0
+    lines: int = 0                  # lines in the new text
+    rescanned: int = 0              # lines lexed to check it
+    problems: list = field(default_factory=list)   # (line, col, description) new in this change
+    full: bool = False              # no usable base: the whole file was scanned
+
+
+def _git(args, cwd):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True).stdout
+
+
+def git_root(cwd=None):
+    return _git(['rev-parse', '--show-toplevel'], cwd).decode().strip()
+
+
+def diff_hunks(base='HEAD', target=None, paths=(), cwd=None):
+    """{path: [Hunk]} for the diff from base to target (None: working tree).
+
+    Files added in the new version map to None; deleted files are left out.
+    """
+    args = ['diff', '--unified=0', '--no-color', '--no-ext-diff', '--no-renames', base]
+    if target is not None:
+        args.append(target)
+    args += ['--', *paths]
+    hunks = {}
+    path = None
+    for raw in _git(args, cwd).decode('utf-8', errors='replace').splitlines():
+        if raw.startswith('--- '):
+            added = raw == '--- /dev/null'
+        elif raw.startswith('+++ '):
+            path = None if raw == '+++ /dev/null' else raw[6:]
+            if path is not None:
+                hunks[path] = None if added else []
+        elif raw.startswith('@@') and path is not None and hunks[path] is not None:
+            m = _HUNK.match(raw)
+            old, old_count, new, new_count = (int(g) if g is not None else 1 for g in m.groups())
+            # With no lines on one side, the number is the line *before* the gap.
+            hunks[path].append(Hunk(old - 1 if old_count else old, old_count,
+                                    new - 1 if new_count else new, new_count))
+    return hunks
+
+
+def base_profile(rev, path, cwd=None):
+    """(StructureProfile, text) for path at rev, cached under its blob id."""
+    blob = _git(['rev-parse', f'{rev}:{path}'], cwd).decode().strip()
+    jsx = path.endswith(JSX_SUFFIXES)
+    key = f"{blob}-{'jsx' if jsx else 'js'}"
+    profile = cache.load('profile', PROFILE_VERSION, key)
+    if profile is None:
+        text = _git(['cat-file', 'blob', blob], cwd).decode('utf-8', errors='ignore')
+        profile = structure_profile(text, jsx), text
+        cache.store('profile', PROFILE_VERSION, key, profile)
+    return profile
+
+
+def text_profile(text, jsx=True):
+    """StructureProfile for an in-memory text, cached under its content hash."""
+    return cache.cached_text(f"structure-{'jsx' if jsx else 'js'}", PROFILE_VERSION, text,
+                             lambda t: structure_profile(t, jsx))
+
+
+def _encloses(frame, start, end):
+    return not (frame.close == -1 or frame.close < end or frame.inner == -1 or frame.inner > start)
+
+
+def _slice(profile, first, last, up=0):
+    """(start, end, frame) of the slice around changed base lines [first, last).
+
+    frame is the innermost open bracket or element enclosing the whole slice
+    (None at top level), or the one `up` levels above that; the slice starts
+    and ends directly inside it.
+    """
+    starts = profile.line_starts
+    count = len(starts)
+    start = starts[first] if first < count else profile.length
+    end = starts[last] if last < count else profile.length
+    known = first
+    while known > 0 and not profile.boundaries[known]:
+        known -= 1
+    frame = profile.tops[known]
+    while frame is not None and (up or not _encloses(frame, start, end)):
+        if _encloses(frame, start, end):
+            up -= 1
+        frame = frame.parent
+    lo_bound = frame.inner if frame is not None else 0
+    hi_bound = frame.close if frame is not None else profile.length
+
+    lo = first
+    while lo > 0 and starts[lo] > lo_bound and not (profile.boundaries[lo] and profile.tops[lo] is frame):
+        lo -= 1
+    hi = last
+    while hi < count and starts[hi] < hi_bound and not (profile.boundaries[hi] and profile.tops[hi] is frame):
+        hi += 1
+    start = max(starts[lo] if lo < count else profile.length, lo_bound)
+    end = min(starts[hi] if hi < count else profile.length, hi_bound)
+    return start, end, frame
+
+
+def _line_starts(text):
+    starts = [0]
+    pos = text.find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = text.find('\n', pos + 1)
+    return starts
+
+
+def _to_new(profile, offset, new_starts, shift):
+    """New-text offset of a base offset on an unchanged line `shift` lines away."""
+    line = profile.line_of(offset) - 1
+    col = offset - profile.line_starts[line]
+    if line + shift >= len(new_starts):
+        return None
+    return new_starts[line + shift] + col
+
+
+def _groups(profile, hunks, up):
+    """Merge hunks whose slices overlap; yield (start, end, frame, hunks) in base order.
+
+    up maps id(hunk) to how many levels above its innermost frame to slice.
+    """
+    pending = list(hunks)
+    while pending:
+        group = [pending.pop(0)]
+        while True:
+            first = min(h.old_first for h in group)
+            last = max(h.old_first + h.old_count for h in group)
+            start, end, frame = _slice(profile, first, last, max(up[id(h)] for h in group))
+            lo = profile.line_of(start) - 1
+            hi = bisect_left(profile.line_starts, end)
+            more = [h for h in pending if h.old_first <= hi and h.old_first + h.old_count >= lo]
+            if not more:
+                break
+            group += more
+            pending = [h for h in pending if h not in more]
+        yield start, end, frame, group
+
+
+def check_file(path, hunks, base='HEAD', target=None, cwd=None):
+    """FileCheck for one file given its hunks (None: added, scan it all)."""
+    root = cwd or git_root()
+    if target is None:
+        with open(os.path.join(root, path), 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+    else:
+        text = _git(['show', f'{target}:{path}'], root).decode('utf-8', errors='ignore')
+    jsx = path.endswith(JSX_SUFFIXES)
+    result = FileCheck(path, len(hunks or ()))
+    if hunks is None:
+        new_starts = _line_starts(text)
+        result.full = True
+        result.lines = result.rescanned = len(new_starts)
+        result.problems = _located(find_mismatches_in_text(text, jsx), new_starts, 0)
+        return result
+    profile, old_text = base_profile(base, path, root)
+    result.problems, result.rescanned, result.lines = check_hunks(profile, old_text, text, hunks, jsx)
+    return result
+
+
+def _located(problems, new_starts, offset, end='end of file'):
+    """(line, col, description) for problems found in a slice starting at offset."""
+    # Slice tokens count lines and columns from the slice start.
+    line = bisect_right(new_starts, offset)
+    col = offset - new_starts[line - 1]
+    located = []
+    moved = set()
+    for p in problems:
+        for tok in (p.token, p.partner):
+            # A token can be one problem's partner and another's subject.
+            if tok is not None and id(tok) not in moved:
+                moved.add(id(tok))
+                if tok.line == 1:
+                    tok.col += col
+                tok.line += line - 1
+        located.append((p.token.line, p.token.col, p.describe(end)))
+    return located
+
+
+def check_hunks(profile, old_text, text, hunks, jsx=True):
+    """Problems the hunks introduced into text, given the base profile and text.
+
+    Returns (problems, lines rescanned, lines in text), problems being
+    (line, col, description) in the new text.
+    """
+    new_starts = _line_starts(text)
+    hunks = sorted(hunks, key=lambda h: h.old_first)
+    up = {id(h): 0 for h in hunks}
+    rescanned = 0
+    while True:
+        found, lines, failing = _check_groups(profile, old_text, text, new_starts, hunks, up, jsx)
+        rescanned += lines
+        if not failing:
+            return found, rescanned, len(new_starts)
+        for h in failing:
+            up[id(h)] += 1
+
+
+def _check_groups(profile, old_text, text, new_starts, hunks, up, jsx):
+    """(problems, lines rescanned, hunks of groups to widen) for one pass over the groups."""
+    found = []
+    failing = []
+    rescanned = 0
+    shift = 0
+    for start, end, frame, group in _groups(profile, hunks, up):
+        # Groups come in base order, so every earlier hunk has shifted lines by `shift`.
+        after = shift + sum(h.new_count - h.old_count for h in group)
+        new_start = _to_new(profile, start, new_starts, shift)
+        new_end = _to_new(profile, end, new_starts, after) if end < profile.length else len(text)
+        if new_start is None:
+            new_start = 0
+        if new_end is None:
+            new_end = len(text)
+        chunk = text[new_start:new_end]
+        rescanned += chunk.count('\n') + 1
+        in_children = frame is not None and frame.kind != BRACKET
+        problems = scan_chunks([chunk], jsx, text[max(0, new_start - LOOKBEHIND):new_start], in_children)
+        if problems:
+            known = Counter((p.kind, p.token.label) for p in scan_chunks(
+                [old_text[start:end]], jsx, old_text[max(0, start - LOOKBEHIND):start], in_children))
+            fresh = []
+            for p in problems:
+                key = (p.kind, p.token.label)
+                if known[key]:
+                    known[key] -= 1
+                else:
+                    fresh.append(p)
+            if fresh and frame is not None:
+                failing += group
+            elif fresh:
+                end_line = bisect_right(new_starts, new_end)
+                found += _located(fresh, new_starts, new_start, f"line {end_line}, the end of the checked block")
+        shift = after
+    return found, rescanned, failing
+
+
+def check_changed(base='HEAD', target=None, paths=(), cwd=None):
+    """FileCheck for every changed source file between base and target.
+
+    target=None compares against the working tree.
+    """
+    root = cwd or git_root()
+    results = []
+    for path, hunks in sorted(diff_hunks(base, target, paths, root).items()):
+        if path.endswith(SOURCE_SUFFIXES):
+            results.append(check_file(path, hunks, base, target, root))
+    return results
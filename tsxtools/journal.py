@@ -0,0 +1,265 @@
+"""
+Reverse-edit journal: undo and redo patch runs by the bytes they changed.
+
+Every write through tsxtools.fileio.write_if_changed() appends one NDJSON
+line to .tsxtools-journal/journal.ndjson in the repo root (TSXTOOLS_JOURNAL
+moves it; an empty string turns journaling off):
+
+    {"run": ..., "script": ..., "time": ..., "path": ...,
+     "pre": sha256 before, "post": sha256 after,
+     "ops": [[offset, removed, inserted], ...]}
+
+The ops are the changed byte regions found by a line diff and trimmed to
+the bytes that actually differ; offsets are into the pre-image, and the
+text is stored as UTF-8 with undecodable bytes escaped. A run is one
+process, so a patch script that rewrites three sections of a 10k-line
+component records three short regions rather than a 500 KB copy.
+
+undo() and redo() replay the regions of whole runs, newest first for undo
+and oldest first for redo. Every file is checked against the hash its run
+left it with (or started it from) before anything is touched, and every
+result against the hash at the other end, so a file edited since the run
+is reported and left alone, along with all the other files in that request.
+Undo and redo add a marker line to the journal rather than journaling their
+own writes, which keeps each run's state (applied or undone) explicit.
+"""
+
+import json
+import os
+import sys
+import time
+from difflib import SequenceMatcher
+
+try:
+    import fcntl
+except ImportError:                 # Windows
+    fcntl = None
+
+from tsxtools.fileio import content_hash
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_DIR = os.environ.get('TSXTOOLS_JOURNAL', os.path.join(ROOT, '.tsxtools-journal'))
+JOURNAL_NAME = 'journal.ndjson'
+
+_run = None
+
+
+class JournalError(Exception):
+    """An undo or redo that cannot be applied; nothing was written."""
+
+
+def journal_path():
+    return os.path.join(JOURNAL_DIR, JOURNAL_NAME)
+
+
+def run_id():
+    """Id of this process's run, made on first use."""
+    global _run
+    if _run is None:
+        _run = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    return _run
+
+
+def _rel(path):
+    path = os.path.abspath(path)
+    if os.path.commonpath([path, ROOT]) == ROOT:
+        return os.path.relpath(path, ROOT).replace(os.sep, '/')
+    return path
+
+
+def _text(data):
+    return data.decode('utf-8', errors='surrogateescape')
+
+
+def _bytes(text):
+    return text.encode('utf-8', errors='surrogateescape')
+
+
+def regions(old, new):
+    """[(offset, removed, inserted)] byte regions turning old into new, offsets into old."""
+    a = old.splitlines(keepends=True)
+    b = new.splitlines(keepends=True)
+    starts_a = [0]
+    for line in a:
+        starts_a.append(starts_a[-1] + len(line))
+    starts_b = [0]
+    for line in b:
+        starts_b.append(starts_b[-1] + len(line))
+    out = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            continue
+        offset = starts_a[i1]
+        removed = old[offset:starts_a[i2]]
+        inserted = new[starts_b[j1]:starts_b[j2]]
+        # Trim to the bytes that differ: a one-word edit records one word.
+        head = 0
+        limit = min(len(removed), len(inserted))
+        while head < limit and removed[head] == inserted[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and removed[-1 - tail] == inserted[-1 - tail]:
+            tail += 1
+        out.append((offset + head, removed[head:len(removed) - tail], inserted[head:len(inserted) - tail]))
+    return out
+
+
+def _append(entry):
+    os.makedirs(JOURNAL_DIR, exist_ok=True)
+    line = json.dumps(entry) + '\n'
+    with open(journal_path(), 'a', encoding='utf-8') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(line)
+
+
+def record(path, old, new):
+    """Journal a write of new over old (None if the file did not exist)."""
+    if not JOURNAL_DIR:
+        return
+    ops = regions(old or b'', new)
+    _append({
+        'run': run_id(),
+        'script': os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else '',
+        'time': time.time(),
+        'path': _rel(path),
+        'pre': content_hash(old) if old is not None else None,
+        'post': content_hash(new),
+        'ops': [[offset, _text(removed), _text(inserted)] for offset, removed, inserted in ops],
+    })
+
+
+def load_runs():
+    """{run: {'script', 'time', 'writes': [entry], 'undone': bool}} in journal order."""
+    runs = {}
+    try:
+        with open(journal_path(), 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return runs
+    for raw in lines:
+        if not raw.endswith('\n'):
+            continue                # a write still in progress
+        entry = json.loads(raw)
+        if 'undo' in entry or 'redo' in entry:
+            run = runs.get(entry.get('undo') or entry.get('redo'))
+            if run is not None:
+                run['undone'] = 'undo' in entry
+            continue
+        run = runs.setdefault(entry['run'], {'script': entry['script'], 'time': entry['time'],
+                                             'writes': [], 'undone': False})
+        run['writes'].append(entry)
+    return runs
+
+
+def _splice(data, ops, backward):
+    """data with ops (pre-image offsets) reverted (backward) or applied to it."""
+    if backward:
+        shift = 0
+        at = []
+        for offset, removed, inserted in ops:
+            at.append(offset + shift)
+            shift += len(inserted) - len(removed)
+        for (_offset, removed, inserted), offset in reversed(list(zip(ops, at))):
+            data = data[:offset] + removed + data[offset + len(inserted):]
+        return data
+    for offset, removed, inserted in reversed(ops):
+        data = data[:offset] + inserted + data[offset + len(removed):]
+    return data
+
+
+def _replay(runs, backward):
+    """{path: bytes or None} after replaying runs; raises JournalError before any write."""
+    current = {}
+    for run_name, run in runs:
+        writes = reversed(run['writes']) if backward else run['writes']
+        for entry in writes:
+            path = entry['path'] if os.path.isabs(entry['path']) else os.path.join(ROOT, entry['path'])
+            if path not in current:
+                try:
+                    with open(path, 'rb') as f:
+                        current[path] = f.read()
+                except FileNotFoundError:
+                    current[path] = None
+            expect, result = (entry['post'], entry['pre']) if backward else (entry['pre'], entry['post'])
+            data = current[path]
+            found = content_hash(data) if data is not None else None
+            if found != expect:
+                raise JournalError(
+                    f"{entry['path']} is not in the state run {run_name} "
+                    f"{'left' if backward else 'found'} it in (expected "
+                    f"{(expect or 'no file')[:12]}, found {(found or 'no file')[:12]}); "
+                    f"it has been edited since; {'undo later runs first' if backward else 'redo earlier runs first'}")
+            ops = [(offset, _bytes(removed), _bytes(inserted)) for offset, removed, inserted in entry['ops']]
+            data = _splice(data or b'', ops, backward) if (result is not None) else None
+            if (content_hash(data) if data is not None else None) != result:
+                raise JournalError(f"{entry['path']}: replaying run {run_name} does not reproduce "
+                                   f"{result[:12] if result else 'the deletion'}; the journal is damaged")
+            current[path] = data
+    return current
+
+
+def _write(current):
+    for path, data in current.items():
+        if data is None:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        with open(path, 'wb') as f:
+            f.write(data)
+
+
+def undo(names):
+    """Revert the given applied runs; returns the paths restored."""
+    runs = load_runs()
+    chosen = [(name, runs[name]) for name in reversed(list(runs)) if name in names]
+    for name, run in chosen:
+        if run['undone']:
+            raise JournalError(f"run {name} is already undone")
+    current = _replay(chosen, backward=True)
+    _write(current)
+    for name, _ in chosen:
+        _append({'undo': name, 'time': time.time()})
+    return sorted(current)
+
+
+def redo(names):
+    """Re-apply the given undone runs; returns the paths rewritten."""
+    runs = load_runs()
+    chosen = [(name, runs[name]) for name in runs if name in names]
+    for name, run in chosen:
+        if not run['undone']:
+            raise JournalError(f"run {name} is not undone")
+    current = _replay(chosen, backward=False)
+    _write(current)
+    for name, _ in chosen:
+        _append({'redo': name, 'time': time.time()})
+    return sorted(current)
+
+
+def select(runs, specs, undone):
+    """Run names for specs: ids, id prefixes or FIRST..LAST ranges; none means the latest one.
+
+    Only runs whose state matches undone are eligible.
+    """
+    names = [name for name, run in runs.items() if run['undone'] == undone]
+    if not specs:
+        return names[-1:]
+    chosen = []
+
+    def find(spec):
+        hits = [name for name in runs if name.startswith(spec)]
+        if len(hits) != 1:
+            raise JournalError(f"{spec!r} matches {len(hits)} runs")
+        return hits[0]
+
+    order = list(runs)
+    for spec in specs:
+        if '..' in spec:
+            first, last = spec.split('..', 1)
+            lo = order.index(find(first)) if first else 0
+            hi = order.index(find(last)) if last else len(order) - 1
+            chosen += [name for name in order[lo:hi + 1] if name in names]
+        else:
+            chosen.append(find(spec))
+    return chosen
@@ -0,0 +1,310 @@
+"""
+JSX element index for TSX sources.
+
+build_index() walks a file once and records every JSX element with its tag,
+attributes, class list, parent and exact character span. The index is what
+selector queries (tsxtools.selector) and later structural tools run against;
+load_index() caches it per file content hash so repeated queries on the same
+file never rescan it.
+
+Like the lexer this is a scanner rather than a TypeScript parser: a `<` opens
+JSX when it starts a tag name or fragment and follows an operator, bracket or
+`return`, which separates it from comparisons and generic arguments.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import re
+
+from tsxtools import cache
+from tsxtools.lexer import LOOKBEHIND, opens_jsx
+
+INDEX_VERSION = 2
+
+_TAG_NAME = re.compile(r'[A-Za-z_$][\w$.:-]*')
+_ATTR_NAME = re.compile(r'[A-Za-z_$][\w$:.-]*')
+_JS = re.compile(r"//|/\*|['\"`{}<]")
+_WS = re.compile(r'\s*')
+_STRING_PARTS = re.compile(r"'([^'\n]*)'|\"([^\"\n]*)\"|`([^`]*)`")
+_TEMPLATE_EXPR = re.compile(r'\$\{[^}]*\}')
+
+
+@dataclass
+class Element:
+    index: int
+    tag: str                                     # '' for fragments
+    start: int                                   # offset of '<'
+    open_end: int = -1                           # offset just past the opening tag
+    end: int = -1                                # offset just past the element
+    parent: int = None
+    children: list = field(default_factory=list)
+    attrs: dict = field(default_factory=dict)    # name -> string contents, '{expr}' source, or ''
+    classes: tuple = ()
+    closed: bool = True                          # False if the closing tag was never found
+    line: int = 0
+    col: int = 0
+    end_line: int = 0
+
+    @property
+    def span(self):
+        return self.start, self.end
+
+    @property
+    def id(self):
+        return self.attrs.get('id')
+
+
+def _class_words(value):
+    if not value.startswith('{'):
+        return tuple(value.split())
+    words = []
+    for m in _STRING_PARTS.finditer(value):
+        part = next(g for g in m.groups() if g is not None)
+        words.extend(_TEMPLATE_EXPR.sub(' ', part).split())
+    return tuple(words)
+
+
+class _Parser:
+
+    def __init__(self, text):
+        self.text = text
+        self.elements = []
+        self.stack = []
+
+    def parse(self):
+        self._js(0, until_brace=False)
+        return self.elements
+
+    # -- JavaScript ------------------------------------------------------
+
+    def _skip_string(self, pos):
+        quote = self.text[pos]
+        text = self.text
+        i = pos + 1
+        while i < len(text):
+            c = text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote or c == '\n':
+                return i + 1
+            i += 1
+        return len(text)
+
+    def _skip_template(self, pos):
+        text = self.text
+        i = pos + 1
+        while i < len(text):
+            c = text[i]
+            if c == '\\':
+                i += 2
+            elif c == '`':
+                return i + 1
+            elif c == '$' and text.startswith('${', i):
+                i = self._js(i + 2, until_brace=True) + 1
+            else:
+                i += 1
+        return len(text)
+
+    def _jsx_start(self, pos):
+        text = self.text
+        nxt = text[pos + 1:pos + 2]
+        if not (nxt == '>' or nxt.isalpha() or nxt in '_$'):
+            return False
+        return opens_jsx(text[max(0, pos - LOOKBEHIND):pos])
+
+    def _js(self, pos, until_brace):
+        """Scan code from pos; return the offset of the unmatched `}` (or EOF)."""
+        text = self.text
+        depth = 0
+        while True:
+            m = _JS.search(text, pos)
+            if m is None:
+                return len(text)
+            tok = m.group()
+            p = m.start()
+            if tok == '{':
+                depth += 1
+                pos = p + 1
+            elif tok == '}':
+                if depth == 0 and until_brace:
+                    return p
+                depth = max(0, depth - 1)
+                pos = p + 1
+            elif tok == "'" or tok == '"':
+                pos = self._skip_string(p)
+            elif tok == '`':
+                pos = self._skip_template(p)
+            elif tok == '//':
+                nl = text.find('\n', p)
+                pos = len(text) if nl == -1 else nl + 1
+            elif tok == '/*':
+                close = text.find('*/', p + 2)
+                pos = len(text) if close == -1 else close + 2
+            elif self._jsx_start(p):
+                pos = self._element(p)
+            else:
+                pos = p + 1
+
+    # -- JSX -------------------------------------------------------------
+
+    def _element(self, pos):
+        text = self.text
+        m = _TAG_NAME.match(text, pos + 1)
+        tag = m.group() if m else ''
+        el = Element(len(self.elements), tag, pos, parent=self.stack[-1] if self.stack else None)
+        self.elements.append(el)
+        self.stack.append(el.index)
+        try:
+            i = self._attributes(el, m.end() if m else pos + 1)
+            if el.end != -1:
+                return el.end
+            return self._children(el, i)
+        finally:
+            self.stack.pop()
+
+    def _attributes(self, el, i):
+        text = self.text
+        n = len(text)
+        while i < n:
+            i = _WS.match(text, i).end()
+            if i >= n:
+                break
+            c = text[i]
+            if text.startswith('/>', i):
+                el.open_end = el.end = i + 2
+                return el.end
+            if c == '>':
+                el.open_end = i + 1
+                return i + 1
+            if c == '{':
+                # {...spread} or {/* comment */}
+                i = self._js(i + 1, until_brace=True) + 1
+                continue
+            m = _ATTR_NAME.match(text, i)
+            if m is None:
+                i += 1
+                continue
+            name = m.group()
+            i = _WS.match(text, m.end()).end()
+            value = ''
+            if text.startswith('=', i):
+                i = _WS.match(text, i + 1).end()
+                q = text[i:i + 1]
+                if q in ('"', "'"):
+                    close = text.find(q, i + 1)
+                    close = n if close == -1 else close
+                    value = text[i + 1:close]
+                    i = close + 1
+                elif q == '{':
+                    close = self._js(i + 1, until_brace=True)
+                    value = text[i:close + 1]
+                    i = close + 1
+                elif q == '<':
+                    start = i
+                    i = self._element(i)
+                    value = text[start:i]
+            el.attrs[name] = value
+        el.open_end = el.end = n
+        el.closed = False
+        return n
+
+    def _children(self, el, i):
+        text = self.text
+        n = len(text)
+        while i < n:
+            lt = text.find('<', i)
+            br = text.find('{', i, lt if lt != -1 else n)
+            if br != -1:
+                i = self._js(br + 1, until_brace=True) + 1
+                continue
+            if lt == -1:
+                break
+            if text.startswith('</', lt):
+                m = _TAG_NAME.match(text, lt + 2)
+                name = m.group() if m else ''
+                gt = text.find('>', lt)
+                gt = n - 1 if gt == -1 else gt
+                if name == el.tag:
+                    el.end = gt + 1
+                    return el.end
+                if any(self.elements[a].tag == name for a in self.stack[:-1]):
+                    # Closes an ancestor: this element was never closed.
+                    el.end = lt
+                    el.closed = False
+                    return lt
+                i = gt + 1        # stray closer, skip it
+                continue
+            i = self._element(lt)
+        el.end = n
+        el.closed = False
+        return n
+
+
+class JsxIndex:
+    """Elements of one file plus lookup tables for selector queries."""
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.by_tag = {}
+        self.by_class = {}
+        self.by_id = {}
+        for el in elements:
+            self.by_tag.setdefault(el.tag, []).append(el.index)
+            for name in el.classes:
+                self.by_class.setdefault(name, []).append(el.index)
+            if el.id is not None:
+                self.by_id.setdefault(el.id, []).append(el.index)
+        self._queries = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_queries'] = {}
+        return state
+
+    def __len__(self):
+        return len(self.elements)
+
+    def roots(self):
+        return [el for el in self.elements if el.parent is None]
+
+    def query(self, selector):
+        """Elements matching a CSS-like selector, in document order."""
+        hit = self._queries.get(selector)
+        if hit is None:
+            from tsxtools.selector import select
+            hit = self._queries[selector] = select(self, selector)
+        return list(hit)
+
+    def enclosing(self, offset):
+        """Innermost element whose span contains offset, or None."""
+        best = None
+        for el in self.elements:
+            if el.start <= offset < el.end and (best is None or el.start >= best.start):
+                best = el
+        return best
+
+
+def build_index(text):
+    elements = _Parser(text).parse()
+    newlines = [m.start() for m in re.finditer('\n', text)]
+    for el in elements:
+        if el.parent is not None:
+            elements[el.parent].children.append(el.index)
+        line = bisect_right(newlines, el.start - 1)
+        el.line = line + 1
+        el.col = el.start - (newlines[line - 1] + 1 if line else 0) + 1
+        el.end_line = bisect_right(newlines, max(el.start, el.end - 1) - 1) + 1
+        cls = el.attrs.get('className', el.attrs.get('class'))
+        if cls:
+            el.classes = _class_words(cls)
+    return JsxIndex(elements)
+
+
+def load_index(path):
+    """JsxIndex for path, from the content-hash cache when possible."""
+    return cache.cached('jsx', INDEX_VERSION, path, build_index)
+
+
+def query(path, selector):
+    return load_index(path).query(selector)
@@ -0,0 +1,299 @@
+"""
+Resumable bracket lexer for TS/TSX/JS sources.
+
+The lexer is fed text in arbitrary chunks (so a multi-megabyte minified bundle
+never has to be decoded or held as one line) and reports every bracket that
+sits in code: braces, parens and square brackets outside strings, template
+text, regex literals and comments. Positions are absolute character offsets
+plus 1-based line:column.
+
+It is a scanner, not a parser. Two heuristics keep JSX text from derailing it:
+a quote directly after a word character is an apostrophe ("don't"), and a
+`//` directly after `:` is a URL, not a comment. Plain strings and regex
+literals never span a newline, so anything misread as one is confined to its
+own line. A `/` starts a regex literal when the code before it ends in an
+operator, an opening bracket or a keyword such as `return`.
+
+With jsx=True the lexer also reports JSX tag tokens (`<name`, `<>`,
+`</name>`, `</>`, `/>` and `>`). A consumer that tracks JSX structure sets
+`jsx_text` while it is inside element children, where quotes, comments and
+round/square brackets are just text and only `{`, `}` and tags matter.
+
+With statements=True it also reports `;` and newlines that sit in code, which
+is what statement-level tools need to find where a declaration ends.
+"""
+
+import codecs
+import re
+
+CHUNK_SIZE = 1 << 16
+
+# Lexer modes.
+CODE = 0
+SQ = 1
+DQ = 2
+TPL = 3
+LINE_COMMENT = 4
+BLOCK_COMMENT = 5
+REGEX = 6
+REGEX_CLASS = 7
+
+MODE_NAMES = ('code', 'single-quote', 'double-quote', 'template', 'line-comment', 'block-comment',
+              'regex', 'regex-class')
+
+BRACKETS = '{}()[]'
+
+_CODE_TOKENS = r"//|/\*|\*/|\$\{|\\.|"
+_JSX_TAG_TOKENS = r"</[A-Za-z_$][\w.:-]*[ \t]*>|</>|<[A-Za-z_$][\w.:-]*|<>|/>|"
+# (jsx, statements) -> token pattern
+_TOKENS = {
+    (False, False): re.compile(_CODE_TOKENS + r"[{}()\[\]'\"`\n/]", re.S),
+    (False, True): re.compile(_CODE_TOKENS + r"[{}()\[\]'\"`\n/;]", re.S),
+    (True, False): re.compile(_CODE_TOKENS + _JSX_TAG_TOKENS + r"[{}()\[\]'\"`\n/>]", re.S),
+    (True, True): re.compile(_CODE_TOKENS + _JSX_TAG_TOKENS + r"[{}()\[\]'\"`\n/>;]", re.S),
+}
+_WORD = re.compile(r'\w')
+# The end of a chunk that may still grow into a JSX tag token.
+_PARTIAL_TAG = re.compile(r'<(?:/?[A-Za-z_$][\w.:-]*|/[A-Za-z_$][\w.:-]*[ \t]+|/)?\Z')
+
+# Decisions that depend on the code before a token look at most this far back.
+LOOKBEHIND = 64
+
+# A `<` opens JSX (rather than comparing or starting type arguments) when the
+# code before it ends in one of these, or in a keyword that takes an expression.
+_JSX_AFTER = set('(,=?:{}[>&|;!+')
+_JSX_KEYWORD_TAIL = re.compile(r'(?<![\w$])(?:return|yield|default|case|in|of)$')
+
+# Likewise for a `/` starting a regex literal rather than dividing. `}`, `)`,
+# `]`, `<` and `>` are left out on purpose: after them a `/` is division or
+# part of a JSX tag (`<br />`, `</p>`) far more often than a regex.
+_REGEX_AFTER = set('(,=:[!&|?{;+-*%~^')
+_REGEX_KEYWORD_TAIL = re.compile(
+    r'(?<![\w$])(?:return|typeof|instanceof|in|of|new|delete|void|throw|case|do|else|yield|await)$')
+
+
+_COMMENTS = re.compile(r'/\*.*?\*/|(?<!:)//[^\n]*', re.S)
+
+
+def _code_before(before):
+    if '/' in before:
+        before = _COMMENTS.sub(' ', before)
+    return before.rstrip()
+
+
+def opens_jsx(before):
+    """True if a `<name` preceded by `before` is a JSX tag."""
+    before = _code_before(before)
+    if not before or before[-1] in _JSX_AFTER:
+        return True
+    return _JSX_KEYWORD_TAIL.search(before) is not None
+
+
+# A whole regex literal from its opening slash, flags included, for scanners
+# that have already decided (with opens_regex) that a `/` starts one.
+REGEX_LITERAL = re.compile(r'/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[A-Za-z]*')
+
+
+def opens_regex(before):
+    """True if a `/` preceded by `before` starts a regex literal."""
+    before = _code_before(before)
+    if not before or before[-1] in _REGEX_AFTER:
+        return True
+    return _REGEX_KEYWORD_TAIL.search(before) is not None
+
+
+class Lexer:
+    """Incremental bracket lexer.
+
+    Call feed() with successive chunks, then close(); both yield
+    (offset, line, col, token) for each bracket (and, with jsx=True, each
+    JSX tag token) found in code. The lexer's mode, depth and tpl_stack are
+    current as of each yielded token.
+
+    A lexer can be resumed mid-file by passing the state it would have had at
+    `offset`; `prev` is the text just before it (LOOKBEHIND chars suffice).
+    """
+
+    def __init__(self, offset=0, line=1, line_start=0, mode=CODE, depth=0, tpl_stack=(), prev='',
+                 jsx=False, statements=False):
+        self.mode = mode
+        self.depth = depth           # brace depth, including ${ } interpolations
+        self.tpl_stack = list(tpl_stack)  # brace depth at which each open ${ started
+        self.offset = offset         # absolute offset of the next unprocessed char
+        self.line = line
+        self.line_start = line_start  # absolute offset of the current line's first char
+        self._pending = ''
+        self.jsx = jsx
+        self.statements = statements
+        self.jsx_text = False      # set by the consumer while inside JSX children
+        self.jsx_likely = False    # for the last `<name` yielded: does context say JSX?
+        self._tail = prev[-LOOKBEHIND:]  # last LOOKBEHIND chars processed
+        self.opened_at = None        # (offset, line, col) of the open template or block comment
+        self._tpl_opened = []        # opened_at of the template around each open ${
+
+    @property
+    def col(self):
+        return self.offset - self.line_start + 1
+
+    def feed(self, text):
+        return self._run(self._pending + text, final=False)
+
+    def close(self):
+        return self._run(self._pending, final=True)
+
+    def _before(self, text, pos):
+        """Up to LOOKBEHIND chars of code before text[pos], across chunks."""
+        before = text[max(0, pos - LOOKBEHIND):pos]
+        if pos < LOOKBEHIND:
+            before = (self._tail + before)[-LOOKBEHIND:]
+        return before
+
+    def _run(self, text, final):
+        base = self.offset
+        mode = self.mode
+        prev = self._tail[-1:]
+        last_end = 0
+        hold = None
+        partial = None
+        if self.jsx and not final:
+            m = _PARTIAL_TAG.search(text, max(0, len(text) - 256))
+            partial = m.start() if m else None
+        tokens = _TOKENS[bool(self.jsx), bool(self.statements)]
+        for m in tokens.finditer(text):
+            tok = m.group()
+            pos = m.start()
+            if partial is not None and m.end() > partial:
+                if pos >= partial:
+                    hold = partial    # the tag may continue in the next chunk
+                    break
+                partial = None        # the `<` was escaped
+            if not final and tok == '/' and m.end() == len(text):
+                hold = pos            # may yet become `//`, `/*` or `/>`
+                break
+            last_end = m.end()
+            if tok == '\n':
+                if mode in (SQ, DQ, LINE_COMMENT, REGEX, REGEX_CLASS):
+                    mode = CODE
+                if self.statements and mode == CODE:
+                    self.mode = mode
+                    yield base + pos, self.line, base + pos - self.line_start + 1, tok
+                self.line += 1
+                self.line_start = base + pos + 1
+                continue
+            if tok == '\\\n':
+                # Line continuation inside a string or template.
+                self.line += 1
+                self.line_start = base + pos + 2
+                continue
+
+            if mode == CODE:
+                if self.jsx_text and tok not in ('{', '}', '${') and tok[0] != '<':
+                    continue      # JSX text: only containers and tags matter
+                if tok == ';':
+                    self.mode = mode
+                    yield base + pos, self.line, base + pos - self.line_start + 1, tok
+                elif tok in BRACKETS:
+                    if tok == '{':
+                        self.depth += 1
+                    elif tok == '}':
+                        if self.tpl_stack and self.depth == self.tpl_stack[-1]:
+                            self.tpl_stack.pop()
+                            self.opened_at = self._tpl_opened.pop() if self._tpl_opened else None
+                            mode = TPL
+                        self.depth -= 1
+                    self.mode = mode
+                    yield base + pos, self.line, base + pos - self.line_start + 1, tok
+                elif tok == "'" or tok == '"':
+                    before = text[pos - 1] if pos else prev
+                    if not (before and _WORD.match(before)):
+                        mode = SQ if tok == "'" else DQ
+                elif tok == '`':
+                    mode = TPL
+                    self.opened_at = (base + pos, self.line, base + pos - self.line_start + 1)
+                elif tok == '//':
+                    before = text[pos - 1] if pos else prev
+                    if before != ':':
+                        mode = LINE_COMMENT
+                elif tok == '/*':
+                    mode = BLOCK_COMMENT
+                    self.opened_at = (base + pos, self.line, base + pos - self.line_start + 1)
+                elif tok == '/':
+                    if opens_regex(self._before(text, pos)):
+                        mode = REGEX
+                elif tok == '${':
+                    # Only meaningful inside a template, but `$` followed by a
+                    # brace in code still opens a brace.
+                    self.depth += 1
+                    self.mode = mode
+                    yield base + pos + 1, self.line, base + pos + 1 - self.line_start + 1, '{'
+                elif tok[0] == '<' or tok == '>' or tok == '/>':
+                    if tok[0] == '<' and tok[1:2] != '/':
+                        self.jsx_likely = opens_jsx(self._before(text, pos))
+                    self.mode = mode
+                    yield base + pos, self.line, base + pos - self.line_start + 1, tok
+            elif mode == SQ:
+                if tok == "'":
+                    mode = CODE
+            elif mode == DQ:
+                if tok == '"':
+                    mode = CODE
+            elif mode == TPL:
+                if tok == '`':
+                    mode = CODE
+                elif tok == '${':
+                    self.depth += 1
+                    self.tpl_stack.append(self.depth)
+                    self._tpl_opened.append(self.opened_at)
+                    mode = CODE
+                    self.mode = mode
+                    yield base + pos + 1, self.line, base + pos + 1 - self.line_start + 1, '{'
+            elif mode == BLOCK_COMMENT:
+                if tok == '*/':
+                    mode = CODE
+            elif mode == REGEX:
+                if tok == '[':
+                    mode = REGEX_CLASS
+                elif tok[0] != '\\' and '/' in tok:
+                    mode = CODE   # the closing slash, possibly lexed as `*/` or `//`
+            elif mode == REGEX_CLASS:
+                if tok == ']':
+                    mode = REGEX
+
+        # A trailing char that no token covered may start a two-char token
+        # once the next chunk arrives; hold it back so chunking never changes
+        # how the text is tokenized.
+        if hold is None:
+            hold = partial
+        end = len(text) if hold is None else hold
+        if not final and hold is None:
+            if last_end < end and text[-1] in '*$\\':
+                end -= 1
+        self._pending = text[end:]
+        if end:
+            self._tail = (self._tail + text[max(0, end - LOOKBEHIND):end])[-LOOKBEHIND:]
+        self.offset = base + end
+        self.mode = mode
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE, encoding='utf-8', errors='ignore'):
+    """Yield decoded text from path in chunks of at most chunk_size bytes."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_brackets(path, chunk_size=CHUNK_SIZE):
+    """All code brackets in a file as (offset, line, col, char)."""
+    lexer = Lexer()
+    for chunk in iter_chunks(path, chunk_size):
+        yield from lexer.feed(chunk)
+    yield from lexer.close()
@@ -0,0 +1,491 @@
+"""
+Large inline literals in TSX sources, and whether they can leave the file.
+
+find_literals() lists two kinds of candidate above a size threshold:
+
+  data   a `const` array or object literal, at module level or directly in
+         a component body, initialised from plain data: strings (template
+         literals without `${}`), numbers, true/false/null, nested arrays
+         and objects, comments and trailing commas. parse_literal() turns it
+         into the Python value json.dumps() writes out; anything else (an
+         identifier, a call, a spread, JSX) makes it `fixed`, with the
+         reason and where it was found.
+  jsx    a JSX element whose whole subtree is static: intrinsic (lowercase)
+         tags, quoted attribute values and text, with no `{...}` beyond a
+         plain string literal. Only the outermost such element is listed.
+
+Sizes are in source bytes; `minified` collapses runs of whitespace, roughly
+what survives esbuild for text-heavy literals.
+"""
+
+from dataclasses import dataclass
+import itertools
+import json
+import os
+import re
+
+from tsxtools.braces import build_brace_index
+from tsxtools.declarations import build_declarations
+from tsxtools.jsx import build_index
+
+THRESHOLD = 2000
+
+_SPACE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.S)
+_NUMBER = re.compile(r'-?(?:0[xX][0-9a-fA-F_]+|(?:\d[\d_]*)?\.?\d[\d_]*(?:[eE][+-]?\d+)?)(?![\w$])')
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_WORDS = {'true': True, 'false': False, 'null': None}
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_STRING_EXPR = re.compile(r'''\{\s*(?:'[^'\n]*'|"[^"\n]*")\s*\}''')
+_COMMENT_EXPR = re.compile(r'\{\s*/\*.*?\*/\s*\}', re.S)
+_INITIALISER = re.compile(r'\s*(?::\s*(?P<type>[^=]+?))?\s*=\s*(?=[\[{])', re.S)
+
+
+class NotData(Exception):
+    def __init__(self, reason, offset):
+        super().__init__(reason)
+        self.offset = offset
+
+
+@dataclass
+class Literal:
+    kind: str                   # 'data' or 'jsx'
+    name: str                   # bound name, or a label for JSX
+    component: str              # enclosing component, None at module level
+    start: int                  # offset of the literal ([, { or <)
+    end: int                    # offset just past it
+    line: int
+    end_line: int
+    size: int
+    minified: int
+    type: str = None            # declared type of a data literal, if any
+    decl_start: int = None      # span of the whole declaration, for data
+    decl_end: int = None
+    value: object = None        # parsed value of a data literal
+    fixed: str = ''             # why it cannot be moved, or ''
+
+
+def _space(text, i):
+    return _SPACE.match(text, i).end()
+
+
+def _string(text, i):
+    quote = text[i]
+    out = []
+    i += 1
+    while i < len(text):
+        c = text[i]
+        if c == quote:
+            return ''.join(out), i + 1
+        if c == '\\':
+            nxt = text[i + 1:i + 2]
+            if nxt == 'u':
+                if text[i + 2:i + 3] == '{':
+                    close = text.index('}', i)
+                    out.append(chr(int(text[i + 3:close], 16)))
+                    i = close + 1
+                else:
+                    out.append(chr(int(text[i + 2:i + 6], 16)))
+                    i += 6
+                continue
+            if nxt == 'x':
+                out.append(chr(int(text[i + 2:i + 4], 16)))
+                i += 4
+                continue
+            if nxt == '\r' and text[i + 2:i + 3] == '\n':
+                i += 3                  # line continuation
+                continue
+            if nxt == '\n':
+                i += 2
+                continue
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+            continue
+        if quote == '`' and text.startswith('${', i):
+            raise NotData('template literal with ${...}', i)
+        if c == '\n' and quote != '`':
+            raise NotData('unterminated string', i)
+        out.append(c)
+        i += 1
+    raise NotData('unterminated string', i)
+
+
+def _value(text, i):
+    i = _space(text, i)
+    c = text[i:i + 1]
+    if c == '[':
+        items = []
+        i = _space(text, i + 1)
+        while text[i:i + 1] != ']':
+            item, i = _value(text, i)
+            items.append(item)
+            i = _space(text, i)
+            if text[i:i + 1] == ',':
+                i = _space(text, i + 1)
+            elif text[i:i + 1] != ']':
+                raise NotData(f"unexpected {text[i:i + 20]!r} in array", i)
+        return items, i + 1
+    if c == '{':
+        obj = {}
+        i = _space(text, i + 1)
+        while text[i:i + 1] != '}':
+            if text[i:i + 1] in ('"', "'"):
+                key, i = _string(text, i)
+            else:
+                m = _IDENT.match(text, i) or _NUMBER.match(text, i)
+                if m is None:
+                    raise NotData(f"unexpected {text[i:i + 20]!r} as object key", i)
+                key, i = m.group(), m.end()
+            i = _space(text, i)
+            if text[i:i + 1] != ':':
+                raise NotData(f"shorthand or method {key!r} refers to code", i)
+            obj[key], i = _value(text, i + 1)
+            i = _space(text, i)
+            if text[i:i + 1] == ',':
+                i = _space(text, i + 1)
+            elif text[i:i + 1] != '}':
+                raise NotData(f"unexpected {text[i:i + 20]!r} in object", i)
+        return obj, i + 1
+    if c in ('"', "'", '`'):
+        return _string(text, i)
+    m = _NUMBER.match(text, i)
+    if m:
+        raw = m.group().replace('_', '')
+        if raw.lstrip('-')[:2] in ('0x', '0X'):
+            return int(raw, 16), m.end()
+        number = float(raw)
+        return (int(number) if number.is_integer() and not re.search(r'[.eE]', raw) else number), m.end()
+    m = _IDENT.match(text, i)
+    if m and m.group() in _WORDS:
+        return _WORDS[m.group()], m.end()
+    if c == '(' or c == '<':
+        raise NotData('JSX or an expression', i)
+    raise NotData(f"reference to {m.group() if m else text[i:i + 20]!r}", i)
+
+
+def parse_literal(text, start):
+    """(value, end) for the data literal at start; raises NotData if it is not plain data."""
+    return _value(text, start)
+
+
+def _minified(text):
+    return len(re.sub(r'\s+', ' ', text).encode('utf-8'))
+
+
+def _is_static(text, el, index):
+    if not el.tag[:1].islower() or not el.closed:
+        return False
+    if any(value.startswith('{') or value.startswith('<') for value in el.attrs.values()):
+        return False
+    # The opening tag must hold no spread or comment container either.
+    header = text[el.start:el.open_end]
+    if '{' in header:
+        return False
+    at = el.open_end
+    for child in el.children:
+        child_el = index.elements[child]
+        if not _is_static(text, child_el, index):
+            return False
+        gap = text[at:child_el.start]
+        if '{' in _COMMENT_EXPR.sub('', _STRING_EXPR.sub('', gap)):
+            return False
+        at = child_el.end
+    gap = text[at:el.end]
+    return '{' not in _COMMENT_EXPR.sub('', _STRING_EXPR.sub('', gap))
+
+
+def _label(el, component, count):
+    words = [w for w in re.split(r'[^A-Za-z0-9]+', el.attrs.get('id', '')) if w]
+    base = ''.join(w.capitalize() for w in words) or el.tag.capitalize()
+    return f"{component or 'Module'}{base}{count}"
+
+
+def find_literals(text, threshold=THRESHOLD):
+    """[Literal] of at least threshold bytes in text, in source order."""
+    decls = build_declarations(text)
+    braces = build_brace_index(text)
+    index = build_index(text)
+    components = {d.index: d.name for d in decls
+                  if d.parent is None and d.body is not None and d.names and d.names[0][:1].isupper()}
+    found = []
+
+    for decl in decls:
+        if decl.kind != 'const' or len(decl.names) != 1:
+            continue
+        if decl.parent is not None and decl.parent not in components:
+            continue
+        m = re.compile(rf'const\s+{re.escape(decl.names[0])}').search(text, decl.start, decl.end)
+        init = _INITIALISER.match(text, m.end()) if m else None
+        if init is None:
+            continue
+        start = init.end()
+        close = braces.match(start)
+        if close is None or close + 1 - start < threshold:
+            continue
+        # Only a bare literal: `const x = [...]`, optionally with `;` or `as const`.
+        rest = text[close + 1:decl.end].strip().rstrip(';').strip()
+        if rest not in ('', 'as const'):
+            continue
+        literal = Literal('data', decl.names[0], components.get(decl.parent), start, close + 1,
+                          braces.line_of(start), braces.line_of(close), close + 1 - start,
+                          _minified(text[start:close + 1]),
+                          type=(init.group('type') or '').strip() or None,
+                          decl_start=decl.start, decl_end=decl.end)
+        try:
+            literal.value, _end = parse_literal(text, start)
+        except NotData as reason:
+            literal.fixed = f"{reason} at line {braces.line_of(reason.offset)}"
+        found.append(literal)
+
+    counts = {}
+    for el in index.elements:
+        if el.end - el.start < threshold or not _is_static(text, el, index):
+            continue
+        parent = index.elements[el.parent] if el.parent is not None else None
+        if parent is not None and parent.end - parent.start >= threshold and _is_static(text, parent, index):
+            continue
+        top = decls.at(el.start)
+        while top is not None and top.parent is not None:
+            top = decls.declarations[top.parent]
+        owner = top.name if top is not None and top.name[:1].isupper() else None
+        counts[owner] = counts.get(owner, 0) + 1
+        found.append(Literal('jsx', _label(el, owner, counts[owner]), owner, el.start, el.end, el.line,
+                             el.end_line, el.end - el.start, _minified(text[el.start:el.end])))
+
+    found.sort(key=lambda lit: lit.start)
+    return found
+
+
+# --- extraction ------------------------------------------------------------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'data', 'extracted')
+HOOK = os.path.join(ROOT, 'hooks', 'useLazyData')
+MODULE_DIR = 'extracted'        # next to the file the markup came from
+
+_IMPORT = re.compile(r'^\ufeff?import\b[^;]*?;[ \t]*\r?\n', re.M | re.S)
+_REACT_IMPORT = re.compile(r'''^\ufeff?import\s+(?P<what>[^;]*?)\s+from\s+['"]react['"];?''', re.M)
+_SEEDS = re.compile(r'\b(?:useState|useReducer|useRef)\s*(?:<[^>]*>)?\s*$')
+_MEMO = re.compile(r'\b(?:useMemo|useCallback|useEffect|useLayoutEffect)\s*(?:<[^>]*>)?\s*$')
+
+
+@dataclass
+class Extraction:
+    """What moving the literals of one file out of it takes."""
+    moved: list                 # [Literal] that leave the file
+    kept: list                  # [Literal] that stay, each with .fixed saying why
+    modules: dict               # {path: text} of the JSON and TSX modules to write
+    edits: list                 # [(start, end, text)] in the source, not overlapping
+    saved: int                  # minified bytes leaving the file's chunk
+    hook: bool = False          # whether the source now uses useLazyData
+
+
+def import_spec(path, target):
+    """Import specifier for target (without extension) from the file at path."""
+    rel = os.path.relpath(target, os.path.dirname(os.path.abspath(path))).replace(os.sep, '/')
+    return rel if rel.startswith('.') else './' + rel
+
+
+def indent_at(text, offset):
+    line_start = text.rfind('\n', 0, offset) + 1
+    return re.match(r'[ \t]*', text[line_start:]).group()
+
+
+def imports_end(text):
+    """Offset just past the last top-of-file import statement (0 if none)."""
+    imports = list(_IMPORT.finditer(text))
+    return imports[-1].end() if imports else 0
+
+
+def react_lazy(text):
+    """(prefix, import line or None, edit or None) making lazy and Suspense usable in text.
+
+    prefix is 'React.' where React is (or will be, by the import line) the
+    default import, or '' when the edit adds them to the named imports.
+    """
+    react = _REACT_IMPORT.search(text)
+    if react is None:
+        return 'React.', "import React from 'react';", None
+    if re.match(r'(?:\*\s*as\s+)?React\b', react.group('what')):
+        return 'React.', None, None
+    names = re.search(r'\{([^}]*)\}', react.group('what'))
+    have = [n.strip() for n in names.group(1).split(',') if n.strip()] if names else []
+    wanted = have + [n for n in ('lazy', 'Suspense') if n not in have]
+    return '', None, (react.start('what'), react.end('what'), '{ ' + ', '.join(wanted) + ' }')
+
+
+def reindent(block, old, new):
+    """block (its first line already unindented) moved from indent old to indent new."""
+    lines = block.split('\n')
+    return '\n'.join([new + lines[0]] + [new + line[len(old):] if line.startswith(old) else line
+                                         for line in lines[1:]])
+
+
+def _reads_of(text, name, skip):
+    """Offsets where name is read outside the span skip."""
+    return [m.start() for m in re.finditer(rf'(?<![\w$.]){re.escape(name)}(?![\w$])(?!\s*:(?!:))', text)
+            if not skip[0] <= m.start() < skip[1]]
+
+
+def _unsafe(text, braces, at, name):
+    """Why the read of name at offset at breaks while name is still empty, or ''.
+
+    That is when it is indexed (`name[i].x`, `name.find(...).x`) without
+    optional chaining, seeds useState/useReducer/useRef, or sits in a memo or
+    effect whose dependency list does not name it.
+    """
+    after = _space(text, at + len(name))
+    lookup = after if text[after:after + 1] == '[' else None
+    if text.startswith('.find(', after):
+        lookup = after + len('.find')
+    if lookup is not None:
+        close = braces.match(lookup)
+        if close is not None and re.match(r'\s*!?\.(?!\.)', text[close + 1:close + 4]):
+            return 'looked up without ?.'
+    opener = braces.enclosing(at)
+    while opener != -1:
+        if text[opener] == '(':
+            before = text[max(0, opener - 80):opener]
+            if _SEEDS.search(before):
+                return 'seeds state'
+            if _MEMO.search(before):
+                close = braces.match(opener)
+                if close is not None and not re.search(
+                        rf'\[[^\[\]]*(?<![\w$.]){re.escape(name)}(?![\w$])[^\[\]]*\]\s*,?\s*$', text[opener:close]):
+                    return 'read in a hook whose dependencies omit it'
+        opener = braces.parents.get(opener, -1)
+    return ''
+
+
+def plan_extraction(path, text, threshold=THRESHOLD, objects=False):
+    """Extraction moving the movable literals of path (with contents text) into lazy modules.
+
+    Data literals become JSON under data/extracted/, read with the
+    useLazyData hook at the top of every component using them; static JSX
+    becomes a component under extracted/ next to path, rendered through
+    React.lazy and <Suspense fallback={null}>. Objects only move with
+    objects=True: until the JSON arrives they are {}, which an unguarded
+    `table[key].field` does not survive.
+    """
+    decls = build_declarations(text)
+    braces = build_brace_index(text)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    components = {d.index: d for d in decls
+                  if d.parent is None and d.body is not None and d.names and d.names[0][:1].isupper()}
+    literals = find_literals(text, threshold)
+    plan = Extraction([], [], {}, [], 0)
+    head = []
+    calls = []                  # (component body, literal start, hook call) for module-level data
+    taken = []
+
+    def outside_taken(lit):
+        return not any(s <= lit.start < e for s, e in taken)
+
+    for lit in sorted(literals, key=lambda lit: lit.size, reverse=True):
+        if not outside_taken(lit):
+            continue                    # inside something larger that already moves
+        if lit.fixed:
+            plan.kept.append(lit)
+            continue
+        if lit.kind == 'jsx':
+            block = text[lit.start:lit.end]
+            if '<pre' in block or '<textarea' in block:
+                lit.fixed = 'whitespace-sensitive markup'
+                plan.kept.append(lit)
+                continue
+            module = os.path.join(os.path.dirname(os.path.abspath(path)), MODULE_DIR, f"{stem}.{lit.name}.tsx")
+            plan.modules[module] = (
+                f"// Static markup moved out of {stem}.tsx by apply_extract_literals.py.\n"
+                f"const {lit.name} = () => (\n"
+                f"{reindent(block, indent_at(text, lit.start), '    ')}\n"
+                f");\n\nexport default {lit.name};\n")
+            head.append((lit.start, 'lazy', f"const {lit.name} = @lazy(() => import('{import_spec(path, module[:-4])}'));"))
+            plan.edits.append((lit.start, lit.end, f"<@Suspense fallback={{null}}><{lit.name} /></@Suspense>"))
+        else:
+            if isinstance(lit.value, dict) and not objects:
+                lit.fixed = 'object (use --objects: lookups see {} until it loads)'
+                plan.kept.append(lit)
+                continue
+            if isinstance(lit.value, dict) and not lit.type:
+                lit.fixed = 'object without a declared type for its {} fallback'
+                plan.kept.append(lit)
+                continue
+            reads = _reads_of(text, lit.name, (lit.decl_start, lit.decl_end))
+            users = {}
+            for at in reads:
+                top = decls.at(at)
+                while top is not None and top.parent is not None:
+                    top = decls.declarations[top.parent]
+                owner = top if top is not None and top.index in components else None
+                if owner is None:
+                    lit.fixed = f"read outside a component body at line {braces.line_of(at)}"
+                    break
+                if lit.component is not None and owner.name != lit.component:
+                    lit.fixed = f"read outside {lit.component} at line {braces.line_of(at)}"
+                    break
+                unsafe = _unsafe(text, braces, at, lit.name)
+                if unsafe:
+                    lit.fixed = f"{unsafe} at line {braces.line_of(at)}"
+                    break
+                users[owner.index] = owner
+            if not lit.fixed and lit.component is not None:
+                owner = next(d for d in components.values() if d.name == lit.component)
+                early = [m.start() for m in re.finditer(r'\breturn\b', text[owner.body[0]:lit.decl_start])
+                         if braces.depth_at(owner.body[0] + m.start()) == braces.depth_at(lit.decl_start)]
+                if early:
+                    lit.fixed = f"after an early return at line {braces.line_of(owner.body[0] + early[0])}"
+            if lit.fixed:
+                plan.kept.append(lit)
+                continue
+            key = f"{stem}.{lit.name}" if lit.component in (None, stem) else f"{stem}.{lit.component}.{lit.name}"
+            module = os.path.join(DATA_DIR, key + '.json')
+            plan.modules[module] = json.dumps(lit.value, indent=2, ensure_ascii=False) + '\n'
+            loader = 'load' + lit.name[:1].upper() + lit.name[1:]
+            cast = f".then((m) => m.default as unknown as {lit.type})" if lit.type else '.then((m) => m.default)'
+            head.append((lit.start, 'data', f"const {loader} = () => import('{import_spec(path, module)}'){cast};"))
+            fallback = '[]' if isinstance(lit.value, list) else '{}'
+            generic = f"<{lit.type}>" if lit.type else ''
+            call = f"const {lit.name} = useLazyData{generic}('{key}', {loader}, {fallback});"
+            if lit.component is not None:
+                plan.edits.append((lit.decl_start, lit.decl_end, call))
+            else:
+                # Drop the declaration (and its line), read it at the top of each user.
+                line_start = text.rfind('\n', 0, lit.decl_start) + 1
+                line_end = text.find('\n', lit.decl_end)
+                line_end = len(text) if line_end == -1 else line_end + 1
+                plan.edits.append((line_start, line_end, ''))
+                for owner in users.values():
+                    calls.append((owner.body[0], lit.start, call))
+            plan.hook = True
+        plan.moved.append(lit)
+        plan.saved += lit.minified
+        taken.append((lit.start, lit.end))
+    plan.kept += [lit for lit in literals if lit not in plan.moved and lit not in plan.kept]
+    plan.kept.sort(key=lambda lit: lit.start)
+    plan.moved.sort(key=lambda lit: lit.start)
+    if not plan.moved:
+        plan.edits = []
+        return plan
+
+    head.sort()
+    calls.sort()
+    for open_, group in itertools.groupby(calls, key=lambda call: call[0]):
+        first = re.compile(r'\s*').match(text, open_ + 1).end()
+        indent = indent_at(text, first)
+        plan.edits.append((first, first, ''.join(call + '\n' + indent for _open, _start, call in group)))
+    # Imports and loaders go after the last import.
+    lines = []
+    prefix = 'React.'
+    if any(kind == 'lazy' for _start, kind, _line in head):
+        prefix, react_line, react_edit = react_lazy(text)
+        lines += [react_line] if react_line else []
+        plan.edits += [react_edit] if react_edit else []
+    if plan.hook:
+        lines.append(f"import useLazyData from '{import_spec(path, HOOK)}';")
+    lines.append('')
+    lines += [line.replace('@lazy', prefix + 'lazy') for _start, _kind, line in head]
+    at = imports_end(text)
+    plan.edits.append((at, at, '\n'.join(lines) + '\n'))
+    plan.edits = [(s, e, new.replace('@Suspense', prefix + 'Suspense')) for s, e, new in plan.edits]
+    plan.edits.sort(key=lambda edit: edit[:2])
+    plan.saved -= sum(len(new) for _s, _e, new in plan.edits)
+    return plan
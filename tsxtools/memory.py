@@ -0,0 +1,247 @@
+"""
+Optional memory accounting for patch runs, with a budget.
+
+Off by default, when step() is a no-op context manager. Turn it on with
+`tsxtool.py --memory COMMAND ...` or `--memory-budget MB`, or for a script
+run on its own with TSXTOOLS_MEMORY=1 or TSXTOOLS_MEMORY_BUDGET=MB. Then
+tracemalloc traces every allocation, and each step (a tsxtool command, every
+EditBuffer splice, validation and write, every file through the pipeline)
+records:
+
+    peak       the most memory traced at any moment during the step
+    retained   what the step left allocated when it finished
+    sites      the source lines holding most of what it retained
+
+report() prints them as an indented tree on stderr. With a budget, a
+watchdog thread polls the traced total and, as soon as it goes over,
+snapshots the largest allocation sites and interrupts the main thread; the
+innermost step then raises MemoryBudgetExceeded. tsxtool.py turns that into
+an ERROR line and exit status 3 (a script run on its own prints the same line
+and exits non-zero); an EditBuffer that goes over is not written. A spike
+that comes and goes between two polls is still caught when its step ends.
+
+Tracing roughly doubles run time, and the numbers include what tracemalloc's
+own snapshots keep alive; they are for comparing steps and inputs, not exact.
+"""
+
+from contextlib import contextmanager
+import os
+import sys
+import threading
+import tracemalloc
+
+FRAMES = 1                  # traceback depth kept per allocation
+TOP = 5                     # allocation sites reported per step
+POLL = 0.005                # seconds between watchdog checks
+MB = 1024 * 1024
+
+_tracker = None
+
+
+class MemoryBudgetExceeded(Exception):
+    """Raised out of the step that took traced memory over the budget."""
+
+    def __init__(self, step, traced, budget, sites):
+        super().__init__(f"memory budget exceeded in {step}: {traced / MB:.1f} MB traced, "
+                         f"budget {budget / MB:.1f} MB")
+        self.step = step
+        self.traced = traced
+        self.budget = budget
+        self.sites = sites          # [(site, size, count)] when the budget was crossed
+
+
+class Step:
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.peak = 0               # bytes
+        self.retained = 0
+        self.sites = []             # [(site, size_diff, count_diff)]
+
+
+def _sites(stats, top):
+    out = []
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        out.append((f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+                    getattr(stat, 'size_diff', stat.size), getattr(stat, 'count_diff', stat.count)))
+    return out
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+class MemoryTracker:
+    """Per-step peak and retained allocations, and an optional budget."""
+
+    def __init__(self, budget=None, top=TOP, poll=POLL):
+        self.budget = budget        # bytes, or None to report only
+        self.top = top
+        self.poll = poll
+        self.steps = []             # every Step, in the order they started
+        self.exceeded = None        # (traced, sites) once the watchdog fires
+        self._open = []
+        self._stop = threading.Event()
+        self._watchdog = None
+
+    def start(self):
+        tracemalloc.start(FRAMES)
+        if self.budget is not None:
+            self._watchdog = threading.Thread(target=self._watch, name='memory-budget', daemon=True)
+            self._watchdog.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+        tracemalloc.stop()
+
+    def _watch(self):
+        import _thread
+        while not self._stop.wait(self.poll):
+            traced = tracemalloc.get_traced_memory()[0]
+            if traced > self.budget:
+                self.exceeded = (traced, _sites(_snapshot().statistics('lineno'), self.top))
+                if self._open:
+                    _thread.interrupt_main()
+                # Otherwise the next step to start raises.
+                return
+
+    def _fold_peak(self):
+        """Credit the peak since the last reset to every open step, then reset it."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for step in self._open:
+            step.peak = max(step.peak, peak)
+        tracemalloc.reset_peak()
+
+    def _over(self, name):
+        if self.exceeded is not None:
+            traced, sites = self.exceeded
+            return MemoryBudgetExceeded(name, traced, self.budget, sites)
+        if self.budget is not None and self._open and self._open[-1].peak > self.budget:
+            step = self._open[-1]
+            return MemoryBudgetExceeded(name, step.peak, self.budget, step.sites)
+        return None
+
+    @contextmanager
+    def step(self, name):
+        if self.exceeded is not None:
+            # Over budget already (say, in another thread): do not start more work.
+            raise self._over(name)
+        before_snapshot = _snapshot() if self.top else None
+        step = Step(name, len(self._open))
+        self.steps.append(step)
+        self._fold_peak()
+        self._open.append(step)
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            yield step
+        except KeyboardInterrupt:
+            error = self._over(name)
+            if error is None:
+                raise
+            raise error from None
+        finally:
+            self._fold_peak()
+            step.retained = tracemalloc.get_traced_memory()[0] - before
+            if before_snapshot is not None:
+                step.sites = _sites(_snapshot().compare_to(before_snapshot, 'lineno'), self.top)
+            self._open.pop()
+        error = self._over(name)
+        if error is not None:
+            raise error
+
+    def report(self, file=None):
+        file = sys.stderr if file is None else file
+        budget = f"budget {self.budget / MB:.1f} MB" if self.budget is not None else 'no budget'
+        print(f"\nMemory by step (tracemalloc, {budget}):", file=file)
+        print(f"  {'step':<60}{'peak MB':>10}{'retained MB':>13}", file=file)
+        for step in self.steps:
+            name = '  ' * step.depth + step.name
+            print(f"  {name[:60]:<60}{step.peak / MB:10.2f}{step.retained / MB:+13.2f}", file=file)
+        for step in sorted(self.steps, key=lambda s: s.retained, reverse=True)[:3]:
+            if step.sites and step.retained >= 1024:
+                print(f"  retained by {step.name}:", file=file)
+                for site, size, count in step.sites:
+                    print(f"    {size / 1024:+10.1f} KB {count:+8d} blocks  {site}", file=file)
+
+
+def active():
+    return _tracker is not None
+
+
+def enable(budget_mb=None, top=TOP):
+    """Start tracing; budget_mb (None for no budget) is where steps start to fail."""
+    global _tracker
+    if _tracker is None:
+        _tracker = MemoryTracker(None if budget_mb is None else int(budget_mb * MB), top)
+        _tracker.start()
+    return _tracker
+
+
+def disable():
+    global _tracker
+    if _tracker is not None:
+        _tracker.stop()
+        _tracker = None
+
+
+def step(name):
+    """Context manager accounting for name when tracing is on, a no-op otherwise."""
+    if _tracker is None:
+        return _NULL
+    return _tracker.step(name)
+
+
+def print_exceeded(error, file=None):
+    """The ERROR line (and the sites that were live) for a MemoryBudgetExceeded."""
+    file = sys.stderr if file is None else file
+    print(f"ERROR: {error}; aborted", file=file)
+    for site, size, count in error.sites:
+        print(f"    {size / 1024:10.1f} KB {count:8d} blocks  {site}", file=file)
+
+
+def budget_from_env():
+    """(enabled, budget MB or None) from TSXTOOLS_MEMORY / TSXTOOLS_MEMORY_BUDGET."""
+    budget = os.environ.get('TSXTOOLS_MEMORY_BUDGET')
+    if budget:
+        return True, float(budget)
+    return os.environ.get('TSXTOOLS_MEMORY', '') not in ('', '0'), None
+
+
+def _excepthook(kind, error, tb, _default=sys.excepthook):
+    if isinstance(error, KeyboardInterrupt) and _tracker is not None and _tracker.exceeded is not None:
+        # The interrupt landed just after the step that went over had ended.
+        traced, sites = _tracker.exceeded
+        error = MemoryBudgetExceeded('the script', traced, _tracker.budget, sites)
+    if isinstance(error, MemoryBudgetExceeded):
+        print_exceeded(error)
+    else:
+        _default(kind, error, tb)
+
+
+def _enable_from_env():
+    """For scripts run on their own: trace from import, report at exit."""
+    import atexit
+    enabled, budget = budget_from_env()
+    if enabled and _tracker is None:
+        enable(budget)
+        sys.excepthook = _excepthook
+        atexit.register(lambda: _tracker is not None and _tracker.report())
+
+
+class _Null:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _Null()
+
+_enable_from_env()
@@ -0,0 +1,177 @@
+"""
+Per-file structural metrics for spotting components that need splitting.
+
+file_metrics() reports, for one TS/TSX file:
+
+    lines               line count
+    max_brace_depth     deepest bracket nesting ({, ( and [ together)
+    max_jsx_depth       deepest element nesting
+    sections            <section> elements
+    hooks               React hook declarations in component bodies
+    largest_literal     size in chars of the biggest inline literal, with the
+                        line it starts on: an array or object literal, a
+                        string or template literal, or a run of JSX text
+                        between two tags or `{...}` containers
+
+It is built from the brace index, the JSX index and the declaration map, so
+a file whose indexes are already cached costs little more than one pass to
+find its string literals, and the result itself is cached per content hash. score() weighs each metric against
+BUDGETS so files can be ranked by how far over budget they are overall.
+"""
+
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+
+from tsxtools import cache
+from tsxtools.braces import INDEX_VERSION as BRACES_VERSION, build_brace_index
+from tsxtools.declarations import HOOKS, MAP_VERSION, build_declarations
+from tsxtools.jsx import INDEX_VERSION as JSX_VERSION, _Parser, build_index
+
+METRICS_VERSION = 2
+
+# Sizes past which a file is a candidate for splitting.
+BUDGETS = {
+    'lines': 1500,
+    'max_brace_depth': 20,
+    'max_jsx_depth': 15,
+    'sections': 8,
+    'hooks': 30,
+    'largest_literal': 5000,
+}
+
+# Code characters after which `[` or `{` starts a literal rather than a block or index.
+_LITERAL_AFTER = set('=(,:[?{&|')
+
+
+@dataclass
+class FileMetrics:
+    path: str
+    lines: int = 0
+    max_brace_depth: int = 0
+    max_jsx_depth: int = 0
+    sections: int = 0
+    hooks: int = 0
+    largest_literal: int = 0
+    largest_literal_line: int = 0
+    over: list = field(default_factory=list)    # metrics past their budget
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class _Strings(_Parser):
+    """The JSX parser's walk over the code, noting the span of every string and template literal."""
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.spans = []
+
+    def _skip_string(self, pos):
+        end = super()._skip_string(pos)
+        self.spans.append((pos, end))
+        return end
+
+    def _skip_template(self, pos):
+        end = super()._skip_template(pos)
+        self.spans.append((pos, end))
+        return end
+
+
+def _largest_string(text):
+    """(size, offset) of the biggest string or template literal in code."""
+    strings = _Strings(text)
+    strings.parse()
+    return max(((end - start, start) for start, end in strings.spans), default=(0, 0))
+
+
+def _largest_jsx_text(text, braces, index):
+    """(size, offset) of the biggest run of JSX text, leading and trailing whitespace left out."""
+    best = (0, 0)
+    elements = index.elements
+    for el in elements:
+        if not el.closed or el.end <= el.open_end:
+            continue
+        close = text.rfind('</', el.open_end, el.end)
+        stops = [(elements[c].start, elements[c].end) for c in el.children if elements[c].start >= el.open_end]
+        stops.append((close, close))
+        pos = el.open_end
+        for stop, resume in stops:
+            while pos < stop:
+                brace = text.find('{', pos, stop)
+                end = stop if brace == -1 else brace
+                run = text[pos:end]
+                size = len(run.strip())
+                if size > best[0]:
+                    best = (size, pos + len(run) - len(run.lstrip()))
+                if brace == -1:
+                    break
+                partner = braces.match(brace)
+                pos = partner + 1 if partner is not None and partner < stop else stop
+            pos = resume
+    return best
+
+
+def _largest_literal(text, braces, index):
+    """(size, line) of the biggest array or object literal outside JSX tag headers."""
+    headers = [(el.start, el.open_end) for el in index.elements]
+    header_starts = [start for start, _end in headers]
+    best = (0, 0)
+    for offset, char, _depth in braces.brackets():
+        if char not in '[{':
+            continue
+        close = braces.match(offset)
+        if close is None or close - offset <= best[0]:
+            continue
+        before = text[max(0, offset - 64):offset].rstrip()
+        if not (before[-1:] in _LITERAL_AFTER or before.endswith('return')) or before.endswith('=>'):
+            continue
+        # `attr={...}` inside an opening tag is an expression container, not a literal.
+        i = bisect_right(header_starts, offset) - 1
+        if i >= 0 and headers[i][0] < offset < headers[i][1]:
+            continue
+        best = (close + 1 - offset, braces.line_of(offset))
+    return best
+
+
+def _measure(text):
+    braces = cache.cached_text('braces', BRACES_VERSION, text, build_brace_index)
+    index = cache.cached_text('jsx', JSX_VERSION, text, build_index)
+    decls = cache.cached_text('decls', MAP_VERSION, text, build_declarations)
+    depth = [0] * len(index.elements)
+    for el in index.elements:
+        depth[el.index] = depth[el.parent] + 1 if el.parent is not None else 1
+    size, line = _largest_literal(text, braces, index)
+    for other, offset in (_largest_string(text), _largest_jsx_text(text, braces, index)):
+        if other > size:
+            size, line = other, braces.line_of(offset)
+    return {
+        'lines': len(braces.line_starts),
+        'max_brace_depth': max(braces.depths, default=0),
+        'max_jsx_depth': max(depth, default=0),
+        'sections': len(index.by_tag.get('section', ())),
+        'hooks': sum(1 for d in decls if d.kind in HOOKS and d.parent is not None),
+        'largest_literal': size,
+        'largest_literal_line': line,
+    }
+
+
+def _finish(path, values):
+    metrics = FileMetrics(path, **values)
+    metrics.over = [name for name, budget in BUDGETS.items() if values[name] > budget]
+    return metrics
+
+
+def file_metrics(path):
+    """FileMetrics for path, from the content-hash cache when possible."""
+    return _finish(path, cache.cached('metrics', METRICS_VERSION, path, _measure))
+
+
+def data_metrics(path, data):
+    """FileMetrics for the bytes of path already read (tsxtools.pipeline work function)."""
+    text = data.decode('utf-8', errors='ignore')
+    return _finish(path, cache.cached_text('metrics', METRICS_VERSION, text, _measure))
+
+
+def score(metrics):
+    """Sum of each metric over its budget (1.0 = exactly at budget), for ranking."""
+    return sum(getattr(metrics, name) / budget for name, budget in BUDGETS.items())
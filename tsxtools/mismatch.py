@@ -0,0 +1,219 @@
+"""
+Full bracket and JSX tag mismatch report in one pass.
+
+Keeps a single stack across `{}`, `()`, `[]` and JSX elements and records
+every problem instead of stopping at the first one:
+
+    unclosed    an opener that was never closed; `partner` is the closer that
+                forced it off the stack, or None at end of file
+    unexpected  a closer with no matching opener; `partner` is the innermost
+                opener it should have closed, if any
+    unterminated  a template literal or block comment still open at the end
+
+When a closer does not match the top of the stack but matches something
+deeper, everything above that opener is reported unclosed and the scan
+carries on, so one missing `</div>` yields one report rather than a cascade.
+
+structure_profile() runs the same scan over a whole file and keeps, for every
+line, the innermost open bracket or element at its start. Incremental checks
+use it to pick slice boundaries that are neutral for both brackets and JSX.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from tsxtools.lexer import BLOCK_COMMENT, CHUNK_SIZE, TPL, Lexer, iter_chunks
+
+BRACKET = 'bracket'
+TAG = 'tag'
+
+JSX_SUFFIXES = ('.tsx', '.jsx')
+
+_CLOSES = {')': '(', ']': '[', '}': '{'}
+_BREAKS = ('\n', ';')
+
+
+@dataclass
+class Token:
+    text: str
+    offset: int
+    line: int
+    col: int
+    kind: str = BRACKET
+    header: bool = False       # tags only: still inside `<name ...` before its `>`
+    parent: 'Token' = None     # openers only: the frame that was open around it
+    inner: int = -1            # openers only: offset where its contents start
+    close: int = -1            # openers only: offset of the matching closer
+
+    @property
+    def name(self):
+        """Tag name ('' for fragments) for tag tokens."""
+        return self.text.lstrip('</').rstrip(' \t>')
+
+    @property
+    def label(self):
+        if self.kind == BRACKET:
+            return f"'{self.text}'"
+        if self.text.startswith('</'):
+            return f"</{self.name}>"
+        return f"<{self.name}>"
+
+
+@dataclass
+class Problem:
+    kind: str                  # 'unclosed', 'unexpected' or 'unterminated'
+    token: Token
+    partner: Token = None
+
+    def describe(self, end='end of file'):
+        tok = self.token
+        if self.kind == 'unterminated':
+            what = 'template literal' if tok.text == '`' else 'block comment'
+            return f"unterminated {what}, still open at {end}"
+        if self.kind == 'unclosed':
+            if self.partner is None:
+                return f"unclosed {tok.label}, still open at {end}"
+            p = self.partner
+            return f"unclosed {tok.label}, interrupted by {p.label} at {p.line}:{p.col}"
+        if self.partner is None:
+            return f"unexpected {tok.label} with nothing open"
+        p = self.partner
+        return f"unexpected {tok.label}, innermost open is {p.label} from {p.line}:{p.col}"
+
+
+def _close(stack, problems, closer, matches):
+    if stack and matches(stack[-1]):
+        stack.pop().close = closer.offset
+        return
+    for i in range(len(stack) - 1, -1, -1):
+        if matches(stack[i]):
+            for frame in reversed(stack[i + 1:]):
+                problems.append(Problem('unclosed', frame, closer))
+            stack[i].close = closer.offset
+            del stack[i:]
+            return
+    problems.append(Problem('unexpected', closer, stack[-1] if stack else None))
+
+
+class _Scanner:
+    """The stack machine behind scan_chunks() and structure_profile()."""
+
+    def __init__(self, jsx=True, prev='', in_children=False, statements=False):
+        self.lexer = Lexer(prev=prev, jsx=jsx, statements=statements)
+        self.in_children = in_children and jsx
+        self.lexer.jsx_text = self.in_children
+        self.stack = []
+        self.problems = []
+
+    def run(self, chunks):
+        """Scan chunks, yielding (offset, token) once the stack reflects each token."""
+        lexer = self.lexer
+
+        def tokens():
+            for chunk in chunks:
+                yield from lexer.feed(chunk)
+            yield from lexer.close()
+
+        for offset, line, col, text in tokens():
+            if text not in _BREAKS:
+                self._token(offset, line, col, text)
+            yield offset, text
+
+    def _token(self, offset, line, col, text):
+        stack = self.stack
+        top = stack[-1] if stack else None
+        if text in ('(', '[', '{'):
+            stack.append(Token(text, offset, line, col, parent=top, inner=offset + 1))
+        elif text in _CLOSES:
+            opener = _CLOSES[text]
+            _close(stack, self.problems, Token(text, offset, line, col),
+                   lambda f: f.kind == BRACKET and f.text == opener)
+        elif text == '>':
+            if top is not None and top.kind == TAG and top.header:
+                top.header = False
+                top.inner = offset + 1
+        elif text == '/>':
+            if top is not None and top.kind == TAG and top.header:
+                stack.pop().close = offset
+        elif text.startswith('</'):
+            closer = Token(text, offset, line, col, TAG)
+            name = closer.name
+            _close(stack, self.problems, closer,
+                   lambda f: f.kind == TAG and not f.header and f.name == name)
+        else:
+            in_children = top.kind == TAG and not top.header if top is not None else self.in_children
+            if in_children or self.lexer.jsx_likely:
+                fragment = text == '<>'
+                stack.append(Token(text, offset, line, col, TAG, header=not fragment, parent=top,
+                                   inner=offset + 2 if fragment else -1))
+        top = stack[-1] if stack else None
+        self.lexer.jsx_text = top.kind == TAG and not top.header if top is not None else self.in_children
+
+    def finish(self):
+        lexer = self.lexer
+        if lexer.mode in (TPL, BLOCK_COMMENT) and lexer.opened_at is not None:
+            offset, line, col = lexer.opened_at
+            opener = '`' if lexer.mode == TPL else '/*'
+            self.problems.append(Problem('unterminated', Token(opener, offset, line, col)))
+        for frame in reversed(self.stack):
+            self.problems.append(Problem('unclosed', frame))
+        self.problems.sort(key=lambda p: p.token.offset)
+        return self.problems
+
+
+def scan_chunks(chunks, jsx=True, prev='', in_children=False):
+    """All problems in the text formed by concatenating chunks, in file order.
+
+    With jsx=False only brackets are checked, which is right for plain .ts
+    files where `<T>(x) => ...` is a generic, not a tag. `prev` is the text
+    before the first chunk and `in_children` says whether it starts inside
+    JSX children, for scanning a slice of a file.
+    """
+    scanner = _Scanner(jsx, prev, in_children)
+    for _ in scanner.run(chunks):
+        pass
+    return scanner.finish()
+
+
+def find_mismatches(path, chunk_size=CHUNK_SIZE):
+    return scan_chunks(iter_chunks(path, chunk_size), jsx=path.endswith(JSX_SUFFIXES))
+
+
+def find_mismatches_in_text(text, jsx=True):
+    return scan_chunks([text], jsx)
+
+
+@dataclass
+class StructureProfile:
+    """Per-line nesting of one file, as seen by the mismatch scan."""
+    length: int
+    line_starts: list          # offset of every line
+    tops: list                 # innermost open frame at each line start (None at top level)
+    depths: list               # number of open frames at each line start, -1 if not in code
+    boundaries: list           # True where a slice may start: in code, not inside a tag header
+    problems: list
+
+    def line_of(self, offset):
+        return bisect_right(self.line_starts, offset)
+
+
+def structure_profile(text, jsx=True):
+    scanner = _Scanner(jsx, statements=True)
+    at_newline = {}
+    for offset, token in scanner.run([text]):
+        if token == '\n':
+            stack = scanner.stack
+            at_newline[offset] = (stack[-1] if stack else None, len(stack))
+    line_starts = [0]
+    tops = [None]
+    depths = [0]
+    boundaries = [True]
+    pos = text.find('\n')
+    while pos != -1:
+        top, depth = at_newline.get(pos, (None, -1))
+        line_starts.append(pos + 1)
+        tops.append(top)
+        depths.append(depth)
+        boundaries.append(depth != -1 and not (top is not None and top.header))
+        pos = text.find('\n', pos + 1)
+    return StructureProfile(len(text), line_starts, tops, depths, boundaries, scanner.finish())
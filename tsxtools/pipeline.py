@@ -0,0 +1,110 @@
+"""
+Reader/worker pipeline that overlaps file reads with scanning.
+
+run_pipeline() reads files in a small pool of reader threads and hands each
+one, as bytes, to work(path, data) in a scan pool: worker processes when
+jobs > 1, otherwise a single thread, which still lets reads of the next files
+proceed while one is being lexed. The two stages meet in a bounded
+asyncio.Queue, so readers stop `backlog` files ahead of the scanners instead
+of pulling the whole tree into memory; on a cold cache or a network mount
+the disk stays busy while the CPU works, rather than the two taking turns.
+
+Results are passed to on_result(path, result) in completion order, on the
+event loop thread, so a caller can stream them as they arrive.
+
+With tsxtools.memory accounting on, files are scanned in one thread of this
+process (allocations in worker processes are not traced) and each one is a
+step of its own. With tsxtools.profiler on, they are scanned one after the
+other on the main thread, the only one its signal samples.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from tsxtools import memory, profiler
+
+READERS = 8
+BACKLOG = 16
+
+_DONE = object()
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+async def scan_files(paths, work, scan_executor, workers, readers=READERS, backlog=BACKLOG, on_result=None):
+    """[(path, result)] for work(path, data) over paths, in completion order."""
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=backlog)
+    pending = iter(paths)
+    results = []
+    read_executor = ThreadPoolExecutor(max_workers=readers)
+
+    async def reader():
+        # Readers share one iterator, so each takes the next unread path.
+        for path in pending:
+            data = await loop.run_in_executor(read_executor, _read, path)
+            await queue.put((path, data))      # waits while the scanners are `backlog` files behind
+
+    async def scanner():
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            path, data = item
+            result = await loop.run_in_executor(scan_executor, work, path, data)
+            results.append((path, result))
+            if on_result is not None:
+                on_result(path, result)
+
+    async def close():
+        await asyncio.gather(*read_tasks)
+        for _ in scan_tasks:
+            await queue.put(_DONE)
+
+    read_tasks = [asyncio.create_task(reader()) for _ in range(readers)]
+    scan_tasks = [asyncio.create_task(scanner()) for _ in range(workers)]
+    try:
+        # One gather, so a failing scanner cannot leave readers blocked on a full queue.
+        await asyncio.gather(close(), *scan_tasks)
+    finally:
+        for task in read_tasks + scan_tasks:
+            task.cancel()
+        read_executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _stepped(work, path, data):
+    with memory.step(f"{path} ({len(data) // 1024} KB)"):
+        return work(path, data)
+
+
+def _scan_here(paths, work, on_result=None):
+    results = []
+    for path in paths:
+        data = _read(path)
+        with profiler.file(path, len(data)):
+            result = work(path, data)
+        results.append((path, result))
+        if on_result is not None:
+            on_result(path, result)
+    return results
+
+
+def run_pipeline(paths, work, jobs=1, readers=READERS, backlog=BACKLOG, on_result=None):
+    """Run scan_files() to completion with a scan pool sized for jobs.
+
+    work must be a module-level function when jobs > 1, since it runs in
+    worker processes.
+    """
+    if memory.active():
+        work = partial(_stepped, work)
+        jobs = 1
+    if profiler.active():
+        return _scan_here(paths, work, on_result)
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else ThreadPoolExecutor(max_workers=1)
+    with pool:
+        return asyncio.run(scan_files(paths, work, pool, max(1, jobs), readers, backlog, on_result))
@@ -0,0 +1,208 @@
+"""
+Optional sampling profiler for tsxtool commands, written as folded stacks.
+
+Off by default, when file() is a no-op context manager. Turn it on with
+`tsxtool.py --profile COMMAND ...` (or `--profile=FILE`), or for a script
+run on its own with TSXTOOLS_PROFILE=FILE. Then a SIGPROF interval timer
+(ITIMER_PROF, so it counts CPU time, not time spent waiting) interrupts the
+process every INTERVAL seconds, and the handler counts the Python stack it
+interrupted. Python runs the handler between bytecodes, so ticks that fall
+in one long C call (a regex over a whole file, say) arrive as one; each
+sample is weighted by the CPU time since the last, which charges that time
+to the stack that made the call. Nothing runs between samples, so the cost
+is one stack walk per sample, a few percent at the default interval.
+
+Every stack is prefixed with the command and the file being worked on, with
+its size: the work on one file goes through file(path) (each index built
+on a cache miss, each file through the pipeline, each EditBuffer splice,
+validation and write; the innermost file wins). write() saves them in the
+folded format that flamegraph.pl, inferno and speedscope read, one stack
+per line, root first, then its weight in INTERVALs of CPU time:
+
+    check;components/CommandCenter.tsx (318 KB);tsxtool.py:main;...;tsxtools/lexer.py:Lexer._run 93
+
+Signals are handled in the main thread, so only work on it is sampled:
+with profiling on, the pipeline scans files one at a time in this process
+instead of in worker processes or threads. setitimer is Unix only; elsewhere
+--profile prints a notice and the command runs unprofiled.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+import os
+import signal
+import sys
+import time
+
+INTERVAL = 0.001            # seconds of CPU time between samples
+TOP = 8                     # functions in the summary on stderr
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_profiler = None
+
+
+def _frame_name(code):
+    path = code.co_filename
+    if path.startswith(ROOT + os.sep):
+        path = os.path.relpath(path, ROOT).replace(os.sep, '/')
+    else:
+        path = os.path.basename(path)
+    name = getattr(code, 'co_qualname', code.co_name)      # co_qualname is 3.11+
+    return f"{path}:{name}".replace(';', ',')
+
+
+def _file_name(path, size):
+    if os.path.isabs(path) and path.startswith(ROOT + os.sep):
+        path = os.path.relpath(path, ROOT)
+    return f"{path.replace(os.sep, '/')} ({size // 1024} KB)".replace(';', ',')
+
+
+class Profiler:
+    """Counts of (command, file, stack) sampled from a SIGPROF timer."""
+
+    def __init__(self, command, interval=INTERVAL):
+        self.command = command
+        self.interval = interval
+        self.samples = Counter()    # (file tag or None, (code, ...) root first) -> weight
+        self._files = []            # file tags of the open file() contexts
+        self._previous = None
+        self._last = 0.0            # process_time() at the last sample
+
+    def start(self):
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        self._last = time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    def _sample(self, _signum, frame):
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        now = time.process_time()
+        weight = max(1, round((now - self._last) / self.interval))
+        self._last = now
+        self.samples[self._files[-1] if self._files else None, tuple(codes)] += weight
+
+    @contextmanager
+    def file(self, path, size=None):
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+        self._files.append(_file_name(path, size))
+        try:
+            yield
+        finally:
+            self._files.pop()
+
+    def folded(self):
+        """{folded stack: samples}, merging stacks that name the same functions."""
+        out = Counter()
+        for (tag, codes), count in self.samples.items():
+            frames = [self.command.replace(';', ',')]
+            if tag is not None:
+                frames.append(tag)
+            frames += [_frame_name(code) for code in codes]
+            out[';'.join(frames)] += count
+        return out
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.folded().items()):
+                f.write(f"{stack} {count}\n")
+
+    def report(self, path, file=None):
+        file = sys.stderr if file is None else file
+        total = sum(self.samples.values())
+        print(f"\nProfile: {total * self.interval * 1000:.0f} ms of CPU sampled every "
+              f"{self.interval * 1000:g} ms, written to {path}", file=file)
+        if not total:
+            return
+        own = Counter()
+        for (_tag, codes), count in self.samples.items():
+            own[_frame_name(codes[-1])] += count
+        print(f"  {'own %':>7}  function", file=file)
+        for name, count in own.most_common(TOP):
+            print(f"  {count / total:7.1%}  {name}", file=file)
+        files = Counter()
+        for (tag, _codes), count in self.samples.items():
+            if tag is not None:
+                files[tag] += count
+        if files:
+            print(f"  {'files %':>7}  file", file=file)
+            for tag, count in files.most_common(TOP):
+                print(f"  {count / total:7.1%}  {tag}", file=file)
+
+
+def supported():
+    return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+
+
+def active():
+    return _profiler is not None
+
+
+def enable(command, interval=INTERVAL):
+    """Start sampling, tagging every stack with command; None where setitimer is missing."""
+    global _profiler
+    if _profiler is None and supported():
+        _profiler = Profiler(command, interval)
+        _profiler.start()
+    elif _profiler is not None:
+        _profiler.command = command     # already on from TSXTOOLS_PROFILE
+    return _profiler
+
+
+def disable():
+    global _profiler
+    if _profiler is not None:
+        _profiler.stop()
+        _profiler = None
+
+
+def file(path, size=None):
+    """Context manager tagging samples with path (and its size) when profiling, a no-op otherwise."""
+    if _profiler is None:
+        return _NULL
+    return _profiler.file(path, size)
+
+
+def finish(path):
+    """Stop sampling, write the folded stacks to path and summarize them on stderr."""
+    profiler = _profiler
+    if profiler is None:
+        return
+    disable()
+    profiler.write(path)
+    profiler.report(path)
+
+
+def _enable_from_env():
+    """For scripts run on their own: sample from import, write at exit."""
+    import atexit
+    target = os.environ.get('TSXTOOLS_PROFILE', '')
+    if target in ('', '0') or _profiler is not None or not supported():
+        return
+    if target == '1':
+        target = f"{os.path.splitext(os.path.basename(sys.argv[0] or 'python'))[0]}.folded"
+    enable(os.path.basename(sys.argv[0] or 'python'))
+    atexit.register(finish, target)
+
+
+class _Null:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _Null()
+
+_enable_from_env()
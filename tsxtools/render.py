@@ -0,0 +1,307 @@
+"""
+Static render-cost estimate for React components.
+
+A function component re-renders its whole JSX tree whenever any of its state
+changes, so a 9k-line component with a hundred useState hooks redraws every
+panel for every keystroke. analyze_text() works out where that hurts, from
+the declaration map (tsxtools.declarations) and the JSX index (tsxtools.jsx)
+of a file:
+
+  * per component: its useState/useReducer state, effects, memo hooks and
+    JSX element count;
+  * inline object, array and function props (`style={{...}}`,
+    `onClick={() => ...}`), which are new on every render and defeat
+    React.memo on the component receiving them;
+  * per state variable: the elements that read it while rendering, and how
+    many elements its changes reach: the whole element for a read in an
+    attribute, the elements inside the `{...}` for a read in an expression
+    child (`{open && <Panel/>}`);
+  * sections: JSX subtrees of MIN_SECTION elements or more, up to half the
+    component, that are not just a wrapper around one child, with the state
+    they read. A section is scored as its size times the share of the
+    component's state it does *not* read, i.e. roughly how many elements
+    each state update redraws for nothing there; the best-scoring ones are
+    what to extract into their own memoized component first.
+
+It is a text analysis, not a type check: a state name that also appears as
+a plain word inside a section counts as a read. analyze() caches the result
+per content hash.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+import re
+
+from tsxtools import cache
+from tsxtools.braces import INDEX_VERSION as BRACES_VERSION, build_brace_index
+from tsxtools.declarations import build_declarations
+from tsxtools.jsx import build_index
+
+RENDER_VERSION = 2
+
+MIN_SECTION = 15            # elements in a subtree before it is worth extracting
+MAX_SHARE = 0.5             # ... and after this share of the component it is the component
+WRAPPER = 0.8               # a child holding this share of its parent stands in for it
+STATE_HOOKS = ('useState', 'useReducer')
+
+_CLASS = re.compile(r'^[\w:/.-]+$')
+
+_INLINE = (
+    ('object', re.compile(r'\{\s*\{')),
+    ('array', re.compile(r'\{\s*\[')),
+    ('function', re.compile(r'\{\s*(?:async\s+)?(?:\([^()]*(?:\([^()]*\)[^()]*)*\)|[\w$]+)\s*(?::\s*[^=]+?)?=>'
+                            r'|\{\s*(?:async\s+)?function\b|\{[^{}]*\.bind\(')),
+)
+
+
+@dataclass
+class InlineProp:
+    line: int
+    tag: str
+    attr: str
+    kind: str                   # 'object', 'array' or 'function'
+
+    @property
+    def on_component(self):
+        """True when the receiver is a component, where it breaks memoization."""
+        return self.tag[:1].isupper()
+
+
+@dataclass
+class StateUse:
+    name: str
+    line: int
+    readers: int                # elements reading it directly
+    subtree: int                # elements its changes re-render
+
+
+@dataclass
+class Section:
+    line: int
+    end_line: int
+    label: str
+    elements: int
+    reads: tuple                # state names it reads
+    inline: int                 # inline props inside it
+    lists: int                  # .map( calls inside it
+    score: float
+
+
+@dataclass
+class ComponentCost:
+    name: str
+    line: int
+    end_line: int
+    state: tuple                # state variable names
+    effects: int
+    memos: int                  # useMemo + useCallback
+    elements: int
+    inline: list = field(default_factory=list)
+    uses: list = field(default_factory=list)
+    sections: list = field(default_factory=list)
+
+
+def _static_classes(value):
+    """Class words of a className value that hold whatever the state: a string's, or a
+    template literal's text outside its ${...} parts. Other expressions have none."""
+    if not value.startswith('{'):
+        return value.split()
+    expr = value[1:-1].strip()
+    if len(expr) > 1 and expr[0] in '\'"' and expr[-1] == expr[0]:
+        return expr[1:-1].split()
+    if len(expr) < 2 or expr[0] != '`' or expr[-1] != '`':
+        return []
+    static = []
+    modes = ['`']               # '`' inside template text, '{' inside code, or a quote
+    i = 1
+    while i < len(expr) - 1 and modes:
+        c = expr[i]
+        mode = modes[-1]
+        if c == '\\':
+            if len(modes) == 1:
+                static.append(expr[i:i + 2])
+            i += 2
+            continue
+        if mode == '`':
+            if expr.startswith('${', i):
+                modes.append('{')
+                static.append(' ')
+                i += 2
+                continue
+            if c == '`':
+                modes.pop()
+            elif len(modes) == 1:
+                static.append(c)
+        elif mode == '{':
+            if c in '{`\'"':
+                modes.append(c)
+            elif c == '}':
+                modes.pop()
+        elif c == mode:         # end of a quoted string
+            modes.pop()
+        i += 1
+    return ''.join(static).split()
+
+
+def _label(el):
+    label = el.tag or 'fragment'
+    if el.id and not el.id.startswith('{'):
+        label += '#' + el.id
+    value = el.attrs.get('className', el.attrs.get('class')) or ''
+    classes = [c for c in _static_classes(value) if _CLASS.match(c)]
+    if classes:
+        label += '.' + '.'.join(classes[:2])
+    return f"<{label}>"
+
+
+def _inline_kind(value):
+    for kind, pattern in _INLINE:
+        if pattern.match(value):
+            return kind
+    return None
+
+
+def _reads(names):
+    """Pattern for any of names not after a dot; group 1 is the name, group 2 a following `:`."""
+    alternatives = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(rf'(?<![\w$.])({alternatives})(?![\w$])(\s*:)?')
+
+
+def _innermost(index, elements, starts, offset):
+    """Innermost of elements (in document order, with their starts) containing offset."""
+    i = bisect_right(starts, offset) - 1
+    el = elements[i] if i >= 0 else None
+    while el is not None and not el.start <= offset < el.end:
+        el = index.elements[el.parent] if el.parent is not None else None
+    return el
+
+
+def _count_in(offsets, start, end):
+    """How many of the sorted offsets fall in [start, end)."""
+    return bisect_left(offsets, end) - bisect_left(offsets, start)
+
+
+def _component(text, decls, index, braces, decl, sizes):
+    members = decls.members(decl)
+    state = []
+    for member in members:
+        if member.kind in STATE_HOOKS and member.names:
+            state.append((member.names[0], member.line))
+    open_, close = decl.body
+    elements = [el for el in index.elements if open_ < el.start < close]
+    cost = ComponentCost(
+        decl.name, decl.line, decl.end_line, tuple(name for name, _line in state),
+        sum(m.kind in ('useEffect', 'useLayoutEffect') for m in members),
+        sum(m.kind in ('useMemo', 'useCallback') for m in members),
+        len(elements),
+    )
+
+    inline_starts = []
+    for el in elements:
+        for attr, value in el.attrs.items():
+            kind = _inline_kind(value) if value.startswith('{') else None
+            if kind:
+                cost.inline.append(InlineProp(el.line, el.tag, attr, kind))
+                inline_starts.append(el.start)
+
+    starts = [el.start for el in elements]
+    positions = {name: [] for name in cost.state}
+    if cost.state:
+        for m in _reads(cost.state).finditer(text, open_, close):
+            if m.group(2) and text[max(0, m.start() - 40):m.start()].rstrip()[-1:] in ('{', ','):
+                continue                    # an object key, `{ name: ... }`
+            positions[m.group(1)].append(m.start())
+    for name, line in state:
+        readers = set()
+        affected = {}
+        for at in positions[name]:
+            el = _innermost(index, elements, starts, at)
+            if el is None:
+                continue                    # read in a hook or handler, not while rendering JSX
+            readers.add(el.index)
+            if at < el.open_end:
+                affected[el.index] = sizes[el.index]
+                continue
+            # In an expression child: what re-renders is what that expression renders.
+            expr = -1
+            opener = braces.enclosing(at)
+            while opener != -1 and opener >= el.open_end:
+                expr = opener
+                opener = braces.parents.get(opener, -1)
+            end = braces.match(expr) if expr != -1 else None
+            inside = [c for c in el.children if end is not None and expr < index.elements[c].start < end]
+            for c in inside:
+                affected[c] = sizes[c]
+            if not inside:
+                affected.setdefault(el.index, 1)   # text only
+        covered = 0
+        last_end = -1
+        for i in sorted(affected, key=lambda i: index.elements[i].start):
+            if index.elements[i].start >= last_end:     # not nested in one already counted
+                covered += affected[i]
+                last_end = index.elements[i].end
+        cost.uses.append(StateUse(name, line, len(readers), covered))
+    cost.uses.sort(key=lambda use: (-use.subtree, use.name))
+
+    total = len(cost.state) or 1
+    for el in elements:
+        size = sizes[el.index]
+        if size < MIN_SECTION or size > MAX_SHARE * len(elements):
+            continue
+        if any(sizes[c] >= WRAPPER * size for c in el.children):
+            continue
+        lists = text.count('.map(', el.start, el.end)
+        reads = tuple(name for name in cost.state if _count_in(positions[name], el.start, el.end))
+        inline = _count_in(inline_starts, el.start, el.end)
+        cost.sections.append(Section(
+            el.line, el.end_line, _label(el), size, reads, inline, lists,
+            size * (1 - len(reads) / total),
+        ))
+    cost.sections.sort(key=lambda s: -s.score)
+    return cost
+
+
+def analyze_text(text):
+    """[ComponentCost] for every module-level component (capitalised function with JSX) in text."""
+    decls = build_declarations(text)
+    index = build_index(text)
+    braces = cache.cached_text('braces', BRACES_VERSION, text, build_brace_index)
+    sizes = [1] * len(index.elements)
+    for el in reversed(index.elements):
+        if el.parent is not None:
+            sizes[el.parent] += sizes[el.index]
+    out = []
+    for decl in decls:
+        if decl.parent is not None or decl.body is None or not decl.names or not decl.names[0][:1].isupper():
+            continue
+        open_, close = decl.body
+        if not any(open_ < el.start < close for el in index.elements):
+            continue
+        out.append(_component(text, decls, index, braces, decl, sizes))
+    return out
+
+
+def analyze(path):
+    return cache.cached('render', RENDER_VERSION, path, analyze_text)
+
+
+def top_sections(cost, n):
+    """The n best-scoring sections, skipping any inside or around one already picked."""
+    picked = []
+    for section in cost.sections:
+        if len(picked) == n:
+            break
+        if any(section.line <= p.end_line and p.line <= section.end_line for p in picked):
+            continue
+        picked.append(section)
+    return picked
+
+
+def advice(cost, section):
+    if not section.reads:
+        return "reads no state here: extract and wrap in React.memo"
+    props = ', '.join(section.reads[:4]) + (', ...' if len(section.reads) > 4 else '')
+    tip = f"extract with props {props}; React.memo"
+    if section.inline:
+        tip += f", and useCallback/useMemo its {section.inline} inline prop(s)"
+    return tip
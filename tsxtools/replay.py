@@ -0,0 +1,228 @@
+"""
+Replay benchmark over the real edit history of the sources.
+
+revisions() reconstructs the versions a file has been through: its copy in a
+backups/ snapshot (the oldest state on record), the file at every commit
+that touched it (`git log --follow`), and the working tree, dropping
+consecutive duplicates. replay_file() walks them in order, as an editing
+session would, and times for every revision after the first:
+
+    full    every stage in tsxtools.bench.STAGES built cold from the text
+    store   pickling them into the cache on that miss
+    hit     loading them back from the on-disk cache, which is what every
+            later command on the unchanged file pays
+    check   the full structure scan (the 'check' stage on its own)
+    diff    line hunks against the previous revision, with difflib as an
+            EditBuffer session computes them (`check --changed` gets its
+            hunks from git instead)
+    incr    the incremental check of those hunks (incremental.check_hunks)
+            against the previous revision's profile, loaded from the cache
+
+The cache is a fresh temporary directory for the whole replay, so every
+revision is a real miss and nothing is left behind. summarize() adds the
+revisions up into the two questions the caches and incremental paths are
+meant to answer: does diff + incremental check beat the full scan on our
+edits, and after how many reuses has a revision paid for its cache entries
+(store / (full - hit)).
+"""
+
+from dataclasses import dataclass, field
+import os
+import statistics
+import subprocess
+import tempfile
+
+from tsxtools import cache
+from tsxtools.bench import STAGES, _best, _stage
+from tsxtools.fileio import content_hash
+from tsxtools.incremental import check_hunks, git_root
+from tsxtools.mismatch import JSX_SUFFIXES
+from tsxtools.session import line_hunks
+
+SOURCE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx', '.mjs')
+BACKUPS = 'backups'
+
+
+@dataclass
+class Revision:
+    label: str                  # 'backup', a short commit id, or 'worktree'
+    lines: int
+    changed: int                # lines in hunks against the previous revision
+    hunks: int
+    full: float                 # ms, all stages cold
+    store: float
+    hit: float
+    check: float
+    diff: float
+    incr: float
+    stages: dict = field(default_factory=dict)     # stage -> (cold, store, hit) ms
+
+
+@dataclass
+class FileReplay:
+    path: str
+    revisions: list = field(default_factory=list)  # [Revision], the first version excluded
+
+
+def _git(args, root):
+    return subprocess.run(['git', *args], cwd=root, capture_output=True, check=True).stdout
+
+
+def latest_snapshot(root):
+    """Newest backups/<timestamp> directory, or None."""
+    base = os.path.join(root, BACKUPS)
+    if not os.path.isdir(base):
+        return None
+    snapshots = sorted(d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d)))
+    return os.path.join(base, snapshots[-1]) if snapshots else None
+
+
+def revisions(path, root, snapshot=None):
+    """[(label, text)] for path (relative to root), oldest first, without consecutive duplicates."""
+    found = []
+    if snapshot:
+        backup = os.path.join(snapshot, path)
+        if os.path.isfile(backup):
+            with open(backup, 'r', encoding='utf-8', errors='ignore') as f:
+                found.append(('backup', f.read()))
+    log = _git(['log', '--follow', '--format=%H', '--name-only', '--', path], root).decode()
+    entries = []
+    commit = None
+    for line in log.splitlines():
+        if not line:
+            continue
+        if commit is None:
+            commit = line
+        else:
+            entries.append((commit, line))
+            commit = None
+    for commit, name in reversed(entries):
+        try:
+            data = _git(['show', f'{commit}:{name}'], root)
+        except subprocess.CalledProcessError:
+            continue                    # deleted in that commit
+        found.append((commit[:8], data.decode('utf-8', errors='ignore')))
+    current = os.path.join(root, path)
+    if os.path.isfile(current):
+        with open(current, 'r', encoding='utf-8', errors='ignore') as f:
+            found.append(('worktree', f.read()))
+    out = []
+    for label, text in found:
+        if not out or content_hash(out[-1][1]) != content_hash(text):
+            out.append((label, text))
+    return out
+
+
+def history_paths(root, snapshot=None):
+    """Source files with more than one version on record: in the snapshot, or modified by a commit."""
+    paths = set()
+    log = _git(['log', '--diff-filter=M', '--format=', '--name-only'], root).decode()
+    paths.update(line for line in log.splitlines() if line.endswith(SOURCE_SUFFIXES))
+    if snapshot:
+        for dirpath, _dirs, files in os.walk(snapshot):
+            for name in files:
+                rel = os.path.relpath(os.path.join(dirpath, name), snapshot).replace(os.sep, '/')
+                if rel.endswith(SOURCE_SUFFIXES) and os.path.isfile(os.path.join(root, rel)):
+                    paths.add(rel)
+    return sorted(p for p in paths if os.path.isfile(os.path.join(root, p)))
+
+
+def _time_stages(text, jsx, stages, repeat):
+    """{stage: (cold, store, hit)} in ms for text, leaving every stage in the cache."""
+    digest = content_hash(text)
+    out = {}
+    for name in stages:
+        build, kind, version = _stage(name, jsx)
+        cold, value = _best(lambda: build(text), repeat)
+        store, _ = _best(lambda: cache.store(kind, version, digest, value), 1)
+
+        def from_disk():
+            cache.forget(kind, version, digest)
+            return cache.load(kind, version, digest)
+        hit, _ = _best(from_disk, repeat)
+        out[name] = (cold, store, hit)
+    return out
+
+
+def replay_file(path, root, snapshot=None, stages=None, repeat=1):
+    """FileReplay of path's revisions; the cache must point somewhere disposable."""
+    jsx = path.endswith(JSX_SUFFIXES)
+    stages = list(stages or STAGES)
+    for needed in ('check', 'profile'):
+        if needed not in stages:
+            stages.append(needed)
+    result = FileReplay(path)
+    versions = revisions(path, root, snapshot)
+    if len(versions) < 2:
+        return result
+    previous = versions[0][1]
+    _time_stages(previous, jsx, ['profile'], 1)
+    for label, text in versions[1:]:
+        old_lines = previous.splitlines(keepends=True)
+        new_lines = text.splitlines(keepends=True)
+        diff, hunks = _best(lambda: line_hunks(old_lines, new_lines), repeat)
+        build_profile, kind, version = _stage('profile', jsx)
+        profile_hit, profile = _best(lambda: cache.load(kind, version, content_hash(previous)), 1)
+        if profile is None:
+            profile = build_profile(previous)
+        incr, _ = _best(lambda: check_hunks(profile, previous, text, hunks, jsx), repeat)
+        timed = _time_stages(text, jsx, stages, repeat)
+        result.revisions.append(Revision(
+            label, len(new_lines), sum(max(h.old_count, h.new_count) for h in hunks), len(hunks),
+            sum(cold for cold, _s, _h in timed.values()),
+            sum(store for _c, store, _h in timed.values()),
+            sum(hit for _c, _s, hit in timed.values()),
+            timed['check'][0], diff, incr + profile_hit, timed,
+        ))
+        previous = text
+    return result
+
+
+def replay(paths=None, root=None, snapshot=None, stages=None, repeat=1, progress=None):
+    """[FileReplay] for paths (default: every file with history), in a throwaway cache."""
+    root = root or git_root()
+    snapshot = latest_snapshot(root) if snapshot is None else snapshot
+    paths = history_paths(root, snapshot) if not paths else paths
+    saved_dir = cache.CACHE_DIR
+    with tempfile.TemporaryDirectory(prefix='tsxtools-replay-') as scratch:
+        cache.CACHE_DIR = scratch
+        try:
+            out = []
+            for path in paths:
+                out.append(replay_file(path, root, snapshot, stages, repeat))
+                if progress is not None:
+                    progress(out[-1])
+            return out
+        finally:
+            cache.CACHE_DIR = saved_dir
+            cache.clear_memory()
+
+
+@dataclass
+class Summary:
+    files: int
+    revisions: int
+    lines: int
+    changed: int
+    full: float
+    store: float
+    hit: float
+    check: float
+    diff: float
+    incr: float
+    incr_wins: int              # revisions where diff + incr beat the full check
+    payoff: float               # median reuses before a revision's cache entries pay off
+
+
+def summarize(replays):
+    revs = [r for f in replays for r in f.revisions]
+    if not revs:
+        return None
+    payoffs = [r.store / (r.full - r.hit) if r.full > r.hit else float('inf') for r in revs]
+    return Summary(
+        sum(1 for f in replays if f.revisions), len(revs), sum(r.lines for r in revs),
+        sum(r.changed for r in revs),
+        sum(r.full for r in revs), sum(r.store for r in revs), sum(r.hit for r in revs),
+        sum(r.check for r in revs), sum(r.diff for r in revs), sum(r.incr for r in revs),
+        sum(1 for r in revs if r.diff + r.incr < r.check), statistics.median(payoffs),
+    )
@@ -0,0 +1,156 @@
+"""
+CSS-like selectors over a JsxIndex.
+
+Supported syntax:
+
+    tag  *  #id  .class  [attr]  [attr=v]  [attr*=v]  [attr^=v]  [attr$=v]  [attr~=v]
+    A B  (descendant)   A > B  (child)   A, B  (either)
+
+Attribute values may be quoted or bare. Tailwind classes with special
+characters need a backslash, as in CSS: `div.md\\:grid-cols-4`. Attribute
+values are matched against the string contents of quoted attributes and the
+`{...}` source of expression attributes, so `button[onClick*=setShowFormulas]`
+works as expected.
+"""
+
+from dataclasses import dataclass, field
+import re
+
+_IDENT = r'(?:[\w-]|\\.)+'
+_TOKEN = re.compile(
+    r'\s*(?P<comb>[>,])\s*'
+    r'|(?P<ws>\s+)'
+    r'|(?P<star>\*)'
+    r'|(?P<tag>' + _IDENT + r')'
+    r'|\#(?P<id>' + _IDENT + r')'
+    r'|\.(?P<cls>' + _IDENT + r')'
+    r'|\[\s*(?P<attr>[\w$:.-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?P<val>"[^"]*"|\'[^\']*\'|[^\]]*?)\s*)?\]'
+)
+_ESCAPE = re.compile(r'\\(.)')
+
+
+@dataclass
+class Compound:
+    tag: str = None
+    ids: list = field(default_factory=list)
+    classes: list = field(default_factory=list)
+    attrs: list = field(default_factory=list)    # (name, op, value)
+
+    def matches(self, el):
+        if self.tag is not None and el.tag != self.tag:
+            return False
+        for ident in self.ids:
+            if el.attrs.get('id') != ident:
+                return False
+        for name in self.classes:
+            if name not in el.classes:
+                return False
+        for name, op, value in self.attrs:
+            if name not in el.attrs:
+                return False
+            actual = el.attrs[name]
+            if op is None:
+                continue
+            if op == '=' and actual != value:
+                return False
+            if op == '*=' and value not in actual:
+                return False
+            if op == '^=' and not actual.startswith(value):
+                return False
+            if op == '$=' and not actual.endswith(value):
+                return False
+            if op == '~=' and value not in actual.split():
+                return False
+        return True
+
+
+def _unescape(text):
+    return _ESCAPE.sub(r'\1', text)
+
+
+def parse(selector):
+    """Parse a selector into a list of chains of (combinator, Compound).
+
+    The first combinator of each chain is None.
+    """
+    chains = []
+    chain = []
+    current = None
+    pending = None
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        m = _TOKEN.match(selector, pos)
+        if m is None or m.end() == pos:
+            raise ValueError(f"bad selector at {pos}: {selector!r}")
+        pos = m.end()
+        kind = m.lastgroup if m.lastgroup not in ('op', 'val') else 'attr'
+        if kind in ('comb', 'ws'):
+            if current is None:
+                raise ValueError(f"selector has a dangling combinator: {selector!r}")
+            chain.append((pending, current))
+            current = None
+            if kind == 'comb' and m.group('comb') == ',':
+                chains.append(chain)
+                chain = []
+                pending = None
+            else:
+                pending = '>' if kind == 'comb' else ' '
+            continue
+        if current is None:
+            current = Compound()
+        if kind == 'star':
+            pass
+        elif kind == 'tag':
+            current.tag = _unescape(m.group('tag'))
+        elif kind == 'id':
+            current.ids.append(_unescape(m.group('id')))
+        elif kind == 'cls':
+            current.classes.append(_unescape(m.group('cls')))
+        else:
+            value = m.group('val')
+            if value is not None and value[:1] in ('"', "'"):
+                value = value[1:-1]
+            current.attrs.append((m.group('attr'), m.group('op'), value))
+    if current is None:
+        raise ValueError(f"selector ends with a combinator: {selector!r}")
+    chain.append((pending, current))
+    chains.append(chain)
+    return chains
+
+
+def _matches_chain(elements, el, chain, i):
+    comb, compound = chain[i]
+    if not compound.matches(el):
+        return False
+    if i == 0:
+        return True
+    parent = el.parent
+    if comb == '>':
+        return parent is not None and _matches_chain(elements, elements[parent], chain, i - 1)
+    while parent is not None:
+        if _matches_chain(elements, elements[parent], chain, i - 1):
+            return True
+        parent = elements[parent].parent
+    return False
+
+
+def _candidates(index, compound):
+    if compound.ids:
+        return index.by_id.get(compound.ids[0], [])
+    if compound.classes:
+        return min((index.by_class.get(c, []) for c in compound.classes), key=len)
+    if compound.tag is not None:
+        return index.by_tag.get(compound.tag, [])
+    return range(len(index.elements))
+
+
+def select(index, selector):
+    """Elements of index matching selector, in document order."""
+    hits = set()
+    elements = index.elements
+    for chain in parse(selector):
+        for i in _candidates(index, chain[-1][1]):
+            if i not in hits and _matches_chain(elements, elements[i], chain, len(chain) - 1):
+                hits.add(i)
+    return [elements[i] for i in sorted(hits)]
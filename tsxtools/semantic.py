@@ -0,0 +1,234 @@
+"""
+Semantic fingerprints: a hash of a file that only changes when its code does.
+
+Most edits to the components are cosmetic: Tailwind classes recoloured
+(the colour passes in apply_banner_and_lines.py and friends), lines
+re-indented or re-wrapped, comments added. None of them can change what
+tsc or a logic test sees, yet every touched file is checked again.
+fingerprint() hashes the token stream of a file instead of its bytes, with
+
+  * whitespace between tokens and comments dropped, except a line break
+    where automatic semicolon insertion can act on it (see below);
+  * the contents of className strings replaced by a placeholder: a string
+    or template literal given directly to a `className` (or `*ClassName`)
+    attribute or object key, and every string and template text inside a
+    `className={...}` expression (`cn('px-4', active && 'bg-blue-600')`
+    keeps `cn`, `active` and the `&&`, not the classes). A string that is
+    compared rather than used as a class stays verbatim: an operand of
+    `===`, `!==`, `==` or `!=`, a `case` label, or anything inside `[...]`
+    (`mode === 'dark' ? 'bg-black' : 'bg-white'` keeps `'dark'`).
+
+Strings, template text, regex literals and numbers are kept verbatim, so a
+changed label, URL or key still changes the hash. The scan is lexical and
+errs towards a new hash: JSX text is read as code, which keeps its words
+and punctuation; only a `//` in JSX text (rarely written outside a URL
+attribute) would hide the rest of its line.
+
+A line break is kept as a token wherever it can end a statement: after
+`return`, `throw`, `break`, `continue`, `yield` and `async`, before `++`
+and `--`, and between a token that can end an expression and one that
+cannot continue it (a name, number, string, `!` or `~`). So `return` with
+its value moved to the next line, or two statements joined onto one line,
+changes the hash. Breaks inside a JSX opening tag, between attributes, are
+plain whitespace: re-wrapping a long tag keeps the hash.
+
+Besides the file's digest, a Fingerprint carries one digest per
+module-level declaration (the components, hooks and helpers a file
+defines), so a report can say which component's logic changed.
+load_fingerprint() caches it per content hash; revision_fingerprint()
+per git blob, for comparing against a commit.
+"""
+
+from dataclasses import dataclass, field
+import hashlib
+import re
+import subprocess
+
+from tsxtools import cache
+from tsxtools.declarations import build_declarations
+from tsxtools.incremental import _git
+from tsxtools.lexer import LOOKBEHIND, REGEX_LITERAL, opens_jsx, opens_regex
+
+SEMANTIC_VERSION = 3
+
+CLASS_PLACEHOLDER = '"<class>"'
+LINE_BREAK = '\n'
+
+# A line break after these is a statement end whatever follows.
+_RESTRICTED = frozenset(('return', 'throw', 'break', 'continue', 'yield', 'async'))
+# A string next to these is a value being tested, not a class.
+_COMPARISONS = frozenset(('===', '!==', '==', '!='))
+
+_TOKEN = re.compile(r'''
+      (?P<space>\s+)
+    | (?P<comment>/\*.*?(?:\*/|\Z)|(?<!:)//[^\n]*)
+    | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*")
+    | (?P<template>`)
+    | (?P<name>[A-Za-z_$][\w$]*)
+    | (?P<number>\.?\d[\w.]*)
+    | (?P<punct>\.\.\.|\?\?=?|\?\.|=>|[=!]==?|[<>]=?|&&=?|\|\|=?|\*\*=?|[-+*%&|^]=|\+\+|--|\S)
+''', re.S | re.X)
+_TEMPLATE_TEXT = re.compile(r'(?:\\.|\$(?!\{)|[^`\\$])*', re.S)
+_CLASS_NAME = re.compile(r'(?:[\w$]*ClassName|className)\Z')
+
+
+@dataclass
+class Fingerprint:
+    digest: str                 # sha256 of the normalized token stream
+    tokens: int
+    parts: list = field(default_factory=list)   # [(name, line, digest)] per module-level declaration
+
+
+def _ends_expression(tok):
+    return (tok[-1] in ')]}`"\'' or tok in ('++', '--') or tok[0].isalnum() or tok[0] in '_$'
+            or (tok[0] == '/' and len(tok) > 1))
+
+
+def _statement_break(prev, tok, kind):
+    """True if a line break between prev and tok (kind) can end a statement."""
+    if prev in _RESTRICTED or tok in ('++', '--'):
+        return True
+    return _ends_expression(prev) and (kind in ('name', 'number', 'string') or tok in ('!', '~'))
+
+
+def _compared(out, squares, braces):
+    """True if a string read next is tested against (after out) rather than used as a class."""
+    return bool(out) and (out[-1][1] in _COMPARISONS or out[-1][1] == 'case') \
+        or bool(squares) and squares[-1] == braces
+
+
+def tokens(text):
+    """[(offset, token)] of text with whitespace and comments dropped and classNames normalized."""
+    out = []
+    i = 0
+    n = len(text)
+    braces = 0
+    resume = []                 # (brace depth, className?) at which each open template resumes
+    classes = []                # brace depths of the open className={...} expressions
+    pending = False             # just read `className =` or `className :`
+    tags = []                   # brace depths of the open JSX opening tags
+    squares = []                # brace depths of the open `[`
+    broken = False              # a line break since the last token
+    verbatim = {}               # index in out -> the string or template text a placeholder replaced
+    templates = []              # index in out of the first chunk of each open template
+    template_first = {}         # index in out of a template's last chunk -> of its first
+
+    while i < n:
+        m = _TOKEN.match(text, i)
+        kind = m.lastgroup
+        tok = m.group()
+        start = i
+        i = m.end()
+        if kind in ('space', 'comment'):
+            broken = broken or '\n' in tok or tok.startswith('//')
+            continue
+        if broken and out and not (tags and tags[-1] == braces) \
+                and _statement_break(out[-1][1], tok, kind):
+            out.append((start, LINE_BREAK))
+        broken = False
+        class_value, pending = pending, False
+        if kind == 'punct' and tok == '/' and opens_regex(text[max(0, start - LOOKBEHIND):start]):
+            regex = REGEX_LITERAL.match(text, start)
+            if regex:
+                tok = regex.group()
+                i = regex.end()
+        if kind == 'template' or (tok == '}' and resume and resume[-1][0] == braces):
+            if kind == 'template':
+                opening, normalize = '`', (class_value or bool(classes)) and not _compared(out, squares, braces)
+                templates.append(len(out))
+            else:
+                opening, normalize = '}', resume.pop()[1]
+                if classes and classes[-1] == braces:
+                    classes.pop()
+                braces -= 1
+            end = _TEMPLATE_TEXT.match(text, i).end()
+            opened = text.startswith('${', end)
+            closing = '${' if opened else '`'
+            if normalize:
+                verbatim[len(out)] = opening + text[i:end] + closing
+            if not opened:
+                template_first[len(out)] = templates.pop() if templates else len(out)
+            chunk = '<class>' if normalize else text[i:end]
+            out.append((start, opening + chunk + closing))
+            i = end + (2 if opened else 1)
+            if opened:
+                braces += 1
+                resume.append((braces, normalize))
+                if normalize:
+                    classes.append(braces)
+            continue
+        if tok == '{':
+            braces += 1
+            if class_value:
+                classes.append(braces)
+        elif tok == '}':
+            if classes and classes[-1] == braces:
+                classes.pop()
+            braces -= 1
+        elif tok == '[':
+            squares.append(braces)
+        elif tok == ']':
+            if squares:
+                squares.pop()
+        elif kind == 'string' and (classes or class_value) and not _compared(out, squares, braces):
+            verbatim[len(out)] = tok
+            tok = CLASS_PLACEHOLDER
+        elif tok in _COMPARISONS and out:
+            # The left operand was read before we knew it is compared.
+            last = len(out) - 1
+            for k in range(template_first.get(last, last), last + 1):
+                if k in verbatim:
+                    out[k] = (out[k][0], verbatim.pop(k))
+        elif tok == '<' and text[i:i + 1].isalpha() and opens_jsx(text[max(0, start - LOOKBEHIND):start]):
+            tags.append(braces)
+        elif tok == '>' and tags and tags[-1] == braces:
+            tags.pop()
+        out.append((start, tok))
+        if tok in ('=', ':') and len(out) > 1 and _CLASS_NAME.match(out[-2][1]):
+            pending = True
+    return out
+
+
+def _digest(toks):
+    h = hashlib.sha256()
+    for _offset, tok in toks:
+        h.update(tok.encode('utf-8', errors='surrogatepass'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def fingerprint(text):
+    """Fingerprint of text: the file's semantic digest and one per module-level declaration."""
+    toks = tokens(text)
+    parts = []
+    offsets = [offset for offset, _tok in toks]
+    lo = 0
+    for decl in build_declarations(text).declarations:
+        if decl.parent is not None:
+            continue
+        while lo < len(offsets) and offsets[lo] < decl.start:
+            lo += 1
+        hi = lo
+        while hi < len(offsets) and offsets[hi] < decl.end:
+            hi += 1
+        parts.append((decl.name, decl.line, _digest(toks[lo:hi])))
+    return Fingerprint(_digest(toks), len(toks), parts)
+
+
+def load_fingerprint(path):
+    """Fingerprint for path, from the content-hash cache when possible."""
+    return cache.cached('semantic', SEMANTIC_VERSION, path, fingerprint)
+
+
+def revision_fingerprint(rev, path, cwd=None):
+    """Fingerprint of path at rev, cached under its blob id; None if it does not exist there."""
+    try:
+        blob = _git(['rev-parse', '--verify', '--quiet', f'{rev}:{path}'], cwd).decode().strip()
+    except subprocess.CalledProcessError:
+        return None
+    value = cache.load('semantic', SEMANTIC_VERSION, blob)
+    if value is None:
+        text = _git(['cat-file', 'blob', blob], cwd).decode('utf-8', errors='ignore')
+        value = fingerprint(text)
+        cache.store('semantic', SEMANTIC_VERSION, blob, value)
+    return value
@@ -0,0 +1,122 @@
+"""
+Optimistic concurrency for patch runs that edit the same file.
+
+A patch session (an EditBuffer) remembers the sha256 of the bytes it read
+and which pre-image lines it replaced. When it commits, it takes an advisory
+lock on the file and hashes it again:
+
+  * unchanged on disk: the buffer is written as it is;
+  * changed by someone else: their regions are recovered by diffing the
+    pre-image against the file now on disk, and if none of them overlaps
+    or touches one of ours, our replacements are applied on top of their
+    version and that is written instead;
+  * overlapping: nothing is written, and conflict_report() says which of
+    our lines (and bytes) collide with which of theirs.
+
+Regions that merely touch count as overlapping (an insertion at the line
+another session rewrote, two edits on adjacent lines), as with `git merge`:
+a section rewrite usually reaches up to the boundary of the next one, so
+adjacent edits are exactly where a blind merge goes wrong. The same
+replacement made by both sides is taken once.
+
+The lock is fcntl.flock on the target itself and only spans re-read, merge
+and write, so sessions do their reading and editing in parallel. Where
+fcntl is missing (Windows) sessions still merge, without the lock.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+import io
+
+try:
+    import fcntl
+except ImportError:                 # Windows
+    fcntl = None
+
+from tsxtools.incremental import Hunk
+
+
+@dataclass
+class Conflict:
+    ours: Hunk                      # old_* in pre-image lines, new_* in our lines
+    theirs: Hunk                    # old_* in pre-image lines, new_* in the file on disk
+
+
+def decode(data, encoding='utf-8'):
+    """Lines of data exactly as open(path, 'r').readlines() would return them."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding=encoding).readlines()
+
+
+@contextmanager
+def locked(path):
+    """Hold an exclusive advisory lock on path (a no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, 'rb') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def line_hunks(old_lines, new_lines):
+    """Hunks from old_lines to new_lines, like diff --unified=0."""
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return [Hunk(i1, i2 - i1, j1, j2 - j1)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def _touch(a, b):
+    return a.old_first <= b.old_first + b.old_count and b.old_first <= a.old_first + a.old_count
+
+
+def merge(base, ours, our_lines, theirs, their_lines):
+    """(merged lines, [Conflict]) for two sets of hunks against the same base lines.
+
+    merged is None when there are conflicts.
+    """
+    edits = {}
+    conflicts = []
+    for o in ours:
+        edits[o.old_first, o.old_count] = our_lines[o.new_first:o.new_first + o.new_count]
+    for t in theirs:
+        replacement = their_lines[t.new_first:t.new_first + t.new_count]
+        clash = [o for o in ours if _touch(o, t)]
+        if clash and not (len(clash) == 1 and (clash[0].old_first, clash[0].old_count) == (t.old_first, t.old_count)
+                          and edits[t.old_first, t.old_count] == replacement):
+            conflicts += [Conflict(o, t) for o in clash]
+            continue
+        edits[t.old_first, t.old_count] = replacement
+    if conflicts:
+        return None, conflicts
+    merged = []
+    at = 0
+    for (first, count), replacement in sorted(edits.items()):
+        merged += base[at:first]
+        merged += replacement
+        at = first + count
+    merged += base[at:]
+    return merged, []
+
+
+def _span(lines, first, count, encoding):
+    """'lines a-b (bytes x-y)' for lines [first, first + count) of lines, 1-based."""
+    start = sum(len(line.encode(encoding)) for line in lines[:first])
+    end = start + sum(len(line.encode(encoding)) for line in lines[first:first + count])
+    if not count:
+        return f"insertion before line {first + 1} (byte {start})"
+    return f"lines {first + 1}-{first + count} (bytes {start}-{end})"
+
+
+def conflict_report(path, base, conflicts, base_hash, disk_hash, encoding='utf-8'):
+    """Lines describing why a session on path could not be merged, pre-image coordinates."""
+    out = [f"CONFLICT: {path} changed on disk since it was read "
+           f"(read {base_hash[:12]}, now {disk_hash[:12]}); nothing written:"]
+    for c in conflicts:
+        out.append(f"  {path}: {_span(base, c.ours.old_first, c.ours.old_count, encoding)} edited here "
+                   f"overlap {_span(base, c.theirs.old_first, c.theirs.old_count, encoding)} "
+                   f"changed on disk")
+    return out
@@ -0,0 +1,253 @@
+"""
+Structural diff of two versions of a TSX file.
+
+The tree has a node for every JSX element, every declaration in the
+declaration map (module-level ones and those directly inside a component or
+function body), every `{...}` block spanning more than one line, and every
+other top-level statement (imports, types, exports, comments), so no code
+change can fall between nodes. Each node gets a subtree hash (a Merkle hash
+over its own text and its children's hashes, all whitespace-normalised so
+re-indenting a block does not count as a change) and a shallow hash of just
+its own text, with its children left out. diff_trees() walks both trees
+top-down: children lists are aligned on subtree hashes, so an unchanged
+subtree is matched with one comparison and never entered. What is left is
+paired by kind and name (tag and id/key for elements) and descended into;
+nodes that still have no partner are added or removed, unless the same
+subtree turns up on the other side, in which case it moved.
+
+Trees are cached per content hash like the JSX index, and built from the
+cached brace, JSX and declaration indexes, so checking a patch against its
+pre-image costs two cache lookups and a walk of the parts that differ.
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from hashlib import blake2b
+import re
+
+from tsxtools import cache
+from tsxtools.braces import INDEX_VERSION as BRACES_VERSION, build_brace_index
+from tsxtools.declarations import MAP_VERSION, _statement_end, build_declarations
+from tsxtools.jsx import INDEX_VERSION as JSX_VERSION, build_index
+
+TREE_VERSION = 2
+
+ADDED = 'added'
+REMOVED = 'removed'
+MOVED = 'moved'
+MODIFIED = 'modified'
+KINDS = (REMOVED, ADDED, MOVED, MODIFIED)
+
+ELEMENT = 'element'
+BLOCK = 'block'
+STATEMENT = 'statement'
+
+# Which of two nodes with the same span is the parent.
+_RANK = {STATEMENT: 0, BLOCK: 2, ELEMENT: 3}
+_CODE = re.compile(r'\S')
+
+
+@dataclass
+class Node:
+    index: int
+    kind: str                    # element, block, statement, or the declaration's kind
+    name: str                    # tag, declaration name, or ''
+    start: int
+    body: int                    # offset where its content starts (past an element's opening tag)
+    end: int
+    line: int
+    end_line: int
+    key: str = None              # id or key attribute of an element
+    parent: int = None
+    children: list = field(default_factory=list)
+
+
+@dataclass
+class Tree:
+    nodes: list
+    deep: list                   # subtree hash per node
+    shallow: list                # hash of the node's own text per node
+    content: list                # child indexes in the node body, per node
+    roots: list
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def label(self, i, text, width=80):
+        node = self.nodes[i]
+        if node.kind == ELEMENT:
+            tag = ' '.join(text[node.start:node.body].split())
+        elif node.kind == BLOCK:
+            head = text[text.rfind('\n', 0, node.start) + 1:node.start]
+            tag = ' '.join(head.split() + ['{…}'])
+        elif node.kind == STATEMENT:
+            tag = ' '.join(text[node.start:node.end].split())
+        else:
+            tag = f"{node.kind} {node.name}"
+        return tag if len(tag) <= width else tag[:width] + '…'
+
+
+def _norm(text):
+    return ' '.join(text.split()).encode('utf-8', errors='ignore')
+
+
+def _nodes(text):
+    """Unnested nodes: declarations, multi-line blocks, JSX elements and leftover statements."""
+    braces = cache.cached_text('braces', BRACES_VERSION, text, build_brace_index)
+    index = cache.cached_text('jsx', JSX_VERSION, text, build_index)
+    decls = cache.cached_text('decls', MAP_VERSION, text, build_declarations)
+    nodes = []
+    for decl in decls:
+        nodes.append(Node(0, decl.kind, decl.name, decl.start, decl.start, decl.end,
+                          decl.line, decl.end_line))
+    for offset, char, _depth in braces.brackets():
+        close = braces.match(offset) if char == '{' else None
+        if close is not None and close > offset:
+            line, end_line = braces.line_of(offset), braces.line_of(close)
+            if end_line > line:
+                nodes.append(Node(0, BLOCK, '', offset, offset, close + 1, line, end_line))
+    for el in index.elements:
+        nodes.append(Node(0, ELEMENT, el.tag, el.start, max(el.start, el.open_end),
+                          max(el.start, el.end), el.line, max(el.line, el.end_line),
+                          el.attrs.get('id') or el.attrs.get('key')))
+    # Whatever the declarations leave, a statement at a time.
+    tops = sorted((d.start, d.end) for d in decls if d.parent is None)
+    t = 0
+    pos = 0
+    while True:
+        m = _CODE.search(text, pos)
+        if m is None:
+            break
+        start = m.start()
+        if t < len(tops) and tops[t][0] <= start:
+            pos = max(start + 1, tops[t][1])
+            t += 1
+            continue
+        stop = tops[t][0] if t < len(tops) else len(text)
+        end = min(_statement_end(text, braces, start, braces.depth_at(start)), stop)
+        if end <= start:
+            eol = text.find('\n', start)
+            end = min(len(text) if eol == -1 else eol, stop)
+        nodes.append(Node(0, STATEMENT, '', start, start, end, braces.line_of(start),
+                          braces.line_of(max(start, end - 1))))
+        pos = end
+    return nodes
+
+
+def build_tree(text):
+    nodes = _nodes(text)
+    nodes.sort(key=lambda n: (n.start, -n.end, _RANK.get(n.kind, 1)))
+    stack = []
+    roots = []
+    for i, node in enumerate(nodes):
+        node.index = i
+        while stack and not (node.start < stack[-1].end and node.end <= stack[-1].end):
+            stack.pop()
+        if stack:
+            node.parent = stack[-1].index
+            stack[-1].children.append(i)
+        else:
+            roots.append(i)
+        stack.append(node)
+
+    deep = [b''] * len(nodes)
+    shallow = [b''] * len(nodes)
+    content = [[] for _ in nodes]
+    # Nodes are in document order, so every child comes after its parent.
+    for node in reversed(nodes):
+        body = [c for c in node.children if nodes[c].start >= node.body]
+        content[node.index] = body
+        own = blake2b(_norm(text[node.start:node.body]), digest_size=16)
+        own.update(node.kind.encode())
+        sub = own.copy()
+        pos = node.body
+        for c in body:
+            piece = _norm(text[pos:nodes[c].start])
+            own.update(piece)
+            sub.update(piece)
+            sub.update(deep[c])
+            own.update(b'\0')
+            pos = max(pos, nodes[c].end)
+        tail = _norm(text[pos:node.end]) if node.end > pos else b''
+        own.update(tail)
+        sub.update(tail)
+        shallow[node.index] = own.digest()
+        deep[node.index] = sub.digest()
+    return Tree(nodes, deep, shallow, content, roots)
+
+
+def load_tree(path):
+    return cache.cached('tree', TREE_VERSION, path, build_tree)
+
+
+def tree_of_text(text):
+    return cache.cached_text('tree', TREE_VERSION, text, build_tree)
+
+
+@dataclass
+class Change:
+    kind: str                    # added, removed, moved or modified
+    old: int = None              # node index in the old tree
+    new: int = None              # node index in the new tree
+
+
+def _signature(tree, i):
+    node = tree.nodes[i]
+    return node.kind, node.name, node.key
+
+
+def diff_trees(old, new):
+    """Changes turning old into new, as a list of Change."""
+    changes = []
+    removed = []
+    added = []
+
+    def align(olds, news):
+        ops = SequenceMatcher(None, [old.deep[i] for i in olds], [new.deep[j] for j in news],
+                              autojunk=False).get_opcodes()
+        for op, i1, i2, j1, j2 in ops:
+            if op == 'equal':
+                continue
+            left = list(olds[i1:i2])
+            right = list(news[j1:j2])
+            # Same subtree on both sides of a replace: reordered siblings.
+            for i in list(left):
+                for j in right:
+                    if old.deep[i] == new.deep[j]:
+                        changes.append(Change(MOVED, i, j))
+                        left.remove(i)
+                        right.remove(j)
+                        break
+            for i in list(left):
+                sig = _signature(old, i)
+                for j in right:
+                    if _signature(new, j) == sig:
+                        left.remove(i)
+                        right.remove(j)
+                        if old.shallow[i] != new.shallow[j]:
+                            changes.append(Change(MODIFIED, i, j))
+                        align(old.content[i], new.content[j])
+                        break
+            removed.extend(left)
+            added.extend(right)
+
+    align(old.roots, new.roots)
+
+    gone = {}
+    for i in removed:
+        gone.setdefault(old.deep[i], []).append(i)
+    for j in added:
+        twins = gone.get(new.deep[j])
+        if twins:
+            changes.append(Change(MOVED, twins.pop(0), j))
+        else:
+            changes.append(Change(ADDED, None, j))
+    for twins in gone.values():
+        changes.extend(Change(REMOVED, i, None) for i in twins)
+
+    def position(change):
+        if change.kind == REMOVED:
+            return KINDS.index(change.kind), old.nodes[change.old].start
+        return KINDS.index(change.kind), new.nodes[change.new].start
+    changes.sort(key=position)
+    return changes